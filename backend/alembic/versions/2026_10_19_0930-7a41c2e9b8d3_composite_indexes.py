@@ -0,0 +1,43 @@
+"""add composite indexes for list/count queries
+
+Revision ID: 7a41c2e9b8d3
+Revises: 5cd3522f2d40
+Create Date: 2026-10-19 09:30:12.418207
+
+`python -m app.common.db.query_audit` 결과 풀스캔/filesort 가 발생한 목록·카운트 쿼리용 인덱스.
+follows(followee_id, created_at) 는 58db06d7bdf3 의 idx_follow_followee_created 로 이미 존재한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a41c2e9b8d3'
+down_revision: Union[str, Sequence[str], None] = '5cd3522f2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_curriculum_visibility_updated', 'curriculums', ['visibility', 'updated_at'], unique=False)
+    op.create_index('idx_curriculum_visibility_created', 'curriculums', ['visibility', 'created_at'], unique=False)
+    op.create_index('idx_curriculum_user_created', 'curriculums', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_week_schedule_curriculum_week', 'week_schedules', ['curriculum_id', 'week_number'], unique=False)
+    op.create_index('idx_summary_curriculum_week', 'summaries', ['curriculum_id', 'week_number'], unique=False)
+    op.create_index('idx_summary_owner_created', 'summaries', ['owner_id', 'created_at'], unique=False)
+    op.create_index('idx_curriculum_tag_tag_curriculum', 'curriculum_tags', ['tag_id', 'curriculum_id'], unique=False)
+    op.create_index('idx_feedback_summary', 'feedbacks', ['summary_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_feedback_summary', table_name='feedbacks')
+    op.drop_index('idx_curriculum_tag_tag_curriculum', table_name='curriculum_tags')
+    op.drop_index('idx_summary_owner_created', table_name='summaries')
+    op.drop_index('idx_summary_curriculum_week', table_name='summaries')
+    op.drop_index('idx_week_schedule_curriculum_week', table_name='week_schedules')
+    op.drop_index('idx_curriculum_user_created', table_name='curriculums')
+    op.drop_index('idx_curriculum_visibility_created', table_name='curriculums')
+    op.drop_index('idx_curriculum_visibility_updated', table_name='curriculums')
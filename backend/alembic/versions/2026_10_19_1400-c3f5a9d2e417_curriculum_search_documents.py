@@ -0,0 +1,144 @@
+"""add curriculum_search_documents with FULLTEXT ngram indexes
+
+Revision ID: c3f5a9d2e417
+Revises: 7a41c2e9b8d3
+Create Date: 2026-10-19 14:00:41.902315
+
+피드 검색용 비정규화 문서 테이블. 기존 커리큘럼은 이 마이그레이션에서 색인하고,
+이후 어긋난 색인은 `make search-index-rebuild` 로 다시 만든다.
+ngram 파서는 innodb_ft_min_token_size 대신 ngram_token_size(기본 2)를 따른다.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a9d2e417'
+down_revision: Union[str, Sequence[str], None] = '7a41c2e9b8d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('curriculum_search_documents',
+    sa.Column('curriculum_id', sa.String(length=26), nullable=False),
+    sa.Column('title', sa.String(length=50), nullable=False),
+    sa.Column('owner_name', sa.String(length=32), nullable=False),
+    sa.Column('tags', sa.Text(), nullable=False),
+    sa.Column('lessons', sa.Text(), nullable=False),
+    sa.Column('indexed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['curriculum_id'], ['curriculums.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('curriculum_id')
+    )
+    op.create_index('ftx_curriculum_search_title', 'curriculum_search_documents', ['title'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+    op.create_index('ftx_curriculum_search_all', 'curriculum_search_documents', ['title', 'owner_name', 'tags', 'lessons'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        # 레슨 전체를 이어 붙이므로 GROUP_CONCAT 기본 길이(1024)로는 잘린다
+        op.execute("SET SESSION group_concat_max_len = 16777216")
+        op.execute(
+            """
+            INSERT INTO curriculum_search_documents
+                (curriculum_id, title, owner_name, tags, lessons, indexed_at)
+            SELECT c.id, c.title, u.name,
+                   COALESCE(t.tags, ''), COALESCE(l.lessons, ''), UTC_TIMESTAMP()
+            FROM curriculums c
+            JOIN users u ON u.id = c.user_id
+            LEFT JOIN (
+                SELECT ct.curriculum_id,
+                       GROUP_CONCAT(tg.name ORDER BY tg.name SEPARATOR ' ') AS tags
+                FROM curriculum_tags ct
+                JOIN tags tg ON tg.id = ct.tag_id
+                GROUP BY ct.curriculum_id
+            ) t ON t.curriculum_id = c.id
+            LEFT JOIN (
+                SELECT w.curriculum_id,
+                       GROUP_CONCAT(
+                           jt.lesson ORDER BY w.week_number, jt.idx SEPARATOR '\\n'
+                       ) AS lessons
+                FROM week_schedules w,
+                     JSON_TABLE(
+                         w.lessons, '$[*]'
+                         COLUMNS (idx FOR ORDINALITY, lesson TEXT PATH '$')
+                     ) jt
+                GROUP BY w.curriculum_id
+            ) l ON l.curriculum_id = c.id
+            """
+        )
+        return
+
+    # 기타 dialect (로컬 SQLite 등): JSON 함수 차이를 피해 파이썬에서 문서 생성
+    curriculums = sa.table(
+        'curriculums',
+        sa.column('id', sa.String),
+        sa.column('user_id', sa.String),
+        sa.column('title', sa.String),
+    )
+    users = sa.table('users', sa.column('id', sa.String), sa.column('name', sa.String))
+    week_schedules = sa.table(
+        'week_schedules',
+        sa.column('curriculum_id', sa.String),
+        sa.column('week_number', sa.Integer),
+        sa.column('lessons', sa.JSON),
+    )
+    curriculum_tags = sa.table(
+        'curriculum_tags',
+        sa.column('curriculum_id', sa.String),
+        sa.column('tag_id', sa.String),
+    )
+    tags = sa.table('tags', sa.column('id', sa.String), sa.column('name', sa.String))
+    documents = sa.table(
+        'curriculum_search_documents',
+        sa.column('curriculum_id', sa.String),
+        sa.column('title', sa.String),
+        sa.column('owner_name', sa.String),
+        sa.column('tags', sa.Text),
+        sa.column('lessons', sa.Text),
+        sa.column('indexed_at', sa.DateTime),
+    )
+
+    lessons: dict = {}
+    for curriculum_id, week_lessons in bind.execute(
+        sa.select(week_schedules.c.curriculum_id, week_schedules.c.lessons).order_by(
+            week_schedules.c.curriculum_id, week_schedules.c.week_number
+        )
+    ):
+        lessons.setdefault(curriculum_id, []).extend(week_lessons or [])
+    tag_names: dict = {}
+    for curriculum_id, tag_name in bind.execute(
+        sa.select(curriculum_tags.c.curriculum_id, tags.c.name).join(
+            tags, tags.c.id == curriculum_tags.c.tag_id
+        )
+    ):
+        tag_names.setdefault(curriculum_id, []).append(tag_name)
+
+    indexed_at = datetime.now(timezone.utc)
+    rows = [
+        {
+            'curriculum_id': curriculum_id,
+            'title': title,
+            'owner_name': owner_name,
+            'tags': ' '.join(sorted(tag_names.get(curriculum_id, []))),
+            'lessons': '\n'.join(lessons.get(curriculum_id, [])),
+            'indexed_at': indexed_at,
+        }
+        for curriculum_id, title, owner_name in bind.execute(
+            sa.select(curriculums.c.id, curriculums.c.title, users.c.name).join(
+                users, users.c.id == curriculums.c.user_id
+            )
+        )
+    ]
+    if rows:
+        op.bulk_insert(documents, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ftx_curriculum_search_all', table_name='curriculum_search_documents')
+    op.drop_index('ftx_curriculum_search_title', table_name='curriculum_search_documents')
+    op.drop_table('curriculum_search_documents')
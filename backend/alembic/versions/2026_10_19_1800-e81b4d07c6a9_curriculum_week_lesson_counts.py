@@ -0,0 +1,74 @@
+"""add denormalized total_weeks/total_lessons to curriculums
+
+Revision ID: e81b4d07c6a9
+Revises: c3f5a9d2e417
+Create Date: 2026-10-19 18:00:12.551904
+
+목록 조회가 week_schedules 를 읽지 않도록 주차/레슨 개수를 커리큘럼 행에 둔다.
+이후 값은 CurriculumRepository 가 주차 쓰기와 같은 트랜잭션에서 갱신한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81b4d07c6a9'
+down_revision: Union[str, Sequence[str], None] = 'c3f5a9d2e417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('curriculums', sa.Column('total_weeks', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('curriculums', sa.Column('total_lessons', sa.Integer(), server_default='0', nullable=False))
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute(
+            """
+            UPDATE curriculums c
+            JOIN (
+                SELECT curriculum_id,
+                       COUNT(*) AS weeks,
+                       COALESCE(SUM(JSON_LENGTH(lessons)), 0) AS lessons
+                FROM week_schedules
+                GROUP BY curriculum_id
+            ) w ON w.curriculum_id = c.id
+            SET c.total_weeks = w.weeks, c.total_lessons = w.lessons
+            """
+        )
+        return
+
+    # 기타 dialect (로컬 SQLite 등): JSON 함수 차이를 피해 파이썬에서 집계
+    week_schedules = sa.table(
+        'week_schedules',
+        sa.column('curriculum_id', sa.String),
+        sa.column('lessons', sa.JSON),
+    )
+    curriculums = sa.table(
+        'curriculums',
+        sa.column('id', sa.String),
+        sa.column('total_weeks', sa.Integer),
+        sa.column('total_lessons', sa.Integer),
+    )
+    counts: dict = {}
+    for curriculum_id, lessons in bind.execute(
+        sa.select(week_schedules.c.curriculum_id, week_schedules.c.lessons)
+    ):
+        weeks, total = counts.get(curriculum_id, (0, 0))
+        counts[curriculum_id] = (weeks + 1, total + len(lessons or []))
+    for curriculum_id, (weeks, total) in counts.items():
+        bind.execute(
+            curriculums.update()
+            .where(curriculums.c.id == curriculum_id)
+            .values(total_weeks=weeks, total_lessons=total)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('curriculums', 'total_lessons')
+    op.drop_column('curriculums', 'total_weeks')
@@ -0,0 +1,47 @@
+"""store curriculums.updated_at with microsecond precision
+
+Revision ID: 4b7e2d91c5f3
+Revises: e81b4d07c6a9
+Create Date: 2026-10-19 21:00:41.208377
+
+일괄 수정은 updated_at 을 낙관적 동시성 버전으로 비교한다. 초 단위 DATETIME 이면
+같은 초 안의 두 수정이 같은 버전이 되어 나중 요청이 앞선 수정을 덮어쓸 수 있으므로
+DATETIME(6) 으로 바꾼다. SQLite 등은 이미 마이크로초까지 저장한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d91c5f3'
+down_revision: Union[str, Sequence[str], None] = 'e81b4d07c6a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.alter_column(
+        'curriculums',
+        'updated_at',
+        existing_type=mysql.DATETIME(),
+        type_=mysql.DATETIME(fsp=6),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.alter_column(
+        'curriculums',
+        'updated_at',
+        existing_type=mysql.DATETIME(fsp=6),
+        type_=mysql.DATETIME(),
+        existing_nullable=False,
+    )
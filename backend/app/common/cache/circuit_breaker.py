@@ -0,0 +1,111 @@
+"""
+Redis 장애 시 빠르게 포기하기 위한 서킷 브레이커.
+
+- closed    : 정상. 연속 실패가 failure_threshold 에 닿으면 open
+- open      : cooldown 동안 Redis 를 건너뜀 (호출자는 Redis 없음과 같은 경로로 원본 조회)
+- half_open : cooldown 이 지나면 탐색 요청 하나만 흘려 보고, 성공이면 closed, 실패면 open.
+              결과가 나올 때까지 다른 요청은 open 과 같이 건너뛴다 (죽은 Redis 에 워커의
+              모든 요청이 소켓 타임아웃만큼 묶이지 않도록)
+
+이벤트 루프 단일 스레드에서만 쓰므로 락이 없다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown: float = 10.0,
+        on_state_change: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.on_state_change = on_state_change
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        # half_open 탐색 요청 (시작 시각, 보낸 태스크)
+        self._probe_started_at: Optional[float] = None
+        self._probe_owner: Optional[asyncio.Task] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지. open 이면 False, half_open 에서는 탐색 요청 하나만 True
+        (탐색 요청을 보낸 태스크의 후속 접근은 허용). 탐색 결과가 cooldown 안에
+        기록되지 않으면 다음 요청이 탐색을 이어받는다.
+        """
+        state = self.state
+        if state != HALF_OPEN:
+            return state == CLOSED
+        now = time.monotonic()
+        task = _current_task()
+        if (
+            self._probe_started_at is not None
+            and now - self._probe_started_at < self.cooldown
+        ):
+            return task is not None and task is self._probe_owner
+        self._probe_started_at = now
+        self._probe_owner = task
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._end_probe()
+        if self._state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._end_probe()
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            if self._state != OPEN:
+                self._transition(OPEN)
+
+    def _end_probe(self) -> None:
+        self._probe_started_at = None
+        self._probe_owner = None
+
+    def _transition(self, state: str) -> None:
+        previous, self._state = self._state, state
+        if state == OPEN:
+            logger.warning(
+                f"Circuit breaker '{self.name}' opened "
+                f"({self._failures} failures, cooldown {self.cooldown}s)"
+            )
+        else:
+            logger.info(f"Circuit breaker '{self.name}' {previous} -> {state}")
+        if self.on_state_change is not None:
+            self.on_state_change(self.name, state)
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # 이벤트 루프 밖 (동기 호출)
+        return None
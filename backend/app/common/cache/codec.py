@@ -0,0 +1,84 @@
+"""
+Redis 캐시 값 코덱.
+
+값 = 헤더 1바이트 + 본문
+- 헤더 하위 7비트는 스키마 버전, 최상위 비트는 zlib 압축 여부
+- 본문은 필드 순서를 고정한 JSON 배열 (필드 이름 없음, 시각은 epoch 마이크로초 정수)
+
+버전이 다른 값(배포 중 이전/다음 버전 워커가 쓴 값, 예전 JSON 텍스트 캐시)은
+캐시 미스로 취급해 원본에서 다시 채운다. 필드를 바꾸면 VERSION 을 올린다.
+"""
+
+import logging
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Generic, List, Optional, TypeVar
+
+from app.common.serialization.codec import json_codec
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+COMPRESSED = 0x80
+VERSION_MASK = 0x7F
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class CacheCodec(Generic[T]):
+    """캐시 값 하나의 인코딩 (하위 클래스는 VERSION, to_fields, from_fields 구현)"""
+
+    VERSION = 1
+
+    def __init__(
+        self, compress_threshold: Optional[int] = 1024, compress_level: int = 1
+    ) -> None:
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def encode(self, value: T) -> bytes:
+        body = json_codec.dumps(self.to_fields(value))
+        header = self.VERSION
+        if self.compress_threshold and len(body) >= self.compress_threshold:
+            compressed = zlib.compress(body, self.compress_level)
+            if len(compressed) < len(body):
+                body, header = compressed, header | COMPRESSED
+        return bytes((header,)) + body
+
+    def decode(self, raw: Optional[bytes]) -> Optional[T]:
+        """디코딩 (비었거나 버전이 다르거나 손상된 값은 None → 캐시 미스)"""
+        if not raw or not isinstance(raw, bytes):
+            return None
+        header = raw[0]
+        if header & VERSION_MASK != self.VERSION:
+            return None
+        try:
+            body = raw[1:]
+            if header & COMPRESSED:
+                body = zlib.decompress(body)
+            return self.from_fields(json_codec.loads(body))
+        except Exception as e:
+            logger.warning(f"{type(self).__name__} decode failed: {e}")
+            return None
+
+    def to_fields(self, value: T) -> List[Any]:
+        raise NotImplementedError
+
+    def from_fields(self, fields: List[Any]) -> T:
+        raise NotImplementedError
+
+
+def to_epoch_us(value: datetime) -> int:
+    """datetime → epoch 마이크로초 (naive 는 UTC 로 간주)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_epoch_us(value: int, aware: bool) -> datetime:
+    """epoch 마이크로초 → datetime (aware 면 UTC, 아니면 naive UTC)"""
+    days, us = divmod(value, 86_400_000_000)
+    result = _EPOCH + timedelta(days=days, microseconds=us)
+    return result.replace(tzinfo=timezone.utc) if aware else result
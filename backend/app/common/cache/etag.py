@@ -0,0 +1,27 @@
+"""HTTP 조건부 요청(ETag / If-None-Match) 도우미"""
+
+import hashlib
+from typing import Any, Optional
+
+from app.common.serialization.codec import json_codec
+
+
+def compute_etag(payload: Any) -> str:
+    """직렬화 내용 기반 strong ETag (따옴표 포함)"""
+    body = json_codec.dumps(payload, sort_keys=True)
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 (목록, * 지원, W/ 는 약한 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -0,0 +1,41 @@
+"""
+캐시 메트릭 라벨용 네임스페이스.
+
+Redis 키는 "{namespace}:{...}" 형태이므로 키 앞 1~2 세그먼트로 네임스페이스를 정한다.
+목록에 없는 키는 "other" 로 묶어 라벨 카디널리티를 고정한다.
+새 캐시 키 접두사를 만들면 여기에도 추가한다.
+"""
+
+from typing import Any
+
+OTHER = "other"
+
+CACHE_NAMESPACES = frozenset(
+    {
+        "active_user",
+        "curriculum:detail",
+        "feed",
+        "feed:item",
+        "follow:suggest",
+        "graph",
+        "refdata",
+        "refdata:categories",
+        "tag:ranking",
+        "tag:trending",
+        "timeline",
+    }
+)
+
+
+def namespace_of(key: Any) -> str:
+    """Redis 키 → 캐시 네임스페이스 (두 세그먼트 접두사 우선)"""
+    if isinstance(key, bytes):
+        key = key.decode("utf-8", "replace")
+    elif not isinstance(key, str):
+        return OTHER
+    parts = key.split(":", 2)
+    if len(parts) > 1:
+        prefix = f"{parts[0]}:{parts[1]}"
+        if prefix in CACHE_NAMESPACES:
+            return prefix
+    return parts[0] if parts[0] in CACHE_NAMESPACES else OTHER
@@ -1,25 +1,209 @@
-import json
-from typing import Dict, List, Optional, Union
+import os
+import time
+from typing import Any, Dict, List, Optional, Union
 import redis.asyncio as redis
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline, PubSub
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from app.common.cache.circuit_breaker import CircuitBreaker
+from app.common.cache.namespaces import namespace_of
+from app.common.monitoring.metrics import (
+    record_cache_lookup,
+    record_cache_operation,
+    set_circuit_breaker_state,
+)
+from app.common.serialization.codec import json_codec
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# 서킷 브레이커에 실패로 기록할 예외 (응답 오류 등 명령 자체의 오류는 제외)
+_UNAVAILABLE_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError)
+
+# 캐시 네임스페이스 메트릭에서 빼는 관리/수집용 명령
+_ADMIN_COMMANDS = frozenset(
+    {"DBSIZE", "INFO", "MEMORY USAGE", "PING", "PUBLISH", "SCAN"}
+)
+
+# 적중/미스를 기록하는 조회 명령 (키 하나 / 키 여러 개 / 컬렉션 전체)
+_SINGLE_READS = frozenset({"GET", "GETEX", "HGET", "ZSCORE"})
+_MULTI_READS = frozenset({"MGET", "HMGET"})
+_COLLECTION_READS = frozenset(
+    {"EXISTS", "HGETALL", "LRANGE", "SMEMBERS", "ZRANGE", "ZREVRANGE"}
+)
+
+
+def _record_lookup(namespace: str, command: str, result: Any) -> None:
+    if command in _SINGLE_READS:
+        hits = int(result is not None)
+        record_cache_lookup(namespace, "redis", hits, 1 - hits)
+    elif command in _MULTI_READS:
+        hits = sum(value is not None for value in result)
+        record_cache_lookup(namespace, "redis", hits, len(result) - hits)
+    elif command in _COLLECTION_READS:
+        hits = int(bool(result))
+        record_cache_lookup(namespace, "redis", hits, 1 - hits)
+
+
+class _GuardedPipeline(Pipeline):
+    """실행 결과를 서킷 브레이커와 캐시 메트릭에 기록하는 파이프라인"""
+
+    breaker: CircuitBreaker
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        # 네임스페이스는 첫 명령의 키 기준 (실행 후에는 command_stack 이 비워짐)
+        namespace = None
+        if self.command_stack:
+            args = self.command_stack[0][0]
+            if args[0] not in _ADMIN_COMMANDS and len(args) > 1:
+                namespace = namespace_of(args[1])
+        start = time.perf_counter()
+        try:
+            result = await super().execute(raise_on_error)
+        except (RedisError, OSError) as e:
+            if isinstance(e, _UNAVAILABLE_ERRORS):
+                self.breaker.record_failure()
+            if namespace is not None:
+                duration = time.perf_counter() - start
+                record_cache_operation(namespace, "pipeline", duration, error=True)
+            raise
+        self.breaker.record_success()
+        if namespace is not None:
+            record_cache_operation(namespace, "pipeline", time.perf_counter() - start)
+        return result
+
+
+class _GuardedRedis(Redis):
+    """명령 결과를 서킷 브레이커와 캐시 메트릭(네임스페이스별)에 기록하는 클라이언트"""
+
+    breaker: CircuitBreaker
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        command = args[0]
+        namespace = None
+        if command not in _ADMIN_COMMANDS and len(args) > 1:
+            namespace = namespace_of(args[1])
+        start = time.perf_counter()
+        try:
+            result = await super().execute_command(*args, **options)
+        except (RedisError, OSError) as e:
+            if isinstance(e, _UNAVAILABLE_ERRORS):
+                self.breaker.record_failure()
+            if namespace is not None:
+                duration = time.perf_counter() - start
+                record_cache_operation(namespace, command.lower(), duration, True)
+            raise
+        self.breaker.record_success()
+        if namespace is not None:
+            duration = time.perf_counter() - start
+            record_cache_operation(namespace, command.lower(), duration)
+            _record_lookup(namespace, command, result)
+        return result
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> Pipeline:
+        pipe = _GuardedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipe.breaker = self.breaker
+        return pipe
+
 
 class RedisClient:
-    def __init__(self):
-        self.redis: Optional[redis.Redis] = None
+    """
+    Redis 연결 관리.
+
+    명령은 짧은 연결/읽기 타임아웃으로 빠르게 실패하고 재시도하지 않는다.
+    연속 실패로 서킷이 열리면 cooldown 동안 redis/binary 가 None 을 반환하므로,
+    호출자는 Redis 미연결과 같은 경로(원본 조회)로 바로 넘어간다.
+    """
+
+    def __init__(self, breaker: Optional[CircuitBreaker] = None):
+        self._redis: Optional[_GuardedRedis] = None
+        # 캐시 코덱 값(바이너리) 조회용, 응답을 str 로 디코딩하지 않는 별도 풀
+        self._binary: Optional[_GuardedRedis] = None
+        # pub/sub 수신 전용 (메시지를 기다리며 블로킹하므로 읽기 타임아웃 없음)
+        self._pubsub: Optional[Redis] = None
+        self.breaker = breaker or CircuitBreaker(
+            "redis",
+            failure_threshold=settings.redis_breaker_failure_threshold,
+            cooldown=settings.redis_breaker_cooldown,
+            on_state_change=set_circuit_breaker_state,
+        )
+
+    @property
+    def redis(self) -> Optional[Redis]:
+        """텍스트 응답 클라이언트 (미연결이거나 서킷이 열려 있으면 None)"""
+        if self._redis is None or not self.breaker.allow():
+            return None
+        return self._redis
+
+    @property
+    def binary(self) -> Optional[Redis]:
+        """바이너리 응답 클라이언트 (미연결이거나 서킷이 열려 있으면 None)"""
+        if self._binary is None or not self.breaker.allow():
+            return None
+        return self._binary
+
+    @property
+    def circuit_open(self) -> bool:
+        """연결은 됐지만 서킷이 열려 Redis 를 건너뛰는 중인지"""
+        return self._redis is not None and self.breaker.is_open
+
+    def pubsub(self) -> PubSub:
+        if self._pubsub is None:
+            raise RuntimeError("Redis is not connected")
+        return self._pubsub.pubsub()
 
     async def connect(self):
-        """Redis 연결"""
-        self.redis = redis.from_url(
-            settings.redis_url, encoding="utf-8", decode_responses=True
+        """Redis 연결 (풀 크기/타임아웃/헬스 체크 설정)"""
+        options: Dict[str, Any] = {
+            "max_connections": settings.redis_max_connections,
+            "socket_connect_timeout": settings.redis_socket_connect_timeout,
+            "health_check_interval": settings.redis_health_check_interval,
+            "retry": Retry(NoBackoff(), 0),
+        }
+        self._redis = self._guarded(
+            encoding="utf-8",
+            decode_responses=True,
+            socket_timeout=settings.redis_socket_timeout,
+            **options,
+        )
+        self._binary = self._guarded(
+            decode_responses=False,
+            socket_timeout=settings.redis_socket_timeout,
+            **options,
+        )
+        self._pubsub = redis.from_url(
+            settings.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_keepalive=True,
+            **options,
         )
 
+    def _guarded(self, **options: Any) -> _GuardedRedis:
+        client = _GuardedRedis.from_url(settings.redis_url, **options)
+        client.breaker = self.breaker
+        return client
+
     async def disconnect(self):
         """Redis 연결 해제"""
-        if self.redis:
-            await self.redis.close()
+        for client in (self._redis, self._binary, self._pubsub):
+            if client is not None:
+                await client.close()
+
+    def reset_after_fork(self) -> None:
+        """
+        fork 된 워커에서 부모의 클라이언트를 버린다 (소켓/풀은 부모 것이라 닫지 않음).
+        워커는 lifespan 의 connect() 로 자기 연결을 새로 맺는다.
+        """
+        self._redis = self._binary = self._pubsub = None
 
     async def get(self, key: str) -> Optional[str]:
         """키로 값 조회"""
@@ -28,17 +212,26 @@ class RedisClient:
         return await self.redis.get(key)
 
     async def set(
-        self, key: str, value: Union[str, Dict, List], ex: Optional[int] = None
+        self,
+        key: str,
+        value: Union[str, bytes, Dict, List],
+        ex: Optional[int] = None,
     ) -> bool:
         """키-값 저장"""
         if not self.redis:
             return False
 
         if isinstance(value, (dict, list)):
-            value = json.dumps(value, ensure_ascii=False)
+            value = json_codec.dumps(value)
 
         return await self.redis.set(key, value, ex=ex)
 
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """키로 바이너리 값 조회 (캐시 코덱 값)"""
+        if not self.binary:
+            return None
+        return await self.binary.get(key)
+
     async def delete(self, key: str) -> int:
         """키 삭제"""
         if not self.redis:
@@ -80,3 +273,6 @@ class RedisClient:
 
 # 싱글톤 인스턴스
 redis_client = RedisClient()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=redis_client.reset_after_fork)
@@ -0,0 +1,204 @@
+"""
+거의 바뀌지 않는 참조 데이터(카테고리 등)의 워커 로컬 캐시.
+
+- 워커마다 불변 스냅샷을 들고 있고, Redis 버전 카운터가 바뀔 때만 다시 적재한다
+- 변경한 워커는 버전을 올리고 pub/sub 으로 네임스페이스를 알려 다른 워커가 즉시 stale 처리
+- pub/sub 메시지를 놓쳐도 check_interval 마다 버전을 확인하므로 결국 일치한다
+- Redis 를 쓸 수 없으면 check_interval 을 TTL 삼아 원본에서 다시 적재한다
+- shared(2단 캐시)를 주면 버전별 스냅샷을 Redis 에 공유해, 버전이 바뀌어도
+  원본 재적재는 한 워커만 하고 나머지는 Redis 에서 읽는다
+"""
+
+import asyncio
+import logging
+import time
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+from app.common.cache.redis_client import RedisClient, redis_client
+from app.common.monitoring.metrics import record_cache_lookup
+
+if TYPE_CHECKING:
+    from app.common.cache.two_tier import TwoTierCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INVALIDATION_CHANNEL = "refdata:invalidate"
+
+
+class ReferenceDataCache(Generic[T]):
+    """네임스페이스 하나의 버전 관리 스냅샷"""
+
+    def __init__(
+        self,
+        namespace: str,
+        client: RedisClient,
+        check_interval: float = 30.0,
+        shared: Optional["TwoTierCache[T]"] = None,
+    ) -> None:
+        self.namespace = namespace
+        self.client = client
+        self.check_interval = check_interval
+        self.shared = shared
+        self.version_key = f"refdata:{namespace}:version"
+        self.metric_namespace = f"refdata:{namespace}"
+        self._snapshot: Optional[T] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._stale = True
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    async def get(self, loader: Callable[[], Awaitable[T]]) -> T:
+        """스냅샷 반환 (버전이 바뀌었거나 stale 이면 loader 로 다시 적재)"""
+        if self._is_fresh():
+            record_cache_lookup(self.metric_namespace, "local", 1, 0)
+            return self._snapshot  # type: ignore[return-value]
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._is_fresh():
+                record_cache_lookup(self.metric_namespace, "local", 1, 0)
+                return self._snapshot  # type: ignore[return-value]
+
+            version = await self._remote_version()
+            if (
+                self._snapshot is not None
+                and version is not None
+                and version == self._version
+            ):
+                # 버전 동일 → 재적재 없이 확인 시각만 갱신
+                self._mark_checked()
+                record_cache_lookup(self.metric_namespace, "local", 1, 0)
+                return self._snapshot
+
+            record_cache_lookup(self.metric_namespace, "local", 0, 1)
+            snapshot = await self._load(version, loader)
+            self._snapshot = snapshot
+            self._version = version
+            self._mark_checked()
+            return snapshot
+
+    async def _load(
+        self, version: Optional[int], loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        """공유 스냅샷(버전 키) → 없으면 loader 로 적재 후 공유"""
+        if self.shared is None or version is None:
+            return await loader()
+        key = str(version)
+        snapshot = await self.shared.get(key)
+        if snapshot is None:
+            # 버전 증가는 원본 변경 뒤이므로 지금 읽은 값은 이 버전 이상으로 최신
+            snapshot = await loader()
+            await self.shared.set(key, snapshot)
+        return snapshot
+
+    async def bump_version(self) -> None:
+        """원본 변경 후 호출: 버전 증가 + 다른 워커에 알림"""
+        self.mark_stale()
+        redis = self.client.redis
+        if redis is None:
+            return
+        try:
+            pipe = redis.pipeline(transaction=True)
+            pipe.incr(self.version_key)
+            pipe.publish(INVALIDATION_CHANNEL, self.namespace)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                f"Reference data version bump failed ({self.namespace}): {e}"
+            )
+
+    def mark_stale(self) -> None:
+        self._stale = True
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and not self._stale
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    def _mark_checked(self) -> None:
+        self._checked_at = time.monotonic()
+        self._stale = False
+
+    async def _remote_version(self) -> Optional[int]:
+        redis = self.client.redis
+        if redis is None:
+            return None
+        try:
+            raw_version = await redis.get(self.version_key)
+        except Exception as e:
+            logger.warning(
+                f"Reference data version check failed ({self.namespace}): {e}"
+            )
+            return None
+        return int(raw_version) if raw_version is not None else 0
+
+
+class ReferenceDataRegistry:
+    """참조 데이터 캐시 등록 및 pub/sub 무효화 수신"""
+
+    def __init__(self, client: RedisClient, check_interval: float = 30.0) -> None:
+        self.client = client
+        self.check_interval = check_interval
+        self._caches: Dict[str, ReferenceDataCache] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def register(
+        self, namespace: str, shared: Optional["TwoTierCache[T]"] = None
+    ) -> ReferenceDataCache[T]:
+        if namespace not in self._caches:
+            self._caches[namespace] = ReferenceDataCache(
+                namespace, self.client, self.check_interval, shared
+            )
+        return self._caches[namespace]
+
+    def invalidate_local(self, namespace: str) -> None:
+        cache = self._caches.get(namespace)
+        if cache is not None:
+            cache.mark_stale()
+
+    async def start_listener(self) -> None:
+        if self.client.redis is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.invalidate_local(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 수신이 끊겨도 check_interval 버전 확인으로 일관성 유지
+            logger.warning(f"Reference data listener stopped: {e}")
+        finally:
+            await pubsub.aclose()
+
+
+# 싱글톤 인스턴스
+reference_data = ReferenceDataRegistry(redis_client)
@@ -0,0 +1,366 @@
+"""
+2단 캐시: 워커 로컬 L1 (LRU + TTL) → Redis L2 (CacheCodec 바이너리 값).
+
+- 조회는 L1 → L2(MGET 한 번) 순서, L2 적중 값은 L1 에 채운다
+- L1 은 네임스페이스마다 최대 항목 수와 TTL 을 두고, 넘치면 가장 오래 안 쓴 항목부터 버린다
+- 쓰기 경로는 invalidate 로 L2 키를 짧은 TTL 의 툼스톤으로 덮고 pub/sub 으로 알려 모든
+  워커의 L1 항목을 버린다
+- 읽기 채움(set)은 SET NX 로만 L2 에 쓰고 알리지 않는다. 무효화 전에 원본을 읽은 요청이
+  늦게 채워도 툼스톤이 남아 있는 동안은 저장되지 않아 옛 값이 되살아나지 않는다
+  (curriculum:detail 캐시와 같은 방식). 메시지를 놓친 워커의 L1 은 TTL 까지만 stale 하다
+- Redis 를 쓸 수 없으면 L1 만으로 동작한다 (TTL 이 일관성 상한)
+- Redis 서킷이 열려 있는 동안은 만료됐어도 stale_ttl 이내의 L1 값을 그대로 쓴다
+
+L1 값은 워커 안에서 공유되는 객체이므로 호출자는 반환값을 변경하지 않는다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from app.common.cache.codec import CacheCodec
+from app.common.cache.redis_client import RedisClient, redis_client
+from app.common.monitoring.metrics import (
+    record_cache_lookup,
+    record_two_tier_eviction,
+    record_two_tier_invalidation,
+    set_two_tier_l1_entries,
+)
+from app.common.serialization.codec import json_codec
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+# 무효화된 L2 키 값 (조회 시 미스, 채움은 만료될 때까지 막힘)
+TOMBSTONE = b"-"
+
+
+class LocalCache(Generic[T]):
+    """
+    워커 로컬 LRU + TTL 캐시 (이벤트 루프 단일 스레드에서만 사용, 락 없음).
+    만료된 항목은 stale_ttl 동안 남겨 두고 allow_stale 조회에만 돌려준다.
+    """
+
+    def __init__(self, max_size: int, ttl: float, stale_ttl: float = 0.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, Tuple[float, float, T]]" = OrderedDict()
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[T]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        fresh_until, stale_until, value = entry
+        now = time.monotonic()
+        if now >= fresh_until:
+            if now >= stale_until:
+                del self._entries[key]
+                return None
+            if not allow_stale:
+                return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: T) -> int:
+        """저장 후 크기 제한으로 밀려난 항목 수 반환"""
+        if self.max_size <= 0:
+            return 0
+        fresh_until = time.monotonic() + self.ttl
+        self._entries[key] = (fresh_until, fresh_until + self.stale_ttl, value)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierCache(Generic[T]):
+    """네임스페이스 하나의 L1 + L2 캐시 (Redis 키는 {namespace}:{key})"""
+
+    def __init__(
+        self,
+        namespace: str,
+        client: RedisClient,
+        codec: CacheCodec[T],
+        l1_size: int,
+        l1_ttl: float,
+        l2_ttl: Optional[int],
+        registry: Optional["TwoTierCacheRegistry"] = None,
+        l1_stale_ttl: float = 0.0,
+        tombstone_ttl: int = 5,
+    ) -> None:
+        self.namespace = namespace
+        self.client = client
+        self.codec = codec
+        self.l2_ttl = l2_ttl
+        self.tombstone_ttl = tombstone_ttl
+        self.registry = registry
+        self.local: LocalCache[T] = LocalCache(l1_size, l1_ttl, l1_stale_ttl)
+
+    def redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[T]:
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, T]:
+        """
+        적중한 키만 담은 dict (L1 미스는 MGET 한 번으로 L2 조회).
+        서킷이 열려 있으면 만료된 L1 값도 돌려주고 L2 는 건너뛴다.
+        """
+        allow_stale = self.client.circuit_open
+        found: Dict[str, T] = {}
+        missing: List[str] = []
+        for key in keys:
+            value = self.local.get(key, allow_stale)
+            if value is not None:
+                found[key] = value
+            else:
+                missing.append(key)
+        tier = "l1_stale" if allow_stale else "l1"
+        record_cache_lookup(self.namespace, tier, len(found), len(missing))
+        if not missing or allow_stale:
+            return found
+
+        # L2 적중/미스는 RedisClient 가 tier="redis" 로 기록
+        l2_found: Dict[str, T] = {}
+        for key, raw in zip(missing, await self._mget(missing)):
+            if raw == TOMBSTONE:
+                continue
+            value = self.codec.decode(raw)
+            if value is not None:
+                l2_found[key] = value
+        self._fill_local(l2_found)
+        found.update(l2_found)
+        return found
+
+    async def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
+        await self.set_many({key: value}, ttl)
+
+    async def set_many(self, values: Dict[str, T], ttl: Optional[int] = None) -> None:
+        """
+        원본에서 읽은 값 채우기 (다른 워커에는 알리지 않음).
+        L2 는 SET NX 로 쓰고, L1 에는 L2 에 저장된 값만 채운다. 툼스톤이나 다른
+        요청이 먼저 채운 값이 있으면 이 값이 더 오래됐을 수 있으므로 버린다.
+        """
+        if not values:
+            return
+        binary = self.client.binary
+        if binary is None:
+            self._fill_local(values)
+            return
+        try:
+            pipe = binary.pipeline(transaction=False)
+            expire = ttl or self.l2_ttl
+            for key, value in values.items():
+                pipe.set(
+                    self.redis_key(key), self.codec.encode(value), ex=expire, nx=True
+                )
+            stored = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Two-tier cache write failed ({self.namespace}): {e}")
+            self._fill_local(values)
+            return
+        self._fill_local(
+            {key: value for (key, value), ok in zip(values.items(), stored) if ok}
+        )
+
+    async def invalidate(self, keys: Iterable[str]) -> None:
+        """쓰기 경로: L1 에서 지우고 L2 는 툼스톤으로 덮은 뒤 다른 워커의 L1 에도 알림"""
+        targets = list(keys)
+        if not targets:
+            return
+        self.invalidate_local(targets)
+        record_two_tier_invalidation(self.namespace, "local")
+        binary = self.client.binary
+        if binary is None:
+            return
+        try:
+            pipe = binary.pipeline(transaction=False)
+            for key in targets:
+                pipe.set(self.redis_key(key), TOMBSTONE, ex=self.tombstone_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Two-tier cache delete failed ({self.namespace}): {e}")
+        if self.registry is not None:
+            await self.registry.publish(self.namespace, targets)
+
+    def invalidate_local(self, keys: Optional[Iterable[str]] = None) -> None:
+        """이 워커의 L1 항목 제거 (keys 가 None 이면 네임스페이스 전체)"""
+        if keys is None:
+            self.local.clear()
+        else:
+            for key in keys:
+                self.local.delete(key)
+        set_two_tier_l1_entries(self.namespace, len(self.local))
+
+    def _fill_local(self, values: Dict[str, T]) -> None:
+        if not values:
+            return
+        evicted = sum(self.local.set(key, value) for key, value in values.items())
+        if evicted:
+            record_two_tier_eviction(self.namespace, evicted)
+        set_two_tier_l1_entries(self.namespace, len(self.local))
+
+    async def _mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        binary = self.client.binary
+        if binary is None:
+            return [None] * len(keys)
+        try:
+            return await binary.mget([self.redis_key(k) for k in keys])
+        except Exception as e:
+            logger.warning(f"Two-tier cache read failed ({self.namespace}): {e}")
+            return [None] * len(keys)
+
+
+class TwoTierCacheRegistry:
+    """2단 캐시 등록 및 pub/sub 무효화 송수신 (워커마다 하나)"""
+
+    def __init__(
+        self,
+        client: RedisClient,
+        default_l1_size: int = 1000,
+        default_l1_ttl: float = 30.0,
+        l1_sizes: Optional[Dict[str, int]] = None,
+        l1_stale_ttl: float = 0.0,
+    ) -> None:
+        self.client = client
+        self.default_l1_size = default_l1_size
+        self.default_l1_ttl = default_l1_ttl
+        self.l1_stale_ttl = l1_stale_ttl
+        self.l1_sizes = l1_sizes or {}
+        # 자기 워커가 보낸 메시지는 무시 (L1 은 이미 비움)
+        self.sender = uuid.uuid4().hex
+        self._caches: Dict[str, TwoTierCache] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        namespace: str,
+        codec: CacheCodec[T],
+        l1_size: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        l2_ttl: Optional[int] = None,
+    ) -> TwoTierCache[T]:
+        """
+        네임스페이스 캐시 등록 (같은 이름이면 기존 인스턴스 반환).
+        L1 크기는 설정(cache_l1_sizes) > l1_size 인자 > 기본값 순으로 정한다.
+        """
+        if namespace not in self._caches:
+            size = self.l1_sizes.get(namespace, l1_size)
+            self._caches[namespace] = TwoTierCache(
+                namespace,
+                self.client,
+                codec,
+                l1_size=self.default_l1_size if size is None else size,
+                l1_ttl=self.default_l1_ttl if l1_ttl is None else l1_ttl,
+                l2_ttl=l2_ttl,
+                registry=self,
+                l1_stale_ttl=self.l1_stale_ttl,
+            )
+        return self._caches[namespace]
+
+    async def publish(self, namespace: str, keys: Optional[List[str]]) -> None:
+        redis = self.client.redis
+        if redis is None:
+            return
+        message = json_codec.dumps({"s": self.sender, "n": namespace, "k": keys})
+        try:
+            await redis.publish(INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.warning(f"Two-tier cache invalidation publish failed: {e}")
+
+    def handle_message(self, data: str | bytes) -> None:
+        """다른 워커의 무효화 메시지 적용"""
+        try:
+            message = json_codec.loads(data)
+            sender, namespace, keys = message["s"], message["n"], message["k"]
+        except Exception as e:
+            logger.warning(f"Invalid two-tier cache invalidation message: {e}")
+            return
+        cache = self._caches.get(namespace)
+        if sender == self.sender or cache is None:
+            return
+        cache.invalidate_local(keys)
+        record_two_tier_invalidation(namespace, "remote")
+
+    def reset_after_fork(self) -> None:
+        """
+        fork 된 워커에서 호출: 송신자 ID 를 새로 만들고 L1 과 리스너 참조를 버린다.
+        ID 를 부모와 공유하면 워커끼리 서로의 무효화 메시지를 자기 것으로 보고 무시한다.
+        """
+        self.sender = uuid.uuid4().hex
+        self._listener = None
+        for cache in self._caches.values():
+            cache.local.clear()
+
+    async def start_listener(self) -> None:
+        if self.client.redis is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        """수신이 끊기면 잠시 뒤 다시 구독 (그동안 놓친 메시지 대신 L1 을 비움)"""
+        reconnecting = False
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                if reconnecting:
+                    for cache in self._caches.values():
+                        cache.invalidate_local()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 다시 구독할 때까지 L1 은 TTL 까지만 stale
+                logger.warning(f"Two-tier cache listener disconnected: {e}")
+            finally:
+                await pubsub.aclose()
+            reconnecting = True
+            await asyncio.sleep(self.client.breaker.cooldown)
+
+
+_settings = get_settings()
+
+# 싱글톤 인스턴스
+two_tier_caches = TwoTierCacheRegistry(
+    redis_client,
+    default_l1_size=_settings.cache_l1_size,
+    default_l1_ttl=_settings.cache_l1_ttl,
+    l1_sizes=_settings.cache_l1_sizes,
+    l1_stale_ttl=_settings.cache_l1_stale_ttl,
+)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=two_tier_caches.reset_after_fork)
@@ -1,3 +1,5 @@
+import os
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # type: ignore
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.orm import declarative_base
@@ -18,6 +20,12 @@ engine: AsyncEngine = create_async_engine(
     connect_args={"charset": "utf8mb4"},
 )
 
+if hasattr(os, "register_at_fork"):
+    # fork 된 워커는 부모 풀의 연결을 닫지 않고 버린 뒤 자기 연결을 새로 맺는다
+    os.register_at_fork(
+        after_in_child=lambda: engine.sync_engine.dispose(close=False)
+    )
+
 AsyncSessionLocal = async_sessionmaker(  # type: ignore
     bind=engine,
     expire_on_commit=False,
@@ -10,3 +10,4 @@ import app.modules.social.infrastructure.db_model.like  # type: ignore  # noqa:
 import app.modules.social.infrastructure.db_model.comment  # type: ignore  # noqa: F401
 import app.modules.social.infrastructure.db_model.bookmark  # type: ignore  # noqa: F401
 import app.modules.social.infrastructure.db_model.follow  # type: ignore  # noqa: F401
+import app.modules.feed.infrastructure.db_model.curriculum_search  # type: ignore  # noqa: F401
@@ -0,0 +1,39 @@
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+_Default = Tuple[str, Any, Optional[Callable[[], Any]]]
+_Defaults = Tuple[_Default, ...]
+_defaults_cache: Dict[type, _Defaults] = {}
+
+
+def hydrate(cls: Type[T], **values: Any) -> T:
+    """
+    저장소 전용: DB 에서 읽은 값으로 dataclass 엔티티를 만든다.
+
+    저장 전에 도메인 생성자/메서드에서 이미 검증된 값이므로 __init__/__post_init__
+    검증을 건너뛴다. 생략한 필드는 dataclass 기본값으로 채운다.
+    사용자 입력에는 절대 쓰지 않는다.
+    """
+    obj = object.__new__(cls)
+    state = obj.__dict__
+    state.update(values)
+    for name, default, factory in _field_defaults(cls):
+        if name not in values:
+            state[name] = factory() if factory is not None else default
+    return obj
+
+
+def _field_defaults(cls: type) -> _Defaults:
+    defaults = _defaults_cache.get(cls)
+    if defaults is None:
+        result: List[_Default] = []
+        for f in fields(cls):
+            if f.default is not MISSING:
+                result.append((f.name, f.default, None))
+            elif f.default_factory is not MISSING:
+                result.append((f.name, None, f.default_factory))
+        defaults = tuple(result)
+        _defaults_cache[cls] = defaults
+    return defaults
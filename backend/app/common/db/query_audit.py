@@ -0,0 +1,632 @@
+"""
+Repository 쿼리 실행계획(EXPLAIN) 점검 도구
+
+시드 데이터를 채운 DB에서 각 Repository 의 목록/카운트 메서드를 실제로 실행하고,
+그 과정에서 발생한 SELECT 문마다 실행계획을 수집해 풀스캔과 filesort 를 표시한다.
+
+사용법:
+    # SQLite 메모리 DB (스키마 생성 + 시드 자동)
+    python -m app.common.db.query_audit
+
+    # compose MySQL (alembic upgrade head 이후, 시드는 트랜잭션 롤백으로 정리됨)
+    python -m app.common.db.query_audit --url mysql+aiomysql://user:pw@localhost/db
+
+    # 경고가 하나라도 있으면 exit code 1
+    python -m app.common.db.query_audit --strict
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import warnings
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+from ulid import ULID  # type: ignore
+
+from app.common.db.database import Base
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.modules.admin.infrastructure.repository.admin_curriculum_repository import (
+    AdminCurriculumRepository,
+)
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
+    CurriculumRepository,
+)
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.modules.learning.infrastructure.db_model.feedback import FeedbackModel
+from app.modules.learning.infrastructure.db_model.summary import SummaryModel
+from app.modules.learning.infrastructure.repository.feedback_repo import (
+    FeedbackRepository,
+)
+from app.modules.learning.infrastructure.repository.summary_repo import (
+    SummaryRepository,
+)
+from app.modules.social.infrastructure.db_model.bookmark import BookmarkModel
+from app.modules.social.infrastructure.db_model.comment import CommentModel
+from app.modules.social.infrastructure.db_model.follow import FollowModel
+from app.modules.social.infrastructure.db_model.like import LikeModel
+from app.modules.social.infrastructure.repository.bookmark_repo import (
+    BookmarkRepository,
+)
+from app.modules.social.infrastructure.repository.comment_repo import (
+    CommentRepository,
+)
+from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.social.infrastructure.repository.like_repo import LikeRepository
+from app.modules.taxonomy.infrastructure.db_model.category import CategoryModel
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumCategoryModel,
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.taxonomy.infrastructure.repository.cached_category_repo import (
+    category_reference_data,
+    load_category_snapshot,
+)
+from app.modules.taxonomy.infrastructure.repository.category_repo import (
+    CategoryRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
+    CurriculumCategoryRepository,
+    CurriculumTagRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_repo import TagRepository
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+from app.modules.user.infrastructure.repository.user_repo import UserRepository
+
+DEFAULT_URL = "sqlite+aiosqlite:///:memory:"
+
+FULL_SCAN = "full_scan"
+FILESORT = "filesort"
+TEMPORARY = "temporary"
+
+_SQLITE_SCAN_RE = re.compile(r"^SCAN (\w+)$")
+_ALIAS_SUFFIX_RE = re.compile(r"_\d+$")
+
+
+@dataclass(frozen=True)
+class PlanIssue:
+    """실행계획에서 발견된 경고"""
+
+    kind: str
+    table: str
+    detail: str
+
+
+@dataclass
+class AuditResult:
+    """하나의 SELECT 문에 대한 점검 결과"""
+
+    label: str
+    statement: str
+    plan: List[str] = field(default_factory=list)
+    issues: List[PlanIssue] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class SeedIds:
+    """점검 쿼리에 넘길 시드 데이터 식별자"""
+
+    user_id: str
+    other_user_id: str
+    curriculum_id: str
+    summary_id: str
+    tag_id: str
+    tag_name: str
+    category_id: str
+    since: datetime
+
+
+def analyze_sqlite_plan(
+    details: Sequence[str], table_names: Sequence[str]
+) -> List[PlanIssue]:
+    """SQLite EXPLAIN QUERY PLAN 의 detail 목록을 분석"""
+    issues: List[PlanIssue] = []
+    for detail in details:
+        scan = _SQLITE_SCAN_RE.match(detail.strip())
+        if scan:
+            # joinedload 별칭(users_1 등)은 원래 테이블 이름으로 되돌린다
+            table = _ALIAS_SUFFIX_RE.sub("", scan.group(1))
+            if table in table_names:
+                issues.append(PlanIssue(FULL_SCAN, table, detail))
+        elif "USE TEMP B-TREE" in detail:
+            kind = FILESORT if "ORDER BY" in detail else TEMPORARY
+            issues.append(PlanIssue(kind, "", detail))
+    return issues
+
+
+def analyze_mysql_plan(rows: Sequence[Mapping[str, Any]]) -> List[PlanIssue]:
+    """MySQL EXPLAIN 결과 행을 분석"""
+    issues: List[PlanIssue] = []
+    for row in rows:
+        table = str(row.get("table") or "")
+        extra = str(row.get("Extra") or "")
+        # <derived2>, <subquery3> 같은 파생 테이블은 원본 쿼리에서 이미 점검된다
+        if row.get("type") == "ALL" and not table.startswith("<"):
+            issues.append(
+                PlanIssue(FULL_SCAN, table, f"type=ALL rows={row.get('rows')}")
+            )
+        if "Using filesort" in extra:
+            issues.append(PlanIssue(FILESORT, table, extra))
+        if "Using temporary" in extra:
+            issues.append(PlanIssue(TEMPORARY, table, extra))
+    return issues
+
+
+class _StatementRecorder:
+    """엔진에서 실행되는 SELECT 문과 파라미터를 라벨별로 기록"""
+
+    def __init__(self) -> None:
+        self.label: Optional[str] = None
+        self.statements: Dict[str, List[tuple[str, Any]]] = {}
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if self.label is None or not statement.lstrip().upper().startswith("SELECT"):
+            return
+        captured = self.statements.setdefault(self.label, [])
+        if all(statement != seen for seen, _ in captured):
+            captured.append((statement, parameters))
+
+
+AuditTarget = Callable[[AsyncSession, SeedIds], Awaitable[Any]]
+
+# (라벨, 실행 함수) - Repository 의 목록/카운트 조회 경로
+AUDIT_TARGETS: List[tuple[str, AuditTarget]] = [
+    # curriculum
+    (
+        "curriculum.find_by_owner_id",
+        lambda s, ids: CurriculumRepository(s).find_by_owner_id(ids.user_id),
+    ),
+    (
+        "curriculum.find_public_curriculums",
+        lambda s, ids: CurriculumRepository(s).find_public_curriculums(),
+    ),
+    (
+        "curriculum.find_public_curriculums_by_users",
+        lambda s, ids: CurriculumRepository(s).find_public_curriculums_by_users(
+            [ids.user_id, ids.other_user_id]
+        ),
+    ),
+    (
+        "curriculum.find_public_curriculums_followed_by",
+        lambda s, ids: CurriculumRepository(s).find_public_curriculums_followed_by(
+            ids.user_id
+        ),
+    ),
+    (
+        "admin.find_brief_page",
+        lambda s, ids: AdminCurriculumRepository(s).find_brief_page(
+            page=1, items_per_page=10, owner_id=None
+        ),
+    ),
+    (
+        "admin.find_brief_page_by_owner",
+        lambda s, ids: AdminCurriculumRepository(s).find_brief_page(
+            page=1, items_per_page=10, owner_id=ids.user_id
+        ),
+    ),
+    # 카테고리 참조 데이터 스냅샷 적재 (워커당 버전 변경 시 1회, 피드는 이후 스냅샷 사용)
+    (
+        "category.reference_snapshot",
+        lambda s, ids: category_reference_data.get(
+            lambda: load_category_snapshot(CategoryRepository(s))
+        ),
+    ),
+    (
+        "feed.get_public_feed",
+        lambda s, ids: FeedRepository(s).get_public_feed(FeedFilter()),
+    ),
+    (
+        "feed.get_public_feed_by_category",
+        lambda s, ids: FeedRepository(s).get_public_feed(
+            FeedFilter(category_id=ids.category_id)
+        ),
+    ),
+    (
+        "feed.find_following_entries",
+        lambda s, ids: FeedRepository(s).find_following_entries(ids.user_id, [], 500),
+    ),
+    # learning
+    (
+        "summary.find_by_curriculum_and_week",
+        lambda s, ids: SummaryRepository(s).find_by_curriculum_and_week(
+            ids.curriculum_id, 1
+        ),
+    ),
+    (
+        "summary.find_by_curriculum",
+        lambda s, ids: SummaryRepository(s).find_by_curriculum(ids.curriculum_id),
+    ),
+    (
+        "summary.find_by_user",
+        lambda s, ids: SummaryRepository(s).find_by_user(ids.user_id),
+    ),
+    (
+        "summary.count_by_user_since",
+        lambda s, ids: SummaryRepository(s).count_by_user_since(ids.user_id, ids.since),
+    ),
+    (
+        "feedback.find_by_summary_id",
+        lambda s, ids: FeedbackRepository(s).find_by_summary_id(ids.summary_id),
+    ),
+    (
+        "feedback.find_by_curriculum",
+        lambda s, ids: FeedbackRepository(s).find_by_curriculum(ids.curriculum_id),
+    ),
+    (
+        "feedback.find_by_user",
+        lambda s, ids: FeedbackRepository(s).find_by_user(ids.user_id),
+    ),
+    (
+        "feedback.count_by_user_since",
+        lambda s, ids: FeedbackRepository(s).count_by_user_since(
+            ids.user_id, ids.since
+        ),
+    ),
+    # social
+    (
+        "follow.find_followers",
+        lambda s, ids: FollowRepository(s).find_followers(ids.user_id),
+    ),
+    (
+        "follow.find_followees",
+        lambda s, ids: FollowRepository(s).find_followees(ids.user_id),
+    ),
+    (
+        "follow.get_follow_suggestions",
+        lambda s, ids: FollowRepository(s).get_follow_suggestions(ids.user_id),
+    ),
+    (
+        "follow.count_second_degree",
+        lambda s, ids: FollowRepository(s).count_second_degree([ids.user_id]),
+    ),
+    (
+        "like.find_by_curriculum",
+        lambda s, ids: LikeRepository(s).find_by_curriculum(ids.curriculum_id),
+    ),
+    ("like.find_by_user", lambda s, ids: LikeRepository(s).find_by_user(ids.user_id)),
+    (
+        "bookmark.find_by_user",
+        lambda s, ids: BookmarkRepository(s).find_by_user(ids.user_id),
+    ),
+    (
+        "comment.find_by_curriculum",
+        lambda s, ids: CommentRepository(s).find_by_curriculum(ids.curriculum_id),
+    ),
+    (
+        "comment.find_by_user",
+        lambda s, ids: CommentRepository(s).find_by_user(ids.user_id),
+    ),
+    # taxonomy
+    ("tag.find_popular_tags", lambda s, ids: TagRepository(s).find_popular_tags()),
+    (
+        "curriculum_tag.find_tag_ids_by_owners",
+        lambda s, ids: CurriculumTagRepository(s).find_tag_ids_by_owners([ids.user_id]),
+    ),
+    ("tag.find_all", lambda s, ids: TagRepository(s).find_all()),
+    (
+        "curriculum_tag.find_tags_by_curriculum",
+        lambda s, ids: CurriculumTagRepository(s).find_tags_by_curriculum(
+            ids.curriculum_id
+        ),
+    ),
+    (
+        "curriculum_tag.find_curriculums_by_tag",
+        lambda s, ids: CurriculumTagRepository(s).find_curriculums_by_tag(ids.tag_id),
+    ),
+    (
+        "curriculum_tag.find_curriculums_by_tag_names",
+        lambda s, ids: CurriculumTagRepository(s).find_curriculums_by_tag_names(
+            [ids.tag_name]
+        ),
+    ),
+    (
+        "curriculum_category.find_curriculums_by_category",
+        lambda s, ids: CurriculumCategoryRepository(s).find_curriculums_by_category(
+            ids.category_id
+        ),
+    ),
+    (
+        "category.find_all_active",
+        lambda s, ids: CategoryRepository(s).find_all_active(),
+    ),
+    # user
+    ("user.find_users", lambda s, ids: UserRepository(s).find_users()),
+]
+
+
+def _id() -> str:
+    return ULID().generate()
+
+
+async def seed(session: AsyncSession, rows: int) -> SeedIds:
+    """점검용 시드 데이터 삽입 (commit 하지 않고 flush 만 수행)"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    user_count = max(rows // 10, 2)
+
+    users = [
+        UserModel(  # type: ignore
+            id=_id(),
+            email=f"audit{i}@example.com",
+            name=f"audit{i}",
+            password="hashed_password",
+            role=RoleVO.USER,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(user_count)
+    ]
+    categories = [
+        CategoryModel(  # type: ignore
+            id=_id(),
+            name=f"category {i}",
+            color="#336699",
+            sort_order=i,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(10)
+    ]
+    tags = [
+        TagModel(  # type: ignore
+            id=_id(),
+            name=f"tag{i}",
+            usage_count=i,
+            created_by=users[i % user_count].id,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(max(rows // 5, 1))
+    ]
+    session.add_all(users + categories + tags)
+    await session.flush()
+
+    curriculums: List[CurriculumModel] = []
+    children: List[Any] = []
+    for i in range(rows):
+        owner = users[i % user_count]
+        created_at = now - timedelta(minutes=i)
+        curriculum = CurriculumModel(  # type: ignore
+            id=_id(),
+            user_id=owner.id,
+            title=f"audit curriculum {i}",
+            visibility="PUBLIC" if i % 2 == 0 else "PRIVATE",
+            total_weeks=4,
+            total_lessons=8,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        curriculums.append(curriculum)
+        for week in range(1, 5):
+            children.append(
+                WeekScheduleModel(  # type: ignore
+                    curriculum_id=curriculum.id,
+                    week_number=week,
+                    lessons=[f"lesson {week}-1", f"lesson {week}-2"],
+                )
+            )
+        tag = tags[i % len(tags)]
+        children.append(
+            CurriculumTagModel(  # type: ignore
+                id=f"{curriculum.id}_{tag.id}",
+                curriculum_id=curriculum.id,
+                tag_id=tag.id,
+                added_by=owner.id,
+                created_at=created_at,
+            )
+        )
+        children.append(
+            CurriculumCategoryModel(  # type: ignore
+                id=f"{curriculum.id}_{categories[i % 10].id}",
+                curriculum_id=curriculum.id,
+                category_id=categories[i % 10].id,
+                assigned_by=owner.id,
+                created_at=created_at,
+            )
+        )
+    session.add_all(curriculums)
+    await session.flush()
+    session.add_all(children)
+    await session.flush()
+
+    summaries: List[SummaryModel] = []
+    social: List[Any] = []
+    for i, curriculum in enumerate(curriculums):
+        reader = users[(i + 1) % user_count]
+        summaries.append(
+            SummaryModel(  # type: ignore
+                id=_id(),
+                curriculum_id=curriculum.id,
+                week_number=(i % 4) + 1,
+                content="audit summary " * 10,
+                owner_id=curriculum.user_id,
+                created_at=curriculum.created_at,
+                updated_at=curriculum.created_at,
+            )
+        )
+        for model in (LikeModel, BookmarkModel):
+            social.append(
+                model(  # type: ignore
+                    id=_id(),
+                    curriculum_id=curriculum.id,
+                    user_id=reader.id,
+                    created_at=curriculum.created_at,
+                )
+            )
+        social.append(
+            CommentModel(  # type: ignore
+                id=_id(),
+                curriculum_id=curriculum.id,
+                user_id=reader.id,
+                content="audit comment",
+                created_at=curriculum.created_at,
+                updated_at=curriculum.created_at,
+            )
+        )
+    for i, follower in enumerate(users):
+        for step in (1, 2, 3):
+            followee = users[(i + step) % user_count]
+            if followee.id == follower.id:
+                continue
+            social.append(
+                FollowModel(  # type: ignore
+                    id=_id(),
+                    follower_id=follower.id,
+                    followee_id=followee.id,
+                    created_at=now - timedelta(minutes=i),
+                )
+            )
+    session.add_all(summaries)
+    await session.flush()
+    feedbacks = [
+        FeedbackModel(  # type: ignore
+            id=_id(),
+            summary_id=summary.id,
+            comment="audit feedback",
+            score=float(i % 10),
+            created_at=summary.created_at,
+            updated_at=summary.created_at,
+        )
+        for i, summary in enumerate(summaries)
+    ]
+    session.add_all(social + feedbacks)
+    await session.flush()
+
+    return SeedIds(
+        user_id=users[0].id,
+        other_user_id=users[1].id,
+        curriculum_id=curriculums[0].id,
+        summary_id=summaries[0].id,
+        tag_id=tags[0].id,
+        tag_name=tags[0].name,
+        category_id=categories[0].id,
+        since=now - timedelta(days=7),
+    )
+
+
+async def _explain(
+    session: AsyncSession, dialect: str, statement: str, parameters: Any
+) -> tuple[List[str], List[PlanIssue]]:
+    conn = await session.connection()
+    if dialect == "sqlite":
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        details = [str(row[-1]) for row in result.fetchall()]
+        return details, analyze_sqlite_plan(details, list(Base.metadata.tables))
+
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    rows = [dict(row) for row in result.mappings().all()]
+    plan = [
+        f"{row.get('table')}: type={row.get('type')} key={row.get('key')} "
+        f"rows={row.get('rows')} extra={row.get('Extra')}"
+        for row in rows
+    ]
+    return plan, analyze_mysql_plan(rows)
+
+
+async def run_audit(
+    url: str = DEFAULT_URL,
+    rows: int = 500,
+    targets: Optional[List[tuple[str, AuditTarget]]] = None,
+) -> List[AuditResult]:
+    """시드 → Repository 쿼리 실행 → 실행계획 수집. 시드 데이터는 마지막에 롤백된다."""
+    is_sqlite = url.startswith("sqlite")
+    engine: AsyncEngine = create_async_engine(
+        url,
+        poolclass=StaticPool if is_sqlite else None,  # type: ignore[arg-type]
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+    recorder = _StatementRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+
+    results: List[AuditResult] = []
+    try:
+        if is_sqlite:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+        async with session_factory() as session:
+            try:
+                ids = await seed(session, rows)
+                # 프로세스 로컬 스냅샷은 시드 데이터 기준으로 다시 적재
+                category_reference_data.mark_stale()
+                for label, target in targets or AUDIT_TARGETS:
+                    recorder.label = label
+                    await target(session, ids)
+                recorder.label = None
+
+                for label, statements in recorder.statements.items():
+                    for statement, parameters in statements:
+                        plan, issues = await _explain(
+                            session, engine.dialect.name, statement, parameters
+                        )
+                        results.append(AuditResult(label, statement, plan, issues))
+            finally:
+                await session.rollback()
+                category_reference_data.mark_stale()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", recorder)
+        await engine.dispose()
+    return results
+
+
+def format_report(results: List[AuditResult], verbose: bool = False) -> str:
+    lines: List[str] = []
+    for result in results:
+        status = "WARN" if result.issues else "OK"
+        lines.append(f"[{status:4}] {result.label}")
+        if not (result.issues or verbose):
+            continue
+        lines.append(f"       {' '.join(result.statement.split())[:200]}")
+        for step in result.plan:
+            lines.append(f"         | {step}")
+        for issue in result.issues:
+            lines.append(f"         ! {issue.kind} {issue.table} ({issue.detail})")
+    flagged = sum(1 for result in results if result.issues)
+    lines.append(f"\n{len(results)} statements, {flagged} flagged")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Repository 쿼리 실행계획 점검")
+    parser.add_argument("--url", default=DEFAULT_URL, help="SQLAlchemy async URL")
+    parser.add_argument("--rows", type=int, default=500, help="시드 커리큘럼 수")
+    parser.add_argument("--verbose", action="store_true", help="모든 실행계획 출력")
+    parser.add_argument(
+        "--strict", action="store_true", help="경고가 있으면 exit code 1"
+    )
+    args = parser.parse_args(argv)
+
+    # 관계 설정 중복 경고는 점검 결과와 무관하므로 출력하지 않는다
+    warnings.filterwarnings("ignore", category=SAWarning)
+    results = asyncio.run(run_audit(args.url, args.rows))
+    print(format_report(results, verbose=args.verbose))
+    if args.strict and any(result.issues for result in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+중복 키를 무시하는 다중 행 INSERT 헬퍼.
+
+같은 유니크 키를 동시에 INSERT 하는 요청이 겹쳐도 IntegrityError 없이
+한 쪽만 반영되도록, 방언별 "충돌 시 무시" 구문으로 한 번에 삽입한다.
+- MySQL: INSERT ... ON DUPLICATE KEY UPDATE <pk> = <pk> (no-op)
+- SQLite/PostgreSQL: INSERT ... ON CONFLICT DO NOTHING
+
+INSERT IGNORE 는 FK 위반 같은 다른 오류까지 경고로 삼켜버리므로 사용하지 않는다.
+"""
+
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import Insert, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def build_insert_ignore_duplicates(
+    dialect_name: str, model: Type[Any], rows: List[Dict[str, Any]]
+) -> Insert:
+    """방언에 맞는 '중복 시 무시' 다중 행 INSERT 문 생성"""
+    if dialect_name == "mysql":
+        stmt = mysql_insert(model).values(rows)
+        pk = model.__table__.primary_key.columns.values()[0]
+        # 기존 행의 PK 를 자기 자신으로 갱신 → 실제 변경 없음
+        return stmt.on_duplicate_key_update({pk.name: pk})
+    if dialect_name == "sqlite":
+        return sqlite_insert(model).values(rows).on_conflict_do_nothing()
+    if dialect_name == "postgresql":
+        return postgresql_insert(model).values(rows).on_conflict_do_nothing()
+    return insert(model).values(rows)
+
+
+async def insert_ignore_duplicates(
+    session: AsyncSession, model: Type[Any], rows: List[Dict[str, Any]]
+) -> None:
+    """rows 를 한 문장으로 INSERT 하고 유니크 키 충돌 행은 건너뛴다 (commit 하지 않음)"""
+    if not rows:
+        return
+    dialect_name = session.get_bind().dialect.name
+    await session.execute(build_insert_ignore_duplicates(dialect_name, model, rows))
@@ -1,7 +1,9 @@
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import os
-from langfuse.langchain import CallbackHandler
+
+if TYPE_CHECKING:
+    from langfuse.langchain import CallbackHandler
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +12,7 @@ class LangfuseManager:
     """Langfuse v3 연동 관리 클래스"""
 
     _instance: Optional["LangfuseManager"] = None
-    _callback_handler: Optional[CallbackHandler] = None
+    _callback_handler: Optional["CallbackHandler"] = None
 
     def __new__(cls) -> "LangfuseManager":
         if cls._instance is None:
@@ -63,6 +65,9 @@ class LangfuseManager:
                 os.environ["LANGFUSE_PUBLIC_KEY"] = public_key
                 os.environ["LANGFUSE_HOST"] = host
 
+                # langfuse 는 키가 있을 때만 import (없으면 SDK 로딩 비용 없음)
+                from langfuse.langchain import CallbackHandler
+
                 # v3에서는 환경변수만 있으면 자동으로 연결
                 self._callback_handler = CallbackHandler()
 
@@ -82,7 +87,7 @@ class LangfuseManager:
             logger.warning("🔥 Langfuse keys not provided or invalid format")
 
     @property
-    def callback_handler(self) -> Optional[CallbackHandler]:
+    def callback_handler(self) -> Optional["CallbackHandler"]:
         """콜백 핸들러 반환"""
         return self._callback_handler
 
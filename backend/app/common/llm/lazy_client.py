@@ -0,0 +1,73 @@
+"""
+무거운 LLM 클라이언트를 첫 호출 때 만드는 지연 프록시.
+
+LangChainLLMClient 는 langchain / langchain-openai / langfuse 를 import 하고
+ChatOpenAI 를 만든다 (워커마다 약 1.5초, 수십 MB). DI 컨테이너는 이 프록시만
+등록하고, 실제 클라이언트 모듈은 커리큘럼/피드백 생성이 처음 호출될 때 import 한다.
+import 와 생성은 스레드에서 실행해 그동안 같은 워커의 다른 요청이 멈추지 않게 한다.
+"""
+
+import asyncio
+import importlib
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.common.llm.llm_client_repo import ILLMClientRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LazyLLMClient(ILLMClientRepository):
+    """target("모듈:클래스") 을 첫 사용 시 import 해 kwargs 로 생성"""
+
+    def __init__(self, target: str, **kwargs: Any) -> None:
+        self.target = target
+        self.kwargs = kwargs
+        self._client: Optional[ILLMClientRepository] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._client is not None
+
+    async def resolve(self) -> ILLMClientRepository:
+        """
+        실제 클라이언트 반환 (처음이면 스레드에서 import + 생성).
+        동시 요청은 락에서 기다려 한 번만 만든다.
+        """
+        if self._client is not None:
+            return self._client
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._client is None:
+                logger.info(f"Loading LLM client {self.target}")
+                self._client = await asyncio.to_thread(self._create)
+        return self._client
+
+    def _create(self) -> ILLMClientRepository:
+        module_name, _, class_name = self.target.partition(":")
+        client_class = getattr(importlib.import_module(module_name), class_name)
+        return client_class(**self.kwargs)
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        client = await self.resolve()
+        return await client.generate_curriculum(
+            goal=goal, period=period, difficulty=difficulty, details=details
+        )
+
+    async def generate_feedback(
+        self,
+        lessons: List[str],
+        summary_content: str,
+    ) -> Dict[str, Any]:
+        client = await self.resolve()
+        return await client.generate_feedback(
+            lessons=lessons, summary_content=summary_content
+        )
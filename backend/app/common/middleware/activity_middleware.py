@@ -1,49 +1,67 @@
 import logging
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from typing import Any, Optional
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.common.cache.redis_client import redis_client
-from app.core.auth import decode_access_token
+from app.common.middleware.background import schedule_after_response
+from app.core.auth import TOKEN_CLAIMS_STATE_KEY, decode_access_token
 
 logger = logging.getLogger(__name__)
 
 
-class ActivityTrackingMiddleware(BaseHTTPMiddleware):
-    """사용자 활동 추적 미들웨어"""
+def get_bearer_token(scope: Scope) -> Optional[str]:
+    """ASGI scope 헤더에서 Bearer 토큰 추출"""
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            auth_header = value.decode("latin-1")
+            if auth_header.startswith("Bearer "):
+                return auth_header[7:]
+            return None
+    return None
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # 요청 처리
-        response = await call_next(request)
+class ActivityTrackingMiddleware:
+    """사용자 활동 추적 미들웨어 (pure ASGI)"""
 
-        # 인증된 사용자의 활동 추적
-        await self._track_user_activity(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def _track_user_activity(self, request: Request) -> None:
-        """사용자 활동 추적"""
-        try:
-            # Authorization 헤더에서 토큰 추출
-            auth_header = request.headers.get("authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return
+        # 토큰은 요청당 한 번만 디코딩하고 get_current_user 와 state 로 공유
+        claims = self._decode_claims(scope)
+
+        # 요청 처리 (응답 전송까지 완료)
+        await self.app(scope, receive, send)
 
-            token = auth_header.split(" ")[1]
+        # 인증된 사용자의 활동 추적은 응답 이후 백그라운드로 실행
+        user_id = claims.get("sub") if claims else None
+        if user_id:
+            schedule_after_response(self._track_user_activity(user_id))
 
-            # 토큰 디코딩으로 사용자 ID 획득
-            payload = decode_access_token(token)
-            user_id = payload.get("sub")
+    def _decode_claims(self, scope: Scope) -> Optional[dict[str, Any]]:
+        token = get_bearer_token(scope)
+        if not token:
+            return None
+        try:
+            claims = decode_access_token(token)
+        except HTTPException:
+            # 인증 실패 응답은 라우트의 의존성에서 처리한다
+            return None
+        scope.setdefault("state", {})[TOKEN_CLAIMS_STATE_KEY] = (token, claims)
+        return claims
 
-            if user_id:
-                # Redis에 활성 사용자 표시 (5분 TTL)
-                key = f"active_user:{user_id}"
-                await redis_client.set(key, "1", ex=300)
+    async def _track_user_activity(self, user_id: str) -> None:
+        """사용자 활동 추적"""
+        try:
+            # Redis에 활성 사용자 표시 (5분 TTL)
+            key = f"active_user:{user_id}"
+            await redis_client.set(key, "1", ex=300)
 
         except Exception as e:
-            # 인증 실패는 정상적인 상황이므로 에러 로그 생략
+            # 활동 추적 실패가 요청 처리에 영향을 주지 않도록 무시
             logger.debug(f"Activity tracking failed: {e}")
-            pass
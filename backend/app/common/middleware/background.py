@@ -0,0 +1,26 @@
+import asyncio
+import logging
+from typing import Any, Coroutine, Set
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 작업 참조 보관 (GC로 인한 조기 종료 방지)
+_background_tasks: Set["asyncio.Task[Any]"] = set()
+
+
+def schedule_after_response(coro: Coroutine[Any, Any, Any]) -> None:
+    """응답 전송이 끝난 뒤 실행할 작업 등록 (요청 처리 시간에 포함되지 않음)"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def drain_background_tasks(timeout: float = 5.0) -> None:
+    """종료 시 남은 백그라운드 작업 대기"""
+    if not _background_tasks:
+        return
+    _, pending = await asyncio.wait(set(_background_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(f"Cancelled {len(pending)} pending background tasks")
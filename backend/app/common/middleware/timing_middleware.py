@@ -0,0 +1,48 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.monitoring.metrics import record_api_request
+
+# 라우트에 매칭되지 않은 요청은 경로별 라벨을 만들지 않는다 (카디널리티 방지)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def get_route_template(scope: Scope) -> str:
+    """라우팅 이후 scope 에서 경로 템플릿 조회 (/curriculums/{curriculum_id})"""
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return str(template) if template else UNMATCHED_ROUTE
+
+
+class RequestTimingMiddleware:
+    """요청 처리 시간 측정 미들웨어 (pure ASGI)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        # 응답 시작 전에 예외가 나면 ServerErrorMiddleware 가 500 으로 응답한다
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            record_api_request(
+                scope["method"],
+                get_route_template(scope),
+                status_code,
+                time.perf_counter() - start_time,
+            )
@@ -0,0 +1,121 @@
+"""
+네임스페이스별 Redis 키 수/메모리 사용량 샘플링.
+
+SCAN 으로 키를 훑으며 네임스페이스별로 세고, 네임스페이스마다 저수지 표본
+(memory_samples 개) 을 뽑아 MEMORY USAGE 평균 × 키 수로 메모리를 추정한다.
+키가 max_keys 보다 많으면 거기서 멈추고 DBSIZE 비율로 키 수를 보정한다.
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from app.common.cache.namespaces import namespace_of
+from app.common.cache.redis_client import RedisClient
+from app.common.monitoring.metrics import set_cache_usage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NamespaceUsage:
+    """네임스페이스 하나의 샘플링 결과"""
+
+    keys: int = 0
+    samples: List[str] = field(default_factory=list)
+    sampled_bytes: int = 0
+    sampled_keys: int = 0
+
+    @property
+    def estimated_bytes(self) -> float:
+        if not self.sampled_keys:
+            return 0.0
+        return self.sampled_bytes / self.sampled_keys * self.keys
+
+
+class CacheUsageSampler:
+    """주기적으로 네임스페이스별 키 수/메모리를 Prometheus 게이지에 반영"""
+
+    def __init__(
+        self,
+        client: RedisClient,
+        interval: float = 300.0,
+        max_keys: int = 100_000,
+        memory_samples: int = 20,
+        scan_count: int = 1000,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.client = client
+        self.interval = interval
+        self.max_keys = max_keys
+        self.memory_samples = memory_samples
+        self.scan_count = scan_count
+        self.rng = rng or random.Random()
+        self._sampled_at: Optional[float] = None
+        self._namespaces: Set[str] = set()
+
+    async def run_if_due(self) -> None:
+        """interval 이 지났으면 샘플링 후 게이지 갱신"""
+        now = time.monotonic()
+        if self._sampled_at is not None and now - self._sampled_at < self.interval:
+            return
+        self._sampled_at = now
+        try:
+            usage = await self.sample()
+        except Exception as e:
+            logger.error(f"Error sampling cache usage: {e}")
+            return
+        # 사라진 네임스페이스는 0 으로
+        for namespace in self._namespaces - usage.keys():
+            set_cache_usage(namespace, 0, 0.0)
+        for namespace, item in usage.items():
+            set_cache_usage(namespace, item.keys, item.estimated_bytes)
+        self._namespaces = set(usage)
+
+    async def sample(self) -> Dict[str, NamespaceUsage]:
+        redis = self.client.redis
+        if redis is None:
+            return {}
+
+        usage: Dict[str, NamespaceUsage] = {}
+        scanned = 0
+        cursor = 0
+        while scanned < self.max_keys:
+            cursor, keys = await redis.scan(cursor, count=self.scan_count)
+            keys = keys[: self.max_keys - scanned]
+            for key in keys:
+                self._add(usage.setdefault(namespace_of(key), NamespaceUsage()), key)
+            scanned += len(keys)
+            if cursor == 0:
+                break
+
+        if cursor != 0 and scanned:
+            total = await redis.dbsize()
+            for item in usage.values():
+                item.keys = round(item.keys * total / scanned)
+
+        pipe = redis.pipeline(transaction=False)
+        order = []
+        for namespace, item in usage.items():
+            for key in item.samples:
+                pipe.memory_usage(key)
+                order.append(namespace)
+        if order:
+            for namespace, size in zip(order, await pipe.execute()):
+                # 샘플링과 조회 사이에 만료된 키는 None
+                if size is not None:
+                    usage[namespace].sampled_bytes += size
+                    usage[namespace].sampled_keys += 1
+        return usage
+
+    def _add(self, item: NamespaceUsage, key: str) -> None:
+        """키 수 증가 + 저수지 표본 갱신"""
+        item.keys += 1
+        if len(item.samples) < self.memory_samples:
+            item.samples.append(key)
+            return
+        index = self.rng.randrange(item.keys)
+        if index < self.memory_samples:
+            item.samples[index] = key
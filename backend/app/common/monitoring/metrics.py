@@ -1,17 +1,50 @@
-from prometheus_client import Counter, Gauge, Histogram, start_http_server
+"""
+Prometheus 메트릭 정의와 기록 함수.
+
+멀티 워커(app.core.server)에서는 PROMETHEUS_MULTIPROC_DIR 의 mmap 파일에 워커별 값을
+쓰고, 노출할 때 MultiProcessCollector 로 합산한다 (카운터/히스토그램은 합계).
+게이지는 multiprocess_mode 로 합치는 방법을 정하며, 죽은 워커 파일이 정리되도록
+모두 live* 모드를 쓴다.
+    - livemostrecent : DB/Redis 에서 읽은 전역 값 (메트릭 포트를 잡은 워커만 수집)
+    - livesum        : 워커별 상태 (풀 크기, L1 항목 수 등) 의 합
+    - liveall        : 워커마다 따로 봐야 하는 값 (pid 라벨)
+"""
+
 import logging
+import os
 from typing import Optional
 
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
 logger = logging.getLogger(__name__)
 
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
 # 사용자 메트릭
 user_registrations_total = Counter(
     "user_registrations_total", "Total number of user registrations"
 )
 
-total_users_gauge = Gauge("total_users", "Total number of users in the system")
+total_users_gauge = Gauge(
+    "total_users",
+    "Total number of users in the system",
+    multiprocess_mode="livemostrecent",
+)
 
-active_users_gauge = Gauge("active_users", "Number of currently active users")
+active_users_gauge = Gauge(
+    "active_users",
+    "Number of currently active users",
+    multiprocess_mode="livemostrecent",
+)
 
 # 커리큘럼 메트릭
 curriculum_creations_total = Counter(
@@ -19,10 +52,16 @@ curriculum_creations_total = Counter(
 )
 
 total_curriculums_gauge = Gauge(
-    "total_curriculums", "Total number of curriculums in the system"
+    "total_curriculums",
+    "Total number of curriculums in the system",
+    multiprocess_mode="livemostrecent",
 )
 
-public_curriculums_gauge = Gauge("public_curriculums", "Number of public curriculums")
+public_curriculums_gauge = Gauge(
+    "public_curriculums",
+    "Number of public curriculums",
+    multiprocess_mode="livemostrecent",
+)
 
 # 학습 메트릭
 summary_creations_total = Counter(
@@ -30,7 +69,9 @@ summary_creations_total = Counter(
 )
 
 total_summaries_gauge = Gauge(
-    "total_summaries", "Total number of summaries in the system"
+    "total_summaries",
+    "Total number of summaries in the system",
+    multiprocess_mode="livemostrecent",
 )
 
 feedback_creations_total = Counter(
@@ -38,32 +79,50 @@ feedback_creations_total = Counter(
 )
 
 total_feedbacks_gauge = Gauge(
-    "total_feedbacks", "Total number of feedbacks in the system"
+    "total_feedbacks",
+    "Total number of feedbacks in the system",
+    multiprocess_mode="livemostrecent",
 )
 
 # 학습 통계 메트릭
 average_completion_rate_gauge = Gauge(
-    "average_completion_rate", "Average curriculum completion rate across all users"
+    "average_completion_rate",
+    "Average curriculum completion rate across all users",
+    multiprocess_mode="livemostrecent",
 )
 
 average_feedback_score_gauge = Gauge(
-    "average_feedback_score", "Average feedback score across all users"
+    "average_feedback_score",
+    "Average feedback score across all users",
+    multiprocess_mode="livemostrecent",
 )
 
 active_learners_gauge = Gauge(
-    "active_learners", "Number of users who created summaries in the last 7 days"
+    "active_learners",
+    "Number of users who created summaries in the last 7 days",
+    multiprocess_mode="livemostrecent",
 )
 
 # 태그/카테고리 메트릭
 tag_creations_total = Counter("tag_creations_total", "Total number of tag creations")
 
-total_tags_gauge = Gauge("total_tags", "Total number of tags in the system")
+total_tags_gauge = Gauge(
+    "total_tags",
+    "Total number of tags in the system",
+    multiprocess_mode="livemostrecent",
+)
 
 total_categories_gauge = Gauge(
-    "total_categories", "Total number of categories in the system"
+    "total_categories",
+    "Total number of categories in the system",
+    multiprocess_mode="livemostrecent",
 )
 
-active_categories_gauge = Gauge("active_categories", "Number of active categories")
+active_categories_gauge = Gauge(
+    "active_categories",
+    "Number of active categories",
+    multiprocess_mode="livemostrecent",
+)
 
 curriculum_tag_assignments_total = Counter(
     "curriculum_tag_assignments_total", "Total number of curriculum-tag assignments"
@@ -75,26 +134,42 @@ curriculum_category_assignments_total = Counter(
 )
 
 total_curriculum_tags_gauge = Gauge(
-    "total_curriculum_tags", "Total number of curriculum-tag connections"
+    "total_curriculum_tags",
+    "Total number of curriculum-tag connections",
+    multiprocess_mode="livemostrecent",
 )
 
 total_curriculum_categories_gauge = Gauge(
-    "total_curriculum_categories", "Total number of curriculum-category connections"
+    "total_curriculum_categories",
+    "Total number of curriculum-category connections",
+    multiprocess_mode="livemostrecent",
 )
 
-popular_tags_gauge = Gauge("popular_tags", "Number of popular tags (usage_count >= 10)")
+popular_tags_gauge = Gauge(
+    "popular_tags",
+    "Number of popular tags (usage_count >= 10)",
+    multiprocess_mode="livemostrecent",
+)
 
 average_tags_per_curriculum_gauge = Gauge(
-    "average_tags_per_curriculum", "Average number of tags per curriculum"
+    "average_tags_per_curriculum",
+    "Average number of tags per curriculum",
+    multiprocess_mode="livemostrecent",
 )
 
 # Like 메트릭
 like_creations_total = Counter("like_creations_total", "Total number of like creations")
 
-total_likes_gauge = Gauge("total_likes", "Total number of likes in the system")
+total_likes_gauge = Gauge(
+    "total_likes",
+    "Total number of likes in the system",
+    multiprocess_mode="livemostrecent",
+)
 
 likes_per_curriculum_gauge = Gauge(
-    "likes_per_curriculum_avg", "Average number of likes per curriculum"
+    "likes_per_curriculum_avg",
+    "Average number of likes per curriculum",
+    multiprocess_mode="livemostrecent",
 )
 
 # Bookmark 메트릭
@@ -103,11 +178,15 @@ bookmark_creations_total = Counter(
 )
 
 total_bookmarks_gauge = Gauge(
-    "total_bookmarks", "Total number of bookmarks in the system"
+    "total_bookmarks",
+    "Total number of bookmarks in the system",
+    multiprocess_mode="livemostrecent",
 )
 
 bookmarks_per_user_gauge = Gauge(
-    "bookmarks_per_user_avg", "Average number of bookmarks per user"
+    "bookmarks_per_user_avg",
+    "Average number of bookmarks per user",
+    multiprocess_mode="livemostrecent",
 )
 
 # Comment 메트릭 (기존에 없다면 추가)
@@ -115,10 +194,16 @@ comment_creations_total = Counter(
     "comment_creations_total", "Total number of comment creations"
 )
 
-total_comments_gauge = Gauge("total_comments", "Total number of comments in the system")
+total_comments_gauge = Gauge(
+    "total_comments",
+    "Total number of comments in the system",
+    multiprocess_mode="livemostrecent",
+)
 
 comments_per_curriculum_gauge = Gauge(
-    "comments_per_curriculum_avg", "Average number of comments per curriculum"
+    "comments_per_curriculum_avg",
+    "Average number of comments per curriculum",
+    multiprocess_mode="livemostrecent",
 )
 
 # Follow 메트릭
@@ -127,20 +212,28 @@ follow_creations_total = Counter(
 )
 
 total_follows_gauge = Gauge(
-    "total_follows", "Total number of follow relationships in the system"
+    "total_follows",
+    "Total number of follow relationships in the system",
+    multiprocess_mode="livemostrecent",
 )
 
 followers_per_user_gauge = Gauge(
-    "followers_per_user_avg", "Average number of followers per user"
+    "followers_per_user_avg",
+    "Average number of followers per user",
+    multiprocess_mode="livemostrecent",
 )
 
 # Social Engagement 메트릭
 active_social_users_gauge = Gauge(
-    "active_social_users", "Number of users who performed social actions in last 7 days"
+    "active_social_users",
+    "Number of users who performed social actions in last 7 days",
+    multiprocess_mode="livemostrecent",
 )
 
 social_engagement_rate_gauge = Gauge(
-    "social_engagement_rate", "Percentage of users who engaged socially in last 7 days"
+    "social_engagement_rate",
+    "Percentage of users who engaged socially in last 7 days",
+    multiprocess_mode="livemostrecent",
 )
 
 # 쿼리 성능 메트릭
@@ -158,15 +251,21 @@ db_query_total = Counter(
 )
 
 db_connection_pool_size = Gauge(
-    "db_connection_pool_size", "Current database connection pool size"
+    "db_connection_pool_size",
+    "Current database connection pool size",
+    multiprocess_mode="livesum",
 )
 
 db_connection_pool_checked_out = Gauge(
-    "db_connection_pool_checked_out", "Number of connections currently checked out"
+    "db_connection_pool_checked_out",
+    "Number of connections currently checked out",
+    multiprocess_mode="livesum",
 )
 
 db_connection_pool_overflow = Gauge(
-    "db_connection_pool_overflow", "Number of connections in overflow"
+    "db_connection_pool_overflow",
+    "Number of connections in overflow",
+    multiprocess_mode="livesum",
 )
 
 api_request_duration = Histogram(
@@ -203,33 +302,185 @@ redis_operation_duration = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
 )
 
-cache_hit_ratio = Gauge("cache_hit_ratio", "Cache hit ratio percentage")
+cache_hit_ratio = Gauge(
+    "cache_hit_ratio",
+    "Cache hit ratio percentage",
+    multiprocess_mode="livemostrecent",
+)
+
+circuit_breaker_state = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state (0=closed, 1=open, 2=half_open)",
+    ["name"],
+    multiprocess_mode="liveall",
+)
+
+circuit_breaker_transitions_total = Counter(
+    "circuit_breaker_transitions_total",
+    "Total number of circuit breaker state transitions",
+    ["name", "state"],
+)
+
+# 캐시 네임스페이스별 메트릭 (tier: redis, l1, l1_stale, local)
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Total number of cache key lookups by namespace, tier and result",
+    ["namespace", "tier", "result"],
+)
+
+cache_errors_total = Counter(
+    "cache_errors_total",
+    "Total number of failed cache operations",
+    ["namespace", "operation"],
+)
+
+cache_operation_duration = Histogram(
+    "cache_operation_duration_seconds",
+    "Cache (Redis) operation latency by namespace",
+    ["namespace", "operation"],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
+)
+
+cache_keys = Gauge(
+    "cache_keys",
+    "Number of Redis keys per cache namespace (periodic SCAN)",
+    ["namespace"],
+    multiprocess_mode="livemostrecent",
+)
+
+cache_memory_bytes = Gauge(
+    "cache_memory_bytes",
+    "Estimated Redis memory per cache namespace (MEMORY USAGE sampling)",
+    ["namespace"],
+    multiprocess_mode="livemostrecent",
+)
+
+# 2단 캐시(워커 로컬 L1 + Redis L2) 메트릭
+
+two_tier_cache_l1_entries = Gauge(
+    "two_tier_cache_l1_entries",
+    "Number of entries held in the worker-local L1 cache",
+    ["namespace"],
+    multiprocess_mode="livesum",
+)
+
+two_tier_cache_l1_evictions_total = Counter(
+    "two_tier_cache_l1_evictions_total",
+    "Total number of L1 entries evicted by the size limit",
+    ["namespace"],
+)
+
+two_tier_cache_invalidations_total = Counter(
+    "two_tier_cache_invalidations_total",
+    "Total number of two-tier cache invalidations",
+    ["namespace", "source"],
+)
+
+# 비밀번호 해시 풀 메트릭
+password_hash_queue_depth = Gauge(
+    "password_hash_queue_depth",
+    "Number of password hash jobs waiting for a worker",
+    multiprocess_mode="livesum",
+)
+
+password_hash_active = Gauge(
+    "password_hash_active",
+    "Number of password hash jobs currently running",
+    multiprocess_mode="livesum",
+)
+
+password_hash_wait_duration = Histogram(
+    "password_hash_wait_seconds",
+    "Time spent waiting for a password hash worker",
+    ["operation"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+password_hash_duration = Histogram(
+    "password_hash_duration_seconds",
+    "Password hash/verify execution time",
+    ["operation"],
+    buckets=[0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5],
+)
 
 # 메트릭 서버 상태
 _metrics_server_port: Optional[int] = None
+# 멀티프로세스 모드에서 다른 워커가 포트를 잡고 있어 나중에 다시 시도할 포트
+_pending_metrics_port: Optional[int] = None
+
+
+def is_multiprocess() -> bool:
+    """prometheus_client 멀티프로세스 모드 여부 (import 전에 환경변수로 결정됨)"""
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def metrics_registry() -> CollectorRegistry:
+    """노출용 레지스트리 (멀티프로세스 모드면 모든 워커의 파일을 합산)"""
+    if not is_multiprocess():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def generate_metrics() -> bytes:
+    """/metrics 응답 본문 (어느 워커가 받아도 같은 합산 결과)"""
+    return generate_latest(metrics_registry())
+
+
+def mark_worker_dead(pid: int) -> None:
+    """종료된 워커의 live 게이지 파일 삭제 (마스터의 child_exit 에서 호출)"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
 
 
 async def initialize_metrics_collector(port: int = 8000) -> None:
-    """메트릭 수집 서버 초기화"""
-    global _metrics_server_port
+    """
+    메트릭 수집 서버 초기화.
+    멀티프로세스 모드에서는 한 워커만 포트를 잡고 합산 결과를 노출한다. 다른 워커는
+    실패를 기록해 두고 ensure_metrics_collector 로 다시 시도한다 (그 워커가 재생성되면
+    남은 워커 중 하나가 이어받음).
+    """
+    global _metrics_server_port, _pending_metrics_port
 
     if _metrics_server_port is not None:
         logger.warning(f"Metrics server already running on port {_metrics_server_port}")
         return
 
     try:
-        start_http_server(port)
+        start_http_server(port, registry=metrics_registry())
         _metrics_server_port = port
+        _pending_metrics_port = None
         logger.info(f"Prometheus metrics server started on port {port}")
-    except Exception as e:
-        logger.error(f"Failed to start metrics server: {e}")
-        raise
+    except OSError as e:
+        if not is_multiprocess():
+            logger.error(f"Failed to start metrics server: {e}")
+            raise
+        if _pending_metrics_port is None:
+            logger.info(f"Metrics server on port {port} is served by another worker")
+        _pending_metrics_port = port
+
+
+def collects_global_metrics() -> bool:
+    """
+    DB/Redis 전역 메트릭을 이 프로세스가 수집할지 여부.
+    멀티프로세스 모드에서는 메트릭 포트를 잡은 워커 하나만 수집한다 (워커 수만큼
+    같은 COUNT/SCAN 을 반복하지 않도록).
+    """
+    return not is_multiprocess() or _metrics_server_port is not None
+
+
+async def ensure_metrics_collector() -> None:
+    """멀티프로세스 모드에서 포트를 잡은 워커가 없어졌으면 이 워커가 이어받음"""
+    if _metrics_server_port is None and _pending_metrics_port is not None:
+        await initialize_metrics_collector(_pending_metrics_port)
 
 
 async def shutdown_metrics_collector() -> None:
     """메트릭 수집 서버 종료"""
-    global _metrics_server_port
+    global _metrics_server_port, _pending_metrics_port
 
+    _pending_metrics_port = None
     if _metrics_server_port is None:
         logger.info("Metrics server was not running")
         return
@@ -463,6 +714,22 @@ def record_api_request(
     ).inc()
 
 
+def set_password_hash_queue_depth(depth: int) -> None:
+    """비밀번호 해시 대기 작업 수 설정"""
+    password_hash_queue_depth.set(depth)
+
+
+def set_password_hash_active(count: int) -> None:
+    """비밀번호 해시 실행 중 작업 수 설정"""
+    password_hash_active.set(count)
+
+
+def record_password_hash(operation: str, wait: float, duration: float) -> None:
+    """비밀번호 해시 대기/실행 시간 기록"""
+    password_hash_wait_duration.labels(operation=operation).observe(wait)
+    password_hash_duration.labels(operation=operation).observe(duration)
+
+
 def increment_application_error(
     error_type: str, module: str, severity: str = "error"
 ) -> None:
@@ -484,3 +751,56 @@ def record_redis_operation(
 def set_cache_hit_ratio(ratio: float) -> None:
     """캐시 적중률 설정"""
     cache_hit_ratio.set(ratio)
+
+
+_CIRCUIT_BREAKER_STATES = {"closed": 0, "open": 1, "half_open": 2}
+
+
+def set_circuit_breaker_state(name: str, state: str) -> None:
+    """서킷 브레이커 상태 전환 기록"""
+    circuit_breaker_state.labels(name=name).set(_CIRCUIT_BREAKER_STATES[state])
+    circuit_breaker_transitions_total.labels(name=name, state=state).inc()
+
+
+def record_cache_lookup(namespace: str, tier: str, hits: int, misses: int) -> None:
+    """캐시 계층별 적중/미스 키 수 기록"""
+    if hits:
+        cache_requests_total.labels(namespace=namespace, tier=tier, result="hit").inc(
+            hits
+        )
+    if misses:
+        cache_requests_total.labels(namespace=namespace, tier=tier, result="miss").inc(
+            misses
+        )
+
+
+def record_cache_operation(
+    namespace: str, operation: str, duration: float, error: bool = False
+) -> None:
+    """캐시(Redis) 명령 지연/실패 기록"""
+    cache_operation_duration.labels(namespace=namespace, operation=operation).observe(
+        duration
+    )
+    if error:
+        cache_errors_total.labels(namespace=namespace, operation=operation).inc()
+
+
+def set_cache_usage(namespace: str, keys: int, memory_bytes: float) -> None:
+    """네임스페이스별 Redis 키 수/추정 메모리 설정"""
+    cache_keys.labels(namespace=namespace).set(keys)
+    cache_memory_bytes.labels(namespace=namespace).set(memory_bytes)
+
+
+def set_two_tier_l1_entries(namespace: str, count: int) -> None:
+    """2단 캐시 L1 항목 수 설정"""
+    two_tier_cache_l1_entries.labels(namespace=namespace).set(count)
+
+
+def record_two_tier_eviction(namespace: str, count: int) -> None:
+    """2단 캐시 L1 크기 제한 축출 수 기록"""
+    two_tier_cache_l1_evictions_total.labels(namespace=namespace).inc(count)
+
+
+def record_two_tier_invalidation(namespace: str, source: str) -> None:
+    """2단 캐시 무효화 기록 (source: local=이 워커의 쓰기, remote=pub/sub 수신)"""
+    two_tier_cache_invalidations_total.labels(namespace=namespace, source=source).inc()
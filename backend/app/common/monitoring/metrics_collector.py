@@ -7,7 +7,11 @@ from sqlalchemy import Engine, QueuePool, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection, AsyncEngine
 
 from app.common.cache.redis_client import RedisClient
+from app.common.monitoring.cache_usage import CacheUsageSampler
+from app.core.config import get_settings
 from app.common.monitoring.metrics import (
+    collects_global_metrics,
+    ensure_metrics_collector,
     set_active_users,
     set_total_users,
     set_total_curriculums,
@@ -47,6 +51,9 @@ from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
     CurriculumTagModel,
     CurriculumCategoryModel,
 )
+from app.modules.taxonomy.infrastructure.repository.tag_ranking_repo import (
+    TagRankingRepository,
+)
 from app.modules.social.infrastructure.db_model.like import LikeModel
 from app.modules.social.infrastructure.db_model.bookmark import BookmarkModel
 from app.modules.social.infrastructure.db_model.comment import CommentModel
@@ -66,7 +73,15 @@ class MetricsService:
     ):
         self.session = session
         self.redis_client = redis_client
+        self.tag_ranking_repo = TagRankingRepository(redis_client)
         self.update_interval = update_interval
+        settings = get_settings()
+        self.cache_usage = CacheUsageSampler(
+            redis_client,
+            interval=settings.cache_usage_sample_interval,
+            max_keys=settings.cache_usage_max_keys,
+            memory_samples=settings.cache_usage_memory_samples,
+        )
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -99,6 +114,7 @@ class MetricsService:
         """주기적 메트릭 업데이트"""
         while self._running:
             try:
+                await ensure_metrics_collector()
                 await self.update_all_metrics()
                 await asyncio.sleep(self.update_interval)
             except asyncio.CancelledError:
@@ -108,7 +124,19 @@ class MetricsService:
                 await asyncio.sleep(self.update_interval)
 
     async def update_all_metrics(self) -> None:
-        """모든 메트릭 업데이트"""
+        """
+        모든 메트릭 업데이트.
+        프로세스별 게이지(DB 풀)는 워커마다, DB/Redis 전역 메트릭은 메트릭 포트를 잡은
+        워커에서만 갱신한다. L1 항목 수/해시 풀 게이지는 변경 시점에 각 워커가 기록한다.
+        """
+        # DB 연결 풀 메트릭 (워커별, livesum)
+        await self._update_db_connection_metrics()
+
+        if collects_global_metrics():
+            await self._update_global_metrics()
+
+    async def _update_global_metrics(self) -> None:
+        """DB 집계 쿼리와 Redis 로 읽는 전역 메트릭 업데이트"""
         try:
             # 전체 사용자 수
             total_users = await self._get_total_users()
@@ -200,12 +228,12 @@ class MetricsService:
             )
             set_social_engagement_rate(engagement_rate)
 
-            # DB 연결 풀 메트릭
-            await self._update_db_connection_metrics()
-
             # Redis 캐시 메트릭
             await self._update_cache_metrics()
 
+            # 네임스페이스별 키 수/메모리 (cache_usage_sample_interval 마다)
+            await self.cache_usage.run_if_due()
+
             logger.debug(
                 f"Metrics updated - Users: {total_users} (active: {active_users}), "
                 + f"Curriculums: {total_curriculums} (public: {public_curriculums} "
@@ -414,7 +442,11 @@ class MetricsService:
         return result.scalar_one()
 
     async def _get_popular_tags(self) -> int:
-        """인기 태그 수 조회 (usage_count >= 10)"""
+        """인기 태그 수 조회 (usage_count >= 10, Redis 랭킹 우선)"""
+        ranked_count = await self.tag_ranking_repo.count_by_min_usage(10)
+        if ranked_count is not None:
+            return ranked_count
+
         try:
             query = (
                 select(func.count())
@@ -669,7 +701,8 @@ class MetricsService:
             # Redis 정보 가져오기
             info = await self.redis_client.redis.info()
 
-            # 캐시 적중률 계산 (keyspace_hits / (keyspace_hits + keyspace_misses))
+            # 서버 전체 적중률 (keyspace_hits / (keyspace_hits + keyspace_misses)),
+            # 네임스페이스별 적중률은 cache_requests_total 로 본다
             hits = info.get("keyspace_hits", 0)
             misses = info.get("keyspace_misses", 0)
 
@@ -0,0 +1,126 @@
+import dataclasses
+import json
+from abc import ABCMeta, abstractmethod
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+ORJSON = "orjson"
+STDLIB = "json"
+
+
+class JSONCodec(metaclass=ABCMeta):
+    """
+    응답 본문과 Redis 캐시 값이 함께 쓰는 JSON 코덱.
+
+    dumps 는 UTF-8 bytes(한글 이스케이프 없음, 공백 없는 구분자)를 돌려주고
+    loads 는 bytes/str 모두 받는다. datetime 은 ISO 8601 (UTC 는 "Z"),
+    dataclass DTO 와 pydantic 모델은 변환 없이 바로 넘길 수 있다.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, sort_keys: bool = False) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        raise NotImplementedError
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson 기반 (dataclass/datetime/Enum 을 네이티브로 직렬화)"""
+
+    name = ORJSON
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False) -> bytes:
+        option = self._option
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        return self._orjson.dumps(obj, default=_fallback, option=option)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """표준 json 기반 (orjson 미설치 환경용, 출력 형식은 OrjsonCodec 과 같게 맞춤)"""
+
+    name = STDLIB
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False) -> bytes:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+            default=_stdlib_default,
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+def _fallback(obj: Any) -> Any:
+    """두 코덱 공통: 네이티브로 처리되지 않는 타입 (datetime 서브클래스 포함)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, datetime):
+        if obj.utcoffset() == timedelta(0):
+            return obj.replace(tzinfo=None).isoformat() + "Z"
+        return obj.isoformat()
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return _fallback(obj)
+
+
+_CODECS: dict[str, Callable[[], JSONCodec]] = {
+    ORJSON: OrjsonCodec,
+    STDLIB: StdlibJSONCodec,
+}
+
+
+def load_json_codec(name: Optional[str]) -> JSONCodec:
+    """설정값으로 코덱 선택, 패키지가 없으면 표준 json 으로 대체"""
+    factory = _CODECS.get(name or ORJSON)
+    if factory is None:
+        logger.warning(f"Unknown JSON codec '{name}', using {ORJSON}")
+        factory = OrjsonCodec
+    try:
+        return factory()
+    except ImportError:
+        logger.warning(f"{name} is not installed, falling back to stdlib json")
+        return StdlibJSONCodec()
+
+
+json_codec: JSONCodec = load_json_codec(get_settings().json_codec)
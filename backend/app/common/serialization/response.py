@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.common.serialization.codec import json_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    앱 기본 응답 클래스 (공용 JSON 코덱 사용).
+
+    엔드포인트가 이 응답을 직접 반환하면 FastAPI 의 response_model 재검증과
+    jsonable_encoder 를 건너뛴다. pydantic 모델은 pydantic-core 가 바로 bytes 로,
+    dataclass DTO/dict 는 코덱이 직렬화한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return json_codec.dumps(content)
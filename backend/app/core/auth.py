@@ -3,16 +3,26 @@ from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from app.common.monitoring.metrics import record_cache_lookup
 from app.core.config import get_settings
-from jose import JWTError, jwt
+from app.core.jwt_backend import InvalidTokenError, load_jwt_backend
+from app.core.token_cache import VerifiedTokenCache
 
 settings = get_settings()
 
 SECRET_KEY: str = settings.secret_key
 ALGORITHM: str = settings.algorithm
 
+jwt_backend = load_jwt_backend(settings.jwt_backend)
+token_cache = VerifiedTokenCache(
+    maxsize=settings.jwt_cache_size, ttl=settings.jwt_cache_ttl
+)
+
+# 미들웨어가 디코딩한 (token, claims) 를 요청 state 에 공유하는 키
+TOKEN_CLAIMS_STATE_KEY = "token_claims"
+
 
 class Role(StrEnum):
     ADMIN = "ADMIN"
@@ -28,8 +38,10 @@ class CurrentUser:
     role: Role
 
 
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> CurrentUser:
-    payload = decode_access_token(token)
+def get_current_user(
+    request: Request, token: Annotated[str, Depends(oauth2_scheme)]
+) -> CurrentUser:
+    payload = get_request_token_claims(request, token)
     sub = payload.get("sub")
     role_str = payload.get("role")
     if not sub or not role_str:
@@ -57,16 +69,33 @@ def create_access_token(
         "role": role.value,
         "exp": int(expire_dt.timestamp()),  # <-- int 형태
     }
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt_backend.encode(to_encode, SECRET_KEY, ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
+    """검증된 claims 반환 (캐시 hit 이면 서명 검증 생략), 반환값은 읽기 전용으로 사용"""
+    cached = token_cache.get(token)
+    if cached is not None:
+        record_cache_lookup("jwt", "local", 1, 0)
+        return cached
+    record_cache_lookup("jwt", "local", 0, 1)
+
     try:
-        payload: dict[str, Any] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        payload: dict[str, Any] = jwt_backend.decode(token, SECRET_KEY, ALGORITHM)
+    except InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
+    token_cache.set(token, payload)
+    return payload
+
+
+def get_request_token_claims(request: Request, token: str) -> dict[str, Any]:
+    """같은 요청에서 미들웨어가 이미 디코딩한 claims 가 있으면 재사용"""
+    shared = getattr(request.state, TOKEN_CLAIMS_STATE_KEY, None)
+    if shared is not None and shared[0] == token:
+        return shared[1]
+    return decode_access_token(token)
+
 
 def assert_admin(current_user: CurrentUser) -> None:
     if current_user.role != Role.ADMIN:
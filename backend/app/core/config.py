@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Dict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,10 +16,51 @@ class Settings(BaseSettings):
     sqlalchemy_database_url: str = ""
     secret_key: str = ""
     algorithm: str = ""
+    jwt_backend: str = "jose"  # jose | pyjwt
+    jwt_cache_size: int = 4096
+    jwt_cache_ttl: int = 300
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    tag_autocomplete_sync_interval: float = 5.0
+    tag_trending_days: int = 7
+    tag_trending_half_life_days: float = 2.0
+    follow_suggestion_size: int = 50
+    follow_suggestion_ttl: int = 7 * 24 * 60 * 60
+    follow_suggestion_tag_weight: float = 0.5
+    timeline_size: int = 500
+    timeline_ttl: int = 3 * 24 * 60 * 60
+    timeline_fanout_threshold: int = 5000
+    social_graph_cache_enabled: bool = True
+    social_graph_ttl: int = 24 * 60 * 60
+    social_graph_max_set_size: int = 10000
+    curriculum_detail_cache_ttl: int = 300
+    json_codec: str = "orjson"  # orjson | json
+    cache_compress_threshold: int = 1024  # 캐시 값 zlib 압축 기준 (bytes, 0=끔)
+    cache_l1_size: int = 1000  # 2단 캐시 L1 네임스페이스별 기본 최대 항목 수
+    cache_l1_ttl: float = 30.0  # L1 항목 TTL (무효화 메시지 유실 시 stale 상한)
+    cache_l1_sizes: Dict[str, int] = {}  # 네임스페이스별 L1 최대 항목 수 (JSON)
+    cache_l1_stale_ttl: float = 600.0  # Redis 서킷이 열렸을 때 만료된 L1 을 쓸 상한
+    cache_usage_sample_interval: int = 300  # 네임스페이스별 키 수/메모리 샘플링 (초)
+    cache_usage_max_keys: int = 100_000  # 샘플링 한 번에 SCAN 할 최대 키 수
+    cache_usage_memory_samples: int = 20  # 네임스페이스당 MEMORY USAGE 표본 수
     llm_api_key: str = ""
     llm_endpoint: str = ""
     redis_url: str = ""
+    redis_max_connections: int = 50  # 워커당 클라이언트별 최대 연결 수
+    redis_socket_connect_timeout: float = 0.25  # 초
+    redis_socket_timeout: float = 0.25  # 명령 읽기 타임아웃 (초)
+    redis_health_check_interval: int = 30  # 유휴 연결 재사용 전 PING 간격 (초)
+    redis_breaker_failure_threshold: int = 5  # 연속 실패 몇 번에 서킷을 열지
+    redis_breaker_cooldown: float = 10.0  # 서킷이 열린 뒤 Redis 를 건너뛸 시간 (초)
     kafka_bootstrap_servers: str = ""
+    web_bind: str = "0.0.0.0:8000"
+    web_workers: int = 0  # 0 이면 컨테이너에 할당된 CPU 수
+    web_max_requests: int = 10000  # 요청 N 개 처리 후 워커 재생성 (0=끔)
+    web_max_requests_jitter: int = 1000  # 워커들이 동시에 재생성되지 않도록
+    web_timeout: int = 60  # 응답 없는 워커를 재시작할 시간 (초)
+    web_graceful_timeout: int = 30  # 재시작/종료 시 처리 중 요청을 기다릴 시간 (초)
+    web_keepalive: int = 5  # HTTP keep-alive (초)
+    web_metrics_dir: str = ""  # 멀티프로세스 메트릭 파일 위치 (비우면 임시 디렉터리)
     langfuse_secret_key: str = ""
     langfuse_public_key: str = ""
     langfuse_host: str = "https://cloud.langfuse.com"
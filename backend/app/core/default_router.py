@@ -16,10 +16,12 @@ def hello() -> dict[str, str]:
 @default_router.get("/metrics", tags=["Default"])
 async def metrics():
     """Prometheus 메트릭 엔드포인트"""
-    from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+    from prometheus_client import CONTENT_TYPE_LATEST
     from fastapi import Response
 
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    from app.common.monitoring.metrics import generate_metrics
+
+    return Response(content=generate_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 @default_router.get("/health", tags=["Default"])
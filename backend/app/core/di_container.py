@@ -1,11 +1,10 @@
 from dependency_injector import containers, providers
 
 # from dependency_injector.wiring import Provide
-from app.common.cache import redis_client
+from app.common.cache.redis_client import redis_client
 from app.common.db.session import get_session
 
-# from app.common.llm.openai_client import OpenAILLMClient
-from app.common.llm.langchain_client import LangChainLLMClient
+from app.common.llm.lazy_client import LazyLLMClient
 from app.common.monitoring.metrics_collector import MetricsService
 from app.modules.admin.application.service.admin_curriculum_service import (
     AdminCurriculumService,
@@ -20,6 +19,9 @@ from app.modules.curriculum.application.service.curriculum_service import (
 from app.modules.curriculum.domain.service.curriculum_domain_service import (
     CurriculumDomainService,
 )
+from app.modules.curriculum.infrastructure.repository.curriculum_cache_repo import (
+    CurriculumCacheRepository,
+)
 from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
     CurriculumRepository,
 )
@@ -31,15 +33,27 @@ from app.modules.learning.application.service.learning_stats_service import (
 from app.modules.learning.core.di_container import LearningContainer
 
 from app.modules.social.application.service.follow_service import FollowService
+from app.modules.social.application.service.follow_suggestion_service import (
+    FollowSuggestionService,
+)
 from app.modules.social.core.di_container import SocialContainer
 from app.modules.social.domain.service.follow_domain_service import FollowDomainService
 from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.social.infrastructure.repository.follow_suggestion_repo import (
+    FollowSuggestionRepository,
+)
+from app.modules.social.infrastructure.repository.social_graph_cache import (
+    SocialGraphCache,
+)
 from app.modules.taxonomy.application.service.category_service import CategoryService
 from app.modules.taxonomy.application.service.curriculum_tag_service import (
     CurriculumTagService,
 )
 from app.modules.taxonomy.application.service.tag_service import TagService
 from app.modules.taxonomy.domain.service.tag_domain_service import TagDomainService
+from app.modules.taxonomy.infrastructure.repository.cached_category_repo import (
+    CachedCategoryRepository,
+)
 from app.modules.taxonomy.infrastructure.repository.category_repo import (
     CategoryRepository,
 )
@@ -48,6 +62,12 @@ from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
     CurriculumTagRepository,
 )
 from app.modules.taxonomy.infrastructure.repository.tag_repo import TagRepository
+from app.modules.taxonomy.infrastructure.repository.tag_autocomplete_repo import (
+    TagAutocompleteRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_ranking_repo import (
+    TagRankingRepository,
+)
 from app.modules.user.domain.service.user_domain_service import UserDomainService
 from app.core.config import get_settings
 from app.modules.user.application.service.auth_service import AuthService
@@ -79,6 +99,35 @@ class Container(containers.DeclarativeContainer):
         get_session,
     )
 
+    # 팔로우 관계 확인용 Redis set (social_graph_cache_enabled=False 면 DB 만 사용)
+    social_graph_cache = providers.Singleton(
+        SocialGraphCache,
+        redis_client=providers.Singleton(lambda: redis_client),
+        ttl=config.provided.social_graph_ttl,
+        max_set_size=config.provided.social_graph_max_set_size,
+        enabled=config.provided.social_graph_cache_enabled,
+    )
+
+    # Feed (커리큘럼/사용자 쓰기 이벤트를 받아 검색 색인, 팔로잉 타임라인 갱신)
+    follow_repository = providers.Factory(
+        FollowRepository,
+        session=db_session,
+        social_graph=social_graph_cache,
+    )
+
+    feed_container = providers.Container(
+        FeedContainer,
+        session=db_session,
+        redis_client=providers.Singleton(lambda: redis_client),
+        follow_repository=follow_repository,
+        config=config,
+    )
+
+    feed_service = feed_container.feed_service
+    feed_repository = feed_container.feed_repository
+    curriculum_event_handler = feed_container.curriculum_event_handler
+    timeline_service = feed_container.timeline_service
+
     # User
     user_repository = providers.Factory(
         UserRepository,
@@ -95,7 +144,8 @@ class Container(containers.DeclarativeContainer):
         user_repo=user_repository,
         user_domain_service=user_domain_service,
         ulid=providers.Singleton(ULID),
-        crypto=providers.Singleton(Crypto),
+        crypto=providers.Singleton(Crypto, rounds=config.provided.bcrypt_rounds),
+        feed_event_handler=curriculum_event_handler,
     )
 
     # Auth
@@ -104,23 +154,19 @@ class Container(containers.DeclarativeContainer):
         user_repo=user_repository,
         user_domain_service=user_domain_service,
         ulid=providers.Singleton(ULID),
-        crypto=providers.Singleton(Crypto),
+        crypto=providers.Singleton(Crypto, rounds=config.provided.bcrypt_rounds),
     )
 
-    # LLM
+    # LLM (langchain/langfuse 는 첫 생성 요청 때 import)
     llm_client = providers.Singleton(
-        # OpenAILLMClient,
-        LangChainLLMClient,
+        LazyLLMClient,
+        # "app.common.llm.openai_client:OpenAILLMClient",
+        "app.common.llm.langchain_client:LangChainLLMClient",
         api_key=config.provided.llm_api_key,
         model="gpt-4o-mini",
     )
 
     # Social
-    follow_repository = providers.Factory(
-        FollowRepository,
-        session=db_session,
-    )
-
     follow_domain_service = providers.Factory(
         FollowDomainService,
         follow_repo=follow_repository,
@@ -141,6 +187,13 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
     )
 
+    # 상세 조회 read-through 캐시 (수정/삭제/공개 범위 변경 시 무효화)
+    curriculum_cache_repository = providers.Singleton(
+        CurriculumCacheRepository,
+        redis_client=providers.Singleton(lambda: redis_client),
+        ttl=config.provided.curriculum_detail_cache_ttl,
+    )
+
     curriculum_domain_service = providers.Factory(
         CurriculumDomainService,
         curriculum_repo=curriculum_repository,
@@ -152,6 +205,9 @@ class Container(containers.DeclarativeContainer):
         llm_client=llm_client,
         follow_repo=follow_repository,
         ulid=providers.Singleton(ULID),
+        feed_event_handler=curriculum_event_handler,
+        timeline_service=timeline_service,
+        curriculum_cache=curriculum_cache_repository,
     )
     # Learning
 
@@ -180,9 +236,13 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
     )
 
+    # 조회는 워커 로컬 참조 데이터 스냅샷, 변경은 DB + 버전 증가
     category_repository = providers.Factory(
-        CategoryRepository,
-        session=db_session,
+        CachedCategoryRepository,
+        category_repo=providers.Factory(
+            CategoryRepository,
+            session=db_session,
+        ),
     )
 
     curriculum_tag_repository = providers.Factory(
@@ -195,6 +255,20 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
     )
 
+    tag_ranking_repository = providers.Singleton(
+        TagRankingRepository,
+        redis_client=providers.Singleton(lambda: redis_client),
+        trending_days=config.provided.tag_trending_days,
+        trending_half_life_days=config.provided.tag_trending_half_life_days,
+    )
+
+    # 워커 프로세스 로컬 인덱스 → Singleton
+    tag_autocomplete_repository = providers.Singleton(
+        TagAutocompleteRepository,
+        tag_ranking_repo=tag_ranking_repository,
+        sync_interval=config.provided.tag_autocomplete_sync_interval,
+    )
+
     tag_domain_service = providers.Factory(
         TagDomainService,
         tag_repo=tag_repository,
@@ -207,6 +281,8 @@ class Container(containers.DeclarativeContainer):
         TagService,
         tag_repo=tag_repository,
         tag_domain_service=tag_domain_service,
+        tag_autocomplete_repo=tag_autocomplete_repository,
+        tag_ranking_repo=tag_ranking_repository,
         ulid=providers.Singleton(ULID),
     )
 
@@ -224,7 +300,9 @@ class Container(containers.DeclarativeContainer):
         curriculum_tag_repo=curriculum_tag_repository,
         curriculum_category_repo=curriculum_category_repository,
         curriculum_repo=curriculum_repository,
+        tag_autocomplete_repo=tag_autocomplete_repository,
         ulid=providers.Singleton(ULID),
+        feed_event_handler=curriculum_event_handler,
     )
 
     social_container = providers.Container(
@@ -242,27 +320,38 @@ class Container(containers.DeclarativeContainer):
         user_repo=user_repository,
     )
 
+    follow_suggestion_repository = providers.Singleton(
+        FollowSuggestionRepository,
+        redis_client=providers.Singleton(lambda: redis_client),
+        size=config.provided.follow_suggestion_size,
+        ttl=config.provided.follow_suggestion_ttl,
+    )
+
+    follow_suggestion_service = providers.Factory(
+        FollowSuggestionService,
+        follow_repo=follow_repository,
+        follow_suggestion_repo=follow_suggestion_repository,
+        curriculum_tag_repo=curriculum_tag_repository,
+        tag_affinity_weight=config.provided.follow_suggestion_tag_weight,
+    )
+
     follow_service = providers.Factory(
         FollowService,
         follow_repo=follow_repository,
         user_repo=user_repository,
         follow_domain_service=follow_domain_service,
         ulid=providers.Singleton(ULID),
+        follow_suggestion_service=follow_suggestion_service,
+        timeline_service=timeline_service,
     )
 
-    feed_container = providers.Container(
-        FeedContainer,
-        session=db_session,
-    )
-
-    feed_service = feed_container.feed_service
-    feed_repository = feed_container.feed_repository
-
     admin_curriculum_repository = providers.Factory(
         AdminCurriculumRepository, session=db_session
     )
     admin_curriculum_service = providers.Factory(
-        AdminCurriculumService, repo=admin_curriculum_repository
+        AdminCurriculumService,
+        repo=admin_curriculum_repository,
+        curriculum_cache=curriculum_cache_repository,
     )
 
     metrics_service = providers.Factory(
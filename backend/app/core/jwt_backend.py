@@ -0,0 +1,73 @@
+import logging
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+JOSE = "jose"
+PYJWT = "pyjwt"
+
+
+class InvalidTokenError(Exception):
+    """서명/만료/형식 검증 실패"""
+
+
+class JWTBackend(Protocol):
+    name: str
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str: ...
+
+    def decode(self, token: str, key: str, algorithm: str) -> dict[str, Any]: ...
+
+
+class JoseBackend:
+    """python-jose 기반 (기본값)"""
+
+    name = JOSE
+
+    def __init__(self) -> None:
+        from jose import jwt
+
+        self._jwt = jwt
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithm: str) -> dict[str, Any]:
+        from jose import JWTError
+
+        try:
+            return self._jwt.decode(token, key, algorithms=[algorithm])
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+class PyJWTBackend:
+    """PyJWT 기반 (선택, `pip install pyjwt` 필요)"""
+
+    name = PYJWT
+
+    def __init__(self) -> None:
+        import jwt
+
+        self._jwt = jwt
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithm: str) -> dict[str, Any]:
+        try:
+            return self._jwt.decode(token, key, algorithms=[algorithm])
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+def load_jwt_backend(name: str) -> JWTBackend:
+    """설정값으로 JWT 백엔드 선택, 패키지가 없으면 jose 로 대체"""
+    if name == PYJWT:
+        try:
+            return PyJWTBackend()
+        except ImportError:
+            logger.warning("pyjwt is not installed, falling back to python-jose")
+    elif name and name != JOSE:
+        logger.warning(f"Unknown JWT backend '{name}', using python-jose")
+    return JoseBackend()
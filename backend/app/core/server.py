@@ -0,0 +1,170 @@
+"""
+운영용 API 서버 실행기 (gunicorn 프로세스 관리 + uvicorn 워커)
+
+- 마스터가 app.main 을 미리 import(preload) 한 뒤 워커를 fork 한다. import 된 코드와
+  모듈 객체는 copy-on-write 로 워커들이 공유하고, fork 직전에 gc.freeze() 로 GC 가
+  공유 페이지를 건드리지 않게 한다
+- 워커 수는 컨테이너에 할당된 CPU 수 (cgroup 쿼터 → affinity → cpu_count 순)
+- 워커는 web_max_requests (+jitter) 개 요청을 처리하면 새로 fork 된다
+- 프로세스별 상태(Redis 연결, DB 풀, 2단 캐시 송신자 ID)는 각 모듈이
+  os.register_at_fork 로 fork 직후 초기화하고, 연결은 워커 lifespan 에서 맺는다
+- Prometheus 는 멀티프로세스 모드: 시작할 때 web_metrics_dir 을 비우고, 워커가 죽으면
+  그 워커의 live 게이지 파일을 지운다. 카운터/히스토그램 파일은 합계가 줄지 않도록
+  남겨 두며 다음 시작 때 정리된다
+
+재시작:
+    kill -HUP <master>    설정 재적용 + 워커 순차 교체 (preload 라 코드는 그대로)
+    kill -USR2 <master>   새 마스터 실행(코드 다시 로드), 이후 이전 마스터에 -TERM
+
+사용법:
+    python -m app.core.server
+    WEB_WORKERS=4 python -m app.core.server --bind 0.0.0.0:8000
+"""
+
+import argparse
+import gc
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from gunicorn.app.base import BaseApplication
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+APP = "app.main:app"
+WORKER_CLASS = "uvicorn_worker.UvicornWorker"
+CGROUP_ROOT = "/sys/fs/cgroup"
+# app.common.monitoring.metrics.MULTIPROC_DIR_ENV 와 같은 값. 그 모듈을 import 하면
+# prometheus_client 가 환경변수를 읽기 전에 로드되므로 여기서는 문자열로 둔다
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def available_cpus() -> int:
+    """컨테이너에 할당된 CPU 수 (cgroup v2/v1 쿼터를 반영, 최소 1)"""
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        return max(1, int(quota + 0.5))
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    try:
+        with open(os.path.join(CGROUP_ROOT, "cpu.max")) as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(os.path.join(CGROUP_ROOT, "cpu", "cpu.cfs_quota_us")) as f:
+            quota_us = int(f.read())
+        with open(os.path.join(CGROUP_ROOT, "cpu", "cpu.cfs_period_us")) as f:
+            period_us = int(f.read())
+        return quota_us / period_us if quota_us > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def prepare_metrics_dir(path: str) -> str:
+    """
+    멀티프로세스 메트릭 디렉터리를 비우고 환경변수로 지정.
+    prometheus_client 가 import 시점에 읽으므로 app 을 preload 하기 전에 호출한다.
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    os.environ[MULTIPROC_DIR_ENV] = path
+    return path
+
+
+def default_metrics_dir() -> str:
+    settings = get_settings()
+    return (
+        settings.web_metrics_dir
+        or os.environ.get(MULTIPROC_DIR_ENV)
+        or os.path.join(tempfile.gettempdir(), "prometheus-multiproc")
+    )
+
+
+def when_ready(server: Any) -> None:
+    """preload 가 끝난 마스터에서 fork 전에 한 번 호출"""
+    # 지금까지 만든 객체를 GC 대상에서 빼서 워커의 GC 가 공유 페이지를 복사하지 않게 함
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        f"Master ready: {server.cfg.workers} workers, "
+        f"{gc.get_freeze_count()} objects frozen"
+    )
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    logger.info(f"Worker spawned (pid {worker.pid})")
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """마스터에서 호출: 종료된 워커의 live 게이지 파일 정리"""
+    from app.common.monitoring.metrics import mark_worker_dead
+
+    mark_worker_dead(worker.pid)
+
+
+def build_options(args: argparse.Namespace) -> Dict[str, Any]:
+    settings = get_settings()
+    return {
+        "bind": args.bind or settings.web_bind,
+        "workers": args.workers or settings.web_workers or available_cpus(),
+        "worker_class": WORKER_CLASS,
+        "preload_app": True,
+        "max_requests": settings.web_max_requests,
+        "max_requests_jitter": settings.web_max_requests_jitter,
+        "timeout": settings.web_timeout,
+        "graceful_timeout": settings.web_graceful_timeout,
+        "keepalive": settings.web_keepalive,
+        # 워커 heartbeat 파일을 메모리에 (컨테이너 overlay fs 블로킹 방지)
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+        "forwarded_allow_ips": "*",
+        "accesslog": "-",
+        "when_ready": when_ready,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+class Server(BaseApplication):
+    """설정을 코드로 넘기는 gunicorn 애플리케이션"""
+
+    def __init__(self, app_uri: str, options: Dict[str, Any]) -> None:
+        self.app_uri = app_uri
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            if value is not None:
+                self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        from gunicorn.util import import_app
+
+        return import_app(self.app_uri)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="운영용 API 서버 (멀티 워커)")
+    parser.add_argument("--bind", help="기본값: WEB_BIND")
+    parser.add_argument("--workers", type=int, help="기본값: WEB_WORKERS 또는 CPU 수")
+    parser.add_argument("--app", default=APP)
+    args = parser.parse_args(argv)
+
+    prepare_metrics_dir(default_metrics_dir())
+    Server(args.app, build_options(args)).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+API 프로세스 시작 프로파일러
+
+sys.meta_path 에 훅을 걸고 대상 모듈(기본 app.main)을 import 하면서, 모듈마다
+실행 시간과 RSS 증가량을 잰다. 누적(cumulative)은 그 모듈이 import 한 하위 모듈을
+포함하고, self 는 하위 모듈을 뺀 값이다. 최상위 패키지별 합계도 함께 출력한다.
+
+    python -X importtime 과 달리 RSS 증가량을 같이 보여 주므로
+    "어떤 의존성이 워커 메모리를 먹는지" 를 바로 확인할 수 있다.
+
+사용법:
+    python -m app.core.startup_profile
+    python -m app.core.startup_profile --module app.main --top 30 --sort rss
+"""
+
+import argparse
+import importlib
+import importlib.abc
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """현재 RSS (bytes). /proc 가 없으면 최대 RSS 로 대신한다"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS 는 bytes, Linux 는 KB
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class ModuleImport:
+    """모듈 하나의 import 측정값"""
+
+    name: str
+    cumulative_time: float = 0.0
+    self_time: float = 0.0
+    cumulative_rss: int = 0
+    self_rss: int = 0
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """원래 loader 의 exec_module 을 감싸 시간/RSS 를 기록"""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler") -> None:
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec: Any) -> Any:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self.profiler.exec_module(self.loader, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    meta_path 맨 앞에서 다른 finder 에 spec 탐색을 맡기고 loader 만 감싼다.
+    exec_module 이 중첩되므로 스택으로 하위 모듈 몫을 부모의 self 에서 뺀다.
+    """
+
+    def __init__(self) -> None:
+        self.imports: Dict[str, ModuleImport] = {}
+        self._stack: List[ModuleImport] = []
+        self._finding = False
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def exec_module(self, loader: Any, module: Any) -> None:
+        record = ModuleImport(module.__name__)
+        self._stack.append(record)
+        rss_before = current_rss()
+        started = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            record.cumulative_time = time.perf_counter() - started
+            record.cumulative_rss = current_rss() - rss_before
+            self._stack.pop()
+            record.self_time += record.cumulative_time
+            record.self_rss += record.cumulative_rss
+            if self._stack:
+                self._stack[-1].self_time -= record.cumulative_time
+                self._stack[-1].self_rss -= record.cumulative_rss
+            self.imports[record.name] = record
+
+    def by_package(self) -> List[ModuleImport]:
+        """최상위 패키지별 self 합계 (누적은 최상위 모듈 자신의 값)"""
+        packages: Dict[str, ModuleImport] = {}
+        for record in self.imports.values():
+            name = record.name.split(".", 1)[0]
+            total = packages.setdefault(name, ModuleImport(name))
+            total.self_time += record.self_time
+            total.self_rss += record.self_rss
+            if record.name == name:
+                total.cumulative_time = record.cumulative_time
+                total.cumulative_rss = record.cumulative_rss
+        return list(packages.values())
+
+
+def _mb(value: int) -> str:
+    return f"{value / 1024 / 1024:8.1f}"
+
+
+def report(title: str, records: Sequence[ModuleImport], sort: str, top: int) -> None:
+    key = {
+        "time": lambda r: r.self_time,
+        "cumulative": lambda r: r.cumulative_time,
+        "rss": lambda r: r.self_rss,
+    }[sort]
+    print(f"\n[{title}] top {top} by {sort}")
+    print(f"{'self ms':>9} {'cum ms':>9} {'self MB':>8} {'cum MB':>8}  module")
+    for record in sorted(records, key=key, reverse=True)[:top]:
+        print(
+            f"{record.self_time * 1000:9.1f} {record.cumulative_time * 1000:9.1f} "
+            f"{_mb(record.self_rss)} {_mb(record.cumulative_rss)}  {record.name}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="API 프로세스 시작 프로파일러")
+    parser.add_argument("--module", default="app.main", help="import 할 모듈")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--sort", choices=["time", "cumulative", "rss"], default="time")
+    args = parser.parse_args(argv)
+
+    profiler = ImportProfiler()
+    rss_before = current_rss()
+    started = time.perf_counter()
+    profiler.install()
+    try:
+        importlib.import_module(args.module)
+    finally:
+        profiler.uninstall()
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"import {args.module}: {elapsed * 1000:.0f} ms, "
+        f"RSS {_mb(rss_before).strip()} -> {_mb(current_rss()).strip()} MB, "
+        f"{len(profiler.imports)} modules"
+    )
+    report("modules", list(profiler.imports.values()), args.sort, args.top)
+    package_sort = "rss" if args.sort == "rss" else "time"
+    report("packages", profiler.by_package(), package_sort, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
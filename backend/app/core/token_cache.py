@@ -0,0 +1,59 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class VerifiedTokenCache:
+    """서명 검증이 끝난 토큰 claims 의 LRU/TTL 캐시
+
+    - 키는 토큰 원문이 아닌 SHA-256 digest
+    - 만료 시각은 min(exp, 저장 시각 + ttl) 이라 만료된 토큰을 돌려주지 않는다
+    - 검증에 성공한 토큰만 저장하므로 같은 토큰이면 같은 claims 가 보장된다
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: int = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple[dict[str, Any], float]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return claims
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+
+        expires_at = time.time() + self.ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        key = self._key(token)
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
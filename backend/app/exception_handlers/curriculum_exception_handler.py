@@ -5,6 +5,7 @@ from app.modules.curriculum.application.exception import (
     CurriculumAccessDeniedError,
     CurriculumCountOverError,
     CurriculumNotFoundError,
+    CurriculumVersionConflictError,
     InvalidCurriculumStructureError,
     InvalidLLMResponseError,
     LLMGenerationError,
@@ -37,6 +38,18 @@ async def curriculum_count_over_error(
     raise exc
 
 
+async def curriculum_version_conflict_error(
+    request: Request,
+    exc: Exception,
+):
+    if isinstance(exc, CurriculumVersionConflictError):
+        return JSONResponse(
+            status_code=409,
+            content={"detail": str(exc)},
+        )
+    raise exc
+
+
 async def weekschedule_not_found_error(
     request: Request,
     exc: Exception,
@@ -112,6 +125,9 @@ async def invalid_llm_reponse_error(
 def CurriculumExceptionHandler(app: FastAPI):
     app.add_exception_handler(CurriculumNotFoundError, curriculum_not_found_error)
     app.add_exception_handler(CurriculumCountOverError, curriculum_count_over_error)
+    app.add_exception_handler(
+        CurriculumVersionConflictError, curriculum_version_conflict_error
+    )
     app.add_exception_handler(WeekScheduleNotFoundError, weekschedule_not_found_error)
     app.add_exception_handler(WeekIndexOutOfRangeError, week_index_out_of_range_error)
     app.add_exception_handler(
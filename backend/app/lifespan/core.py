@@ -2,6 +2,8 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import logging
 
+from app.utils.password_hasher import password_hasher
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,4 +14,4 @@ async def core_lifespan(app: FastAPI):
     yield
     logger.info("⚙️ DI unwired")
     app.container.unwire()  # type: ignore # app.container 사용
-    yield
+    password_hasher.shutdown()
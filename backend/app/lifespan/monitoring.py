@@ -21,7 +21,11 @@ async def monitoring_lifespan(app: FastAPI):
         # Prometheus 메트릭 서버 시작 (포트 8001 사용)
         await initialize_metrics_collector(port=8001)
         logger.info("📈 Metrics collector initialized on port 8001")
+    except Exception as e:
+        # 포트를 못 잡아도 메트릭 서비스는 시작 (/metrics 는 계속 응답)
+        logger.warning(f"Metrics collector not started in this worker: {e}")
 
+    try:
         # 메트릭 서비스 시작
         async with AsyncSessionLocal() as session:
             metrics_service = MetricsService(session, redis_client, update_interval=30)
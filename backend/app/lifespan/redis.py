@@ -1,6 +1,9 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.common.cache.redis_client import redis_client
+from app.common.cache.reference_data import reference_data
+from app.common.cache.two_tier import two_tier_caches
+from app.common.middleware.background import drain_background_tasks
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -11,6 +14,14 @@ logger = logging.getLogger(__name__)
 async def redis_lifespan(app: FastAPI):
     logger.info("🔴 Connecting Redis")
     await redis_client.connect()
+    # 다른 워커의 참조 데이터 변경 알림 수신
+    await reference_data.start_listener()
+    # 다른 워커의 쓰기로 인한 2단 캐시 L1 무효화 수신
+    await two_tier_caches.start_listener()
     yield
+    await two_tier_caches.stop_listener()
+    await reference_data.stop_listener()
+    # 응답 이후 예약된 Redis 작업을 마무리한 뒤 연결 종료
+    await drain_background_tasks()
     logger.info("🔴 Disconnecting Redis")
     await redis_client.disconnect()
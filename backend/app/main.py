@@ -5,6 +5,8 @@ from app.core.di_container import Container
 from app.exception_handlers import setup_exception_handlers
 from app.lifespan import combined_lifespan
 from app.common.middleware.activity_middleware import ActivityTrackingMiddleware
+from app.common.middleware.timing_middleware import RequestTimingMiddleware
+from app.common.serialization.response import FastJSONResponse
 
 
 class App(FastAPI):
@@ -16,14 +18,16 @@ app = App(
     title="Curriculum Learning Platform API",
     description="A comprehensive learning platform with social features",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 app.container = Container()
 
 setup_exception_handlers(app)
 
-# 미들웨어 추가
+# 미들웨어 추가 (pure ASGI, 나중에 추가한 것이 바깥쪽)
 app.add_middleware(ActivityTrackingMiddleware)
+app.add_middleware(RequestTimingMiddleware)
 
 # 라우터 추가
 app.include_router(v1_router)
@@ -7,11 +7,23 @@ from app.modules.admin.interface.schema.admin_curriculum_schema import (
     AdminGetCurriculumsPageResponse,
     AdminGetCurriculumResponse,
 )
+from app.modules.curriculum.domain.repository.curriculum_cache_repo import (
+    ICurriculumCacheRepository,
+)
 
 
 class AdminCurriculumService:
-    def __init__(self, repo: AdminCurriculumRepository) -> None:
+    def __init__(
+        self,
+        repo: AdminCurriculumRepository,
+        curriculum_cache: Optional[ICurriculumCacheRepository] = None,
+    ) -> None:
         self.repo = repo
+        self.curriculum_cache = curriculum_cache
+
+    async def _invalidate_detail(self, curriculum_id: str) -> None:
+        if self.curriculum_cache:
+            await self.curriculum_cache.invalidate(curriculum_id)
 
     async def list_curriculums(
         self, *, page: int, items_per_page: int, owner_id: Optional[str]
@@ -46,7 +58,9 @@ class AdminCurriculumService:
         if visibility not in ("PUBLIC", "PRIVATE"):
             raise ValueError("invalid visibility")
         await self.repo.update_visibility(curriculum_id, visibility)
+        await self._invalidate_detail(curriculum_id)
         return await self.get_curriculum(curriculum_id)
 
     async def delete_curriculum(self, curriculum_id: str) -> None:
         await self.repo.delete_by_id(curriculum_id)
+        await self._invalidate_detail(curriculum_id)
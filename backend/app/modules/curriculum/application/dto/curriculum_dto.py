@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import List, Optional, Sequence
 
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.entity.curriculum_brief import CurriculumBrief
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
 from app.modules.curriculum.domain.vo.difficulty import Difficulty
 from app.modules.curriculum.domain.vo.visibility import Visibility
@@ -97,6 +99,53 @@ class DeleteLessonCommand:
     lesson_index: int
 
 
+class CurriculumEditOp(str, Enum):
+    """일괄 수정 작업 종류"""
+
+    INSERT_WEEK = "insert_week"
+    REMOVE_WEEK = "remove_week"
+    INSERT_LESSON = "insert_lesson"
+    UPDATE_LESSON = "update_lesson"
+    REMOVE_LESSON = "remove_lesson"
+
+
+@dataclass
+class CurriculumEditOperation:
+    """일괄 수정의 개별 주차/레슨 작업"""
+
+    op: CurriculumEditOp
+    week_number: int
+    lesson_index: Optional[int] = None
+    lesson: Optional[str] = None
+    lessons: Optional[List[str]] = None
+
+    def __post_init__(self):
+        """작업별 필수 값 검증"""
+        self.op = CurriculumEditOp(self.op)
+        if self.op == CurriculumEditOp.INSERT_WEEK and not self.lessons:
+            raise ValueError("insert_week requires lessons")
+        if (
+            self.op in (CurriculumEditOp.INSERT_LESSON, CurriculumEditOp.UPDATE_LESSON)
+            and self.lesson is None
+        ):
+            raise ValueError(f"{self.op.value} requires lesson")
+        if (
+            self.op in (CurriculumEditOp.UPDATE_LESSON, CurriculumEditOp.REMOVE_LESSON)
+            and self.lesson_index is None
+        ):
+            raise ValueError(f"{self.op.value} requires lesson_index")
+
+
+@dataclass
+class BatchEditCurriculumCommand:
+    """주차/레슨 일괄 수정 명령 (expected_updated_at: 클라이언트가 읽은 버전)"""
+
+    curriculum_id: str
+    owner_id: str
+    expected_updated_at: datetime
+    operations: List[CurriculumEditOperation]
+
+
 @dataclass
 class CurriculumQuery:
     """커리큘럼 조회 쿼리"""
@@ -148,6 +197,37 @@ class CurriculumDTO:
             ],
         )
 
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (상세 캐시 저장/ETag 계산용)"""
+        return {
+            "id": self.id,
+            "owner_id": self.owner_id,
+            "title": self.title,
+            "visibility": self.visibility,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "week_schedules": [
+                {"week_number": ws.week_number, "lessons": ws.lessons}
+                for ws in self.week_schedules
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CurriculumDTO":
+        """딕셔너리에서 객체 생성 (상세 캐시 조회용)"""
+        return cls(
+            id=data["id"],
+            owner_id=data["owner_id"],
+            title=data["title"],
+            visibility=data["visibility"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            week_schedules=[
+                WeekScheduleDTO(week_number=ws["week_number"], lessons=ws["lessons"])
+                for ws in data["week_schedules"]
+            ],
+        )
+
 
 @dataclass
 class CurriculumBriefDTO:
@@ -163,7 +243,9 @@ class CurriculumBriefDTO:
     updated_at: datetime
 
     @classmethod
-    def from_domain(cls, curriculum: Curriculum) -> "CurriculumBriefDTO":
+    def from_domain(
+        cls, curriculum: Curriculum | CurriculumBrief
+    ) -> "CurriculumBriefDTO":
         return cls(
             id=curriculum.id,
             owner_id=curriculum.owner_id,
@@ -191,7 +273,7 @@ class CurriculumPageDTO:
         total_count: int,
         page: int,
         items_per_page: int,
-        curriculums: List[Curriculum],
+        curriculums: Sequence[Curriculum | CurriculumBrief],
     ) -> "CurriculumPageDTO":
         curriculum_dtos: List[CurriculumBriefDTO] = [
             CurriculumBriefDTO.from_domain(c) for c in curriculums
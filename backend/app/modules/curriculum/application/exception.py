@@ -22,6 +22,12 @@ class WeekIndexOutOfRangeError(Exception):
     pass
 
 
+class CurriculumVersionConflictError(Exception):
+    """커리큘럼이 읽은 뒤 다른 요청으로 수정됨"""
+
+    pass
+
+
 class InvalidCurriculumStructureError(Exception):
     """잘못된 커리큘럼 구조"""
 
@@ -1,12 +1,16 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
 from ulid import ULID  # type: ignore
+from app.common.cache.etag import compute_etag
 from app.common.llm.llm_client_repo import ILLMClientRepository
 from app.modules.curriculum.application.dto.curriculum_dto import (
+    BatchEditCurriculumCommand,
     CreateCurriculumCommand,
     CreateLessonCommand,
     CreateWeekScheduleCommand,
     CurriculumDTO,
+    CurriculumEditOp,
+    CurriculumEditOperation,
     CurriculumPageDTO,
     CurriculumQuery,
     DeleteLessonCommand,
@@ -17,6 +21,7 @@ from app.modules.curriculum.application.dto.curriculum_dto import (
 from app.modules.curriculum.application.exception import (
     CurriculumCountOverError,
     CurriculumNotFoundError,
+    CurriculumVersionConflictError,
     LLMGenerationError,
     WeekIndexOutOfRangeError,
     WeekScheduleNotFoundError,
@@ -24,6 +29,9 @@ from app.modules.curriculum.application.exception import (
 )
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.repository.curriculum_cache_repo import (
+    ICurriculumCacheRepository,
+)
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
 )
@@ -34,6 +42,10 @@ from app.modules.curriculum.domain.vo.lessons import Lessons
 from app.modules.curriculum.domain.vo.title import Title
 from app.modules.curriculum.domain.vo.visibility import Visibility
 from app.modules.curriculum.domain.vo.week_number import WeekNumber
+from app.modules.feed.application.service.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
+from app.modules.feed.application.service.timeline_service import TimelineService
 from app.modules.user.domain.vo.role import RoleVO
 from app.modules.social.domain.repository.follow_repo import IFollowRepository
 from app.common.monitoring.metrics import increment_curriculum_creation
@@ -48,7 +60,9 @@ class CurriculumService:
         llm_client: ILLMClientRepository,
         follow_repo: IFollowRepository,  # 추가
         ulid: ULID = ULID(),
-        # feed_event_handler: Optional[CurriculumEventHandler] = None,
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
+        timeline_service: Optional[TimelineService] = None,
+        curriculum_cache: Optional[ICurriculumCacheRepository] = None,
     ) -> None:
 
         self.curriculum_repo: ICurriculumRepository = curriculum_repo
@@ -58,7 +72,19 @@ class CurriculumService:
         self.llm_client: ILLMClientRepository = llm_client
         self.ulid: ULID = ulid
         self.follow_repo: IFollowRepository = follow_repo  # 추가
-        # self.feed_event_handler = feed_event_handler  # 추가
+        self.feed_event_handler = feed_event_handler
+        self.timeline_service = timeline_service
+        self.curriculum_cache = curriculum_cache
+
+    async def _invalidate_detail(self, curriculum_id: str) -> None:
+        if self.curriculum_cache:
+            await self.curriculum_cache.invalidate(curriculum_id)
+
+    async def _on_schedule_changed(self, curriculum_id: str) -> None:
+        """주차/레슨 변경 → 상세 캐시 무효화, 피드 검색 색인 갱신"""
+        await self._invalidate_detail(curriculum_id)
+        if self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_updated(curriculum_id)
 
     def _parse_llm_response(self, llm_response: dict, goal: str) -> dict:  # type: ignore
         try:
@@ -159,6 +185,8 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.save(curriculum)
+        if self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_created(curriculum.id)
 
         increment_curriculum_creation()
 
@@ -203,6 +231,8 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.save(curriculum)
+        if self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_created(curriculum.id)
         increment_curriculum_creation()
         return CurriculumDTO.from_domain(curriculum)
 
@@ -250,6 +280,35 @@ class CurriculumService:
 
         return CurriculumDTO.from_domain(curriculum)
 
+    async def get_curriculum_detail(
+        self,
+        curriculum_id: str,
+        role: RoleVO,
+        owner_id: Optional[str] = None,
+    ) -> Tuple[CurriculumDTO, str]:
+        """
+        상세 조회 + ETag (read-through 캐시).
+        캐시는 요청자와 무관하게 커리큘럼 단위로 저장하므로 권한은 읽은 뒤 확인한다.
+        """
+        if self.curriculum_cache:
+            cached = await self.curriculum_cache.get(curriculum_id)
+            if cached is not None:
+                dto = CurriculumDTO.from_dict(cached["curriculum"])
+                if not _can_view(dto, role, owner_id):
+                    raise CurriculumNotFoundError(
+                        f"Curriculum {curriculum_id} not found"
+                    )
+                return dto, cached["etag"]
+
+        dto = await self.get_curriculum_by_id(curriculum_id, role, owner_id)
+        payload = dto.to_dict()
+        etag = compute_etag(payload)
+        if self.curriculum_cache:
+            await self.curriculum_cache.set(
+                curriculum_id, {"etag": etag, "curriculum": payload}
+            )
+        return dto, etag
+
     async def update_curriculum(
         self,
         command: UpdateCurriculumCommand,
@@ -270,9 +329,9 @@ class CurriculumService:
         if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
             raise PermissionError("You can only update your own curriculum")
 
-        # visibility_changed = (
-        #     command.visibility and curriculum.visibility != command.visibility
-        # )
+        visibility_changed = (
+            command.visibility and curriculum.visibility != command.visibility
+        )
 
         # 업데이트
         if command.title:
@@ -282,12 +341,15 @@ class CurriculumService:
             curriculum.change_visibility(command.visibility)
 
         await self.curriculum_repo.update(curriculum)
+        await self._invalidate_detail(curriculum.id)
 
-        # if self.feed_event_handler:
-        #     if visibility_changed:
-        #         await self.feed_event_handler.on_curriculum_visibility_changed(curriculum.id)
-        #     else:
-        #         await self.feed_event_handler.on_curriculum_updated(curriculum.id)
+        if self.feed_event_handler:
+            if visibility_changed:
+                await self.feed_event_handler.on_curriculum_visibility_changed(
+                    curriculum.id
+                )
+            else:
+                await self.feed_event_handler.on_curriculum_updated(curriculum.id)
 
         return CurriculumDTO.from_domain(curriculum)
 
@@ -311,6 +373,11 @@ class CurriculumService:
             raise PermissionError("You can only delete your own curriculum")
 
         await self.curriculum_repo.delete(curriculum_id)
+        await self._invalidate_detail(curriculum_id)
+        if self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_deleted(
+                curriculum_id, curriculum.owner_id
+            )
 
     async def create_week_schedule(
         self,
@@ -338,6 +405,7 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.update(updated_curriculum)
+        await self._on_schedule_changed(updated_curriculum.id)
         return CurriculumDTO.from_domain(updated_curriculum)
 
     async def delete_week_schedule(
@@ -370,6 +438,7 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.update(updated_curriculum)
+        await self._on_schedule_changed(updated_curriculum.id)
 
     async def create_lesson(
         self,
@@ -391,32 +460,12 @@ class CurriculumService:
         if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
             raise PermissionError("You can only modify your own curriculum")
 
-        target_week = WeekNumber(command.week_number)
-        week_schedule: WeekSchedule | None = curriculum.get_week_schedule(target_week)
-
-        if not week_schedule:
-            raise WeekScheduleNotFoundError(f"Week {command.week_number} not found")
-
-        insert_index = (
-            command.lesson_index
-            if command.lesson_index is not None
-            else week_schedule.lessons.count
+        self._insert_lesson(
+            curriculum, command.week_number, command.lesson, command.lesson_index
         )
 
-        if not (0 <= insert_index <= week_schedule.lessons.count):
-            raise WeekIndexOutOfRangeError("Lesson index out of range")
-
-        lessons_list = week_schedule.lessons.items
-        lessons_list.insert(insert_index, command.lesson)
-
-        updated_week_schedule = WeekSchedule(
-            week_number=target_week,
-            lessons=Lessons(lessons_list),
-        )
-
-        curriculum.update_week_schedule(target_week, updated_week_schedule)
-
         await self.curriculum_repo.update(curriculum)
+        await self._on_schedule_changed(curriculum.id)
         return CurriculumDTO.from_domain(curriculum)
 
     async def update_lesson(
@@ -439,31 +488,50 @@ class CurriculumService:
         if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
             raise PermissionError("You can only modify your own curriculum")
 
-        target_week = WeekNumber(command.week_number)
-        week_schedule: WeekSchedule | None = curriculum.get_week_schedule(target_week)
+        self._update_lesson(
+            curriculum, command.week_number, command.lesson_index, command.new_lesson
+        )
 
-        if not week_schedule:
-            raise WeekScheduleNotFoundError(f"Week {command.week_number} not found")
+        await self.curriculum_repo.update(curriculum)
+        await self._on_schedule_changed(curriculum.id)
+        return CurriculumDTO.from_domain(curriculum)
 
-        if not (0 <= command.lesson_index < week_schedule.lessons.count):
-            raise WeekIndexOutOfRangeError("Lesson index out of range")
+    async def delete_lesson(
+        self,
+        command: DeleteLessonCommand,
+        role: RoleVO,
+    ) -> CurriculumDTO:
 
-        updated_week_schedule: WeekSchedule = week_schedule.update_lesson_at(
-            index=command.lesson_index,
-            new_lesson=command.new_lesson,
+        curriculum: Curriculum | None = await self.curriculum_repo.find_by_id(
+            curriculum_id=command.curriculum_id,
+            role=role,
+            owner_id=command.owner_id,
         )
 
-        curriculum.update_week_schedule(target_week, updated_week_schedule)
+        if not curriculum:
+            raise CurriculumNotFoundError(
+                f"Curriculum {command.curriculum_id} not found"
+            )
+
+        if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
+            raise PermissionError("You can only modify your own curriculum")
+
+        self._remove_lesson(curriculum, command.week_number, command.lesson_index)
 
         await self.curriculum_repo.update(curriculum)
+        await self._on_schedule_changed(curriculum.id)
         return CurriculumDTO.from_domain(curriculum)
 
-    async def delete_lesson(
+    async def batch_edit_curriculum(
         self,
-        command: DeleteLessonCommand,
+        command: BatchEditCurriculumCommand,
         role: RoleVO,
     ) -> CurriculumDTO:
-
+        """
+        주차/레슨 작업 목록을 순서대로 메모리의 커리큘럼에 적용하고 한 번에 저장.
+        하나라도 실패하면 아무것도 저장하지 않으며, 읽은 버전(expected_updated_at) 이후
+        다른 수정이 있었으면 CurriculumVersionConflictError.
+        """
         curriculum: Curriculum | None = await self.curriculum_repo.find_by_id(
             curriculum_id=command.curriculum_id,
             role=role,
@@ -478,23 +546,133 @@ class CurriculumService:
         if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
             raise PermissionError("You can only modify your own curriculum")
 
-        target_week = WeekNumber(command.week_number)
-        week_schedule: WeekSchedule | None = curriculum.get_week_schedule(target_week)
+        if _version(curriculum.updated_at) != _version(command.expected_updated_at):
+            raise CurriculumVersionConflictError(
+                f"Curriculum {command.curriculum_id} was modified by another request"
+            )
+
+        for operation in command.operations:
+            curriculum = await self._apply_edit(curriculum, operation)
 
+        # 응답의 updated_at 이 다음 요청의 버전 (저장 컬럼은 DATETIME(6))
+        curriculum.updated_at = datetime.now(timezone.utc)
+
+        updated = await self.curriculum_repo.update_if_unchanged(
+            curriculum, command.expected_updated_at
+        )
+        if not updated:
+            raise CurriculumVersionConflictError(
+                f"Curriculum {command.curriculum_id} was modified by another request"
+            )
+
+        await self._on_schedule_changed(curriculum.id)
+        return CurriculumDTO.from_domain(curriculum)
+
+    async def _apply_edit(
+        self, curriculum: Curriculum, operation: CurriculumEditOperation
+    ) -> Curriculum:
+        """일괄 수정 작업 하나 적용 (주차 삽입/삭제는 새 커리큘럼 반환)"""
+        if operation.op == CurriculumEditOp.INSERT_WEEK:
+            return await self.curriculum_domain_service.insert_week_and_shift(
+                curriculum=curriculum,
+                new_week_number=operation.week_number,
+                lessons_data=operation.lessons or [],
+            )
+        if operation.op == CurriculumEditOp.REMOVE_WEEK:
+            if not curriculum.has_week(WeekNumber(operation.week_number)):
+                raise WeekScheduleNotFoundError(
+                    f"Week {operation.week_number} not found"
+                )
+            return await self.curriculum_domain_service.remove_week_and_shift(
+                curriculum=curriculum,
+                target_week_number=operation.week_number,
+            )
+        if operation.op == CurriculumEditOp.INSERT_LESSON:
+            self._insert_lesson(
+                curriculum,
+                operation.week_number,
+                operation.lesson or "",
+                operation.lesson_index,
+            )
+        elif operation.op == CurriculumEditOp.UPDATE_LESSON:
+            self._update_lesson(
+                curriculum,
+                operation.week_number,
+                operation.lesson_index or 0,
+                operation.lesson or "",
+            )
+        else:
+            self._remove_lesson(
+                curriculum, operation.week_number, operation.lesson_index or 0
+            )
+        return curriculum
+
+    def _get_week(self, curriculum: Curriculum, week_number: int) -> WeekSchedule:
+        week_schedule = curriculum.get_week_schedule(WeekNumber(week_number))
         if not week_schedule:
-            raise WeekScheduleNotFoundError(f"Week {command.week_number} not found")
+            raise WeekScheduleNotFoundError(f"Week {week_number} not found")
+        return week_schedule
 
-        if not (0 <= command.lesson_index < week_schedule.lessons.count):
+    def _insert_lesson(
+        self,
+        curriculum: Curriculum,
+        week_number: int,
+        lesson: str,
+        lesson_index: Optional[int] = None,
+    ) -> None:
+        week_schedule = self._get_week(curriculum, week_number)
+
+        insert_index = (
+            lesson_index if lesson_index is not None else week_schedule.lessons.count
+        )
+
+        if not (0 <= insert_index <= week_schedule.lessons.count):
             raise WeekIndexOutOfRangeError("Lesson index out of range")
 
-        updated_week_schedule: WeekSchedule = week_schedule.remove_lesson_at(
-            command.lesson_index
+        lessons_list = week_schedule.lessons.items
+        lessons_list.insert(insert_index, lesson)
+
+        updated_week_schedule = WeekSchedule(
+            week_number=week_schedule.week_number,
+            lessons=Lessons(lessons_list),
         )
 
-        curriculum.update_week_schedule(target_week, updated_week_schedule)
+        curriculum.update_week_schedule(
+            week_schedule.week_number, updated_week_schedule
+        )
 
-        await self.curriculum_repo.update(curriculum)
-        return CurriculumDTO.from_domain(curriculum)
+    def _update_lesson(
+        self, curriculum: Curriculum, week_number: int, lesson_index: int, lesson: str
+    ) -> None:
+        week_schedule = self._get_week(curriculum, week_number)
+
+        if not (0 <= lesson_index < week_schedule.lessons.count):
+            raise WeekIndexOutOfRangeError("Lesson index out of range")
+
+        updated_week_schedule: WeekSchedule = week_schedule.update_lesson_at(
+            index=lesson_index,
+            new_lesson=lesson,
+        )
+
+        curriculum.update_week_schedule(
+            week_schedule.week_number, updated_week_schedule
+        )
+
+    def _remove_lesson(
+        self, curriculum: Curriculum, week_number: int, lesson_index: int
+    ) -> None:
+        week_schedule = self._get_week(curriculum, week_number)
+
+        if not (0 <= lesson_index < week_schedule.lessons.count):
+            raise WeekIndexOutOfRangeError("Lesson index out of range")
+
+        updated_week_schedule: WeekSchedule = week_schedule.remove_lesson_at(
+            lesson_index
+        )
+
+        curriculum.update_week_schedule(
+            week_schedule.week_number, updated_week_schedule
+        )
 
     async def get_following_users_curriculums(
         self,
@@ -502,31 +680,20 @@ class CurriculumService:
         page: int = 1,
         items_per_page: int = 10,
     ) -> CurriculumPageDTO:
-        """팔로우한 사용자들의 public 커리큘럼 목록 조회"""
-
-        # 팔로우한 사용자들 조회
-        _, follows = await self.follow_repo.find_followees(
-            user_id, page=1, items_per_page=1000  # 모든 팔로잉 사용자 조회
-        )
-
-        if not follows:
-            return CurriculumPageDTO.from_domain(
-                total_count=0,
-                page=page,
-                items_per_page=items_per_page,
-                curriculums=[],
+        """팔로우한 사용자들의 public 커리큘럼 목록 조회 (최근 수정순)"""
+        if self.timeline_service:
+            total_count, curriculum_ids = await self.timeline_service.get_page(
+                user_id, page, items_per_page
             )
-
-        followee_ids = [follow.followee_id for follow in follows]
-
-        # 팔로우한 사용자들의 public 커리큘럼 조회
-        total_count, curriculums = (
-            await self.curriculum_repo.find_public_curriculums_by_users(
-                user_ids=followee_ids,
-                page=page,
-                items_per_page=items_per_page,
+            curriculums = await self.curriculum_repo.find_public_by_ids(curriculum_ids)
+        else:
+            total_count, curriculums = (
+                await self.curriculum_repo.find_public_curriculums_followed_by(
+                    user_id=user_id,
+                    page=page,
+                    items_per_page=items_per_page,
+                )
             )
-        )
 
         return CurriculumPageDTO.from_domain(
             total_count=total_count,
@@ -534,3 +701,19 @@ class CurriculumService:
             items_per_page=items_per_page,
             curriculums=curriculums,
         )
+
+
+def _version(updated_at: datetime) -> datetime:
+    """낙관적 동시성 비교용 버전 (tz 없는 UTC, 마이크로초까지)"""
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return updated_at
+
+
+def _can_view(dto: CurriculumDTO, role: RoleVO, owner_id: Optional[str]) -> bool:
+    """find_by_id 의 조회 조건과 동일 (관리자, 소유자, 공개)"""
+    return (
+        role == RoleVO.ADMIN
+        or dto.owner_id == owner_id
+        or dto.visibility == Visibility.PUBLIC.value
+    )
@@ -1,7 +1,9 @@
 from .week_schedule import WeekSchedule
 from .curriculum import Curriculum
+from .curriculum_brief import CurriculumBrief
 
 __all__ = [
     "WeekSchedule",
     "Curriculum",
+    "CurriculumBrief",
 ]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.modules.curriculum.domain.vo import Title, Visibility, WeekNumber
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
@@ -17,6 +17,10 @@ class Curriculum:
     created_at: datetime
     updated_at: datetime
     week_schedules: List[WeekSchedule] = field(default_factory=list)  # type: ignore
+    # 저장 시 주차 번호 일괄 이동으로 반영할 (시작 주차, 이동량) 기록
+    week_shifts: List[Tuple[int, int]] = field(
+        default_factory=list, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """생성 후 유효성 검사"""
@@ -99,6 +103,10 @@ class Curriculum:
 
         self._touch_updated_at()
 
+    def record_week_shift(self, from_week: int, delta: int) -> None:
+        """from_week 이후 주차 번호 이동 기록 (저장소가 UPDATE 한 번으로 반영)"""
+        self.week_shifts.append((from_week, delta))
+
     def get_week_schedule(self, week_number: WeekNumber) -> Optional[WeekSchedule]:
         """특정 주차 주제 조회"""
         print(f"Looking for week: {week_number.value}")
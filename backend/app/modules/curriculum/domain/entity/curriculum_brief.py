@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.modules.curriculum.domain.vo import Title, Visibility
+
+
+@dataclass
+class CurriculumBrief:
+    """
+    목록 조회용 커리큘럼 읽기 모델 (주차/레슨 없이 저장된 개수만).
+    Curriculum 과 같은 조회 메서드를 제공해 목록 DTO 변환에 그대로 쓴다.
+    """
+
+    id: str
+    owner_id: str
+    title: Title
+    visibility: Visibility
+    total_weeks: int
+    total_lessons: int
+    created_at: datetime
+    updated_at: datetime
+
+    def get_total_weeks(self) -> int:
+        return self.total_weeks
+
+    def get_total_lessons(self) -> int:
+        return self.total_lessons
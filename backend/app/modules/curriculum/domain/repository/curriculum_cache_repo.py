@@ -0,0 +1,21 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ICurriculumCacheRepository(metaclass=ABCMeta):
+    """직렬화된 커리큘럼 상세 캐시 (권한 검사는 읽은 뒤 호출 측에서)"""
+
+    @abstractmethod
+    async def get(self, curriculum_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 상세 (없음/장애 시 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, curriculum_id: str, detail: Dict[str, Any]) -> None:
+        """상세 저장 (무효화 직후에는 저장하지 않음)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, curriculum_id: str) -> None:
+        """수정/삭제/공개 범위 변경 후 무효화"""
+        raise NotImplementedError
@@ -1,7 +1,9 @@
 from abc import ABCMeta, abstractmethod
+from datetime import datetime
 from typing import List, Optional, Tuple
 
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.entity.curriculum_brief import CurriculumBrief
 from app.modules.user.domain.vo.role import RoleVO
 
 
@@ -27,8 +29,8 @@ class ICurriculumRepository(metaclass=ABCMeta):
         owner_id: str,
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[Curriculum]]:
-        """소유자 ID로 커리큘럼 목록 조회"""
+    ) -> Tuple[int, List[CurriculumBrief]]:
+        """소유자 ID로 커리큘럼 목록 조회 (목록용 읽기 모델, 주차/레슨 제외)"""
         raise NotImplementedError
 
     @abstractmethod
@@ -36,7 +38,7 @@ class ICurriculumRepository(metaclass=ABCMeta):
         self,
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[Curriculum]]:
+    ) -> Tuple[int, List[CurriculumBrief]]:
         """공개 커리큘럼 목록 조회"""
         raise NotImplementedError
 
@@ -45,6 +47,16 @@ class ICurriculumRepository(metaclass=ABCMeta):
         """커리큘럼 업데이트"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_if_unchanged(
+        self, curriculum: Curriculum, expected_updated_at: datetime
+    ) -> bool:
+        """
+        저장된 updated_at 이 expected_updated_at(초 단위)과 같을 때만 업데이트.
+        다른 요청이 먼저 수정했으면 아무것도 쓰지 않고 False.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, curriculum_id: str) -> None:
         """커리큘럼 삭제"""
@@ -66,6 +78,23 @@ class ICurriculumRepository(metaclass=ABCMeta):
         user_ids: List[str],
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[Curriculum]]:
+    ) -> Tuple[int, List[CurriculumBrief]]:
         """특정 사용자들의 공개 커리큘럼 목록 조회"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_public_curriculums_followed_by(
+        self,
+        user_id: str,
+        page: int = 1,
+        items_per_page: int = 10,
+    ) -> Tuple[int, List[CurriculumBrief]]:
+        """사용자가 팔로우하는 사람들의 공개 커리큘럼 목록 조회 (최근 수정순)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_public_by_ids(
+        self, curriculum_ids: List[str]
+    ) -> List[CurriculumBrief]:
+        """ID 순서대로 공개 커리큘럼 조회 (없거나 비공개인 ID 는 제외)"""
+        raise NotImplementedError
@@ -91,7 +91,7 @@ class CurriculumDomainService:
             updated_week_schedules.append(new_week_schedule)
 
         # 새 커리큘럼 생성 (불변성 유지)
-        return Curriculum(
+        shifted = Curriculum(
             id=curriculum.id,
             owner_id=curriculum.owner_id,
             title=curriculum.title,
@@ -99,7 +99,10 @@ class CurriculumDomainService:
             created_at=curriculum.created_at,
             updated_at=datetime.now(timezone.utc),
             week_schedules=updated_week_schedules,
+            week_shifts=list(curriculum.week_shifts),
         )
+        shifted.record_week_shift(new_week_number, 1)
+        return shifted
 
     async def remove_week_and_shift(
         self,
@@ -130,7 +133,7 @@ class CurriculumDomainService:
                 # 이전 주차들은 그대로 유지
                 updated_week_schedules.append(week_schedule)
 
-        return Curriculum(
+        shifted = Curriculum(
             id=curriculum.id,
             owner_id=curriculum.owner_id,
             title=curriculum.title,
@@ -138,7 +141,10 @@ class CurriculumDomainService:
             created_at=curriculum.created_at,
             updated_at=datetime.now(timezone.utc),
             week_schedules=updated_week_schedules,
+            week_shifts=list(curriculum.week_shifts),
         )
+        shifted.record_week_shift(target_week_number + 1, -1)
+        return shifted
 
     async def validate_curriculum_structure(
         self,
@@ -4,7 +4,7 @@ from app.modules.curriculum.domain.vo.lesson import Lesson
 
 
 class Lessons:
-    """Lessons (list)"""
+    """Lessons (list), 내부에는 검증된 레슨 문자열만 보관하고 Lesson VO 는 필요할 때 생성"""
 
     __slots__ = ("_items",)
 
@@ -15,8 +15,8 @@ class Lessons:
         if not isinstance(raw, list):  # type: ignore
             raise ValueError(f"Lessons must be a list, got {type(raw).__name__}")
 
-        # Lesson VO로 변환하면서 빈 값 제거
-        lessons: List[Lesson] = []
+        # Lesson VO로 검증하면서 빈 값 제거
+        lessons: List[str] = []
         for i, item in enumerate(raw):
             if not isinstance(item, str):
                 raise ValueError(
@@ -25,7 +25,7 @@ class Lessons:
 
             text = item.strip()
             if text:  # 빈 문자열이 아닌 경우만 추가
-                lessons.append(Lesson(text))
+                lessons.append(Lesson(text).value)
 
         count = len(lessons)
         if count < self.MIN_COUNT:
@@ -37,10 +37,17 @@ class Lessons:
 
         self._items = tuple(lessons)  # 불변성 보장
 
+    @classmethod
+    def from_trusted(cls, items: List[str]) -> "Lessons":
+        """저장소 전용: 이미 검증되어 저장된 레슨 목록으로 생성 (검증 생략)"""
+        obj = cls.__new__(cls)
+        obj._items = tuple(items)
+        return obj
+
     @property
     def items(self) -> List[str]:
         """문자열 리스트로 반환"""
-        return [lesson.value for lesson in self._items]
+        return list(self._items)
 
     @property
     def count(self) -> int:
@@ -49,15 +56,14 @@ class Lessons:
     @property
     def lessons(self) -> List[Lesson]:
         """Lesson VO 리스트로 반환"""
-        return list(self._items)
+        return [Lesson.from_trusted(value) for value in self._items]
 
     def add_lesson(self, lesson: str) -> "Lessons":
         """새 레슨 추가한 Lessons 반환 (불변성 유지)"""
         if self.count >= self.MAX_COUNT:
             raise ValueError(f"Cannot add more than {self.MAX_COUNT} lessons")
 
-        new_lessons = list(self._items) + [Lesson(lesson)]
-        return Lessons([lesson.value for lesson in new_lessons])
+        return Lessons([*self._items, Lesson(lesson).value])
 
     def remove_lesson_at(self, index: int) -> "Lessons":
         """지정 인덱스의 레슨 제거한 Lessons 반환 (불변성 유지)"""
@@ -69,7 +75,7 @@ class Lessons:
 
         new_lessons = list(self._items)
         new_lessons.pop(index)
-        return Lessons([lesson.value for lesson in new_lessons])
+        return Lessons(new_lessons)
 
     def update_lesson_at(self, index: int, new_lesson: str) -> "Lessons":
         """지정 인덱스의 레슨 수정한 Lessons 반환 (불변성 유지)"""
@@ -77,8 +83,8 @@ class Lessons:
             raise ValueError(f"Index {index} out of range (0-{self.count-1})")
 
         new_lessons = list(self._items)
-        new_lessons[index] = Lesson(new_lesson)
-        return Lessons([lesson.value for lesson in new_lessons])
+        new_lessons[index] = Lesson(new_lesson).value
+        return Lessons(new_lessons)
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Lessons) and self._items == other._items
@@ -87,13 +93,13 @@ class Lessons:
         return hash(self._items)
 
     def __repr__(self) -> str:
-        return f"<Lessons {[lesson.value for lesson in self._items]}>"
+        return f"<Lessons {list(self._items)}>"
 
     def __iter__(self):
-        return iter(self._items)
+        return iter(self.lessons)
 
     def __len__(self) -> int:
         return len(self._items)
 
     def __getitem__(self, index: int) -> Lesson:
-        return self._items[index]
+        return Lesson.from_trusted(self._items[index])
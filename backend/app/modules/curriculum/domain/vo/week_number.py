@@ -16,6 +16,13 @@ class WeekNumber:
 
         self._value = raw
 
+    @classmethod
+    def from_trusted(cls, value: int) -> "WeekNumber":
+        """저장소 전용: 이미 검증되어 저장된 값으로 생성 (검증 생략)"""
+        obj = cls.__new__(cls)
+        obj._value = value
+        return obj
+
     @property
     def value(self) -> int:
         return self._value
@@ -1,6 +1,7 @@
 from datetime import datetime
 from app.common.db.database import Base
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -30,7 +31,24 @@ class CurriculumModel(Base):
         String(10), nullable=False, default="PRIVATE"
     )
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # 일괄 수정의 낙관적 동시성 버전으로 쓰므로 마이크로초까지 저장
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"), nullable=False
+    )
+    # 목록 조회용 비정규화 개수 (저장소가 주차 쓰기마다 함께 갱신)
+    total_weeks: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_lessons: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # 인덱스 설정: 공개 목록/피드 정렬, 소유자별 목록
+    __table_args__ = (
+        Index("idx_curriculum_visibility_updated", "visibility", "updated_at"),
+        Index("idx_curriculum_visibility_created", "visibility", "created_at"),
+        Index("idx_curriculum_user_created", "user_id", "created_at"),
+    )
 
     # relationship
     user: Mapped["UserModel"] = relationship(
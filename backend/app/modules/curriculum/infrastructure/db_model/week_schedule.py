@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, JSON, ForeignKey
+from sqlalchemy import Index, Integer, String, JSON, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from typing import TYPE_CHECKING
@@ -40,6 +40,11 @@ class WeekScheduleModel(Base):
         nullable=False,
     )
 
+    # 인덱스 설정: selectinload(curriculum_id IN ...) 및 주차 조회
+    __table_args__ = (
+        Index("idx_week_schedule_curriculum_week", "curriculum_id", "week_number"),
+    )
+
     # 역방향 관계 설정 (DB 레벨 CASCADE 신뢰)
     curriculum: Mapped["CurriculumModel"] = relationship(
         "CurriculumModel",
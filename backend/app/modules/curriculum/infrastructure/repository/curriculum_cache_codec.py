@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.common.cache.codec import CacheCodec, from_epoch_us, to_epoch_us
+from app.core.config import get_settings
+
+
+class CurriculumDetailCodec(CacheCodec[Dict[str, Any]]):
+    """
+    curriculum:detail:{curriculum_id} 값.
+
+    {"etag", "curriculum": CurriculumDTO.to_dict()} 를 인코딩한다.
+    시각은 epoch 정수로 저장하고 읽을 때 같은 ISO 문자열로 되돌린다.
+    """
+
+    VERSION = 1
+
+    def to_fields(self, value: Dict[str, Any]) -> List[Any]:
+        curriculum = value["curriculum"]
+        created_at = datetime.fromisoformat(curriculum["created_at"])
+        updated_at = datetime.fromisoformat(curriculum["updated_at"])
+        return [
+            value["etag"],
+            curriculum["id"],
+            curriculum["owner_id"],
+            curriculum["title"],
+            curriculum["visibility"],
+            to_epoch_us(created_at),
+            to_epoch_us(updated_at),
+            updated_at.tzinfo is not None,
+            [[ws["week_number"], ws["lessons"]] for ws in curriculum["week_schedules"]],
+        ]
+
+    def from_fields(self, fields: List[Any]) -> Dict[str, Any]:
+        (
+            etag,
+            curriculum_id,
+            owner_id,
+            title,
+            visibility,
+            created_at,
+            updated_at,
+            aware,
+            weeks,
+        ) = fields
+        return {
+            "etag": etag,
+            "curriculum": {
+                "id": curriculum_id,
+                "owner_id": owner_id,
+                "title": title,
+                "visibility": visibility,
+                "created_at": from_epoch_us(created_at, aware).isoformat(),
+                "updated_at": from_epoch_us(updated_at, aware).isoformat(),
+                "week_schedules": [
+                    {"week_number": week_number, "lessons": lessons}
+                    for week_number, lessons in weeks
+                ],
+            },
+        }
+
+
+curriculum_detail_codec = CurriculumDetailCodec(
+    compress_threshold=get_settings().cache_compress_threshold
+)
@@ -0,0 +1,79 @@
+import logging
+from typing import Any, Dict, Optional
+
+from app.common.cache.redis_client import RedisClient
+from app.modules.curriculum.domain.repository.curriculum_cache_repo import (
+    ICurriculumCacheRepository,
+)
+from app.modules.curriculum.infrastructure.repository.curriculum_cache_codec import (
+    CurriculumDetailCodec,
+    curriculum_detail_codec,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CurriculumCacheRepository(ICurriculumCacheRepository):
+    """
+    Redis 기반 커리큘럼 상세 캐시.
+
+    - curriculum:detail:{curriculum_id} (string) CurriculumDetailCodec 값, TTL
+    - 무효화는 키를 짧은 TTL 의 툼스톤으로 덮어쓰고, 저장은 SET NX 로만 한다.
+      무효화 전에 DB 에서 읽은 요청이 늦게 저장해 옛 내용을 되살리는 것을 막는다.
+    """
+
+    KEY_PREFIX = "curriculum:detail"
+    TOMBSTONE = "-"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        ttl: int = 300,
+        tombstone_ttl: int = 5,
+        codec: CurriculumDetailCodec = curriculum_detail_codec,
+    ) -> None:
+        self.redis_client = redis_client
+        self.codec = codec
+        self.ttl = ttl
+        self.tombstone_ttl = tombstone_ttl
+
+    async def get(self, curriculum_id: str) -> Optional[Dict[str, Any]]:
+        redis = self.redis_client.binary
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(self._key(curriculum_id))
+        except Exception as e:
+            logger.warning(f"Curriculum cache read failed: {e}")
+            return None
+        if not raw or raw == self.TOMBSTONE.encode():
+            return None
+        return self.codec.decode(raw)
+
+    async def set(self, curriculum_id: str, detail: Dict[str, Any]) -> None:
+        redis = self.redis_client.redis
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                self._key(curriculum_id),
+                self.codec.encode(detail),
+                ex=self.ttl,
+                nx=True,
+            )
+        except Exception as e:
+            logger.warning(f"Curriculum cache write failed: {e}")
+
+    async def invalidate(self, curriculum_id: str) -> None:
+        redis = self.redis_client.redis
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                self._key(curriculum_id), self.TOMBSTONE, ex=self.tombstone_ttl
+            )
+        except Exception as e:
+            logger.warning(f"Curriculum cache invalidation failed: {e}")
+
+    def _key(self, curriculum_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{curriculum_id}"
@@ -1,10 +1,14 @@
-from typing import List, Optional, Sequence, Tuple
-from sqlalchemy import Result, Select, and_, func, select, or_
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, cast
+from sqlalchemy import CursorResult, Result, Select, and_, func, select, or_, update
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.db.hydration import hydrate
 from app.modules.curriculum.domain.entity.curriculum import (
     Curriculum as CurriculumDomain,
 )
+from app.modules.curriculum.domain.entity.curriculum_brief import CurriculumBrief
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
@@ -17,37 +21,77 @@ from app.modules.curriculum.infrastructure.db_model.curriculum import Curriculum
 from app.modules.curriculum.infrastructure.db_model.week_schedule import (
     WeekScheduleModel,
 )
+from app.modules.social.infrastructure.db_model.follow import FollowModel
 from app.modules.user.domain.vo.role import RoleVO
 
+# 목록 조회는 요약에 필요한 컬럼만 읽는다 (주차/레슨 JSON 은 읽지 않음)
+BRIEF_COLUMNS = (
+    CurriculumModel.id,
+    CurriculumModel.user_id,
+    CurriculumModel.title,
+    CurriculumModel.visibility,
+    CurriculumModel.total_weeks,
+    CurriculumModel.total_lessons,
+    CurriculumModel.created_at,
+    CurriculumModel.updated_at,
+)
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """저장 컬럼과 같은 표현 (tz 없는 UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class CurriculumRepository(ICurriculumRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session: AsyncSession = session
 
     def _to_domain(self, curriculum_model: CurriculumModel) -> CurriculumDomain:
-        """DB Model -> Domain entity"""
-        return CurriculumDomain(
+        """DB Model -> Domain entity (저장된 값은 검증 없이 복원)"""
+        week_models = sorted(
+            curriculum_model.week_schedules, key=lambda ws: ws.week_number
+        )
+        return hydrate(
+            CurriculumDomain,
             id=curriculum_model.id,
             owner_id=curriculum_model.user_id,
-            title=Title(curriculum_model.title),
+            title=Title.from_trusted(curriculum_model.title),
             week_schedules=[
-                WeekSchedule(
-                    week_number=WeekNumber(week_schedule.week_number),
-                    lessons=Lessons(week_schedule.lessons),
+                hydrate(
+                    WeekSchedule,
+                    week_number=WeekNumber.from_trusted(week_schedule.week_number),
+                    lessons=Lessons.from_trusted(week_schedule.lessons),
                 )
-                for week_schedule in curriculum_model.week_schedules
+                for week_schedule in week_models
             ],
             visibility=Visibility(curriculum_model.visibility),
             created_at=curriculum_model.created_at,
             updated_at=curriculum_model.updated_at,
         )
 
+    def _to_brief(self, row: Any) -> CurriculumBrief:
+        """BRIEF_COLUMNS 행 -> 목록용 읽기 모델"""
+        return CurriculumBrief(
+            id=row.id,
+            owner_id=row.user_id,
+            title=Title.from_trusted(row.title),
+            visibility=Visibility(row.visibility),
+            total_weeks=row.total_weeks,
+            total_lessons=row.total_lessons,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
     async def save(self, curriculum: CurriculumDomain) -> None:
         new_curriculum = CurriculumModel(  # type: ignore
             id=str(curriculum.id),
             user_id=str(curriculum.owner_id),
             title=str(curriculum.title),
             visibility=curriculum.visibility.value,
+            total_weeks=curriculum.get_total_weeks(),
+            total_lessons=curriculum.get_total_lessons(),
             created_at=curriculum.created_at,
             updated_at=curriculum.updated_at,
         )
@@ -101,29 +145,24 @@ class CurriculumRepository(ICurriculumRepository):
         owner_id: str,
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[CurriculumDomain]]:
+    ) -> Tuple[int, List[CurriculumBrief]]:
 
         total_count: int = await self.count_by_owner(owner_id=owner_id)
-        query: Select[Tuple[CurriculumModel]] = (
-            select(CurriculumModel)
+        query: Select[Any] = (
+            select(*BRIEF_COLUMNS)
             .where(CurriculumModel.user_id == owner_id)
-            .options(selectinload(CurriculumModel.week_schedules))
             .order_by(CurriculumModel.created_at.desc())
             .offset((page - 1) * items_per_page)
             .limit(items_per_page)
         )
-        result: Result[Tuple[CurriculumModel]] = await self.session.execute(query)
-        curriculums: Sequence[CurriculumModel] = result.scalars().all()
-        return (
-            total_count,
-            [self._to_domain(curriculum) for curriculum in curriculums],
-        )
+        result: Result[Any] = await self.session.execute(query)
+        return total_count, [self._to_brief(row) for row in result.all()]
 
     async def find_public_curriculums(
         self,
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[CurriculumDomain]]:
+    ) -> Tuple[int, List[CurriculumBrief]]:
 
         total_count_query: Select[Tuple[int]] = (
             select(func.count())
@@ -132,42 +171,133 @@ class CurriculumRepository(ICurriculumRepository):
         )
         total: int = (await self.session.execute(total_count_query)).scalar_one()
 
-        query: Select[Tuple[CurriculumModel]] = (
-            select(CurriculumModel)
-            .options(selectinload(CurriculumModel.week_schedules))
+        query: Select[Any] = (
+            select(*BRIEF_COLUMNS)
             .where(CurriculumModel.visibility == Visibility.PUBLIC.value)
             .order_by(CurriculumModel.created_at.desc())
             .offset((page - 1) * items_per_page)
             .limit(items_per_page)
         )
-        result: Result[Tuple[CurriculumModel]] = await self.session.execute(query)
-        models: Sequence[CurriculumModel] = result.scalars().all()
-        return total, [self._to_domain(m) for m in models]
+        result: Result[Any] = await self.session.execute(query)
+        return total, [self._to_brief(row) for row in result.all()]
 
     async def update(self, curriculum: CurriculumDomain) -> None:
-        existing_curriculum: CurriculumModel | None = await self.session.get(
-            CurriculumModel,
-            curriculum.id,
-            options=[selectinload(CurriculumModel.week_schedules)],
+        """
+        커리큘럼 수정. 주차는 저장된 행과 비교해 바뀐 주차만 INSERT/UPDATE/DELETE 하고,
+        주차 삽입/삭제로 밀린 번호는 기록된 이동마다 UPDATE 한 번으로 반영한다.
+        """
+        try:
+            if await self._apply_update(curriculum):
+                await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+        curriculum.week_shifts.clear()
+
+    async def update_if_unchanged(
+        self, curriculum: CurriculumDomain, expected_updated_at: datetime
+    ) -> bool:
+        """
+        낙관적 동시성 업데이트. 커리큘럼 행을 updated_at 조건부 UPDATE 로 먼저 잠그고
+        (다른 요청이 먼저 수정했으면 0 행), 이후 update 와 같은 방식으로 주차를 반영한다.
+        updated_at 은 DATETIME(6) 이라 정확히 같은 값일 때만 잠근다. 새 값이 읽은 버전보다
+        크지 않으면 (서버 간 시계 차이 등) 1µs 뒤로 올려 버전이 항상 바뀌게 한다.
+        """
+        version = _utc_naive(expected_updated_at)
+        if _utc_naive(curriculum.updated_at) <= version:
+            curriculum.updated_at = (version + timedelta(microseconds=1)).replace(
+                tzinfo=timezone.utc
+            )
+        try:
+            claimed = cast(
+                CursorResult[Any],
+                await self.session.execute(
+                    update(CurriculumModel)
+                    .where(
+                        CurriculumModel.id == curriculum.id,
+                        CurriculumModel.updated_at == version,
+                    )
+                    .values(updated_at=_utc_naive(curriculum.updated_at))
+                    .execution_options(synchronize_session=False)
+                ),
+            )
+            if claimed.rowcount == 0:
+                await self.session.rollback()
+                return False
+            await self._apply_update(curriculum)
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+        curriculum.week_shifts.clear()
+        return True
+
+    async def _apply_update(self, curriculum: CurriculumDomain) -> bool:
+        for from_week, delta in curriculum.week_shifts:
+            await self.session.execute(
+                update(WeekScheduleModel)
+                .where(
+                    WeekScheduleModel.curriculum_id == curriculum.id,
+                    WeekScheduleModel.week_number >= from_week,
+                )
+                .values(week_number=WeekScheduleModel.week_number + delta)
+                .execution_options(synchronize_session=False)
+            )
+
+        # 이동이 반영된 주차 행으로 컬렉션을 다시 채움
+        result: Result[Tuple[CurriculumModel]] = await self.session.execute(
+            select(CurriculumModel)
+            .where(CurriculumModel.id == curriculum.id)
+            .options(selectinload(CurriculumModel.week_schedules))
+            .execution_options(populate_existing=True)
         )
+        existing_curriculum: CurriculumModel | None = result.scalars().first()
 
         if not existing_curriculum:
-            return None
+            return False
 
         existing_curriculum.title = curriculum.title.value
         existing_curriculum.visibility = curriculum.visibility.value
         existing_curriculum.updated_at = curriculum.updated_at
+        existing_curriculum.total_weeks = curriculum.get_total_weeks()
+        existing_curriculum.total_lessons = curriculum.get_total_lessons()
 
-        existing_curriculum.week_schedules.clear()
-        for week_schedule in curriculum.week_schedules:
-            existing_curriculum.week_schedules.append(
-                WeekScheduleModel(  # type: ignore
-                    week_number=week_schedule.week_number.value,
-                    lessons=week_schedule.lessons.items,
-                )
+        self._sync_week_schedules(existing_curriculum, curriculum.week_schedules)
+        return True
+
+    def _sync_week_schedules(
+        self, curriculum_model: CurriculumModel, week_schedules: List[WeekSchedule]
+    ) -> None:
+        """주차 번호별로 저장된 행과 비교, 같은 번호가 여럿이면 레슨이 같은 행을 남김"""
+        rows_by_week: Dict[int, List[WeekScheduleModel]] = defaultdict(list)
+        for row in curriculum_model.week_schedules:
+            rows_by_week[row.week_number].append(row)
+
+        stale: List[WeekScheduleModel] = []
+        for week_schedule in week_schedules:
+            week_number = week_schedule.week_number.value
+            lessons = week_schedule.lessons.items
+            candidates = rows_by_week.pop(week_number, [])
+            row = next(
+                (candidate for candidate in candidates if candidate.lessons == lessons),
+                candidates[0] if candidates else None,
             )
-        self.session.add(existing_curriculum)
-        await self.session.commit()
+            if row is None:
+                curriculum_model.week_schedules.append(
+                    WeekScheduleModel(  # type: ignore
+                        week_number=week_number,
+                        lessons=lessons,
+                    )
+                )
+                continue
+            if row.lessons != lessons:
+                row.lessons = lessons
+            stale.extend(candidate for candidate in candidates if candidate is not row)
+
+        for rows in rows_by_week.values():
+            stale.extend(rows)
+        for row in stale:
+            curriculum_model.week_schedules.remove(row)
 
     async def delete(self, curriculum_id: str) -> None:
         model: CurriculumModel | None = await self.session.get(
@@ -197,20 +327,16 @@ class CurriculumRepository(ICurriculumRepository):
         user_ids: List[str],
         page: int = 1,
         items_per_page: int = 10,
-    ) -> Tuple[int, List[CurriculumDomain]]:
+    ) -> Tuple[int, List[CurriculumBrief]]:
         """특정 사용자들의 공개 커리큘럼 목록 조회"""
         if not user_ids:
             return 0, []
 
-        base_query: Select[Tuple[CurriculumModel]] = (
-            select(CurriculumModel)
-            .where(
-                and_(
-                    CurriculumModel.user_id.in_(user_ids),
-                    CurriculumModel.visibility == Visibility.PUBLIC.value,
-                )
+        base_query: Select[Any] = select(*BRIEF_COLUMNS).where(
+            and_(
+                CurriculumModel.user_id.in_(user_ids),
+                CurriculumModel.visibility == Visibility.PUBLIC.value,
             )
-            .options(selectinload(CurriculumModel.week_schedules))
         )
 
         # 총 개수 조회
@@ -221,13 +347,57 @@ class CurriculumRepository(ICurriculumRepository):
 
         # 페이지네이션
         offset: int = (page - 1) * items_per_page
-        paged_query: Select[Tuple[CurriculumModel]] = (
+        paged_query: Select[Any] = (
             base_query.limit(items_per_page)
             .offset(offset)
             .order_by(CurriculumModel.created_at.desc())
         )
 
-        result: Result[Tuple[CurriculumModel]] = await self.session.execute(paged_query)
-        models: Sequence[CurriculumModel] = result.scalars().all()
+        result: Result[Any] = await self.session.execute(paged_query)
+        return total_count, [self._to_brief(row) for row in result.all()]
+
+    async def find_public_curriculums_followed_by(
+        self,
+        user_id: str,
+        page: int = 1,
+        items_per_page: int = 10,
+    ) -> Tuple[int, List[CurriculumBrief]]:
+        """사용자가 팔로우하는 사람들의 공개 커리큘럼 목록 조회 (최근 수정순)"""
+        followee_ids = select(FollowModel.followee_id).where(
+            FollowModel.follower_id == user_id
+        )
+        base_query: Select[Any] = select(*BRIEF_COLUMNS).where(
+            CurriculumModel.user_id.in_(followee_ids),
+            CurriculumModel.visibility == Visibility.PUBLIC.value,
+        )
+
+        count_query: Select[Tuple[int]] = select(func.count()).select_from(
+            base_query.subquery()
+        )
+        total_count: int = await self.session.scalar(count_query) or 0
+
+        paged_query: Select[Any] = (
+            base_query.order_by(CurriculumModel.updated_at.desc())
+            .offset((page - 1) * items_per_page)
+            .limit(items_per_page)
+        )
+        result: Result[Any] = await self.session.execute(paged_query)
+        return total_count, [self._to_brief(row) for row in result.all()]
 
-        return total_count, [self._to_domain(m) for m in models]
+    async def find_public_by_ids(
+        self, curriculum_ids: List[str]
+    ) -> List[CurriculumBrief]:
+        """ID 순서대로 공개 커리큘럼 조회 (없거나 비공개인 ID 는 제외)"""
+        if not curriculum_ids:
+            return []
+        query: Select[Any] = select(*BRIEF_COLUMNS).where(
+            CurriculumModel.id.in_(curriculum_ids),
+            CurriculumModel.visibility == Visibility.PUBLIC.value,
+        )
+        result: Result[Any] = await self.session.execute(query)
+        by_id = {row.id: row for row in result.all()}
+        return [
+            self._to_brief(by_id[curriculum_id])
+            for curriculum_id in curriculum_ids
+            if curriculum_id in by_id
+        ]
@@ -1,9 +1,12 @@
-from typing import Annotated
-from fastapi import APIRouter, Depends, Query, status
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from dependency_injector.wiring import inject, Provide
+from app.common.cache.etag import etag_matches
+from app.common.serialization.response import FastJSONResponse
 from app.core.auth import CurrentUser, get_current_user
 from app.core.di_container import Container
 from app.modules.curriculum.application.dto.curriculum_dto import (
+    BatchEditCurriculumCommand,
     CreateCurriculumCommand,
     CreateLessonCommand,
     CreateWeekScheduleCommand,
@@ -19,6 +22,7 @@ from app.modules.curriculum.application.service.curriculum_service import (
     CurriculumService,
 )
 from app.modules.curriculum.interface.schema.curriculum_schema import (
+    BatchEditCurriculumRequest,
     CreateCurriculumRequest,
     CreateLessonRequest,
     CreateWeekScheduleRequest,
@@ -117,17 +121,24 @@ async def get_following_users_curriculums(
 async def get_curriculum(
     curriculum_id: str,
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    if_none_match: Optional[str] = Header(default=None),
     curriculum_service: CurriculumService = Depends(
         Provide[Container.curriculum_service]
     ),
-) -> CurriculumResponse:
-
+):
+    """커리큘럼 상세 조회 (ETag, If-None-Match 일치 시 304)"""
     role: RoleVO = RoleVO(current_user.role.value) if current_user else RoleVO.USER
     owner_id: str | None = current_user.id if current_user else None
-    result: CurriculumDTO = await curriculum_service.get_curriculum_by_id(
+    result, etag = await curriculum_service.get_curriculum_detail(
         curriculum_id=curriculum_id, role=role, owner_id=owner_id
     )
-    return CurriculumResponse.from_dto(result)
+    # 권한별로 볼 수 있는 내용이 달라 공유 캐시 저장은 막고, 매번 재검증
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # DTO 필드가 CurriculumResponse 와 같아 재검증 없이 바로 직렬화
+    return FastJSONResponse(result, headers=headers)
 
 
 @curriculum_router.patch(
@@ -200,6 +211,31 @@ async def create_week_schedule(
     return CurriculumResponse.from_dto(updated)
 
 
+@week_router.patch(
+    "/{curriculum_id}/weeks",
+    response_model=CurriculumResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def batch_edit_weeks(
+    curriculum_id: str,
+    body: BatchEditCurriculumRequest,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    curriculum_service: CurriculumService = Depends(
+        Provide[Container.curriculum_service]
+    ),
+) -> CurriculumResponse:
+    """주차/레슨 작업 일괄 적용 (버전 불일치 시 409)"""
+    dto: BatchEditCurriculumCommand = body.to_dto(
+        curriculum_id=curriculum_id, owner_id=current_user.id
+    )
+    updated: CurriculumDTO = await curriculum_service.batch_edit_curriculum(
+        command=dto,
+        role=RoleVO(current_user.role),
+    )
+    return CurriculumResponse.from_dto(updated)
+
+
 @week_router.delete(
     "/{curriculum_id}/weeks/{week_number}",
     status_code=status.HTTP_204_NO_CONTENT,
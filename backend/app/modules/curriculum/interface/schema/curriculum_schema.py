@@ -3,7 +3,10 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.modules.curriculum.application.dto.curriculum_dto import (
+    BatchEditCurriculumCommand,
     CreateCurriculumCommand,
+    CurriculumEditOp,
+    CurriculumEditOperation,
     UpdateCurriculumCommand,
     CurriculumPageDTO,
     CreateWeekScheduleCommand,
@@ -101,6 +104,44 @@ class UpdateLessonRequest(BaseModel):
         )
 
 
+class CurriculumEditOperationRequest(BaseModel):
+    op: CurriculumEditOp = Field(description="작업 종류")
+    week_number: int = Field(ge=1, description="대상 주차 번호")
+    lesson_index: Optional[int] = Field(
+        None, ge=0, description="레슨 인덱스 (insert_lesson 은 생략 시 마지막)"
+    )
+    lesson: Optional[str] = Field(None, description="insert/update_lesson 레슨 내용")
+    lessons: Optional[List[str]] = Field(  # type: ignore
+        None, min_length=1, description="insert_week 레슨 목록"
+    )
+
+
+class BatchEditCurriculumRequest(BaseModel):
+    expected_updated_at: datetime = Field(
+        description="마지막으로 읽은 커리큘럼의 updated_at (낙관적 동시성)"
+    )
+    operations: List[CurriculumEditOperationRequest] = Field(  # type: ignore
+        min_length=1, max_length=200, description="순서대로 적용할 작업 목록"
+    )
+
+    def to_dto(self, curriculum_id: str, owner_id: str) -> BatchEditCurriculumCommand:
+        return BatchEditCurriculumCommand(
+            curriculum_id=curriculum_id,
+            owner_id=owner_id,
+            expected_updated_at=self.expected_updated_at,
+            operations=[
+                CurriculumEditOperation(
+                    op=operation.op,
+                    week_number=operation.week_number,
+                    lesson_index=operation.lesson_index,
+                    lesson=operation.lesson,
+                    lessons=operation.lessons,
+                )
+                for operation in self.operations
+            ],
+        )
+
+
 class GenerateCurriculumRequest(BaseModel):
     goal: str = Field(description="생성 목표(예: AI 학습)")
     period: int = Field(ge=1, le=24, description="기간(주 단위)")
@@ -157,11 +198,12 @@ class CurriculumBriefResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto) -> "CurriculumBriefResponse":
-        return cls(
+        # 목록 항목은 검증된 DTO 로 생성만 한다 (출력 검증은 response_model 에서 한 번)
+        return cls.model_construct(
             id=dto.id,
             owner_id=dto.owner_id,
             title=dto.title,
-            visibility=dto.visibility,
+            visibility=VisibilityEnum(dto.visibility),
             total_weeks=dto.total_weeks,
             total_lessons=dto.total_lessons,
             created_at=dto.created_at,
@@ -180,7 +222,7 @@ class CurriculumsPageResponse(BaseModel):
         items: List[CurriculumBriefResponse] = [
             CurriculumBriefResponse.from_dto(c) for c in page_dto.curriculums
         ]
-        return cls(
+        return cls.model_construct(
             total_count=page_dto.total_count,
             page=page_dto.page,
             items_per_page=page_dto.items_per_page,
@@ -0,0 +1,72 @@
+import logging
+from typing import Optional
+
+from app.modules.feed.application.service.timeline_service import TimelineService
+from app.modules.feed.domain.repository.curriculum_search_repo import (
+    ICurriculumSearchRepository,
+)
+from app.modules.feed.domain.repository.feed_repo import IFeedRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CurriculumEventHandler:
+    """
+    커리큘럼 쓰기 이벤트 → 피드 검색 색인/캐시, 팔로잉 타임라인 반영.
+
+    원본 변경은 이미 커밋된 뒤 호출되므로 실패해도 요청을 실패시키지 않고 로그만 남긴다.
+    (어긋난 색인은 rebuild_search_index 명령으로 복구)
+    """
+
+    def __init__(
+        self,
+        curriculum_search_repo: ICurriculumSearchRepository,
+        feed_repo: IFeedRepository,
+        timeline_service: Optional[TimelineService] = None,
+    ) -> None:
+        self.curriculum_search_repo = curriculum_search_repo
+        self.feed_repo = feed_repo
+        self.timeline_service = timeline_service
+
+    async def on_curriculum_created(self, curriculum_id: str) -> None:
+        await self._reindex(curriculum_id)
+        await self._update_timeline(curriculum_id)
+
+    async def on_curriculum_updated(self, curriculum_id: str) -> None:
+        """제목/주차/레슨/태그 변경"""
+        await self._reindex(curriculum_id)
+        await self.feed_repo.remove_from_cache(curriculum_id)
+        await self._update_timeline(curriculum_id)
+
+    async def on_curriculum_visibility_changed(self, curriculum_id: str) -> None:
+        await self._reindex(curriculum_id)
+        await self.feed_repo.remove_from_cache(curriculum_id)
+        await self.feed_repo.invalidate_feed_cache()
+        await self._update_timeline(curriculum_id)
+
+    async def on_curriculum_deleted(
+        self, curriculum_id: str, owner_id: Optional[str] = None
+    ) -> None:
+        try:
+            await self.curriculum_search_repo.remove(curriculum_id)
+        except Exception as e:
+            logger.warning(f"Search index removal failed ({curriculum_id}): {e}")
+        await self.feed_repo.remove_from_cache(curriculum_id)
+        if self.timeline_service and owner_id:
+            await self.timeline_service.on_curriculum_deleted(curriculum_id, owner_id)
+
+    async def on_owner_renamed(self, owner_id: str) -> None:
+        try:
+            await self.curriculum_search_repo.index_owner(owner_id)
+        except Exception as e:
+            logger.warning(f"Search reindex failed for owner {owner_id}: {e}")
+
+    async def _update_timeline(self, curriculum_id: str) -> None:
+        if self.timeline_service:
+            await self.timeline_service.on_curriculum_changed(curriculum_id)
+
+    async def _reindex(self, curriculum_id: str) -> None:
+        try:
+            await self.curriculum_search_repo.index_curriculums([curriculum_id])
+        except Exception as e:
+            logger.warning(f"Search reindex failed ({curriculum_id}): {e}")
@@ -0,0 +1,197 @@
+import logging
+from typing import Dict, List, Tuple
+
+from app.modules.feed.domain.repository.feed_repo import IFeedRepository
+from app.modules.feed.domain.repository.timeline_repo import ITimelineRepository
+from app.modules.feed.domain.vo.timeline import TimelineEntry, TimelinePage
+from app.modules.social.domain.repository.follow_repo import IFollowRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineService:
+    """
+    팔로잉 타임라인 (팔로우한 사용자들의 공개 커리큘럼, 최근 수정순).
+
+    - 일반 작성자: 공개 커리큘럼 생성/수정 시 팔로워 타임라인에 push (fan-out-on-write)
+    - 팔로워 fanout_threshold 명 이상 대형 계정: 작성자 타임라인에만 기록하고
+      읽을 때 합친다 (fan-out-on-read). 전환은 다음 공개 글에서 이루어지며 되돌리지 않는다.
+    - 조회는 상위 size 개 구간만 제공한다. 타임라인이 없으면 DB 에서 한 번 만든다.
+      DB 조회 전에 받은 세대로 교체하므로, 만드는 중 반영된 쓰기가 있으면 저장하지 않고
+      다음 조회에서 다시 만든다.
+
+    쓰기 반영은 원본 커밋 뒤 호출되므로 실패해도 로그만 남긴다.
+    """
+
+    def __init__(
+        self,
+        timeline_repo: ITimelineRepository,
+        feed_repo: IFeedRepository,
+        follow_repo: IFollowRepository,
+        fanout_threshold: int = 5000,
+        size: int = 500,
+    ) -> None:
+        self.timeline_repo = timeline_repo
+        self.feed_repo = feed_repo
+        self.follow_repo = follow_repo
+        self.fanout_threshold = fanout_threshold
+        self.size = size
+
+    # ========================= 조회 =========================
+
+    async def get_page(
+        self, user_id: str, page: int, items_per_page: int
+    ) -> Tuple[int, List[str]]:
+        """타임라인 페이지 (전체 수, 커리큘럼 ID 목록)"""
+        offset = (page - 1) * items_per_page
+        window = min(offset + items_per_page, self.size)
+
+        timeline = await self.timeline_repo.read(user_id, window)
+        if timeline is None:
+            timeline = await self._build(user_id, window)
+
+        entries = timeline.entries
+        total = timeline.total
+        if timeline.celebrity_ids:
+            author_pages = await self._read_authors(timeline.celebrity_ids, window)
+            entries = _merge([entries] + [p.entries for p in author_pages])
+            total += sum(p.total for p in author_pages)
+
+        total = min(total, self.size)
+        return total, [cid for cid, _ in entries[offset:window]]
+
+    async def _build(self, user_id: str, window: int) -> TimelinePage:
+        generation = await self.timeline_repo.generation(user_id)
+        celebrities = await self.timeline_repo.find_celebrity_ids() or set()
+        followed = await self.follow_repo.filter_followees(user_id, list(celebrities))
+        entries = await self.feed_repo.find_following_entries(
+            user_id, exclude_owner_ids=sorted(followed), limit=self.size
+        )
+        await self.timeline_repo.replace(user_id, entries, followed, generation)
+        return TimelinePage(
+            entries=_scored(entries[:window]),
+            total=len(entries),
+            celebrity_ids=sorted(followed),
+        )
+
+    async def _read_authors(
+        self, author_ids: List[str], window: int
+    ) -> List[TimelinePage]:
+        pages = await self.timeline_repo.read_authors(author_ids, window)
+        result = []
+        for author_id, author_page in pages.items():
+            if author_page is None:
+                generation = await self.timeline_repo.author_generation(author_id)
+                entries = await self.feed_repo.find_recent_public_entries(
+                    author_id, self.size
+                )
+                await self.timeline_repo.replace_author(author_id, entries, generation)
+                author_page = TimelinePage(
+                    entries=_scored(entries[:window]), total=len(entries)
+                )
+            result.append(author_page)
+        return result
+
+    # ========================= 쓰기 반영 =========================
+
+    async def on_curriculum_changed(self, curriculum_id: str) -> None:
+        """커리큘럼 생성/수정/공개 범위 변경 후 호출"""
+        try:
+            entry = await self.feed_repo.find_timeline_entry(curriculum_id)
+            if entry is None:
+                return
+            if entry.is_public:
+                await self._publish(entry)
+            else:
+                await self._retract(entry.owner_id, [curriculum_id])
+        except Exception as e:
+            logger.warning(f"Timeline update failed ({curriculum_id}): {e}")
+
+    async def on_curriculum_deleted(self, curriculum_id: str, owner_id: str) -> None:
+        try:
+            await self._retract(owner_id, [curriculum_id])
+        except Exception as e:
+            logger.warning(f"Timeline update failed ({curriculum_id}): {e}")
+
+    async def on_follow(self, follower_id: str, followee_id: str) -> None:
+        """팔로우 후 호출, 새 팔로위의 최근 공개 커리큘럼으로 백필"""
+        try:
+            celebrities = await self.timeline_repo.find_celebrity_ids()
+            if celebrities is None:
+                return
+            if followee_id in celebrities:
+                await self.timeline_repo.set_followed_celebrity(
+                    follower_id, followee_id, True
+                )
+                return
+            entries = await self.feed_repo.find_recent_public_entries(
+                followee_id, self.size
+            )
+            await self.timeline_repo.add_entries([follower_id], entries)
+        except Exception as e:
+            logger.warning(f"Timeline backfill failed ({follower_id}): {e}")
+
+    async def on_unfollow(self, follower_id: str, followee_id: str) -> None:
+        """언팔로우 후 호출, 해당 작성자 항목 정리"""
+        try:
+            await self.timeline_repo.set_followed_celebrity(
+                follower_id, followee_id, False
+            )
+            curriculum_ids = await self.feed_repo.find_curriculum_ids_by_owner(
+                followee_id
+            )
+            await self.timeline_repo.remove_entries([follower_id], curriculum_ids)
+        except Exception as e:
+            logger.warning(f"Timeline trim failed ({follower_id}): {e}")
+
+    async def _publish(self, entry: TimelineEntry) -> None:
+        celebrities = await self.timeline_repo.find_celebrity_ids()
+        if celebrities is None:
+            return
+        owner_id = entry.owner_id
+        if owner_id in celebrities:
+            await self.timeline_repo.add_author_entry(owner_id, entry)
+            return
+
+        follower_ids = await self.follow_repo.find_follower_ids(owner_id)
+        if len(follower_ids) >= self.fanout_threshold:
+            await self._promote(owner_id, follower_ids)
+            return
+        await self.timeline_repo.add_entries(follower_ids, [entry])
+
+    async def _promote(self, owner_id: str, follower_ids: List[str]) -> None:
+        """대형 계정 전환: 작성자 타임라인을 만들고 팔로워 타임라인의 기존 항목은 제거"""
+        generation = await self.timeline_repo.author_generation(owner_id)
+        await self.timeline_repo.replace_author(
+            owner_id,
+            await self.feed_repo.find_recent_public_entries(owner_id, self.size),
+            generation,
+        )
+        await self.timeline_repo.promote_celebrity(owner_id, follower_ids)
+        await self.timeline_repo.remove_entries(
+            follower_ids, await self.feed_repo.find_curriculum_ids_by_owner(owner_id)
+        )
+
+    async def _retract(self, owner_id: str, curriculum_ids: List[str]) -> None:
+        celebrities = await self.timeline_repo.find_celebrity_ids()
+        if celebrities is None:
+            return
+        if owner_id in celebrities:
+            await self.timeline_repo.remove_author_entries(owner_id, curriculum_ids)
+            return
+        follower_ids = await self.follow_repo.find_follower_ids(owner_id)
+        await self.timeline_repo.remove_entries(follower_ids, curriculum_ids)
+
+
+def _scored(entries: List[TimelineEntry]) -> List[Tuple[str, float]]:
+    return [(entry.curriculum_id, entry.score) for entry in entries]
+
+
+def _merge(sources: List[List[Tuple[str, float]]]) -> List[Tuple[str, float]]:
+    """여러 타임라인 구간을 점수 내림차순으로 합침 (중복 ID 는 높은 점수)"""
+    best: Dict[str, float] = {}
+    for entries in sources:
+        for curriculum_id, score in entries:
+            if score > best.get(curriculum_id, float("-inf")):
+                best[curriculum_id] = score
+    return sorted(best.items(), key=lambda item: (-item[1], item[0]))
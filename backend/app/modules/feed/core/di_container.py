@@ -1,18 +1,59 @@
 from dependency_injector import containers, providers
 
+from app.modules.feed.application.service.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.feed.application.service.feed_service import FeedService
+from app.modules.feed.application.service.timeline_service import TimelineService
+from app.modules.feed.infrastructure.repository.curriculum_search_repo import (
+    CurriculumSearchRepository,
+)
 from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.modules.feed.infrastructure.repository.timeline_repo import (
+    TimelineRepository,
+)
 
 
 class FeedContainer(containers.DeclarativeContainer):
     session: providers.Dependency[object] = providers.Dependency()
+    redis_client: providers.Dependency[object] = providers.Dependency()
+    follow_repository: providers.Dependency[object] = providers.Dependency()
+    config: providers.Dependency[object] = providers.Dependency()
 
     feed_repository = providers.Factory(
         FeedRepository,
         session=session,
     )
 
+    curriculum_search_repository = providers.Factory(
+        CurriculumSearchRepository,
+        session=session,
+    )
+
     feed_service = providers.Factory(
         FeedService,
         feed_repo=feed_repository,
     )
+
+    timeline_repository = providers.Singleton(
+        TimelineRepository,
+        redis_client=redis_client,
+        size=config.provided.timeline_size,
+        ttl=config.provided.timeline_ttl,
+    )
+
+    timeline_service = providers.Factory(
+        TimelineService,
+        timeline_repo=timeline_repository,
+        feed_repo=feed_repository,
+        follow_repo=follow_repository,
+        fanout_threshold=config.provided.timeline_fanout_threshold,
+        size=config.provided.timeline_size,
+    )
+
+    curriculum_event_handler = providers.Factory(
+        CurriculumEventHandler,
+        curriculum_search_repo=curriculum_search_repository,
+        feed_repo=feed_repository,
+        timeline_service=timeline_service,
+    )
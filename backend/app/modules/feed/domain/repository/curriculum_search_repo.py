@@ -0,0 +1,24 @@
+from abc import ABCMeta, abstractmethod
+from typing import List
+
+
+class ICurriculumSearchRepository(metaclass=ABCMeta):
+    @abstractmethod
+    async def index_curriculums(self, curriculum_ids: List[str]) -> None:
+        """커리큘럼 검색 문서를 원본 테이블 기준으로 다시 색인 (없어진 커리큘럼은 제거)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def index_owner(self, owner_id: str) -> None:
+        """작성자의 모든 커리큘럼 재색인 (이름 변경 시)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, curriculum_id: str) -> None:
+        """커리큘럼 검색 문서 삭제"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """전체 검색 문서 재구성, 색인된 커리큘럼 수 반환"""
+        raise NotImplementedError
@@ -1,8 +1,9 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from app.modules.feed.domain.entity.feed_item import FeedItem
 from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.domain.vo.timeline import TimelineEntry
 
 
 class IFeedRepository(metaclass=ABCMeta):
@@ -27,3 +28,27 @@ class IFeedRepository(metaclass=ABCMeta):
     async def invalidate_feed_cache(self) -> None:
         """전체 피드 캐시 무효화"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_timeline_entry(self, curriculum_id: str) -> Optional[TimelineEntry]:
+        """타임라인 반영용 커리큘럼 작성자/공개 여부/수정 시각"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_recent_public_entries(
+        self, owner_id: str, limit: int
+    ) -> List[TimelineEntry]:
+        """작성자의 최근 수정 공개 커리큘럼"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_following_entries(
+        self, user_id: str, exclude_owner_ids: List[str], limit: int
+    ) -> List[TimelineEntry]:
+        """사용자가 팔로우하는 작성자들의 최근 수정 공개 커리큘럼 (일부 작성자 제외)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_curriculum_ids_by_owner(self, owner_id: str) -> List[str]:
+        """작성자의 모든 커리큘럼 ID"""
+        raise NotImplementedError
@@ -0,0 +1,94 @@
+from abc import ABCMeta, abstractmethod
+from typing import Dict, List, Optional, Set
+
+from app.modules.feed.domain.vo.timeline import TimelineEntry, TimelinePage
+
+
+class ITimelineRepository(metaclass=ABCMeta):
+    """팔로잉 타임라인 저장소 (팔로워별 / 대형 계정 작성자별 sorted set)"""
+
+    @abstractmethod
+    async def read(self, user_id: str, window: int) -> Optional[TimelinePage]:
+        """상위 window 개 조회, 만들어진 적 없거나 저장소 장애면 None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generation(self, user_id: str) -> Optional[int]:
+        """타임라인을 만들기 전(DB 조회 전) 호출, 이후 이 타임라인 쓰기마다 올라가는 세대"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace(
+        self,
+        user_id: str,
+        entries: List[TimelineEntry],
+        celebrity_ids: Set[str],
+        generation: Optional[int],
+    ) -> bool:
+        """
+        타임라인 전체 교체 (빈 타임라인도 '만들어짐'으로 기록).
+        generation 이후 쓰기가 있었으면 교체하지 않고 False.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_entries(
+        self, user_ids: List[str], entries: List[TimelineEntry]
+    ) -> None:
+        """만들어진 타임라인에만 항목 추가 (fan-out-on-write / 팔로우 백필)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_entries(
+        self, user_ids: List[str], curriculum_ids: List[str]
+    ) -> None:
+        """타임라인에서 항목 제거 (비공개 전환/삭제/언팔로우)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_authors(
+        self, author_ids: List[str], window: int
+    ) -> Dict[str, Optional[TimelinePage]]:
+        """대형 계정 작성자별 최근 공개 커리큘럼 상위 window 개 (없으면 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def author_generation(self, author_id: str) -> Optional[int]:
+        """대형 계정 작성자 타임라인을 만들기 전 호출 (generation 과 같음)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_author(
+        self, author_id: str, entries: List[TimelineEntry], generation: Optional[int]
+    ) -> bool:
+        """대형 계정 작성자 타임라인 전체 교체 (generation 이후 쓰기가 있었으면 False)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_author_entry(self, author_id: str, entry: TimelineEntry) -> None:
+        """대형 계정 작성자 타임라인에 항목 추가 (만들어진 경우만)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_author_entries(
+        self, author_id: str, curriculum_ids: List[str]
+    ) -> None:
+        """대형 계정 작성자 타임라인에서 항목 제거"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_celebrity_ids(self) -> Optional[Set[str]]:
+        """fan-out-on-read 로 전환된 대형 계정 ID, 저장소 장애면 None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def promote_celebrity(self, author_id: str, follower_ids: List[str]) -> None:
+        """대형 계정으로 전환, 만들어진 팔로워 타임라인에 읽기 시 합칠 계정으로 등록"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_followed_celebrity(
+        self, user_id: str, author_id: str, following: bool
+    ) -> None:
+        """팔로워 타임라인의 대형 계정 목록 갱신 (팔로우/언팔로우)"""
+        raise NotImplementedError
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    """타임라인에 올라가는 커리큘럼 (최근 수정 시각 순)"""
+
+    curriculum_id: str
+    owner_id: str
+    is_public: bool
+    updated_at: datetime
+
+    @property
+    def score(self) -> float:
+        """sorted set 점수 (UTC epoch 초, DB 의 naive datetime 은 UTC 로 간주)"""
+        updated_at = self.updated_at
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return updated_at.timestamp()
+
+
+@dataclass
+class TimelinePage:
+    """타임라인 상위 구간 (커리큘럼 ID, 점수) + 전체 수 + 읽기 시 합칠 대형 계정"""
+
+    entries: List[Tuple[str, float]]
+    total: int
+    celebrity_ids: List[str] = field(default_factory=list)
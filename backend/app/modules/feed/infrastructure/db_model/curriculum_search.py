@@ -0,0 +1,46 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.db.database import Base
+
+
+class CurriculumSearchDocumentModel(Base):
+    """
+    피드 검색용 비정규화 문서 (커리큘럼당 1행).
+
+    제목/작성자 이름/태그/레슨 주제를 한 행에 모아 MySQL FULLTEXT(ngram) 인덱스로 검색한다.
+    원본 테이블 변경 시 커리큘럼 이벤트로 다시 색인되며, 어긋나면 재구성 명령으로 복구한다.
+    """
+
+    __tablename__ = "curriculum_search_documents"
+
+    curriculum_id: Mapped[str] = mapped_column(
+        String(26),
+        ForeignKey("curriculums.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    title: Mapped[str] = mapped_column(String(50), nullable=False)
+    owner_name: Mapped[str] = mapped_column(String(32), nullable=False)
+    tags: Mapped[str] = mapped_column(Text, nullable=False)  # 공백 구분 태그 이름
+    lessons: Mapped[str] = mapped_column(Text, nullable=False)  # 줄바꿈 구분 레슨
+    indexed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # ngram 파서: 공백 없는 한글 복합어도 2글자 단위로 색인
+    __table_args__ = (
+        Index(
+            "ftx_curriculum_search_title",
+            "title",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        Index(
+            "ftx_curriculum_search_all",
+            "title",
+            "owner_name",
+            "tags",
+            "lessons",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+    )
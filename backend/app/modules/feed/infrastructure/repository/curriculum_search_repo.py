@@ -0,0 +1,241 @@
+import re
+from functools import reduce
+from operator import add
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    case,
+    delete,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.feed.domain.repository.curriculum_search_repo import (
+    ICurriculumSearchRepository,
+)
+from app.modules.feed.infrastructure.db_model.curriculum_search import (
+    CurriculumSearchDocumentModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+# innodb ngram_token_size 기본값, 이보다 짧은 검색어는 FULLTEXT 로 찾을 수 없다
+MIN_FULLTEXT_TERM_LENGTH = 2
+MAX_SEARCH_TERMS = 8
+
+# 필드 가중치: 제목 > 태그 > 작성자/레슨
+TITLE_WEIGHT = 3
+TAGS_WEIGHT = 2
+OWNER_WEIGHT = 1
+LESSONS_WEIGHT = 1
+
+_BOOLEAN_OPERATOR_RE = re.compile(r'[+\-<>()~*"@]+')
+
+
+@dataclass(frozen=True)
+class SearchCondition:
+    """검색어를 적용할 WHERE 조건과 정렬용 관련도 점수"""
+
+    where: ColumnElement[bool]
+    score: ColumnElement[Any]
+
+
+def parse_search_terms(query: str) -> List[str]:
+    """검색어를 공백 단위로 분리 (불리언 연산자 제거, 중복 제거, 최대 8개)"""
+    cleaned = _BOOLEAN_OPERATOR_RE.sub(" ", query.lower())
+    return list(dict.fromkeys(cleaned.split()))[:MAX_SEARCH_TERMS]
+
+
+def build_search_condition(dialect_name: str, query: str) -> Optional[SearchCondition]:
+    """
+    검색 문서에 적용할 조건 생성 (모든 검색어를 포함하는 문서만 매칭).
+
+    - mysql: FULLTEXT ngram 인덱스 MATCH ... AGAINST (BOOLEAN MODE), 제목 매칭 가중
+    - 그 외(sqlite 등 개발/테스트용): 필드별 LIKE 와 가중치 합산 점수
+    """
+    terms = parse_search_terms(query)
+    if not terms:
+        return None
+    if dialect_name != "mysql":
+        return _like_condition(terms)
+
+    fulltext_terms = [t for t in terms if len(t) >= MIN_FULLTEXT_TERM_LENGTH]
+    short_terms = [t for t in terms if len(t) < MIN_FULLTEXT_TERM_LENGTH]
+    if not fulltext_terms:
+        return _like_condition(short_terms)
+
+    doc = CurriculumSearchDocumentModel
+    against = " ".join(f'+"{term}"' for term in fulltext_terms)
+    match_all = match(
+        doc.title, doc.owner_name, doc.tags, doc.lessons, against=against
+    ).in_boolean_mode()
+    match_title = match(doc.title, against=against).in_boolean_mode()
+    score: ColumnElement[Any] = match_title * TITLE_WEIGHT + match_all
+
+    if not short_terms:
+        return SearchCondition(where=match_all, score=score)
+    short = _like_condition(short_terms)
+    return SearchCondition(
+        where=and_(match_all, short.where), score=score + short.score
+    )
+
+
+def _like_condition(terms: Sequence[str]) -> SearchCondition:
+    doc = CurriculumSearchDocumentModel
+    weighted_fields = (
+        (doc.title, TITLE_WEIGHT),
+        (doc.tags, TAGS_WEIGHT),
+        (doc.owner_name, OWNER_WEIGHT),
+        (doc.lessons, LESSONS_WEIGHT),
+    )
+    conditions = []
+    field_scores = []
+    for term in terms:
+        matches = [
+            (field.contains(term, autoescape=True), weight)
+            for field, weight in weighted_fields
+        ]
+        conditions.append(or_(*(condition for condition, _ in matches)))
+        field_scores.extend(case((cond, weight), else_=0) for cond, weight in matches)
+    return SearchCondition(where=and_(*conditions), score=reduce(add, field_scores))
+
+
+class CurriculumSearchRepository(ICurriculumSearchRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session: AsyncSession = session
+
+    async def index_curriculums(self, curriculum_ids: List[str]) -> None:
+        """커리큘럼 검색 문서를 원본 테이블 기준으로 다시 색인 (없어진 커리큘럼은 제거)"""
+        ids = list(dict.fromkeys(curriculum_ids))
+        if not ids:
+            return
+
+        try:
+            documents = await self._build_documents(ids)
+            await self.session.execute(
+                delete(CurriculumSearchDocumentModel).where(
+                    CurriculumSearchDocumentModel.curriculum_id.in_(ids)
+                )
+            )
+            if documents:
+                await self.session.execute(
+                    insert(CurriculumSearchDocumentModel), documents
+                )
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+
+    async def index_owner(self, owner_id: str) -> None:
+        """작성자의 모든 커리큘럼 재색인 (이름 변경 시)"""
+        result = await self.session.scalars(
+            select(CurriculumModel.id).where(CurriculumModel.user_id == owner_id)
+        )
+        await self.index_curriculums(list(result.all()))
+
+    async def remove(self, curriculum_id: str) -> None:
+        """커리큘럼 검색 문서 삭제"""
+        try:
+            await self.session.execute(
+                delete(CurriculumSearchDocumentModel).where(
+                    CurriculumSearchDocumentModel.curriculum_id == curriculum_id
+                )
+            )
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """
+        전체 검색 문서 재구성, 색인된 커리큘럼 수 반환.
+
+        커리큘럼 ID 순으로 배치 단위 교체 후 원본이 없는 문서를 정리하므로
+        재구성 중에도 검색이 빈 결과를 내지 않는다.
+        """
+        indexed = 0
+        last_id = ""
+        try:
+            while True:
+                result = await self.session.scalars(
+                    select(CurriculumModel.id)
+                    .where(CurriculumModel.id > last_id)
+                    .order_by(CurriculumModel.id)
+                    .limit(batch_size)
+                )
+                ids = list(result.all())
+                if not ids:
+                    break
+                await self.index_curriculums(ids)
+                indexed += len(ids)
+                last_id = ids[-1]
+
+            await self.session.execute(
+                delete(CurriculumSearchDocumentModel).where(
+                    CurriculumSearchDocumentModel.curriculum_id.not_in(
+                        select(CurriculumModel.id)
+                    )
+                )
+            )
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+        return indexed
+
+    async def _build_documents(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """커리큘럼/작성자/레슨/태그를 각각 한 번씩 조회해 검색 문서 생성"""
+        curriculum_rows = (
+            await self.session.execute(
+                select(CurriculumModel.id, CurriculumModel.title, UserModel.name)
+                .join(UserModel, UserModel.id == CurriculumModel.user_id)
+                .where(CurriculumModel.id.in_(ids))
+            )
+        ).all()
+        if not curriculum_rows:
+            return []
+
+        lessons: Dict[str, List[str]] = {}
+        lesson_rows = await self.session.execute(
+            select(WeekScheduleModel.curriculum_id, WeekScheduleModel.lessons)
+            .where(WeekScheduleModel.curriculum_id.in_(ids))
+            .order_by(WeekScheduleModel.curriculum_id, WeekScheduleModel.week_number)
+        )
+        for curriculum_id, week_lessons in lesson_rows:
+            lessons.setdefault(curriculum_id, []).extend(week_lessons)
+
+        tags: Dict[str, List[str]] = {}
+        tag_rows = await self.session.execute(
+            select(CurriculumTagModel.curriculum_id, TagModel.name)
+            .join(TagModel, TagModel.id == CurriculumTagModel.tag_id)
+            .where(CurriculumTagModel.curriculum_id.in_(ids))
+        )
+        for curriculum_id, tag_name in tag_rows:
+            tags.setdefault(curriculum_id, []).append(tag_name)
+
+        indexed_at = datetime.now(timezone.utc)
+        return [
+            {
+                "curriculum_id": curriculum_id,
+                "title": title,
+                "owner_name": owner_name,
+                "tags": " ".join(sorted(tags.get(curriculum_id, []))),
+                "lessons": "\n".join(lessons.get(curriculum_id, [])),
+                "indexed_at": indexed_at,
+            }
+            for curriculum_id, title, owner_name in curriculum_rows
+        ]
@@ -0,0 +1,70 @@
+from typing import Any, List
+
+from app.common.cache.codec import CacheCodec, from_epoch_us, to_epoch_us
+from app.common.cache.two_tier import TwoTierCache, two_tier_caches
+from app.core.config import get_settings
+from app.modules.feed.domain.entity.feed_item import FeedItem
+
+
+class FeedItemCodec(CacheCodec[FeedItem]):
+    """
+    feed:item:{curriculum_id} 값.
+
+    카테고리는 ID 만 저장하고 이름/색상은 읽을 때 워커 로컬 카테고리 스냅샷으로 채운다.
+    score 는 저장하지 않는다 (정렬 점수는 Sorted Set 에 있음).
+    """
+
+    VERSION = 1
+
+    def to_fields(self, value: FeedItem) -> List[Any]:
+        return [
+            value.curriculum_id,
+            value.title,
+            value.owner_id,
+            value.owner_name,
+            value.total_weeks,
+            value.total_lessons,
+            to_epoch_us(value.created_at),
+            to_epoch_us(value.updated_at),
+            value.updated_at.tzinfo is not None,
+            value.category_id,
+            value.tags,
+        ]
+
+    def from_fields(self, fields: List[Any]) -> FeedItem:
+        (
+            curriculum_id,
+            title,
+            owner_id,
+            owner_name,
+            total_weeks,
+            total_lessons,
+            created_at,
+            updated_at,
+            aware,
+            category_id,
+            tags,
+        ) = fields
+        return FeedItem(
+            curriculum_id=curriculum_id,
+            title=title,
+            owner_id=owner_id,
+            owner_name=owner_name,
+            total_weeks=total_weeks,
+            total_lessons=total_lessons,
+            created_at=from_epoch_us(created_at, aware),
+            updated_at=from_epoch_us(updated_at, aware),
+            score=0.0,
+            category_id=category_id,
+            tags=tags,
+        )
+
+
+feed_item_codec = FeedItemCodec(
+    compress_threshold=get_settings().cache_compress_threshold
+)
+
+# feed:item:{curriculum_id} 2단 캐시 (워커 로컬 L1 + Redis)
+feed_item_cache: TwoTierCache[FeedItem] = two_tier_caches.register(
+    "feed:item", feed_item_codec, l2_ttl=300
+)
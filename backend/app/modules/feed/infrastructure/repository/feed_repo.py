@@ -1,26 +1,56 @@
-import json
-from typing import List, Tuple, Optional
-from sqlalchemy import Result, Select, select, func, or_
+from dataclasses import replace
+from typing import Any, Dict, List, Tuple, Optional
+from sqlalchemy import Select, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import joinedload
 
 from app.common.cache.redis_client import redis_client
+from app.common.cache.two_tier import LocalCache, TwoTierCache
+from app.core.config import get_settings
 from app.modules.feed.domain.repository.feed_repo import IFeedRepository
 from app.modules.feed.domain.entity.feed_item import FeedItem
 from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.domain.vo.timeline import TimelineEntry
 from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
-from app.modules.user.infrastructure.db_model.user import UserModel
-from app.modules.taxonomy.infrastructure.db_model.category import CategoryModel
+from app.modules.feed.infrastructure.db_model.curriculum_search import (
+    CurriculumSearchDocumentModel,
+)
+from app.modules.feed.infrastructure.repository.curriculum_search_repo import (
+    build_search_condition,
+)
+from app.modules.feed.infrastructure.repository.feed_cache_codec import (
+    feed_item_cache,
+)
+from app.modules.social.infrastructure.db_model.follow import FollowModel
 from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
     CurriculumCategoryModel,
     CurriculumTagModel,
 )
 from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.taxonomy.infrastructure.repository.cached_category_repo import (
+    category_reference_data,
+    load_category_snapshot,
+)
+from app.modules.taxonomy.infrastructure.repository.category_repo import (
+    CategoryRepository,
+)
+
+# 최근 캐시 조회한 피드 페이지 (전체 개수, 커리큘럼 ID 목록), Redis 서킷이 열렸을 때 사용
+recent_feed_pages: LocalCache[Tuple[int, List[str]]] = LocalCache(
+    max_size=256, ttl=get_settings().cache_l1_stale_ttl
+)
 
 
 class FeedRepository(IFeedRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        item_cache: TwoTierCache[FeedItem] = feed_item_cache,
+        recent_pages: LocalCache[Tuple[int, List[str]]] = recent_feed_pages,
+    ):
         self.session = session
+        self.item_cache = item_cache
+        self.recent_pages = recent_pages
         self.CACHE_KEY_PREFIX = "feed"
         self.CACHE_EXPIRE_TIME = 300  # 5분
         self.SORTED_SET_KEY = "feed:public_curriculums"
@@ -30,10 +60,11 @@ class FeedRepository(IFeedRepository):
     ) -> Tuple[int, List[FeedItem]]:
         """공개 커리큘럼 피드 조회 (캐시 우선, DB 백업)"""
 
-        # 1. 캐시에서 시도
-        cached_items = await self._get_from_cache(feed_filter)
-        if cached_items is not None:
-            return cached_items
+        # 1. 캐시에서 시도 (검색은 관련도 순이라 최신순 캐시를 쓸 수 없음)
+        if not feed_filter.search_query:
+            cached_items = await self._get_from_cache(feed_filter)
+            if cached_items is not None:
+                return cached_items
 
         # 2. DB에서 조회
         total_count, feed_items = await self._get_from_database(feed_filter)
@@ -47,6 +78,8 @@ class FeedRepository(IFeedRepository):
         self, feed_filter: FeedFilter
     ) -> Optional[Tuple[int, List[FeedItem]]]:
         """캐시에서 피드 조회"""
+        if redis_client.circuit_open:
+            return await self._get_stale_page(feed_filter)
         try:
             # Sorted Set에서 최신순으로 조회
             start = feed_filter.offset
@@ -59,29 +92,58 @@ class FeedRepository(IFeedRepository):
             if not curriculum_ids:
                 return None
 
-            # 각 아이템의 상세 정보 조회
-            feed_items = []
-            for curriculum_id in curriculum_ids:
-                cache_key = f"{self.CACHE_KEY_PREFIX}:item:{curriculum_id}"
-                cached_data = await redis_client.get(cache_key)
-
-                if cached_data:
-                    item_data = json.loads(cached_data)
-                    feed_item = FeedItem.from_dict(item_data)
-
-                    # 필터링 적용
-                    if self._matches_filter(feed_item, feed_filter):
-                        feed_items.append(feed_item)
+            # 각 아이템의 상세 정보 조회 (L1 → L2 MGET 한 번)
+            cached = await self.item_cache.get_many(curriculum_ids)
+            feed_items = await self._assemble_page(curriculum_ids, cached, feed_filter)
 
             # 전체 개수는 Sorted Set 크기로 추정
             total_count = await redis_client.redis.zcard(self.SORTED_SET_KEY)  # type: ignore
 
+            self.recent_pages.set(
+                self._page_key(feed_filter), (total_count, curriculum_ids)
+            )
             return total_count, feed_items
 
         except Exception:
             # 캐시 오류 시 None 반환하여 DB 조회로 fallback
             return None
 
+    async def _get_stale_page(
+        self, feed_filter: FeedFilter
+    ) -> Optional[Tuple[int, List[FeedItem]]]:
+        """Redis 서킷이 열린 동안: 최근 페이지 구성 + L1 아이템 (하나라도 없으면 DB)"""
+        page = self.recent_pages.get(self._page_key(feed_filter))
+        if page is None:
+            return None
+        total_count, curriculum_ids = page
+        cached = await self.item_cache.get_many(curriculum_ids)
+        if len(cached) < len(curriculum_ids):
+            return None
+        return total_count, await self._assemble_page(
+            curriculum_ids, cached, feed_filter
+        )
+
+    async def _assemble_page(
+        self,
+        curriculum_ids: List[str],
+        cached: Dict[str, FeedItem],
+        feed_filter: FeedFilter,
+    ) -> List[FeedItem]:
+        feed_items = []
+        for curriculum_id in curriculum_ids:
+            feed_item = cached.get(curriculum_id)
+
+            # 필터링 적용 (L1 객체는 공유되므로 복사본에 카테고리를 채움)
+            if feed_item and self._matches_filter(feed_item, feed_filter):
+                feed_items.append(replace(feed_item))
+        await self._fill_categories(feed_items)
+        return feed_items
+
+    @staticmethod
+    def _page_key(feed_filter: FeedFilter) -> str:
+        tags = ",".join(sorted(feed_filter.tags or []))
+        return f"{feed_filter.offset}:{feed_filter.limit}:{tags}"
+
     async def _get_from_database(
         self, feed_filter: FeedFilter
     ) -> Tuple[int, List[FeedItem]]:
@@ -89,10 +151,7 @@ class FeedRepository(IFeedRepository):
         base_query = (
             select(CurriculumModel)
             .where(CurriculumModel.visibility == "PUBLIC")
-            .options(
-                selectinload(CurriculumModel.week_schedules),
-                joinedload(CurriculumModel.user),
-            )
+            .options(joinedload(CurriculumModel.user))
         )
 
         # 필터링 적용
@@ -110,14 +169,21 @@ class FeedRepository(IFeedRepository):
                 .having(func.count(TagModel.id) == len(feed_filter.tags))
             )
 
-        if feed_filter.search_query:
-            search_term = f"%{feed_filter.search_query}%"
-            base_query = base_query.where(
-                or_(
-                    CurriculumModel.title.like(search_term),
-                    CurriculumModel.user.has(UserModel.name.like(search_term)),
-                )
+        # 검색: 검색 문서(FULLTEXT) 매칭 + 관련도 순 정렬
+        order_by: List[Any] = [CurriculumModel.updated_at.desc()]
+        search = (
+            build_search_condition(
+                self.session.get_bind().dialect.name, feed_filter.search_query
             )
+            if feed_filter.search_query
+            else None
+        )
+        if search is not None:
+            base_query = base_query.join(
+                CurriculumSearchDocumentModel,
+                CurriculumSearchDocumentModel.curriculum_id == CurriculumModel.id,
+            ).where(search.where)
+            order_by.insert(0, search.score.desc())
 
         # 전체 개수
         count_query = select(func.count()).select_from(base_query.subquery())
@@ -125,7 +191,7 @@ class FeedRepository(IFeedRepository):
 
         # 페이지네이션 및 정렬
         paged_query = (
-            base_query.order_by(CurriculumModel.updated_at.desc())
+            base_query.order_by(*order_by)
             .offset(feed_filter.offset)
             .limit(feed_filter.limit)
         )
@@ -136,8 +202,8 @@ class FeedRepository(IFeedRepository):
         # FeedItem으로 변환
         feed_items = []
         for curriculum in curriculum_models:
-            # 카테고리 정보 조회
-            category_info = await self._get_category_info(curriculum.id)
+            # 카테고리 ID 조회 (이름/색상은 아래에서 스냅샷으로)
+            category_id = await self._get_category_id(curriculum.id)
 
             # 태그 정보 조회
             tags = await self._get_curriculum_tags(curriculum.id)
@@ -147,28 +213,39 @@ class FeedRepository(IFeedRepository):
                 title=curriculum.title,
                 owner_id=curriculum.user_id,
                 owner_name=curriculum.user.name,
-                total_weeks=len(curriculum.week_schedules),
-                total_lessons=sum(len(ws.lessons) for ws in curriculum.week_schedules),
+                total_weeks=curriculum.total_weeks,
+                total_lessons=curriculum.total_lessons,
                 created_at=curriculum.created_at,
                 updated_at=curriculum.updated_at,
                 score=curriculum.updated_at.timestamp(),
-                category_name=category_info[0] if category_info else None,
-                category_color=category_info[1] if category_info else None,
+                category_id=category_id,
                 tags=tags,
             )
             feed_items.append(feed_item)
+        await self._fill_categories(feed_items)
 
         return total_count, feed_items
 
-    async def _get_category_info(self, curriculum_id: str) -> Optional[Tuple[str, str]]:
-        """커리큘럼의 카테고리 정보 조회"""
-        query: Select[Tuple[str, str]] = (
-            select(CategoryModel.name, CategoryModel.color)
-            .join(CurriculumCategoryModel)
-            .where(CurriculumCategoryModel.curriculum_id == curriculum_id)
+    async def _get_category_id(self, curriculum_id: str) -> Optional[str]:
+        """커리큘럼의 카테고리 ID 조회"""
+        query: Select[Tuple[str]] = select(CurriculumCategoryModel.category_id).where(
+            CurriculumCategoryModel.curriculum_id == curriculum_id
+        )
+        return await self.session.scalar(query)
+
+    async def _fill_categories(self, feed_items: List[FeedItem]) -> None:
+        """카테고리 ID → 이름/색상 (카테고리 참조 데이터 스냅샷)"""
+        if not any(item.category_id for item in feed_items):
+            return
+        snapshot = await category_reference_data.get(
+            lambda: load_category_snapshot(CategoryRepository(self.session))
         )
-        result: Result[Tuple[str, str]] = await self.session.execute(query)
-        return result.first()  # type: ignore
+        for item in feed_items:
+            if item.category_id is None:
+                continue
+            info = snapshot.name_and_color(item.category_id)
+            if info:
+                item.category_name, item.category_color = info
 
     async def _get_curriculum_tags(self, curriculum_id: str) -> List[str]:
         """커리큘럼의 태그 목록 조회"""
@@ -182,14 +259,6 @@ class FeedRepository(IFeedRepository):
 
     def _matches_filter(self, feed_item: FeedItem, feed_filter: FeedFilter) -> bool:
         """피드 아이템이 필터 조건에 맞는지 확인"""
-        if feed_filter.search_query:
-            search_lower = feed_filter.search_query.lower()
-            if (
-                search_lower not in feed_item.title.lower()
-                and search_lower not in feed_item.owner_name.lower()
-            ):
-                return False
-
         if feed_filter.tags:
             if not all(tag in feed_item.tags for tag in feed_filter.tags):  # type: ignore
                 return False
@@ -207,9 +276,11 @@ class FeedRepository(IFeedRepository):
                 await redis_client.zadd(self.SORTED_SET_KEY, mapping)
                 await redis_client.expire(self.SORTED_SET_KEY, self.CACHE_EXPIRE_TIME)
 
-            # 개별 아이템 캐시
-            for item in feed_items:
-                await self.cache_feed_item(item)
+            # 개별 아이템 캐시 (파이프라인 한 번)
+            await self.item_cache.set_many(
+                {item.curriculum_id: item for item in feed_items},
+                ttl=self.CACHE_EXPIRE_TIME,
+            )
 
         except Exception:
             # 캐시 오류는 무시 (DB 조회는 성공했으므로)
@@ -218,9 +289,9 @@ class FeedRepository(IFeedRepository):
     async def cache_feed_item(self, feed_item: FeedItem) -> None:
         """단일 피드 아이템 캐시"""
         try:
-            cache_key = f"{self.CACHE_KEY_PREFIX}:item:{feed_item.curriculum_id}"
-            item_data = json.dumps(feed_item.to_dict(), ensure_ascii=False)
-            await redis_client.set(cache_key, item_data, ex=self.CACHE_EXPIRE_TIME)
+            await self.item_cache.set(
+                feed_item.curriculum_id, feed_item, ttl=self.CACHE_EXPIRE_TIME
+            )
 
             # Sorted Set에도 추가
             await redis_client.zadd(
@@ -234,9 +305,8 @@ class FeedRepository(IFeedRepository):
     async def remove_from_cache(self, curriculum_id: str) -> None:
         """캐시에서 피드 아이템 제거"""
         try:
-            # 개별 아이템 캐시 삭제
-            cache_key = f"{self.CACHE_KEY_PREFIX}:item:{curriculum_id}"
-            await redis_client.delete(cache_key)
+            # 개별 아이템 캐시 삭제 (다른 워커의 L1 에도 알림)
+            await self.item_cache.invalidate([curriculum_id])
 
             # Sorted Set에서 제거
             await redis_client.zrem(self.SORTED_SET_KEY, curriculum_id)
@@ -264,18 +334,15 @@ class FeedRepository(IFeedRepository):
                 .where(CurriculumModel.visibility == "PUBLIC")
                 .order_by(CurriculumModel.updated_at.desc())
                 .limit(limit)
-                .options(
-                    selectinload(CurriculumModel.week_schedules),
-                    joinedload(CurriculumModel.user),
-                )
+                .options(joinedload(CurriculumModel.user))
             )
 
             result = await self.session.execute(query)
             curriculums = result.unique().scalars().all()
 
-            # 캐시에 저장
+            # 캐시에 저장 (카테고리는 ID 만 캐시하므로 이름은 채우지 않음)
             for curriculum in curriculums:
-                category_info = await self._get_category_info(curriculum.id)
+                category_id = await self._get_category_id(curriculum.id)
                 tags = await self._get_curriculum_tags(curriculum.id)
 
                 feed_item = FeedItem(
@@ -283,15 +350,12 @@ class FeedRepository(IFeedRepository):
                     title=curriculum.title,
                     owner_id=curriculum.user_id,
                     owner_name=curriculum.user.name,
-                    total_weeks=len(curriculum.week_schedules),
-                    total_lessons=sum(
-                        len(ws.lessons) for ws in curriculum.week_schedules
-                    ),
+                    total_weeks=curriculum.total_weeks,
+                    total_lessons=curriculum.total_lessons,
                     created_at=curriculum.created_at,
                     updated_at=curriculum.updated_at,
                     score=curriculum.updated_at.timestamp(),
-                    category_name=category_info[0] if category_info else None,
-                    category_color=category_info[1] if category_info else None,
+                    category_id=category_id,
                     tags=tags,
                 )
 
@@ -317,3 +381,71 @@ class FeedRepository(IFeedRepository):
             }
         except Exception:
             return {"error": "Unable to get cache stats"}
+
+    # ========================= 팔로잉 타임라인 원본 =========================
+
+    _TIMELINE_COLUMNS = (
+        CurriculumModel.id,
+        CurriculumModel.user_id,
+        CurriculumModel.visibility,
+        CurriculumModel.updated_at,
+    )
+
+    async def find_timeline_entry(self, curriculum_id: str) -> Optional[TimelineEntry]:
+        """타임라인 반영용 커리큘럼 작성자/공개 여부/수정 시각"""
+        result = await self.session.execute(
+            select(*self._TIMELINE_COLUMNS).where(CurriculumModel.id == curriculum_id)
+        )
+        row = result.first()
+        return self._to_timeline_entry(row) if row else None
+
+    async def find_recent_public_entries(
+        self, owner_id: str, limit: int
+    ) -> List[TimelineEntry]:
+        """작성자의 최근 수정 공개 커리큘럼"""
+        result = await self.session.execute(
+            select(*self._TIMELINE_COLUMNS)
+            .where(
+                CurriculumModel.user_id == owner_id,
+                CurriculumModel.visibility == "PUBLIC",
+            )
+            .order_by(CurriculumModel.updated_at.desc())
+            .limit(limit)
+        )
+        return [self._to_timeline_entry(row) for row in result.all()]
+
+    async def find_following_entries(
+        self, user_id: str, exclude_owner_ids: List[str], limit: int
+    ) -> List[TimelineEntry]:
+        """사용자가 팔로우하는 작성자들의 최근 수정 공개 커리큘럼 (일부 작성자 제외)"""
+        query = (
+            select(*self._TIMELINE_COLUMNS)
+            .join(FollowModel, FollowModel.followee_id == CurriculumModel.user_id)
+            .where(
+                FollowModel.follower_id == user_id,
+                CurriculumModel.visibility == "PUBLIC",
+            )
+            .order_by(CurriculumModel.updated_at.desc())
+            .limit(limit)
+        )
+        if exclude_owner_ids:
+            query = query.where(CurriculumModel.user_id.not_in(exclude_owner_ids))
+        result = await self.session.execute(query)
+        return [self._to_timeline_entry(row) for row in result.all()]
+
+    async def find_curriculum_ids_by_owner(self, owner_id: str) -> List[str]:
+        """작성자의 모든 커리큘럼 ID"""
+        result = await self.session.scalars(
+            select(CurriculumModel.id).where(CurriculumModel.user_id == owner_id)
+        )
+        return list(result.all())
+
+    @staticmethod
+    def _to_timeline_entry(row: Any) -> TimelineEntry:
+        curriculum_id, owner_id, visibility, updated_at = row
+        return TimelineEntry(
+            curriculum_id=curriculum_id,
+            owner_id=owner_id,
+            is_public=visibility == "PUBLIC",
+            updated_at=updated_at,
+        )
@@ -0,0 +1,320 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from redis.exceptions import WatchError
+
+from app.common.cache.redis_client import RedisClient
+from app.modules.feed.domain.repository.timeline_repo import ITimelineRepository
+from app.modules.feed.domain.vo.timeline import TimelineEntry, TimelinePage
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineRepository(ITimelineRepository):
+    """
+    Redis 기반 팔로잉 타임라인.
+
+    - timeline:user:{user_id}        (zset) 커리큘럼 ID → updated_at, 팔로워별 fan-out-on-write
+    - timeline:user:{user_id}:celebs (set)  읽기 시 합칠 팔로우 중인 대형 계정
+    - timeline:author:{author_id}    (zset) 대형 계정의 최근 공개 커리큘럼 (fan-out-on-read)
+    - timeline:celebrities           (set)  대형 계정 ID
+    - {타임라인 키}:gen              (int)  만들기 시작한 뒤 쓰기마다 증가하는 세대
+
+    zset 에는 센티널 멤버("")를 +inf 점수로 두어 비어 있어도 '만들어짐'을 표시한다.
+    상위 size 개만 유지하고 TTL 은 조회 때마다 연장하므로, 키가 있는 사용자만 쓰기 대상
+    (활성 사용자)이 되고 나머지는 다음 조회 때 DB 에서 다시 만든다.
+
+    만들기(replace)는 DB 조회 전에 세대를 올려 두고, 세대가 그대로일 때만 교체한다 (WATCH).
+    만드는 중의 쓰기는 세대를 올리므로 DB 에서 읽은 오래된 목록이 그 쓰기를 덮어쓰지 않고,
+    센티널 없이 남은 부분 zset 은 다음 조회에서 다시 만든다.
+    """
+
+    KEY_PREFIX = "timeline"
+    CELEBRITIES_KEY = "timeline:celebrities"
+    SENTINEL = ""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        size: int = 500,
+        ttl: int = 3 * 24 * 60 * 60,
+    ) -> None:
+        self.redis_client = redis_client
+        self.size = size
+        self.ttl = ttl
+
+    # ========================= 팔로워 타임라인 =========================
+
+    async def read(self, user_id: str, window: int) -> Optional[TimelinePage]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        key = self._user_key(user_id)
+        celebs_key = self._celebs_key(user_id)
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.zrevrangebyscore(
+                key, "(inf", "-inf", start=0, num=window, withscores=True
+            )
+            pipe.zcard(key)
+            pipe.smembers(celebs_key)
+            pipe.zscore(key, self.SENTINEL)
+            for expiring in (key, celebs_key, self._generation_key(key)):
+                pipe.expire(expiring, self.ttl)
+            entries, total, celebrity_ids, built, *_ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Timeline read failed: {e}")
+            return None
+        if built is None:
+            return None
+        return TimelinePage(
+            entries=list(entries),
+            total=max(int(total) - 1, 0),
+            celebrity_ids=sorted(celebrity_ids),
+        )
+
+    async def generation(self, user_id: str) -> Optional[int]:
+        return await self._begin_build(self._user_key(user_id))
+
+    async def replace(
+        self,
+        user_id: str,
+        entries: List[TimelineEntry],
+        celebrity_ids: Set[str],
+        generation: Optional[int],
+    ) -> bool:
+        key = self._user_key(user_id)
+        celebs_key = self._celebs_key(user_id)
+
+        def _replace(pipe) -> None:
+            pipe.delete(key, celebs_key)
+            pipe.zadd(key, self._mapping(entries, with_sentinel=True))
+            pipe.expire(key, self.ttl)
+            if celebrity_ids:
+                pipe.sadd(celebs_key, *celebrity_ids)
+                pipe.expire(celebs_key, self.ttl)
+
+        return await self._replace_if_current(key, generation, _replace)
+
+    async def add_entries(
+        self, user_ids: List[str], entries: List[TimelineEntry]
+    ) -> None:
+        if not entries:
+            return
+        mapping = self._mapping(entries)
+        await self._write_existing(
+            [self._user_key(user_id) for user_id in user_ids],
+            lambda pipe, key: self._add(pipe, key, mapping),
+        )
+
+    async def remove_entries(
+        self, user_ids: List[str], curriculum_ids: List[str]
+    ) -> None:
+        if not curriculum_ids:
+            return
+        await self._write_existing(
+            [self._user_key(user_id) for user_id in user_ids],
+            lambda pipe, key: pipe.zrem(key, *curriculum_ids),
+        )
+
+    # ========================= 대형 계정 (fan-out-on-read) =========================
+
+    async def read_authors(
+        self, author_ids: List[str], window: int
+    ) -> Dict[str, Optional[TimelinePage]]:
+        pages: Dict[str, Optional[TimelinePage]] = {a: None for a in author_ids}
+        redis = self.redis_client.redis
+        if redis is None or not author_ids:
+            return pages
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for author_id in author_ids:
+                key = self._author_key(author_id)
+                pipe.zrevrangebyscore(
+                    key, "(inf", "-inf", start=0, num=window, withscores=True
+                )
+                pipe.zcard(key)
+                pipe.zscore(key, self.SENTINEL)
+                pipe.expire(key, self.ttl)
+                pipe.expire(self._generation_key(key), self.ttl)
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Timeline author read failed: {e}")
+            return pages
+        for i, author_id in enumerate(author_ids):
+            entries, total, built = results[i * 5 : i * 5 + 3]
+            if built is not None:
+                pages[author_id] = TimelinePage(
+                    entries=list(entries), total=max(int(total) - 1, 0)
+                )
+        return pages
+
+    async def author_generation(self, author_id: str) -> Optional[int]:
+        return await self._begin_build(self._author_key(author_id))
+
+    async def replace_author(
+        self, author_id: str, entries: List[TimelineEntry], generation: Optional[int]
+    ) -> bool:
+        key = self._author_key(author_id)
+
+        def _replace(pipe) -> None:
+            pipe.delete(key)
+            pipe.zadd(key, self._mapping(entries, with_sentinel=True))
+            pipe.expire(key, self.ttl)
+
+        return await self._replace_if_current(key, generation, _replace)
+
+    async def add_author_entry(self, author_id: str, entry: TimelineEntry) -> None:
+        mapping = self._mapping([entry])
+        await self._write_existing(
+            [self._author_key(author_id)],
+            lambda pipe, key: self._add(pipe, key, mapping),
+        )
+
+    async def remove_author_entries(
+        self, author_id: str, curriculum_ids: List[str]
+    ) -> None:
+        if not curriculum_ids:
+            return
+        await self._write_existing(
+            [self._author_key(author_id)],
+            lambda pipe, key: pipe.zrem(key, *curriculum_ids),
+        )
+
+    async def find_celebrity_ids(self) -> Optional[Set[str]]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            return set(await redis.smembers(self.CELEBRITIES_KEY))
+        except Exception as e:
+            logger.warning(f"Timeline celebrity read failed: {e}")
+            return None
+
+    async def promote_celebrity(self, author_id: str, follower_ids: List[str]) -> None:
+        redis = self.redis_client.redis
+        if redis is None:
+            return
+        try:
+            await redis.sadd(self.CELEBRITIES_KEY, author_id)
+        except Exception as e:
+            logger.warning(f"Timeline write failed: {e}")
+            return
+
+        def _follow(pipe, key: str) -> None:
+            celebs_key = f"{key}:celebs"
+            pipe.sadd(celebs_key, author_id)
+            pipe.expire(celebs_key, self.ttl)
+
+        await self._write_existing(
+            [self._user_key(user_id) for user_id in follower_ids], _follow
+        )
+
+    async def set_followed_celebrity(
+        self, user_id: str, author_id: str, following: bool
+    ) -> None:
+        def _update(pipe, key: str) -> None:
+            celebs_key = f"{key}:celebs"
+            if following:
+                pipe.sadd(celebs_key, author_id)
+                pipe.expire(celebs_key, self.ttl)
+            else:
+                pipe.srem(celebs_key, author_id)
+
+        await self._write_existing([self._user_key(user_id)], _update)
+
+    # ========================= 내부 =========================
+
+    async def _write_existing(self, keys: List[str], write) -> None:
+        """
+        만들어졌거나 만드는 중인(세대 키가 있는) 타임라인에만 쓰고 세대를 올린다.
+        만드는 중에 생긴 센티널 없는 부분 zset 은 TTL 을 붙여 두고 다음 조회에서 교체된다.
+        """
+        redis = self.redis_client.redis
+        if redis is None or not keys:
+            return
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.exists(key)
+                pipe.exists(self._generation_key(key))
+            found = await pipe.execute()
+
+            pipe = redis.pipeline(transaction=False)
+            for key, exists, building in zip(keys, found[::2], found[1::2]):
+                if not exists and not building:
+                    continue
+                write(pipe, key)
+                if not exists:
+                    pipe.expire(key, self.ttl)
+                pipe.incr(self._generation_key(key))
+                pipe.expire(self._generation_key(key), self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Timeline write failed: {e}")
+
+    async def _begin_build(self, key: str) -> Optional[int]:
+        """세대 키를 만들고(올리고) 그 값을 반환, 이후 이 키의 쓰기는 세대를 올린다"""
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        generation_key = self._generation_key(key)
+        try:
+            pipe = redis.pipeline(transaction=True)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, self.ttl)
+            generation, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Timeline write failed: {e}")
+            return None
+        return int(generation)
+
+    async def _replace_if_current(
+        self, key: str, generation: Optional[int], replace: Callable[[Any], None]
+    ) -> bool:
+        """세대가 generation 그대로일 때만 교체 (WATCH 중 쓰기가 끼어들면 포기)"""
+        redis = self.redis_client.redis
+        if redis is None or generation is None:
+            return False
+        generation_key = self._generation_key(key)
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(generation_key)
+                current = await pipe.get(generation_key)
+                if current is None or int(current) != generation:
+                    return False
+                pipe.multi()
+                replace(pipe)
+                await pipe.execute()
+        except WatchError:
+            return False
+        except Exception as e:
+            logger.warning(f"Timeline write failed: {e}")
+            return False
+        return True
+
+    def _add(self, pipe, key: str, mapping: Dict[str, float]) -> None:
+        pipe.zadd(key, mapping)
+        # 센티널(+inf) 포함 상위 size + 1 개 유지
+        pipe.zremrangebyrank(key, 0, -(self.size + 2))
+
+    def _mapping(
+        self, entries: List[TimelineEntry], with_sentinel: bool = False
+    ) -> Dict[str, float]:
+        top = sorted(entries, key=lambda e: -e.score)[: self.size]
+        mapping = {entry.curriculum_id: entry.score for entry in top}
+        if with_sentinel:
+            mapping[self.SENTINEL] = float("inf")
+        return mapping
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:user:{user_id}"
+
+    def _celebs_key(self, user_id: str) -> str:
+        return f"{self._user_key(user_id)}:celebs"
+
+    def _author_key(self, author_id: str) -> str:
+        return f"{self.KEY_PREFIX}:author:{author_id}"
+
+    def _generation_key(self, key: str) -> str:
+        return f"{key}:gen"
@@ -0,0 +1,41 @@
+"""
+피드 검색 색인(curriculum_search_documents) 재구성 명령
+
+커리큘럼/작성자/레슨/태그 원본 테이블에서 검색 문서를 다시 만든다.
+기존 데이터는 마이그레이션이 색인하므로, 이벤트 누락으로 색인이 어긋났을 때 실행.
+
+사용법:
+    python -m app.modules.feed.interface.cli.rebuild_search_index [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.common.db.database import AsyncSessionLocal
+from app.modules.feed.infrastructure.repository.curriculum_search_repo import (
+    CurriculumSearchRepository,
+)
+
+
+async def rebuild_search_index(batch_size: int = 500) -> str:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        indexed = await CurriculumSearchRepository(session).rebuild(batch_size)
+    elapsed = time.perf_counter() - started
+    return f"curriculums={indexed} elapsed={elapsed:.2f}s"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="피드 검색 색인 재구성")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+    print(asyncio.run(rebuild_search_index(args.batch_size)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, Query, status
 from dependency_injector.wiring import inject, Provide
 
+from app.common.serialization.response import FastJSONResponse
 from app.core.auth import CurrentUser, get_current_user
 from app.core.di_container import Container
 from app.modules.feed.application.service.feed_service import FeedService
@@ -22,7 +23,7 @@ async def get_public_feed(
     tags: Optional[str] = Query(None, description="태그로 필터링 (쉼표로 구분)"),
     search: Optional[str] = Query(None, description="제목 또는 작성자로 검색"),
     feed_service: FeedService = Depends(Provide[Container.feed_service]),
-) -> FeedPageResponse:
+) -> FastJSONResponse:
     """공개 커리큘럼 피드 조회"""
 
     # 태그 파싱
@@ -39,7 +40,7 @@ async def get_public_feed(
     )
 
     feed_page = await feed_service.get_public_feed(query)
-    return FeedPageResponse.from_dto(feed_page)
+    return FastJSONResponse(FeedPageResponse.from_dto(feed_page))
 
 
 @feed_router.post("/refresh", status_code=status.HTTP_204_NO_CONTENT)
@@ -20,6 +20,13 @@ class FeedbackScore:
 
         self._value = value
 
+    @classmethod
+    def from_trusted(cls, value: float) -> "FeedbackScore":
+        """저장소 전용: 이미 검증되어 저장된 값으로 생성 (검증 생략)"""
+        obj = cls.__new__(cls)
+        obj._value = value
+        return obj
+
     @property
     def value(self) -> float:
         return self._value
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import String, Text, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.common.db.database import Base
 from typing import TYPE_CHECKING
@@ -19,6 +19,9 @@ class FeedbackModel(Base):
     score: Mapped[float] = mapped_column(Float, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # 인덱스 설정
+    __table_args__ = (Index("idx_feedback_summary", "summary_id"),)
     # 역방향 관계
     summary: Mapped["SummaryModel"] = relationship(
         "SummaryModel",
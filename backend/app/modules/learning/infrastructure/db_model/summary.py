@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.common.db.database import Base
 from typing import TYPE_CHECKING
@@ -23,6 +23,12 @@ class SummaryModel(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
+    # 인덱스 설정
+    __table_args__ = (
+        Index("idx_summary_curriculum_week", "curriculum_id", "week_number"),
+        Index("idx_summary_owner_created", "owner_id", "created_at"),
+    )
+
     # 역방향 관계
     curriculum: Mapped["CurriculumModel"] = relationship(
         "CurriculumModel",
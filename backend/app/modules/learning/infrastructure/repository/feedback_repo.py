@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Any, List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.db.hydration import hydrate
 from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
 from app.modules.learning.domain.repository.feedback_repo import IFeedbackRepository
 from app.modules.learning.domain.vo.feedback_comment import FeedbackComment
@@ -16,12 +17,13 @@ class FeedbackRepository(IFeedbackRepository):
         self.session: AsyncSession = session
 
     def _to_domain(self, feedback_model: FeedbackModel) -> FeedbackDomain:
-
-        return FeedbackDomain(
+        """DB Model -> Domain entity (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            FeedbackDomain,
             id=feedback_model.id,
             summary_id=feedback_model.summary_id,
-            comment=FeedbackComment(feedback_model.comment),
-            score=FeedbackScore(feedback_model.score),
+            comment=FeedbackComment.from_trusted(feedback_model.comment),
+            score=FeedbackScore.from_trusted(feedback_model.score),
             created_at=feedback_model.created_at,
             updated_at=feedback_model.updated_at,
         )
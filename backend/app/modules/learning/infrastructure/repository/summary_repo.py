@@ -3,6 +3,7 @@ from typing import List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, func, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.db.hydration import hydrate
 from app.modules.curriculum.domain.vo.week_number import WeekNumber
 
 from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
@@ -17,11 +18,13 @@ class SummaryRepository(ISummaryRepository):
         self.session: AsyncSession = session
 
     def _to_domain(self, summary_model: SummaryModel) -> SummaryDomain:
-        return SummaryDomain(
+        """DB Model -> Domain entity (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            SummaryDomain,
             id=summary_model.id,
             curriculum_id=summary_model.curriculum_id,
-            week_number=WeekNumber(summary_model.week_number),
-            content=SummaryContent(summary_model.content),
+            week_number=WeekNumber.from_trusted(summary_model.week_number),
+            content=SummaryContent.from_trusted(summary_model.content),
             owner_id=summary_model.owner_id,
             created_at=summary_model.created_at,
             updated_at=summary_model.updated_at,
@@ -2,6 +2,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from dependency_injector.wiring import inject, Provide
 
+from app.common.serialization.response import FastJSONResponse
 from app.core.auth import CurrentUser, get_current_user
 from app.core.di_container import Container
 from app.modules.learning.application.service.learning_stats_service import (
@@ -28,7 +29,7 @@ async def get_my_learning_stats(
     learning_stats_service: LearningStatsService = Depends(
         Provide[Container.learning_stats_service]
     ),
-) -> UserLearningStatsResponse:
+) -> FastJSONResponse:
     """내 학습 통계 조회"""
 
     query = UserLearningStatsQuery(
@@ -43,7 +44,7 @@ async def get_my_learning_stats(
         )
     )
 
-    return UserLearningStatsResponse.from_dto(stats_dto)
+    return FastJSONResponse(UserLearningStatsResponse.from_dto(stats_dto))
 
 
 @learning_stats_router.get("/overview", response_model=dict)
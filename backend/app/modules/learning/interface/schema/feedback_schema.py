@@ -90,7 +90,7 @@ class FeedbackBriefResponse(BaseModel):
         comment_snippet = (
             dto.comment[:80] + "..." if len(dto.comment) > 80 else dto.comment
         )
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             summary_id=dto.summary_id,
             comment_snippet=comment_snippet,
@@ -113,7 +113,7 @@ class FeedbackPageResponse(BaseModel):
     def from_dto(
         cls, dto: FeedbackPageDTO, average_score: Optional[float] = None
     ) -> "FeedbackPageResponse":
-        return cls(
+        return cls.model_construct(
             total_count=dto.total_count,
             page=dto.page,
             items_per_page=dto.items_per_page,
@@ -87,7 +87,7 @@ class SummaryBriefResponse(BaseModel):
     @classmethod
     def from_dto(cls, dto: SummaryDTO) -> "SummaryBriefResponse":
         snippet = dto.content[:150] + "..." if len(dto.content) > 150 else dto.content
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             curriculum_id=dto.curriculum_id,
             week_number=dto.week_number,
@@ -107,7 +107,7 @@ class SummaryPageResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: SummaryPageDTO) -> "SummaryPageResponse":
-        return cls(
+        return cls.model_construct(
             total_count=dto.total_count,
             page=dto.page,
             items_per_page=dto.items_per_page,
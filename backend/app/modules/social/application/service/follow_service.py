@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from ulid import ULID  # type: ignore
 
+from app.modules.feed.application.service.timeline_service import TimelineService
 from app.modules.social.application.dto.follow_dto import (
     CreateFollowCommand,
     UnfollowCommand,
@@ -16,12 +17,16 @@ from app.modules.social.application.exception import (
     NotFollowingError,
     SelfFollowError,
 )
+from app.modules.social.application.service.follow_suggestion_service import (
+    FollowSuggestionService,
+)
 from app.modules.social.domain.entity.follow import Follow
 from app.modules.social.domain.repository.follow_repo import IFollowRepository
 from app.modules.social.domain.service.follow_domain_service import FollowDomainService
 from app.modules.user.application.exception import UserNotFoundError
 from app.modules.user.domain.repository.user_repo import IUserRepository
 from app.modules.user.domain.entity.user import User
+from app.common.middleware.background import schedule_after_response
 from app.common.monitoring.metrics import increment_follow_creation
 
 
@@ -34,11 +39,15 @@ class FollowService:
         user_repo: IUserRepository,
         follow_domain_service: FollowDomainService,
         ulid: ULID = ULID(),
+        follow_suggestion_service: Optional[FollowSuggestionService] = None,
+        timeline_service: Optional[TimelineService] = None,
     ) -> None:
         self.follow_repo: IFollowRepository = follow_repo
         self.user_repo: IUserRepository = user_repo
         self.follow_domain_service: FollowDomainService = follow_domain_service
         self.ulid: ULID = ulid
+        self.follow_suggestion_service = follow_suggestion_service
+        self.timeline_service = timeline_service
 
     async def follow_user(self, command: CreateFollowCommand) -> FollowDTO:
         """사용자 팔로우"""
@@ -73,8 +82,6 @@ class FollowService:
 
             await self.follow_repo.save(follow)
             increment_follow_creation()
-            return FollowDTO.from_domain(follow)
-
         except ValueError as e:
             if "Already following" in str(e):
                 raise AlreadyFollowingError(str(e))
@@ -82,6 +89,19 @@ class FollowService:
                 raise UserNotFoundError(str(e))
             raise
 
+        if self.follow_suggestion_service:
+            # 추천 증감 반영은 응답 이후 (실패해도 다음 재계산에서 보정)
+            schedule_after_response(
+                self.follow_suggestion_service.on_follow(
+                    command.follower_id, command.followee_id
+                )
+            )
+        if self.timeline_service:
+            await self.timeline_service.on_follow(
+                command.follower_id, command.followee_id
+            )
+        return FollowDTO.from_domain(follow)
+
     async def unfollow_user(self, command: UnfollowCommand) -> None:
         """사용자 언팔로우"""
         # 팔로우 관계 존재 확인
@@ -94,6 +114,16 @@ class FollowService:
         await self.follow_repo.delete_by_follower_and_followee(
             command.follower_id, command.followee_id
         )
+        if self.follow_suggestion_service:
+            schedule_after_response(
+                self.follow_suggestion_service.on_unfollow(
+                    command.follower_id, command.followee_id
+                )
+            )
+        if self.timeline_service:
+            await self.timeline_service.on_unfollow(
+                command.follower_id, command.followee_id
+            )
 
     async def get_followers(
         self, query: FollowQuery, requester_id: str
@@ -103,19 +133,18 @@ class FollowService:
             query.user_id, query.page, query.items_per_page
         )
 
+        # 요청자와의 팔로우 관계를 페이지 단위로 한 번에 확인
+        relationships = await self.follow_domain_service.get_relationships(
+            requester_id, [follow.follower_id for follow in follows]
+        )
+
         user_infos = []
         for follow in follows:
             follower: User | None = await self.user_repo.find_by_id(follow.follower_id)
             if not follower:
                 continue
 
-            # 요청자와의 팔로우 관계 확인
-            is_following: bool = await self.follow_domain_service.is_following(
-                requester_id, follower.id
-            )
-            is_followed_by: bool = await self.follow_domain_service.is_following(
-                follower.id, requester_id
-            )
+            is_following, is_followed_by = relationships[follower.id]
 
             # 팔로우 통계
             stats = await self.follow_domain_service.get_follow_stats(follower.id)
@@ -143,19 +172,18 @@ class FollowService:
             query.user_id, query.page, query.items_per_page
         )
 
+        # 요청자와의 팔로우 관계를 페이지 단위로 한 번에 확인
+        relationships = await self.follow_domain_service.get_relationships(
+            requester_id, [follow.followee_id for follow in follows]
+        )
+
         user_infos = []
         for follow in follows:
             followee: User | None = await self.user_repo.find_by_id(follow.followee_id)
             if not followee:
                 continue
 
-            # 요청자와의 팔로우 관계 확인
-            is_following: bool = await self.follow_domain_service.is_following(
-                requester_id, followee.id
-            )
-            is_followed_by: bool = await self.follow_domain_service.is_following(
-                followee.id, requester_id
-            )
+            is_following, is_followed_by = relationships[followee.id]
 
             # 팔로우 통계
             stats = await self.follow_domain_service.get_follow_stats(followee.id)
@@ -182,12 +210,11 @@ class FollowService:
 
     async def check_follow_status(self, follower_id: str, followee_id: str) -> dict:
         """팔로우 상태 확인"""
-        is_following: bool = await self.follow_domain_service.is_following(
-            follower_id, followee_id
-        )
-        is_mutual: bool = await self.follow_domain_service.is_mutual_follow(
-            follower_id, followee_id
+        relationships = await self.follow_domain_service.get_relationships(
+            follower_id, [followee_id]
         )
+        is_following, is_followed_by = relationships[followee_id]
+        is_mutual: bool = is_following and is_followed_by
 
         return {
             "is_following": is_following,
@@ -197,10 +224,18 @@ class FollowService:
     async def get_follow_suggestions(
         self, user_id: str, limit: int = 10
     ) -> FollowSuggestionsDTO:
-        """팔로우 추천 목록 조회"""
-        suggested_user_ids: List[str] = await self.follow_repo.get_follow_suggestions(
-            user_id, limit
-        )
+        """팔로우 추천 목록 조회 (미리 계산된 추천 우선)"""
+        suggested_user_ids: List[str]
+        if self.follow_suggestion_service:
+            suggested_user_ids = (
+                await self.follow_suggestion_service.get_suggested_user_ids(
+                    user_id, limit
+                )
+            )
+        else:
+            suggested_user_ids = await self.follow_repo.get_follow_suggestions(
+                user_id, limit
+            )
 
         suggestions = []
         for suggested_id in suggested_user_ids:
@@ -0,0 +1,147 @@
+import logging
+from typing import Dict, List, Optional, Set
+
+from app.modules.social.domain.repository.follow_repo import IFollowRepository
+from app.modules.social.domain.repository.follow_suggestion_repo import (
+    IFollowSuggestionRepository,
+)
+from app.modules.taxonomy.domain.repository.curriculum_tag_repo import (
+    ICurriculumTagRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# 태그 유사도 가산점 상한, 공통 연결 1명(점수 1)보다 항상 작게 유지
+MAX_TAG_AFFINITY_WEIGHT = 0.99
+
+
+class FollowSuggestionService:
+    """
+    2차 연결(친구의 친구) 기반 팔로우 추천 계산/갱신.
+
+    점수 = 공통 연결 수 + tag_affinity_weight × 태그 자카드 유사도.
+    주기 작업(rebuild_follow_suggestions)이 활성 사용자 추천을 다시 계산하고,
+    팔로우/언팔로우는 공통 연결 수만 증감 반영한다.
+    """
+
+    def __init__(
+        self,
+        follow_repo: IFollowRepository,
+        follow_suggestion_repo: IFollowSuggestionRepository,
+        curriculum_tag_repo: Optional[ICurriculumTagRepository] = None,
+        tag_affinity_weight: float = 0.5,
+    ) -> None:
+        self.follow_repo = follow_repo
+        self.follow_suggestion_repo = follow_suggestion_repo
+        self.curriculum_tag_repo = curriculum_tag_repo
+        self.tag_affinity_weight = min(
+            max(tag_affinity_weight, 0.0), MAX_TAG_AFFINITY_WEIGHT
+        )
+
+    async def get_suggested_user_ids(self, user_id: str, limit: int) -> List[str]:
+        """
+        미리 계산된 추천 조회, 없으면 이 사용자만 계산해 저장 (활성 사용자로 편입).
+        저장하지 못하면 (Redis 미연결/장애) 매 요청 전체 점수 계산을 반복하지 않도록
+        DB 의 limit 조회로 대체한다.
+        """
+        suggested = await self.follow_suggestion_repo.get_suggestions(user_id, limit)
+        if suggested is not None:
+            return suggested
+
+        scores = (await self.compute_scores([user_id]))[user_id]
+        if not await self.follow_suggestion_repo.replace({user_id: scores}):
+            return await self.follow_repo.get_follow_suggestions(user_id, limit)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [candidate_id for candidate_id, _ in ranked[:limit]]
+
+    async def refresh(self, user_ids: List[str]) -> int:
+        """사용자들의 추천 전체 재계산, 저장한 사용자 수 반환"""
+        if not user_ids:
+            return 0
+        scores_by_user = await self.compute_scores(user_ids)
+        stored = await self.follow_suggestion_repo.replace(scores_by_user)
+        return len(scores_by_user) if stored else 0
+
+    async def compute_scores(self, user_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        """사용자별 후보 점수 (2차 연결 집계 1회 + 태그 조회 1회)"""
+        counts = await self.follow_repo.count_second_degree(user_ids)
+        if not self.tag_affinity_weight or self.curriculum_tag_repo is None:
+            return {
+                user_id: {cid: float(mutual) for cid, mutual in candidates.items()}
+                for user_id, candidates in counts.items()
+            }
+
+        owners = set(counts)
+        for candidates in counts.values():
+            owners.update(candidates)
+        tags = await self.curriculum_tag_repo.find_tag_ids_by_owners(sorted(owners))
+        return {
+            user_id: {
+                cid: mutual
+                + self.tag_affinity_weight
+                * _jaccard(tags.get(user_id, set()), tags.get(cid, set()))
+                for cid, mutual in candidates.items()
+            }
+            for user_id, candidates in counts.items()
+        }
+
+    async def on_follow(self, follower_id: str, followee_id: str) -> None:
+        """팔로우 저장 후 호출, 실패해도 요청은 성공시키고 다음 재계산에서 보정"""
+        try:
+            await self.follow_suggestion_repo.remove_candidate(follower_id, followee_id)
+            deltas = await self._path_deltas(follower_id, followee_id, 1.0)
+            await self.follow_suggestion_repo.apply_deltas(deltas)
+        except Exception as e:
+            logger.warning(f"Follow suggestion update failed on follow: {e}")
+
+    async def on_unfollow(self, follower_id: str, followee_id: str) -> None:
+        """언팔로우 삭제 후 호출, 해제한 사용자를 다시 후보로 되돌린다"""
+        try:
+            deltas = await self._path_deltas(follower_id, followee_id, -1.0)
+            followee_ids = await self.follow_repo.find_followee_ids(follower_id)
+            mutual = len(
+                await self.follow_repo.filter_following(followee_ids, followee_id)
+            )
+            if mutual:
+                deltas[follower_id][followee_id] = float(mutual)
+            await self.follow_suggestion_repo.apply_deltas(deltas)
+        except Exception as e:
+            logger.warning(f"Follow suggestion update failed on unfollow: {e}")
+
+    async def _path_deltas(
+        self, follower_id: str, followee_id: str, sign: float
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        follower → followee 간선 하나가 바꾸는 2차 연결 수.
+
+        - follower: followee 의 팔로위들 (이미 팔로우 중인 사람 제외)
+        - follower 의 팔로워들: followee (이미 팔로우 중인 사람 제외)
+        """
+        excluded = set(await self.follow_repo.find_followee_ids(follower_id))
+        excluded.update((follower_id, followee_id))
+        deltas: Dict[str, Dict[str, float]] = {
+            follower_id: {
+                candidate_id: sign
+                for candidate_id in await self.follow_repo.find_followee_ids(
+                    followee_id
+                )
+                if candidate_id not in excluded
+            }
+        }
+
+        followers = [
+            user_id
+            for user_id in await self.follow_repo.find_follower_ids(follower_id)
+            if user_id != followee_id
+        ]
+        already = await self.follow_repo.filter_following(followers, followee_id)
+        for user_id in followers:
+            if user_id not in already:
+                deltas[user_id] = {followee_id: sign}
+        return deltas
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.modules.social.domain.entity.follow import Follow
 
@@ -63,6 +63,13 @@ class IFollowRepository(metaclass=ABCMeta):
         """팔로우 관계 존재 여부 확인"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_relationships(
+        self, viewer_id: str, user_ids: List[str]
+    ) -> Dict[str, Tuple[bool, bool]]:
+        """user_ids 각각에 대한 (viewer 가 팔로우 중, viewer 를 팔로우 중) 여부"""
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_all_by_user(self, user_id: str) -> None:
         """특정 사용자와 관련된 모든 팔로우 관계 삭제 (계정 삭제시)"""
@@ -79,3 +86,41 @@ class IFollowRepository(metaclass=ABCMeta):
     async def get_follow_suggestions(self, user_id: str, limit: int = 10) -> List[str]:
         """팔로우 추천 사용자 목록 (팔로우하는 사람들의 팔로위 기반)"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_followee_ids(self, follower_id: str) -> List[str]:
+        """사용자가 팔로우하는 사람들의 ID 전체"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_follower_ids(self, followee_id: str) -> List[str]:
+        """사용자를 팔로우하는 사람들의 ID 전체"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def filter_following(
+        self, follower_ids: List[str], followee_id: str
+    ) -> Set[str]:
+        """follower_ids 중 followee_id 를 이미 팔로우하는 사용자 ID"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def filter_followees(
+        self, follower_id: str, followee_ids: List[str]
+    ) -> Set[str]:
+        """followee_ids 중 follower_id 가 팔로우하는 사용자 ID"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_user_ids_with_followees(
+        self, after_id: str = "", limit: int = 500
+    ) -> List[str]:
+        """팔로우하는 사람이 있는 사용자 ID (ID 순 키셋 페이지)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_second_degree(
+        self, user_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """사용자별 2차 연결 후보 → 공통 연결(팔로위 중 후보를 팔로우하는 사람) 수"""
+        raise NotImplementedError
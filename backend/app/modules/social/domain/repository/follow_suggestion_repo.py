@@ -0,0 +1,31 @@
+from abc import ABCMeta, abstractmethod
+from typing import Dict, List, Optional
+
+
+class IFollowSuggestionRepository(metaclass=ABCMeta):
+    """사용자별 미리 계산된 팔로우 추천 (후보 ID → 점수) 저장소"""
+
+    @abstractmethod
+    async def get_suggestions(self, user_id: str, limit: int) -> Optional[List[str]]:
+        """점수 내림차순 추천 ID, 계산된 적 없거나 저장소 장애면 None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace(self, scores_by_user: Dict[str, Dict[str, float]]) -> bool:
+        """사용자별 추천 전체 교체 (빈 후보도 '계산됨'으로 기록)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apply_deltas(self, deltas_by_user: Dict[str, Dict[str, float]]) -> None:
+        """계산된 사용자에게만 후보 점수 증감 반영 (점수 1 미만 후보는 제거)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_candidate(self, user_id: str, candidate_id: str) -> None:
+        """사용자의 추천에서 후보 제거 (팔로우 시작 등)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_computed_user_ids(self) -> List[str]:
+        """추천이 저장되어 있는(최근 조회된) 사용자 ID"""
+        raise NotImplementedError
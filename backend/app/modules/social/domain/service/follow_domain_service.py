@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.modules.social.domain.entity.follow import Follow
 from app.modules.social.domain.repository.follow_repo import IFollowRepository
@@ -89,6 +89,12 @@ class FollowDomainService:
 
     async def is_mutual_follow(self, user1_id: str, user2_id: str) -> bool:
         """서로 팔로우하고 있는지 확인"""
-        follow1 = await self.follow_repo.exists_follow(user1_id, user2_id)
-        follow2 = await self.follow_repo.exists_follow(user2_id, user1_id)
+        relationships = await self.get_relationships(user1_id, [user2_id])
+        follow1, follow2 = relationships[user2_id]
         return follow1 and follow2
+
+    async def get_relationships(
+        self, viewer_id: str, user_ids: List[str]
+    ) -> Dict[str, Tuple[bool, bool]]:
+        """여러 사용자에 대한 (viewer 가 팔로우, viewer 를 팔로우) 여부 일괄 확인"""
+        return await self.follow_repo.get_relationships(viewer_id, user_ids)
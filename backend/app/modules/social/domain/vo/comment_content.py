@@ -27,6 +27,13 @@ class CommentContent:
 
         self._value: str = cleaned
 
+    @classmethod
+    def from_trusted(cls, value: str) -> "CommentContent":
+        """저장소 전용: 이미 검증되어 저장된 값으로 생성 (검증 생략)"""
+        obj = cls.__new__(cls)
+        obj._value = value
+        return obj
+
     @property
     def value(self) -> str:
         return self._value
@@ -2,6 +2,7 @@ from typing import List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, func, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.db.hydration import hydrate
 from app.modules.social.domain.entity.bookmark import Bookmark
 from app.modules.social.domain.repository.bookmark_repo import IBookmarkRepository
 from app.modules.social.infrastructure.db_model.bookmark import BookmarkModel
@@ -12,8 +13,9 @@ class BookmarkRepository(IBookmarkRepository):
         self.session: AsyncSession = session
 
     def _to_domain(self, bookmark_model: BookmarkModel) -> Bookmark:
-        """DB Model → Domain Entity 변환"""
-        return Bookmark(
+        """DB Model → Domain Entity 변환 (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            Bookmark,
             id=bookmark_model.id,
             curriculum_id=bookmark_model.curriculum_id,
             user_id=bookmark_model.user_id,
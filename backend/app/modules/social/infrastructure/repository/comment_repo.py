@@ -2,6 +2,7 @@ from typing import List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, func, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.db.hydration import hydrate
 from app.modules.social.domain.entity.comment import Comment
 from app.modules.social.domain.repository.comment_repo import ICommentRepository
 from app.modules.social.domain.vo.comment_content import CommentContent
@@ -13,12 +14,13 @@ class CommentRepository(ICommentRepository):
         self.session: AsyncSession = session
 
     def _to_domain(self, comment_model: CommentModel) -> Comment:
-        """DB Model → Domain Entity 변환"""
-        return Comment(
+        """DB Model → Domain Entity 변환 (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            Comment,
             id=comment_model.id,
             curriculum_id=comment_model.curriculum_id,
             user_id=comment_model.user_id,
-            content=CommentContent(comment_model.content),
+            content=CommentContent.from_trusted(comment_model.content),
             created_at=comment_model.created_at,
             updated_at=comment_model.updated_at,
         )
@@ -1,19 +1,37 @@
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from sqlalchemy import Result, Select, func, select, delete, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.common.db.hydration import hydrate
 from app.modules.social.domain.entity.follow import Follow
 from app.modules.social.domain.repository.follow_repo import IFollowRepository
 from app.modules.social.infrastructure.db_model.follow import FollowModel
+from app.modules.social.infrastructure.repository.social_graph_cache import (
+    FOLLOWEES,
+    FOLLOWERS,
+    SocialGraphCache,
+)
 
 
 class FollowRepository(IFollowRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    """
+    팔로우 관계 저장소.
+
+    social_graph 가 주어지면 관계 확인(팔로우 여부, 맞팔로우, 공통 팔로워)을 Redis set 으로
+    처리한다. set 은 변경 시 함께 갱신하고, 없으면 조회 시점에 DB 에서 채운다.
+    """
+
+    def __init__(
+        self, session: AsyncSession, social_graph: Optional[SocialGraphCache] = None
+    ) -> None:
         self.session: AsyncSession = session
+        self.social_graph = social_graph
 
     def _to_domain(self, follow_model: FollowModel) -> Follow:
-        """DB Model → Domain Entity 변환"""
-        return Follow(
+        """DB Model → Domain Entity 변환 (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            Follow,
             id=follow_model.id,
             follower_id=follow_model.follower_id,
             followee_id=follow_model.followee_id,
@@ -34,6 +52,8 @@ class FollowRepository(IFollowRepository):
         except:
             await self.session.rollback()
             raise
+        if self.social_graph:
+            await self.social_graph.add_edge(follow.follower_id, follow.followee_id)
 
     async def find_by_id(self, follow_id: str) -> Optional[Follow]:
         """ID로 팔로우 관계 조회"""
@@ -124,6 +144,7 @@ class FollowRepository(IFollowRepository):
 
     async def delete(self, follow_id: str) -> None:
         """팔로우 관계 삭제"""
+        follow = await self.find_by_id(follow_id) if self.social_graph else None
         query = delete(FollowModel).where(FollowModel.id == follow_id)
         await self.session.execute(query)
         try:
@@ -131,6 +152,8 @@ class FollowRepository(IFollowRepository):
         except:
             await self.session.rollback()
             raise
+        if self.social_graph and follow:
+            await self.social_graph.remove_edge(follow.follower_id, follow.followee_id)
 
     async def delete_by_follower_and_followee(
         self, follower_id: str, followee_id: str
@@ -148,6 +171,8 @@ class FollowRepository(IFollowRepository):
         except:
             await self.session.rollback()
             raise
+        if self.social_graph:
+            await self.social_graph.remove_edge(follower_id, followee_id)
 
     async def count_followers(self, followee_id: str) -> int:
         """특정 사용자의 팔로워 수 조회"""
@@ -169,6 +194,16 @@ class FollowRepository(IFollowRepository):
 
     async def exists_follow(self, follower_id: str, followee_id: str) -> bool:
         """팔로우 관계 존재 여부 확인"""
+        if self.social_graph:
+            found = await self.social_graph.contains(
+                [(FOLLOWEES, follower_id, [followee_id])]
+            )
+            if found is not None:
+                members = found[0] or await self._warm(
+                    FOLLOWEES, follower_id, [followee_id]
+                )
+                if members is not None:
+                    return members[0]
         query: Select[Tuple[FollowModel]] = select(FollowModel).where(
             and_(
                 FollowModel.follower_id == follower_id,
@@ -180,6 +215,9 @@ class FollowRepository(IFollowRepository):
 
     async def delete_all_by_user(self, user_id: str) -> None:
         """특정 사용자와 관련된 모든 팔로우 관계 삭제 (계정 삭제시)"""
+        if self.social_graph:
+            follower_ids = await self.find_follower_ids(user_id)
+            followee_ids = await self.find_followee_ids(user_id)
         query = delete(FollowModel).where(
             or_(
                 FollowModel.follower_id == user_id,
@@ -192,11 +230,77 @@ class FollowRepository(IFollowRepository):
         except:
             await self.session.rollback()
             raise
+        if self.social_graph:
+            await self.social_graph.remove_user(user_id, follower_ids, followee_ids)
+
+    async def get_relationships(
+        self, viewer_id: str, user_ids: List[str]
+    ) -> Dict[str, Tuple[bool, bool]]:
+        """user_ids 각각에 대한 (viewer 가 팔로우 중, viewer 를 팔로우 중) 여부"""
+        if not user_ids:
+            return {}
+        following: Optional[List[bool]] = None
+        followed_by: Optional[List[bool]] = None
+        if self.social_graph:
+            # viewer 의 두 set 을 SMISMEMBER 로 한 번에 확인
+            found = await self.social_graph.contains(
+                [(FOLLOWEES, viewer_id, user_ids), (FOLLOWERS, viewer_id, user_ids)]
+            )
+            if found is not None:
+                following, followed_by = found
+                if following is None:
+                    following = await self._warm(FOLLOWEES, viewer_id, user_ids)
+                if followed_by is None:
+                    followed_by = await self._warm(FOLLOWERS, viewer_id, user_ids)
+
+        if following is None:
+            followees = await self.filter_followees(viewer_id, user_ids)
+            following = [user_id in followees for user_id in user_ids]
+        if followed_by is None:
+            followers = await self.filter_following(user_ids, viewer_id)
+            followed_by = [user_id in followers for user_id in user_ids]
+        return {
+            user_id: (is_following, is_followed_by)
+            for user_id, is_following, is_followed_by in zip(
+                user_ids, following, followed_by
+            )
+        }
+
+    async def _warm(
+        self, direction: str, user_id: str, member_ids: List[str]
+    ) -> Optional[List[bool]]:
+        """
+        DB 에서 set 을 채운 뒤 member_ids 포함 여부 반환.
+        set 크기 상한을 넘으면 채우지 않고 None (호출 측 IN 조회).
+        세대는 DB 조회 전에 읽어 그 사이의 팔로우 변경을 warm 이 알아채게 한다.
+        """
+        assert self.social_graph is not None
+        generation = await self.social_graph.generation(user_id)
+        limit = self.social_graph.max_set_size
+        if direction == FOLLOWEES:
+            column, owner = FollowModel.followee_id, FollowModel.follower_id
+        else:
+            column, owner = FollowModel.follower_id, FollowModel.followee_id
+        result = await self.session.scalars(
+            select(column).where(owner == user_id).limit(limit + 1)
+        )
+        ids = list(result.all())
+        if len(ids) > limit:
+            return None
+        await self.social_graph.warm(direction, user_id, ids, generation)
+        members = set(ids)
+        return [member_id in members for member_id in member_ids]
 
     async def get_mutual_followers(
         self, user1_id: str, user2_id: str, page: int = 1, items_per_page: int = 10
     ) -> Tuple[int, List[str]]:
         """두 사용자의 공통 팔로워 목록 조회"""
+        if self.social_graph:
+            common = await self._cached_mutual_followers(user1_id, user2_id)
+            if common is not None:
+                start = (page - 1) * items_per_page
+                return len(common), common[start : start + items_per_page]
+
         # user1의 팔로워들
         user1_followers = select(FollowModel.follower_id).where(  # noqa: F841
             FollowModel.followee_id == user1_id
@@ -233,6 +337,27 @@ class FollowRepository(IFollowRepository):
 
         return total_count, list(mutual_follower_ids)
 
+    async def _cached_mutual_followers(
+        self, user1_id: str, user2_id: str
+    ) -> Optional[List[str]]:
+        """SINTER 로 공통 팔로워 계산, warm 하지 않은 set 은 한 번 채운 뒤 재시도"""
+        assert self.social_graph is not None
+        user_ids = [user1_id, user2_id]
+        common = await self.social_graph.intersect(FOLLOWERS, user_ids)
+        if common is None:
+            found = await self.social_graph.contains(
+                [(FOLLOWERS, user_id, []) for user_id in user_ids]
+            )
+            if found is None:
+                return None
+            for user_id, members in zip(user_ids, found):
+                if members is None and await self._warm(FOLLOWERS, user_id, []) is None:
+                    return None
+            common = await self.social_graph.intersect(FOLLOWERS, user_ids)
+            if common is None:
+                return None
+        return sorted(common)
+
     async def get_follow_suggestions(self, user_id: str, limit: int = 10) -> List[str]:
         """팔로우 추천 사용자 목록 (팔로우하는 사람들의 팔로위 기반)"""
         # 현재 사용자가 팔로우하는 사람들
@@ -263,3 +388,96 @@ class FollowRepository(IFollowRepository):
         suggested_users = result.scalars().all()
 
         return list(suggested_users)
+
+    async def find_followee_ids(self, follower_id: str) -> List[str]:
+        """사용자가 팔로우하는 사람들의 ID 전체"""
+        result = await self.session.scalars(
+            select(FollowModel.followee_id).where(
+                FollowModel.follower_id == follower_id
+            )
+        )
+        return list(result.all())
+
+    async def find_follower_ids(self, followee_id: str) -> List[str]:
+        """사용자를 팔로우하는 사람들의 ID 전체"""
+        result = await self.session.scalars(
+            select(FollowModel.follower_id).where(
+                FollowModel.followee_id == followee_id
+            )
+        )
+        return list(result.all())
+
+    async def filter_following(
+        self, follower_ids: List[str], followee_id: str
+    ) -> Set[str]:
+        """follower_ids 중 followee_id 를 이미 팔로우하는 사용자 ID"""
+        if not follower_ids:
+            return set()
+        result = await self.session.scalars(
+            select(FollowModel.follower_id).where(
+                FollowModel.followee_id == followee_id,
+                FollowModel.follower_id.in_(follower_ids),
+            )
+        )
+        return set(result.all())
+
+    async def filter_followees(
+        self, follower_id: str, followee_ids: List[str]
+    ) -> Set[str]:
+        """followee_ids 중 follower_id 가 팔로우하는 사용자 ID"""
+        if not followee_ids:
+            return set()
+        result = await self.session.scalars(
+            select(FollowModel.followee_id).where(
+                FollowModel.follower_id == follower_id,
+                FollowModel.followee_id.in_(followee_ids),
+            )
+        )
+        return set(result.all())
+
+    async def find_user_ids_with_followees(
+        self, after_id: str = "", limit: int = 500
+    ) -> List[str]:
+        """팔로우하는 사람이 있는 사용자 ID (ID 순 키셋 페이지)"""
+        result = await self.session.scalars(
+            select(FollowModel.follower_id)
+            .where(FollowModel.follower_id > after_id)
+            .group_by(FollowModel.follower_id)
+            .order_by(FollowModel.follower_id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def count_second_degree(
+        self, user_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        사용자별 2차 연결 후보 → 공통 연결 수.
+
+        user → 팔로위(first) → 팔로위(second) 경로를 사용자 묶음 단위로 한 번에 집계하고,
+        자기 자신과 이미 팔로우 중인 사람은 제외한다.
+        """
+        if not user_ids:
+            return {}
+        first = aliased(FollowModel)
+        second = aliased(FollowModel)
+        already = aliased(FollowModel)
+        query = (
+            select(first.follower_id, second.followee_id, func.count())
+            .join(second, second.follower_id == first.followee_id)
+            .where(
+                first.follower_id.in_(user_ids),
+                second.followee_id != first.follower_id,
+                ~select(already.id)
+                .where(
+                    already.follower_id == first.follower_id,
+                    already.followee_id == second.followee_id,
+                )
+                .exists(),
+            )
+            .group_by(first.follower_id, second.followee_id)
+        )
+        counts: Dict[str, Dict[str, int]] = {user_id: {} for user_id in user_ids}
+        for user_id, candidate_id, mutual in await self.session.execute(query):
+            counts[user_id][candidate_id] = mutual
+        return counts
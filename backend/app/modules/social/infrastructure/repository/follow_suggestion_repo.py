@@ -0,0 +1,115 @@
+import logging
+from typing import Dict, List, Optional
+
+from app.common.cache.redis_client import RedisClient
+from app.modules.social.domain.repository.follow_suggestion_repo import (
+    IFollowSuggestionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FollowSuggestionRepository(IFollowSuggestionRepository):
+    """
+    Redis sorted set 기반 팔로우 추천.
+
+    - follow:suggest:{user_id} (zset) 후보 ID → 공통 연결 수 + 태그 유사도 가산점(< 1)
+      * 센티널 멤버("")를 +inf 점수로 두어 후보가 없어도 '계산됨'을 표시
+      * 점수 1 미만 후보(공통 연결 없음)는 증감 반영 시 제거
+      * 상위 size 개만 유지, TTL 은 조회 때마다 연장 → 키가 있는 사용자 = 활성 사용자
+
+    Redis 장애 시 조회는 None 을 반환해 호출 측이 DB 로 대체할 수 있게 한다.
+    """
+
+    KEY_PREFIX = "follow:suggest"
+    SENTINEL = ""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        size: int = 50,
+        ttl: int = 7 * 24 * 60 * 60,
+    ) -> None:
+        self.redis_client = redis_client
+        self.size = size
+        self.ttl = ttl
+
+    async def get_suggestions(self, user_id: str, limit: int) -> Optional[List[str]]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        key = self._key(user_id)
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.zrevrangebyscore(key, "(inf", 1, start=0, num=limit)
+            pipe.expire(key, self.ttl)
+            ranked, computed = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Follow suggestion read failed: {e}")
+            return None
+        return list(ranked) if computed else None
+
+    async def replace(self, scores_by_user: Dict[str, Dict[str, float]]) -> bool:
+        redis = self.redis_client.redis
+        if redis is None or not scores_by_user:
+            return False
+        try:
+            pipe = redis.pipeline(transaction=True)
+            for user_id, scores in scores_by_user.items():
+                top = sorted(scores.items(), key=lambda item: -item[1])[: self.size]
+                key = self._key(user_id)
+                pipe.delete(key)
+                pipe.zadd(key, {self.SENTINEL: float("inf"), **dict(top)})
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Follow suggestion write failed: {e}")
+            return False
+        return True
+
+    async def apply_deltas(self, deltas_by_user: Dict[str, Dict[str, float]]) -> None:
+        redis = self.redis_client.redis
+        user_ids = [user_id for user_id, deltas in deltas_by_user.items() if deltas]
+        if redis is None or not user_ids:
+            return
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipe.exists(self._key(user_id))
+            computed = await pipe.execute()
+
+            # 계산된 적 없는 사용자에게 부분 집합을 만들지 않는다
+            pipe = redis.pipeline(transaction=True)
+            for user_id, exists in zip(user_ids, computed):
+                if not exists:
+                    continue
+                key = self._key(user_id)
+                for candidate_id, delta in deltas_by_user[user_id].items():
+                    pipe.zincrby(key, delta, candidate_id)
+                pipe.zremrangebyscore(key, "-inf", "(1")
+                pipe.zremrangebyrank(key, 0, -(self.size + 2))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Follow suggestion update failed: {e}")
+
+    async def remove_candidate(self, user_id: str, candidate_id: str) -> None:
+        redis = self.redis_client.redis
+        if redis is None:
+            return
+        try:
+            await redis.zrem(self._key(user_id), candidate_id)
+        except Exception as e:
+            logger.warning(f"Follow suggestion update failed: {e}")
+
+    async def find_computed_user_ids(self) -> List[str]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return []
+        prefix = f"{self.KEY_PREFIX}:"
+        return [
+            key[len(prefix) :]
+            async for key in redis.scan_iter(match=f"{prefix}*", count=1000)
+        ]
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
@@ -2,6 +2,7 @@ from typing import List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, func, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.db.hydration import hydrate
 from app.modules.social.domain.entity.like import Like
 from app.modules.social.domain.repository.like_repo import ILikeRepository
 from app.modules.social.infrastructure.db_model.like import LikeModel
@@ -12,8 +13,9 @@ class LikeRepository(ILikeRepository):
         self.session: AsyncSession = session
 
     def _to_domain(self, like_model: LikeModel) -> Like:
-        """DB Model → Domain Entity 변환"""
-        return Like(
+        """DB Model → Domain Entity 변환 (저장된 값은 검증 없이 복원)"""
+        return hydrate(
+            Like,
             id=like_model.id,
             curriculum_id=like_model.curriculum_id,
             user_id=like_model.user_id,
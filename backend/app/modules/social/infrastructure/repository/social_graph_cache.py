@@ -0,0 +1,200 @@
+import logging
+from typing import List, Optional, Sequence, Set, Tuple
+
+from redis.exceptions import WatchError
+
+from app.common.cache.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+FOLLOWERS = "followers"
+FOLLOWEES = "followees"
+
+
+class SocialGraphCache:
+    """
+    Redis set 기반 팔로우 그래프 캐시 (FollowRepository 내부용).
+
+    - graph:followers:{user_id} (set) 나를 팔로우하는 사용자 ID
+    - graph:followees:{user_id} (set) 내가 팔로우하는 사용자 ID
+    - graph:gen:{user_id}       (int) 사용자의 팔로우 관계가 바뀔 때마다 증가
+
+    센티널 멤버("")가 있는 set 만 완전한(warm) 것으로 본다. 쓰기는 키 유무와 관계없이
+    SADD/SREM 하고, 센티널 없는 부분 set 은 다음 조회 때 DB 에서 다시 채워진다.
+    warm 은 DB 조회 전에 읽은 세대가 그대로일 때만 set 을 채운다 (WATCH) — 그 사이
+    팔로우/언팔로우가 있었다면 읽은 목록이 오래되었으므로 센티널을 붙이지 않는다.
+    조회 결과 None 은 Redis 미연결/장애 또는 비활성 → 호출 측 DB 대체.
+    """
+
+    KEY_PREFIX = "graph"
+    GENERATION = "gen"
+    WARM = ""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        ttl: int = 24 * 60 * 60,
+        max_set_size: int = 10000,
+        enabled: bool = True,
+    ) -> None:
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.max_set_size = max_set_size
+        self.enabled = enabled
+
+    # ========================= 조회 =========================
+
+    async def contains(
+        self, checks: Sequence[Tuple[str, str, List[str]]]
+    ) -> Optional[List[Optional[List[bool]]]]:
+        """
+        (방향, 사용자 ID, 후보 ID 목록) 마다 SMISMEMBER 결과를 한 번의 왕복으로 조회.
+        warm 하지 않은 set 의 결과는 None.
+        """
+        redis = self._redis()
+        if redis is None:
+            return None
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for direction, user_id, member_ids in checks:
+                key = self._key(direction, user_id)
+                pipe.smismember(key, [self.WARM, *member_ids])
+                pipe.expire(key, self.ttl)
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Social graph read failed: {e}")
+            return None
+
+        flags: List[Optional[List[bool]]] = []
+        for found in results[::2]:
+            warm, *members = found
+            flags.append([bool(m) for m in members] if warm else None)
+        return flags
+
+    async def intersect(
+        self, direction: str, user_ids: List[str]
+    ) -> Optional[Set[str]]:
+        """여러 사용자의 같은 방향 set 교집합 (SINTER), 하나라도 warm 하지 않으면 None"""
+        redis = self._redis()
+        if redis is None:
+            return None
+        keys = [self._key(direction, user_id) for user_id in user_ids]
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.sismember(key, self.WARM)
+            pipe.sinter(keys)
+            *warm, common = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Social graph read failed: {e}")
+            return None
+        if not all(warm):
+            return None
+        return set(common) - {self.WARM}
+
+    async def generation(self, user_id: str) -> Optional[str]:
+        """warm 에 넘길 사용자의 현재 세대 (DB 조회 전에 읽는다)"""
+        redis = self._redis()
+        if redis is None:
+            return None
+        try:
+            return await redis.get(self._generation_key(user_id))
+        except Exception as e:
+            logger.warning(f"Social graph read failed: {e}")
+            return None
+
+    # ========================= 쓰기 =========================
+
+    async def warm(
+        self,
+        direction: str,
+        user_id: str,
+        member_ids: List[str],
+        generation: Optional[str],
+    ) -> None:
+        """
+        DB 에서 읽은 전체 목록으로 set 교체 (max_set_size 초과 시 캐시하지 않음).
+        generation 이 현재 세대와 다르거나 교체 중에 바뀌면 채우지 않는다.
+        """
+        redis = self._redis()
+        if redis is None or len(member_ids) > self.max_set_size:
+            return
+        key = self._key(direction, user_id)
+        generation_key = self._generation_key(user_id)
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(generation_key)
+                if await pipe.get(generation_key) != generation:
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                pipe.sadd(key, self.WARM, *member_ids)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except WatchError:
+            return
+        except Exception as e:
+            logger.warning(f"Social graph warm failed: {e}")
+
+    async def add_edge(self, follower_id: str, followee_id: str) -> None:
+        await self._write_edge(follower_id, followee_id, add=True)
+
+    async def remove_edge(self, follower_id: str, followee_id: str) -> None:
+        await self._write_edge(follower_id, followee_id, add=False)
+
+    async def remove_user(
+        self, user_id: str, follower_ids: List[str], followee_ids: List[str]
+    ) -> None:
+        """계정 삭제: 자신의 set 삭제 + 상대방 set 에서 자신 제거"""
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.delete(self._key(FOLLOWERS, user_id), self._key(FOLLOWEES, user_id))
+            for follower_id in follower_ids:
+                pipe.srem(self._key(FOLLOWEES, follower_id), user_id)
+            for followee_id in followee_ids:
+                pipe.srem(self._key(FOLLOWERS, followee_id), user_id)
+            for changed_id in {user_id, *follower_ids, *followee_ids}:
+                self._bump_generation(pipe, changed_id)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Social graph write failed: {e}")
+
+    # ========================= 내부 =========================
+
+    async def _write_edge(self, follower_id: str, followee_id: str, add: bool) -> None:
+        redis = self._redis()
+        if redis is None:
+            return
+        edges = (
+            (self._key(FOLLOWEES, follower_id), followee_id),
+            (self._key(FOLLOWERS, followee_id), follower_id),
+        )
+        try:
+            pipe = redis.pipeline(transaction=True)
+            for key, member in edges:
+                if add:
+                    pipe.sadd(key, member)
+                    pipe.expire(key, self.ttl)
+                else:
+                    pipe.srem(key, member)
+            self._bump_generation(pipe, follower_id)
+            self._bump_generation(pipe, followee_id)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Social graph write failed: {e}")
+
+    def _bump_generation(self, pipe, user_id: str) -> None:
+        pipe.incr(self._generation_key(user_id))
+        pipe.expire(self._generation_key(user_id), self.ttl)
+
+    def _redis(self):
+        return self.redis_client.redis if self.enabled else None
+
+    def _key(self, direction: str, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{direction}:{user_id}"
+
+    def _generation_key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.GENERATION}:{user_id}"
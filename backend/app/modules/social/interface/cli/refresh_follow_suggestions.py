@@ -0,0 +1,87 @@
+"""
+팔로우 추천(Redis follow:suggest:*) 주기 재계산 명령
+
+기본은 추천 키가 남아 있는(TTL 내에 조회한) 활성 사용자만 다시 계산해
+팔로우/언팔로우 증감 반영으로는 바뀌지 않는 태그 유사도와 누락분을 보정한다.
+--all 은 팔로우하는 사람이 있는 모든 사용자를 계산한다 (최초 적재/Redis 초기화 후).
+cron 등으로 주기 실행한다.
+
+사용법:
+    python -m app.modules.social.interface.cli.refresh_follow_suggestions [--all]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+from app.common.cache.redis_client import redis_client
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.common.db.database import AsyncSessionLocal
+from app.core.config import get_settings
+from app.modules.social.application.service.follow_suggestion_service import (
+    FollowSuggestionService,
+)
+from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.social.infrastructure.repository.follow_suggestion_repo import (
+    FollowSuggestionRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
+    CurriculumTagRepository,
+)
+
+
+async def refresh_follow_suggestions(
+    all_users: bool = False, batch_size: int = 200
+) -> str:
+    settings = get_settings()
+    suggestion_repo = FollowSuggestionRepository(
+        redis_client,
+        size=settings.follow_suggestion_size,
+        ttl=settings.follow_suggestion_ttl,
+    )
+    started = time.perf_counter()
+    refreshed = 0
+
+    await redis_client.connect()
+    try:
+        async with AsyncSessionLocal() as session:
+            follow_repo = FollowRepository(session)
+            service = FollowSuggestionService(
+                follow_repo=follow_repo,
+                follow_suggestion_repo=suggestion_repo,
+                curriculum_tag_repo=CurriculumTagRepository(session),
+                tag_affinity_weight=settings.follow_suggestion_tag_weight,
+            )
+            if all_users:
+                last_id = ""
+                while user_ids := await follow_repo.find_user_ids_with_followees(
+                    last_id, batch_size
+                ):
+                    refreshed += await service.refresh(user_ids)
+                    last_id = user_ids[-1]
+            else:
+                active = sorted(await suggestion_repo.find_computed_user_ids())
+                for i in range(0, len(active), batch_size):
+                    refreshed += await service.refresh(active[i : i + batch_size])
+    finally:
+        await redis_client.disconnect()
+
+    elapsed = time.perf_counter() - started
+    return f"users={refreshed} elapsed={elapsed:.2f}s"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="팔로우 추천 재계산")
+    parser.add_argument(
+        "--all", action="store_true", help="팔로우하는 사람이 있는 모든 사용자 계산"
+    )
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args(argv)
+    print(asyncio.run(refresh_follow_suggestions(args.all, args.batch_size)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
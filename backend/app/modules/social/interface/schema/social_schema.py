@@ -42,7 +42,7 @@ class LikeResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: LikeDTO) -> "LikeResponse":
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             curriculum_id=dto.curriculum_id,
             user_id=dto.user_id,
@@ -60,7 +60,7 @@ class LikePageResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: LikePageDTO) -> "LikePageResponse":
-        return cls(
+        return cls.model_construct(
             total_count=dto.total_count,
             page=dto.page,
             items_per_page=dto.items_per_page,
@@ -134,7 +134,7 @@ class CommentBriefResponse(BaseModel):
     @classmethod
     def from_dto(cls, dto: CommentDTO) -> "CommentBriefResponse":
         snippet = dto.content[:100] + "..." if len(dto.content) > 100 else dto.content
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             curriculum_id=dto.curriculum_id,
             user_id=dto.user_id,
@@ -154,7 +154,7 @@ class CommentPageResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: CommentPageDTO) -> "CommentPageResponse":
-        return cls(
+        return cls.model_construct(
             total_count=dto.total_count,
             page=dto.page,
             items_per_page=dto.items_per_page,
@@ -190,7 +190,7 @@ class BookmarkResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: BookmarkDTO) -> "BookmarkResponse":
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             curriculum_id=dto.curriculum_id,
             user_id=dto.user_id,
@@ -208,7 +208,7 @@ class BookmarkPageResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: BookmarkPageDTO) -> "BookmarkPageResponse":
-        return cls(
+        return cls.model_construct(
             total_count=dto.total_count,
             page=dto.page,
             items_per_page=dto.items_per_page,
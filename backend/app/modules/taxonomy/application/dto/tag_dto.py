@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from app.modules.taxonomy.domain.entity.tag import Tag
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
 from app.modules.taxonomy.domain.entity.category import Category
 
 
@@ -60,6 +61,27 @@ class TagDTO:
         )
 
 
+@dataclass
+class TagSuggestionDTO:
+    """태그 자동완성 후보 전송 객체"""
+
+    id: str
+    name: str
+    usage_count: int
+    is_popular: bool
+
+    @classmethod
+    def from_domain(
+        cls, suggestion: TagSuggestion, popular_threshold: int = 10
+    ) -> "TagSuggestionDTO":
+        return cls(
+            id=suggestion.id,
+            name=suggestion.name,
+            usage_count=suggestion.usage_count,
+            is_popular=suggestion.is_popular(popular_threshold),
+        )
+
+
 @dataclass
 class TagPageDTO:
     """태그 목록 페이지 전송 객체"""
@@ -1,8 +1,11 @@
-from typing import List
+from typing import List, Optional
 from ulid import ULID  # type: ignore
 
 from app.modules.curriculum.application.exception import CurriculumNotFoundError
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.feed.application.service.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.taxonomy.application.dto.tag_dto import (
     AddTagsToCurriculumCommand,
     RemoveTagFromCurriculumCommand,
@@ -19,11 +22,15 @@ from app.modules.taxonomy.application.exception import (
 )
 from app.modules.taxonomy.domain.entity.category import Category
 from app.modules.taxonomy.domain.entity.tag import Tag
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
 from app.modules.taxonomy.domain.service.tag_domain_service import TagDomainService
 from app.modules.taxonomy.domain.repository.curriculum_tag_repo import (
     ICurriculumTagRepository,
     ICurriculumCategoryRepository,
 )
+from app.modules.taxonomy.domain.repository.tag_autocomplete_repo import (
+    ITagAutocompleteRepository,
+)
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
 )
@@ -43,7 +50,9 @@ class CurriculumTagService:
         curriculum_tag_repo: ICurriculumTagRepository,
         curriculum_category_repo: ICurriculumCategoryRepository,
         curriculum_repo: ICurriculumRepository,
+        tag_autocomplete_repo: ITagAutocompleteRepository,
         ulid: ULID = ULID(),
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
     ) -> None:
         self.tag_domain_service: TagDomainService = tag_domain_service
         self.curriculum_tag_repo: ICurriculumTagRepository = curriculum_tag_repo
@@ -51,7 +60,9 @@ class CurriculumTagService:
             curriculum_category_repo
         )
         self.curriculum_repo: ICurriculumRepository = curriculum_repo
+        self.tag_autocomplete_repo: ITagAutocompleteRepository = tag_autocomplete_repo
         self.ulid: ULID = ulid
+        self.feed_event_handler = feed_event_handler
 
     async def add_tags_to_curriculum(
         self,
@@ -86,6 +97,11 @@ class CurriculumTagService:
             tag_names=command.tag_names,
             user_id=command.user_id,
         )
+        await self.tag_autocomplete_repo.upsert(
+            [TagSuggestion.from_tag(tag) for tag in added_tags], usage_delta=1
+        )
+        if added_tags and self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_updated(command.curriculum_id)
         for _ in added_tags:
             increment_curriculum_tag_assignment()
         return [TagDTO.from_domain(tag) for tag in added_tags]
@@ -114,10 +130,15 @@ class CurriculumTagService:
                 "You can only remove tags from your own curriculum"
             )
 
-        await self.tag_domain_service.remove_tag_from_curriculum(
+        removed_tag: Tag = await self.tag_domain_service.remove_tag_from_curriculum(
             curriculum_id=command.curriculum_id,
             tag_name=command.tag_name,
         )
+        await self.tag_autocomplete_repo.upsert(
+            [TagSuggestion.from_tag(removed_tag)], usage_delta=-1
+        )
+        if self.feed_event_handler:
+            await self.feed_event_handler.on_curriculum_updated(command.curriculum_id)
 
     async def assign_category_to_curriculum(
         self,
@@ -8,6 +8,7 @@ from app.modules.taxonomy.application.dto.tag_dto import (
     UpdateTagCommand,
     TagQuery,
     TagDTO,
+    TagSuggestionDTO,
     TagPageDTO,
     TagStatisticsDTO,
 )
@@ -19,6 +20,13 @@ from app.modules.taxonomy.application.exception import (
     TagInUseError,
 )
 from app.modules.taxonomy.domain.entity.tag import Tag
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+from app.modules.taxonomy.domain.repository.tag_autocomplete_repo import (
+    ITagAutocompleteRepository,
+)
+from app.modules.taxonomy.domain.repository.tag_ranking_repo import (
+    ITagRankingRepository,
+)
 from app.modules.taxonomy.domain.repository.tag_repo import ITagRepository
 from app.modules.taxonomy.domain.service.tag_domain_service import TagDomainService
 from app.modules.taxonomy.domain.vo.tag_name import TagName
@@ -33,10 +41,14 @@ class TagService:
         self,
         tag_repo: ITagRepository,
         tag_domain_service: TagDomainService,
+        tag_autocomplete_repo: ITagAutocompleteRepository,
+        tag_ranking_repo: ITagRankingRepository,
         ulid: ULID = ULID(),
     ) -> None:
         self.tag_repo: ITagRepository = tag_repo
         self.tag_domain_service: TagDomainService = tag_domain_service
+        self.tag_autocomplete_repo: ITagAutocompleteRepository = tag_autocomplete_repo
+        self.tag_ranking_repo: ITagRankingRepository = tag_ranking_repo
         self.ulid: ULID = ulid
 
     async def create_tag(
@@ -55,6 +67,7 @@ class TagService:
             )
 
             await self.tag_repo.save(tag)
+            await self.tag_autocomplete_repo.upsert([TagSuggestion.from_tag(tag)])
             increment_tag_creation()
             return TagDTO.from_domain(tag)
 
@@ -98,25 +111,44 @@ class TagService:
         self,
         limit: int = 20,
         min_usage: int = 1,
-    ) -> List[TagDTO]:
-        """인기 태그 목록 조회"""
-        tags: List[Tag] = await self.tag_repo.find_popular_tags(
-            limit=limit,
-            min_usage=min_usage,
+    ) -> List[TagSuggestionDTO]:
+        """인기 태그 목록 조회 (Redis 랭킹, 미적재/장애 시 DB)"""
+        suggestions: Optional[List[TagSuggestion]] = (
+            await self.tag_ranking_repo.find_popular(limit=limit, min_usage=min_usage)
+        )
+        if suggestions is None:
+            tags: List[Tag] = await self.tag_repo.find_popular_tags(
+                limit=limit,
+                min_usage=min_usage,
+            )
+            suggestions = [TagSuggestion.from_tag(tag) for tag in tags]
+        return [TagSuggestionDTO.from_domain(s) for s in suggestions]
+
+    async def get_trending_tags(self, limit: int = 20) -> List[TagSuggestionDTO]:
+        """최근 일주일 트렌딩 태그 조회 (랭킹 미적재/장애 시 인기 태그로 대체)"""
+        suggestions: Optional[List[TagSuggestion]] = (
+            await self.tag_ranking_repo.find_trending(limit=limit)
         )
-        return [TagDTO.from_domain(tag) for tag in tags]
+        if suggestions is None:
+            return await self.get_popular_tags(limit=limit)
+        return [TagSuggestionDTO.from_domain(s) for s in suggestions]
 
     async def search_tags(
         self,
         query: str,
         limit: int = 10,
-    ) -> List[TagDTO]:
-        """태그 검색 (자동완성용)"""
+    ) -> List[TagSuggestionDTO]:
+        """태그 검색 (자동완성용, 워커 로컬 접두사 인덱스 사용)"""
         if not query.strip():
             return []
 
-        tags: List[Tag] = await self.tag_repo.search_by_name(query.strip(), limit)
-        return [TagDTO.from_domain(tag) for tag in tags]
+        if not self.tag_autocomplete_repo.is_ready:
+            await self.tag_autocomplete_repo.warm(self.tag_repo.find_all_suggestions)
+
+        suggestions: List[TagSuggestion] = self.tag_autocomplete_repo.search(
+            query, limit
+        )
+        return [TagSuggestionDTO.from_domain(s) for s in suggestions]
 
     async def get_tags(
         self,
@@ -182,6 +214,7 @@ class TagService:
                 raise InvalidTagNameError(str(e))
 
         await self.tag_repo.update(tag)
+        await self.tag_autocomplete_repo.upsert([TagSuggestion.from_tag(tag)])
         return TagDTO.from_domain(tag)
 
     async def delete_tag(
@@ -204,14 +237,17 @@ class TagService:
             raise TagInUseError("Cannot delete tag that is currently in use")
 
         await self.tag_repo.delete(tag_id)
+        await self.tag_autocomplete_repo.remove(tag_id)
 
     async def increment_tag_usage(self, tag_id: str) -> None:
         """태그 사용 횟수 증가"""
         await self.tag_repo.increment_usage_count(tag_id)
+        await self.tag_autocomplete_repo.adjust_usage(tag_id, 1)
 
     async def decrement_tag_usage(self, tag_id: str) -> None:
         """태그 사용 횟수 감소"""
         await self.tag_repo.decrement_usage_count(tag_id)
+        await self.tag_autocomplete_repo.adjust_usage(tag_id, -1)
 
     async def find_or_create_tags_by_names(
         self,
@@ -225,6 +261,9 @@ class TagService:
                     tag_names, created_by
                 )
             )
+            await self.tag_autocomplete_repo.upsert(
+                [TagSuggestion.from_tag(tag) for tag in tags]
+            )
             return [TagDTO.from_domain(tag) for tag in tags]
 
         except ValueError as e:
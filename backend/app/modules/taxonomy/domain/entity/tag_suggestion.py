@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from app.modules.taxonomy.domain.entity.tag import Tag
+
+
+@dataclass(frozen=True)
+class TagSuggestion:
+    """태그 자동완성 후보 (읽기 모델)"""
+
+    id: str
+    name: str
+    usage_count: int
+
+    @classmethod
+    def from_tag(cls, tag: Tag) -> "TagSuggestion":
+        return cls(id=tag.id, name=tag.name.value, usage_count=tag.usage_count)
+
+    def is_popular(self, threshold: int = 10) -> bool:
+        """인기 태그 여부 확인"""
+        return self.usage_count >= threshold
@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Tuple
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.modules.taxonomy.domain.entity.curriculum_tag import (
     CurriculumTag,
@@ -7,6 +8,7 @@ from app.modules.taxonomy.domain.entity.curriculum_tag import (
 )
 from app.modules.taxonomy.domain.entity.tag import Tag
 from app.modules.taxonomy.domain.entity.category import Category
+from app.modules.taxonomy.domain.vo.tag_name import TagName
 
 
 class ICurriculumTagRepository(metaclass=ABCMeta):
@@ -15,6 +17,13 @@ class ICurriculumTagRepository(metaclass=ABCMeta):
         """커리큘럼-태그 연결 저장"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_tags_by_names(
+        self, curriculum_id: str, tag_names: List[TagName], added_by: str
+    ) -> List[Tag]:
+        """커리큘럼에 태그들 일괄 연결 (없는 태그는 생성, 새로 연결된 태그 반환)"""
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_id(self, curriculum_tag_id: str) -> Optional[CurriculumTag]:
         """ID로 커리큘럼-태그 연결 조회"""
@@ -85,6 +94,18 @@ class ICurriculumTagRepository(metaclass=ABCMeta):
         """특정 태그를 사용하는 커리큘럼 수"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def count_tag_additions_by_day(
+        self, since: datetime
+    ) -> List[Tuple[str, date, int]]:
+        """since 이후 태그별/일별 연결 추가 수 (태그 ID, 날짜, 수)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_tag_ids_by_owners(self, user_ids: List[str]) -> Dict[str, Set[str]]:
+        """사용자별 소유 커리큘럼에 달린 태그 ID 집합"""
+        raise NotImplementedError
+
     @abstractmethod
     async def exists_by_curriculum_and_tag(
         self, curriculum_id: str, tag_id: str
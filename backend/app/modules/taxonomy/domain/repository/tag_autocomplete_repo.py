@@ -0,0 +1,39 @@
+from abc import ABCMeta, abstractmethod
+from typing import Awaitable, Callable, List
+
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+
+
+class ITagAutocompleteRepository(metaclass=ABCMeta):
+    @property
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """자동완성 인덱스 적재 여부"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def warm(self, loader: Callable[[], Awaitable[List[TagSuggestion]]]) -> None:
+        """인덱스 적재 (공유 저장소가 비어 있으면 loader 로 원본 조회)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 10) -> List[TagSuggestion]:
+        """접두사(초성/자모 포함)로 자동완성 후보 조회 (사용횟수 내림차순)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert(
+        self, suggestions: List[TagSuggestion], usage_delta: int = 0
+    ) -> None:
+        """태그 생성/이름 변경/사용횟수 변경 반영 (usage_delta: 이번 변경의 증감)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adjust_usage(self, tag_id: str, delta: int) -> None:
+        """태그 사용횟수 증감 반영"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, tag_id: str) -> None:
+        """태그 삭제 반영"""
+        raise NotImplementedError
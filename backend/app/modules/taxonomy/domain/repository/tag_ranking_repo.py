@@ -0,0 +1,63 @@
+from abc import ABCMeta, abstractmethod
+from datetime import date
+from typing import List, Optional, Tuple
+
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+
+
+class ITagRankingRepository(metaclass=ABCMeta):
+    """워커 간 공유되는 태그 랭킹 (사용횟수/트렌딩) 저장소"""
+
+    @abstractmethod
+    async def upsert(
+        self, suggestions: List[TagSuggestion], usage_delta: int = 0
+    ) -> Optional[int]:
+        """이름/사용횟수 반영 (usage_delta 는 트렌딩 집계에 반영), 새 버전 반환"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adjust_usage(self, tag_id: str, delta: int) -> Optional[int]:
+        """사용횟수 증감 반영, 새 버전 반환"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, tag_id: str) -> Optional[int]:
+        """태그 삭제 반영, 새 버전 반환"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_version(self) -> Optional[int]:
+        """현재 랭킹 버전 (미적재/장애 시 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def snapshot(self) -> Optional[Tuple[int, List[TagSuggestion]]]:
+        """전체 (버전, 태그 목록) 조회 (미적재/장애 시 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self, suggestions: List[TagSuggestion]) -> Optional[int]:
+        """사용횟수 랭킹 전체 교체, 새 버전 반환"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild_trending(self, daily_counts: List[Tuple[str, date, int]]) -> None:
+        """(태그 ID, 날짜, 추가 수) 로 일별 트렌딩 집계 전체 교체"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_popular(
+        self, limit: int = 20, min_usage: int = 1
+    ) -> Optional[List[TagSuggestion]]:
+        """사용횟수 상위 태그 (미적재/장애 시 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_trending(self, limit: int = 20) -> Optional[List[TagSuggestion]]:
+        """최근 기간 시간 감쇠 가중 상위 태그 (미적재/장애 시 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_min_usage(self, min_usage: int) -> Optional[int]:
+        """사용횟수 min_usage 이상 태그 수 (미적재/장애 시 None)"""
+        raise NotImplementedError
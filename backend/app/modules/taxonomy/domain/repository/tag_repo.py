@@ -2,6 +2,7 @@ from abc import ABCMeta, abstractmethod
 from typing import List, Optional, Tuple
 
 from app.modules.taxonomy.domain.entity.tag import Tag
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
 from app.modules.taxonomy.domain.vo.tag_name import TagName
 
 
@@ -38,6 +39,11 @@ class ITagRepository(metaclass=ABCMeta):
         """태그 이름으로 검색 (자동완성용)"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_all_suggestions(self) -> List[TagSuggestion]:
+        """자동완성 인덱스 적재용 전체 태그 (ID, 이름, 사용횟수) 조회"""
+        raise NotImplementedError
+
     @abstractmethod
     async def find_all(
         self, page: int = 1, items_per_page: int = 20
@@ -3,7 +3,6 @@ from typing import List, Optional
 
 from app.modules.taxonomy.domain.entity.tag import Tag
 from app.modules.taxonomy.domain.entity.category import Category
-from app.modules.taxonomy.domain.entity.curriculum_tag import CurriculumTag
 from app.modules.taxonomy.domain.repository.tag_repo import ITagRepository
 from app.modules.taxonomy.domain.repository.category_repo import ICategoryRepository
 from app.modules.taxonomy.domain.repository.curriculum_tag_repo import (
@@ -179,36 +178,14 @@ class TagDomainService:
         user_id: str,
     ) -> List[Tag]:
         """커리큘럼에 태그들 추가"""
-        # 태그들을 찾거나 생성
-        tags = await self.find_or_create_tags_by_names(tag_names, user_id)
-
-        now = datetime.now(timezone.utc)
-        added_tags = []
-
-        for tag in tags:
-            # 이미 연결되어 있는지 확인
-            if not await self.curriculum_tag_repo.exists_by_curriculum_and_tag(
-                curriculum_id, tag.id
-            ):
-                # 새 연결 생성
-                curriculum_tag = CurriculumTag(
-                    id=f"{curriculum_id}_{tag.id}",  # 복합 키 형태
-                    curriculum_id=curriculum_id,
-                    tag_id=tag.id,
-                    added_by=user_id,
-                    created_at=now,
-                )
-                await self.curriculum_tag_repo.save(curriculum_tag)
-
-                # 태그 사용횟수 증가
-                await self.tag_repo.increment_usage_count(tag.id)
-                added_tags.append(tag)
-
-        return added_tags
+        # 태그 조회/생성, 연결, 사용횟수 증가를 한 번에 처리 (commit 1회)
+        return await self.curriculum_tag_repo.add_tags_by_names(
+            curriculum_id, TagName.from_list(tag_names), user_id
+        )
 
     async def remove_tag_from_curriculum(
         self, curriculum_id: str, tag_name: str
-    ) -> None:
+    ) -> Tag:
         """커리큘럼에서 태그 제거"""
         tag_name_vo = TagName(tag_name)
         tag = await self.tag_repo.find_by_name(tag_name_vo)
@@ -223,6 +200,9 @@ class TagDomainService:
 
         # 태그 사용횟수 감소
         await self.tag_repo.decrement_usage_count(tag.id)
+        tag.decrement_usage()
+
+        return tag
 
     async def validate_curriculum_tag_limit(
         self, curriculum_id: str, max_tags: int = 10
@@ -33,6 +33,7 @@ class CurriculumTagModel(Base):
         UniqueConstraint("curriculum_id", "tag_id", name="unique_curriculum_tag"),
         Index("idx_curriculum_tag_curriculum", "curriculum_id"),
         Index("idx_curriculum_tag_tag", "tag_id"),
+        Index("idx_curriculum_tag_tag_curriculum", "tag_id", "curriculum_id"),
         Index("idx_curriculum_tag_added_by", "added_by"),
         Index("idx_curriculum_tag_created_at", "created_at"),
     )
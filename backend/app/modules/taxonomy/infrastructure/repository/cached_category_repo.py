@@ -0,0 +1,204 @@
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.common.cache.codec import CacheCodec, from_epoch_us, to_epoch_us
+from app.common.cache.reference_data import ReferenceDataCache, reference_data
+from app.common.cache.two_tier import TwoTierCache, two_tier_caches
+from app.core.config import get_settings
+from app.modules.taxonomy.domain.entity.category import Category
+from app.modules.taxonomy.domain.repository.category_repo import ICategoryRepository
+from app.modules.taxonomy.domain.vo.category_name import CategoryName
+from app.modules.taxonomy.domain.vo.tag_color import TagColor
+from app.modules.taxonomy.infrastructure.repository.category_repo import (
+    CategoryRepository,
+)
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """카테고리 전체(비활성 포함)의 불변 스냅샷, 정렬순 유지"""
+
+    categories: Tuple[Category, ...]
+    by_id: Dict[str, Category] = field(init=False)
+    by_name: Dict[str, Category] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "by_id", {c.id: c for c in self.categories})
+        object.__setattr__(self, "by_name", {c.name.value: c for c in self.categories})
+
+    def name_and_color(self, category_id: str) -> Optional[Tuple[str, str]]:
+        category = self.by_id.get(category_id)
+        if category is None:
+            return None
+        return category.name.value, category.color.value
+
+
+class CategorySnapshotCodec(CacheCodec[CategorySnapshot]):
+    """refdata:categories:{version} 값 (카테고리마다 고정 순서 배열)"""
+
+    VERSION = 1
+
+    def to_fields(self, value: CategorySnapshot) -> List[Any]:
+        return [
+            [
+                c.id,
+                c.name.value,
+                c.description,
+                c.color.value,
+                c.icon,
+                c.sort_order,
+                c.is_active,
+                to_epoch_us(c.created_at),
+                to_epoch_us(c.updated_at),
+                c.updated_at.tzinfo is not None,
+            ]
+            for c in value.categories
+        ]
+
+    def from_fields(self, fields: List[Any]) -> CategorySnapshot:
+        return CategorySnapshot(
+            tuple(
+                Category(
+                    id=category_id,
+                    name=CategoryName(name),
+                    description=description,
+                    color=TagColor(color),
+                    icon=icon,
+                    sort_order=sort_order,
+                    is_active=is_active,
+                    created_at=from_epoch_us(created_at, aware),
+                    updated_at=from_epoch_us(updated_at, aware),
+                )
+                for (
+                    category_id,
+                    name,
+                    description,
+                    color,
+                    icon,
+                    sort_order,
+                    is_active,
+                    created_at,
+                    updated_at,
+                    aware,
+                ) in fields
+            )
+        )
+
+
+# 버전별 스냅샷을 Redis 로 공유 (버전 키라 무효화 불필요, L1 은 최근 버전만).
+# 로컬 스냅샷/버전 키와 같은 네임스페이스라 세 단계 메트릭이 한 라벨로 모인다
+category_snapshot_cache: TwoTierCache[CategorySnapshot] = two_tier_caches.register(
+    "refdata:categories",
+    CategorySnapshotCodec(compress_threshold=get_settings().cache_compress_threshold),
+    l1_size=2,
+    l2_ttl=24 * 60 * 60,
+)
+
+# 워커 프로세스당 하나의 스냅샷 (피드 등 다른 모듈도 공유)
+category_reference_data: ReferenceDataCache[CategorySnapshot] = reference_data.register(
+    "categories", shared=category_snapshot_cache
+)
+
+
+async def load_category_snapshot(repo: CategoryRepository) -> CategorySnapshot:
+    return CategorySnapshot(tuple(await repo.find_all_including_inactive()))
+
+
+class CachedCategoryRepository(ICategoryRepository):
+    """
+    카테고리 참조 데이터 캐시를 거치는 저장소.
+
+    조회는 워커 로컬 스냅샷에서 처리하고 (엔티티는 복사본을 반환),
+    변경은 DB 저장소에 위임한 뒤 참조 데이터 버전을 한 번 올린다.
+    이름 중복 확인과 최대 정렬 순서는 쓰기 경로이므로 DB 를 직접 조회한다.
+    """
+
+    def __init__(
+        self,
+        category_repo: CategoryRepository,
+        cache: ReferenceDataCache[CategorySnapshot] = category_reference_data,
+    ) -> None:
+        self.category_repo = category_repo
+        self.cache = cache
+
+    async def _snapshot(self) -> CategorySnapshot:
+        return await self.cache.get(lambda: load_category_snapshot(self.category_repo))
+
+    # ========================= 조회 (스냅샷) =========================
+
+    async def find_by_id(self, category_id: str) -> Optional[Category]:
+        category = (await self._snapshot()).by_id.get(category_id)
+        return copy(category) if category else None
+
+    async def find_by_name(self, name: CategoryName) -> Optional[Category]:
+        category = (await self._snapshot()).by_name.get(name.value)
+        return copy(category) if category else None
+
+    async def find_all_active(self) -> List[Category]:
+        snapshot = await self._snapshot()
+        return [copy(c) for c in snapshot.categories if c.is_active]
+
+    async def find_all(
+        self, page: int = 1, items_per_page: int = 10, include_inactive: bool = False
+    ) -> Tuple[int, List[Category]]:
+        snapshot = await self._snapshot()
+        categories = [c for c in snapshot.categories if include_inactive or c.is_active]
+        return len(categories), self._paginate(categories, page, items_per_page)
+
+    async def find_by_active_status(
+        self, is_active: bool, page: int = 1, items_per_page: int = 10
+    ) -> Tuple[int, List[Category]]:
+        snapshot = await self._snapshot()
+        categories = [c for c in snapshot.categories if c.is_active == is_active]
+        return len(categories), self._paginate(categories, page, items_per_page)
+
+    async def find_by_sort_order_range(
+        self, min_order: int, max_order: int
+    ) -> List[Category]:
+        snapshot = await self._snapshot()
+        return [
+            copy(c)
+            for c in snapshot.categories
+            if min_order <= c.sort_order <= max_order
+        ]
+
+    async def count_all(self, include_inactive: bool = False) -> int:
+        snapshot = await self._snapshot()
+        if include_inactive:
+            return len(snapshot.categories)
+        return sum(1 for c in snapshot.categories if c.is_active)
+
+    async def count_active(self) -> int:
+        return await self.count_all(include_inactive=False)
+
+    # ========================= 쓰기 경로 (DB) =========================
+
+    async def exists_by_name(self, name: CategoryName) -> bool:
+        return await self.category_repo.exists_by_name(name)
+
+    async def get_max_sort_order(self) -> int:
+        return await self.category_repo.get_max_sort_order()
+
+    async def save(self, category: Category) -> None:
+        await self.category_repo.save(category)
+        await self.cache.bump_version()
+
+    async def update(self, category: Category) -> None:
+        await self.category_repo.update(category)
+        await self.cache.bump_version()
+
+    async def delete(self, category_id: str) -> None:
+        await self.category_repo.delete(category_id)
+        await self.cache.bump_version()
+
+    async def reorder_categories(self, category_orders: List[Tuple[str, int]]) -> None:
+        await self.category_repo.reorder_categories(category_orders)
+        await self.cache.bump_version()
+
+    @staticmethod
+    def _paginate(
+        categories: List[Category], page: int, items_per_page: int
+    ) -> List[Category]:
+        offset = (page - 1) * items_per_page
+        return [copy(c) for c in categories[offset : offset + items_per_page]]
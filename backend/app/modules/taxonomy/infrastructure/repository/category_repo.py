@@ -1,5 +1,5 @@
 from typing import List, Optional, Sequence, Tuple
-from sqlalchemy import Result, Select, func, select, delete, update
+from sqlalchemy import Result, Select, case, func, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.taxonomy.domain.entity.category import Category
@@ -228,15 +228,27 @@ class CategoryRepository(ICategoryRepository):
         result: int | None = await self.session.scalar(query)
         return result or 0
 
+    async def find_all_including_inactive(self) -> List[Category]:
+        """비활성 포함 전체 카테고리를 정렬순으로 조회 (참조 데이터 스냅샷용)"""
+        query: Select[Tuple[CategoryModel]] = select(CategoryModel).order_by(
+            CategoryModel.sort_order.asc(), CategoryModel.name.asc()
+        )
+        result: Result[Tuple[CategoryModel]] = await self.session.execute(query)
+        return [self._to_domain(model) for model in result.scalars().all()]
+
     async def reorder_categories(self, category_orders: List[Tuple[str, int]]) -> None:
-        """카테고리들의 정렬 순서 일괄 변경"""
-        for category_id, sort_order in category_orders:
-            query = (
-                update(CategoryModel)
-                .where(CategoryModel.id == category_id)
-                .values(sort_order=sort_order)
-            )
-            await self.session.execute(query)
+        """카테고리들의 정렬 순서 일괄 변경 (CASE 를 사용한 단일 UPDATE)"""
+        if not category_orders:
+            return
+
+        sort_orders = dict(category_orders)
+        query = (
+            update(CategoryModel)
+            .where(CategoryModel.id.in_(sort_orders))
+            .values(sort_order=case(sort_orders, value=CategoryModel.id))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
 
         try:
             await self.session.commit()
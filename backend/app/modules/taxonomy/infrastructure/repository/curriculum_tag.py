@@ -1,9 +1,12 @@
-from datetime import datetime, timezone
-from typing import List, Optional, Tuple
-from sqlalchemy import func, select, delete
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ulid import ULID  # type: ignore
 
+from app.common.db.upsert import insert_ignore_duplicates
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+
 from app.modules.taxonomy.domain.entity.curriculum_tag import (
     CurriculumTag,
     CurriculumCategory,
@@ -22,6 +25,9 @@ from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
     CurriculumCategoryModel,
 )
 from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.taxonomy.infrastructure.repository.tag_repo import (
+    find_or_insert_tags,
+)
 from app.modules.taxonomy.infrastructure.db_model.category import CategoryModel
 
 
@@ -64,6 +70,70 @@ class CurriculumTagRepository(ICurriculumTagRepository):
             await self.session.rollback()
             raise
 
+    async def add_tags_by_names(
+        self, curriculum_id: str, tag_names: List[TagName], added_by: str
+    ) -> List[Tag]:
+        """
+        커리큘럼에 태그들을 일괄 연결 (없는 태그는 생성)
+
+        태그 수와 무관하게 고정된 문장 수 + commit 1회:
+        태그 조회/생성(최대 3) → 기존 연결 조회 → 연결 다중 행 INSERT
+        → 새로 연결된 태그들의 usage_count 일괄 재계산.
+        새로 연결된 태그만 반환한다.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            tags = await find_or_insert_tags(self.session, tag_names, added_by, now)
+            tag_ids = [tag.id for tag in tags]
+
+            linked_tag_ids: set[str] = set()
+            if tag_ids:
+                result = await self.session.execute(
+                    select(CurriculumTagModel.tag_id).where(
+                        CurriculumTagModel.curriculum_id == curriculum_id,
+                        CurriculumTagModel.tag_id.in_(tag_ids),
+                    )
+                )
+                linked_tag_ids = set(result.scalars().all())
+
+            added_tags = [tag for tag in tags if tag.id not in linked_tag_ids]
+            if added_tags:
+                await insert_ignore_duplicates(
+                    self.session,
+                    CurriculumTagModel,
+                    [
+                        {
+                            "id": f"{curriculum_id}_{tag.id}",  # 복합 키 형태
+                            "curriculum_id": curriculum_id,
+                            "tag_id": tag.id,
+                            "added_by": added_by,
+                            "created_at": now,
+                        }
+                        for tag in added_tags
+                    ],
+                )
+                # +1 대신 연결 수로 재계산 → 같은 태그 동시 추가에도 카운트가 어긋나지 않음
+                usage_count = (
+                    select(func.count())
+                    .select_from(CurriculumTagModel)
+                    .where(CurriculumTagModel.tag_id == TagModel.id)
+                    .scalar_subquery()
+                )
+                await self.session.execute(
+                    update(TagModel)
+                    .where(TagModel.id.in_([tag.id for tag in added_tags]))
+                    .values(usage_count=usage_count, updated_at=now)
+                )
+
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
+
+        for tag in added_tags:
+            tag.increment_usage()
+        return added_tags
+
     async def find_by_id(self, curriculum_tag_id: str) -> Optional[CurriculumTag]:
         """ID로 커리큘럼-태그 연결 조회"""
         query = select(CurriculumTagModel).where(
@@ -260,6 +330,47 @@ class CurriculumTagRepository(ICurriculumTagRepository):
         )
         return await self.session.scalar(query) or 0
 
+    async def count_tag_additions_by_day(
+        self, since: datetime
+    ) -> List[Tuple[str, date, int]]:
+        """since 이후 태그별/일별 연결 추가 수 (태그 ID, 날짜, 수)"""
+        day = func.date(CurriculumTagModel.created_at)
+        query = (
+            select(CurriculumTagModel.tag_id, day, func.count())
+            .where(CurriculumTagModel.created_at >= since)
+            .group_by(CurriculumTagModel.tag_id, day)
+        )
+        result = await self.session.execute(query)
+        return [
+            (
+                tag_id,
+                (
+                    added_on
+                    if isinstance(added_on, date)
+                    else date.fromisoformat(added_on)
+                ),
+                count,
+            )
+            for tag_id, added_on, count in result.all()
+        ]
+
+    async def find_tag_ids_by_owners(self, user_ids: List[str]) -> Dict[str, Set[str]]:
+        """사용자별 소유 커리큘럼에 달린 태그 ID 집합"""
+        tag_ids: Dict[str, Set[str]] = {user_id: set() for user_id in user_ids}
+        if not user_ids:
+            return tag_ids
+        query = (
+            select(CurriculumModel.user_id, CurriculumTagModel.tag_id)
+            .join(
+                CurriculumModel, CurriculumModel.id == CurriculumTagModel.curriculum_id
+            )
+            .where(CurriculumModel.user_id.in_(user_ids))
+            .distinct()
+        )
+        for user_id, tag_id in await self.session.execute(query):
+            tag_ids[user_id].add(tag_id)
+        return tag_ids
+
     async def exists_by_curriculum_and_tag(
         self, curriculum_id: str, tag_id: str
     ) -> bool:
@@ -0,0 +1,214 @@
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, insort
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+from app.modules.taxonomy.domain.repository.tag_autocomplete_repo import (
+    ITagAutocompleteRepository,
+)
+from app.modules.taxonomy.domain.repository.tag_ranking_repo import (
+    ITagRankingRepository,
+)
+from app.utils.hangul import decompose, extract_choseong, has_hangul_syllable
+
+
+def _index_keys(name: str) -> List[str]:
+    """태그 이름의 검색 키: 자모 분해 + (한글이면) 초성"""
+    keys = [decompose(name)]
+    if has_hangul_syllable(name):
+        keys.append(decompose(extract_choseong(name)))
+    return keys
+
+
+class TagPrefixIndex:
+    """
+    (검색 키, 태그 ID) 정렬 배열 기반 접두사 인덱스.
+
+    검색은 bisect 로 접두사 구간을 찾아 사용횟수 상위 N 개만 고른다.
+    키는 자모 단위라 "ㅍㅇ"(초성), "파ㅇ"(입력 중간 상태) 모두 매칭된다.
+    구간이 넓은 짧은 접두사 결과는 변경 전까지 캐시한다.
+    """
+
+    SHORT_PREFIX_LENGTH = 2
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[str, str]] = []
+        self._suggestions: Dict[str, TagSuggestion] = {}
+        self._short_prefix_cache: Dict[Tuple[str, int], List[TagSuggestion]] = {}
+
+    def __len__(self) -> int:
+        return len(self._suggestions)
+
+    def load(self, suggestions: List[TagSuggestion]) -> None:
+        """전체 교체"""
+        self._short_prefix_cache.clear()
+        self._suggestions = {s.id: s for s in suggestions}
+        self._keys = sorted(
+            (key, s.id)
+            for s in self._suggestions.values()
+            for key in _index_keys(s.name)
+        )
+
+    def upsert(self, suggestion: TagSuggestion) -> None:
+        self._short_prefix_cache.clear()
+        previous = self._suggestions.get(suggestion.id)
+        self._suggestions[suggestion.id] = suggestion
+        if previous is not None and previous.name == suggestion.name:
+            return  # 사용횟수만 변경 → 키 유지
+        if previous is not None:
+            self._remove_keys(previous)
+        for key in _index_keys(suggestion.name):
+            insort(self._keys, (key, suggestion.id))
+
+    def adjust_usage(self, tag_id: str, delta: int) -> None:
+        current = self._suggestions.get(tag_id)
+        if current is None:
+            return
+        self._short_prefix_cache.clear()
+        self._suggestions[tag_id] = TagSuggestion(
+            id=current.id,
+            name=current.name,
+            usage_count=max(current.usage_count + delta, 0),
+        )
+
+    def remove(self, tag_id: str) -> None:
+        previous = self._suggestions.pop(tag_id, None)
+        if previous is not None:
+            self._short_prefix_cache.clear()
+            self._remove_keys(previous)
+
+    def search(self, query: str, limit: int = 10) -> List[TagSuggestion]:
+        prefix = decompose(query.strip().lower())
+        if not prefix or limit <= 0:
+            return []
+
+        cacheable = len(prefix) <= self.SHORT_PREFIX_LENGTH
+        if cacheable and (prefix, limit) in self._short_prefix_cache:
+            return list(self._short_prefix_cache[(prefix, limit)])
+
+        keys = self._keys
+        seen: Dict[str, TagSuggestion] = {}
+        i = bisect_left(keys, (prefix,))
+        while i < len(keys) and keys[i][0].startswith(prefix):
+            tag_id = keys[i][1]
+            if tag_id not in seen:
+                seen[tag_id] = self._suggestions[tag_id]
+            i += 1
+
+        result = heapq.nsmallest(
+            limit, seen.values(), key=lambda s: (-s.usage_count, s.name)
+        )
+        if cacheable:
+            self._short_prefix_cache[(prefix, limit)] = result
+        return list(result)
+
+    def _remove_keys(self, suggestion: TagSuggestion) -> None:
+        for key in _index_keys(suggestion.name):
+            i = bisect_left(self._keys, (key, suggestion.id))
+            if i < len(self._keys) and self._keys[i] == (key, suggestion.id):
+                del self._keys[i]
+
+
+class TagAutocompleteRepository(ITagAutocompleteRepository):
+    """
+    워커 프로세스 로컬 접두사 인덱스 + Redis 태그 랭킹 공유 사본.
+
+    - 검색은 로컬 인덱스만 사용 (DB/Redis 왕복 없음)
+    - 변경은 로컬 인덱스에 즉시 반영하고 태그 랭킹(Redis)에 기록 → 버전 증가
+    - 다른 워커의 변경은 sync_interval 마다 랭킹 버전을 확인해 재적재
+    - 콜드 스타트는 랭킹 스냅샷 → 없으면 DB(loader) 로 적재 후 랭킹 시드
+    """
+
+    def __init__(
+        self, tag_ranking_repo: ITagRankingRepository, sync_interval: float = 5.0
+    ) -> None:
+        self.tag_ranking_repo = tag_ranking_repo
+        self.sync_interval = sync_interval
+        self._index = TagPrefixIndex()
+        self._ready = False
+        self._version: Optional[int] = None
+        self._last_sync = 0.0
+        self._sync_task: Optional[asyncio.Task] = None
+        self._warm_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    async def warm(self, loader: Callable[[], Awaitable[List[TagSuggestion]]]) -> None:
+        if self._warm_lock is None:
+            self._warm_lock = asyncio.Lock()
+        async with self._warm_lock:
+            if self._ready:
+                return
+
+            snapshot = await self.tag_ranking_repo.snapshot()
+            if snapshot is not None:
+                version, suggestions = snapshot
+            else:
+                suggestions = await loader()
+                version = await self.tag_ranking_repo.rebuild(suggestions)
+
+            self._index.load(suggestions)
+            self._version = version
+            self._last_sync = time.monotonic()
+            self._ready = True
+
+    def search(self, query: str, limit: int = 10) -> List[TagSuggestion]:
+        self._schedule_sync()
+        return self._index.search(query, limit)
+
+    async def upsert(
+        self, suggestions: List[TagSuggestion], usage_delta: int = 0
+    ) -> None:
+        if not suggestions:
+            return
+        if self._ready:
+            for suggestion in suggestions:
+                self._index.upsert(suggestion)
+        self._advance(await self.tag_ranking_repo.upsert(suggestions, usage_delta))
+
+    async def adjust_usage(self, tag_id: str, delta: int) -> None:
+        if self._ready:
+            self._index.adjust_usage(tag_id, delta)
+        self._advance(await self.tag_ranking_repo.adjust_usage(tag_id, delta))
+
+    async def remove(self, tag_id: str) -> None:
+        if self._ready:
+            self._index.remove(tag_id)
+        self._advance(await self.tag_ranking_repo.remove(tag_id))
+
+    # ========================= 워커 간 동기화 =========================
+
+    def _advance(self, new_version: Optional[int]) -> None:
+        # 그 사이 다른 워커의 변경이 없으면 로컬 인덱스가 이미 최신
+        if (
+            self._ready
+            and new_version is not None
+            and self._version is not None
+            and new_version == self._version + 1
+        ):
+            self._version = new_version
+
+    def _schedule_sync(self) -> None:
+        if not self._ready:
+            return
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        now = time.monotonic()
+        if now - self._last_sync < self.sync_interval:
+            return
+        self._last_sync = now
+        self._sync_task = asyncio.get_running_loop().create_task(self._sync())
+
+    async def _sync(self) -> None:
+        version = await self.tag_ranking_repo.get_version()
+        if version is None or version == self._version:
+            return
+
+        snapshot = await self.tag_ranking_repo.snapshot()
+        if snapshot is not None:
+            self._version, suggestions = snapshot
+            self._index.load(suggestions)
@@ -0,0 +1,279 @@
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+from app.common.cache.redis_client import RedisClient
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+from app.modules.taxonomy.domain.repository.tag_ranking_repo import (
+    ITagRankingRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TagRankingRepository(ITagRankingRepository):
+    """
+    Redis sorted set 기반 태그 랭킹.
+
+    - tag:ranking:usage    (zset) 태그 ID → 사용횟수, 인기 태그 조회는 ZREVRANGEBYSCORE
+    - tag:ranking:names    (hash) 태그 ID → 이름
+    - tag:ranking:version  (int)  변경마다 증가, 워커 로컬 인덱스 동기화에 사용
+    - tag:ranking:seeded   (flag) rebuild 로 전체 태그를 채웠음. 없으면 (새/flush 된 Redis)
+                           조회는 None 을 반환하고 개별 변경은 쓰지 않는다
+    - tag:trending:YYYYMMDD (zset) 일별 사용횟수 증감, trending_days + 1 일 후 만료
+    - tag:trending:recent  (zset) 일별 집계를 반감기 가중치로 합친 결과 (짧은 TTL 캐시)
+
+    변경은 MULTI 파이프라인으로 한 번에 반영하고, Redis 장애 시 조회는 None 을 반환해
+    호출 측이 DB 로 대체할 수 있게 한다.
+    """
+
+    NAMES_KEY = "tag:ranking:names"
+    USAGE_KEY = "tag:ranking:usage"
+    VERSION_KEY = "tag:ranking:version"
+    SEEDED_KEY = "tag:ranking:seeded"
+    TRENDING_KEY_PREFIX = "tag:trending"
+    TRENDING_RECENT_KEY = "tag:trending:recent"
+    # 쓰는 도중 rebuild/flush 로 seeded 가 바뀌었을 때 다시 시도하는 횟수
+    WRITE_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        trending_days: int = 7,
+        trending_half_life_days: float = 2.0,
+        trending_cache_ttl: int = 60,
+    ) -> None:
+        self.redis_client = redis_client
+        self.trending_days = trending_days
+        self.trending_half_life_days = trending_half_life_days
+        self.trending_cache_ttl = trending_cache_ttl
+
+    # ========================= 변경 =========================
+
+    async def upsert(
+        self, suggestions: List[TagSuggestion], usage_delta: int = 0
+    ) -> Optional[int]:
+        if not suggestions:
+            return None
+
+        def _write(pipe) -> None:
+            pipe.hset(self.NAMES_KEY, mapping={s.id: s.name for s in suggestions})
+            pipe.zadd(self.USAGE_KEY, {s.id: s.usage_count for s in suggestions})
+            if usage_delta:
+                for s in suggestions:
+                    self._record_trending(pipe, s.id, usage_delta)
+
+        return await self._write(_write)
+
+    async def adjust_usage(self, tag_id: str, delta: int) -> Optional[int]:
+        def _write(pipe) -> None:
+            pipe.zincrby(self.USAGE_KEY, delta, tag_id)
+            self._record_trending(pipe, tag_id, delta)
+
+        return await self._write(_write)
+
+    async def remove(self, tag_id: str) -> Optional[int]:
+        def _write(pipe) -> None:
+            pipe.hdel(self.NAMES_KEY, tag_id)
+            pipe.zrem(self.USAGE_KEY, tag_id)
+
+        return await self._write(_write)
+
+    async def rebuild(self, suggestions: List[TagSuggestion]) -> Optional[int]:
+        def _write(pipe) -> None:
+            pipe.delete(self.NAMES_KEY, self.USAGE_KEY)
+            if suggestions:
+                pipe.hset(self.NAMES_KEY, mapping={s.id: s.name for s in suggestions})
+                pipe.zadd(self.USAGE_KEY, {s.id: s.usage_count for s in suggestions})
+            pipe.set(self.SEEDED_KEY, 1)
+
+        return await self._write(_write, require_seeded=False)
+
+    async def rebuild_trending(self, daily_counts: List[Tuple[str, date, int]]) -> None:
+        buckets: Dict[date, Dict[str, float]] = {}
+        for tag_id, day, count in daily_counts:
+            buckets.setdefault(day, {})[tag_id] = count
+
+        today = self._today()
+        days = [today - timedelta(days=age) for age in range(self.trending_days)]
+
+        def _write(pipe) -> None:
+            pipe.delete(self.TRENDING_RECENT_KEY, *[self._bucket_key(d) for d in days])
+            for day, mapping in buckets.items():
+                if day in days and mapping:
+                    pipe.zadd(self._bucket_key(day), mapping)
+                    pipe.expire(self._bucket_key(day), self._bucket_ttl())
+
+        await self._write(_write, require_seeded=False)
+
+    # ========================= 조회 =========================
+
+    async def get_version(self) -> Optional[int]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            raw_version = await redis.get(self.VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"Tag ranking version check failed: {e}")
+            return None
+        return int(raw_version) if raw_version is not None else None
+
+    async def snapshot(self) -> Optional[Tuple[int, List[TagSuggestion]]]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            pipe = redis.pipeline(transaction=True)
+            pipe.exists(self.SEEDED_KEY)
+            pipe.get(self.VERSION_KEY)
+            pipe.hgetall(self.NAMES_KEY)
+            pipe.zrange(self.USAGE_KEY, 0, -1, withscores=True)
+            seeded, raw_version, names, usages = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Tag ranking snapshot failed: {e}")
+            return None
+
+        if not seeded or raw_version is None or not names:
+            return None
+
+        usage_by_id = {tag_id: int(score) for tag_id, score in usages}
+        suggestions = [
+            TagSuggestion(
+                id=tag_id, name=name, usage_count=max(usage_by_id.get(tag_id, 0), 0)
+            )
+            for tag_id, name in names.items()
+        ]
+        return int(raw_version), suggestions
+
+    async def find_popular(
+        self, limit: int = 20, min_usage: int = 1
+    ) -> Optional[List[TagSuggestion]]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.exists(self.SEEDED_KEY)
+            pipe.zrevrangebyscore(
+                self.USAGE_KEY, "+inf", min_usage, start=0, num=limit, withscores=True
+            )
+            seeded, ranked = await pipe.execute()
+            if not seeded:
+                return None
+            return await self._hydrate(ranked)
+        except Exception as e:
+            logger.warning(f"Tag ranking popular read failed: {e}")
+            return None
+
+    async def find_trending(self, limit: int = 20) -> Optional[List[TagSuggestion]]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            if not await redis.exists(self.TRENDING_RECENT_KEY):
+                await self._refresh_trending()
+            # 감소만 있었던 태그(점수 <= 0)는 제외
+            ranked = await redis.zrevrangebyscore(
+                self.TRENDING_RECENT_KEY, "+inf", "(0", start=0, num=limit
+            )
+            if not ranked:
+                return []
+            usages = await redis.zmscore(self.USAGE_KEY, ranked)
+            return await self._hydrate(
+                [(tag_id, usage or 0) for tag_id, usage in zip(ranked, usages)]
+            )
+        except Exception as e:
+            logger.warning(f"Tag ranking trending read failed: {e}")
+            return None
+
+    async def count_by_min_usage(self, min_usage: int) -> Optional[int]:
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.exists(self.SEEDED_KEY)
+            pipe.zcount(self.USAGE_KEY, min_usage, "+inf")
+            seeded, count = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Tag ranking count failed: {e}")
+            return None
+        return int(count) if seeded else None
+
+    # ========================= 내부 =========================
+
+    async def _write(
+        self, write: Callable[[Any], None], require_seeded: bool = True
+    ) -> Optional[int]:
+        """
+        MULTI 로 변경 반영 후 버전 증가 (실패해도 요청은 진행).
+        require_seeded 이면 seeded 표시를 WATCH 로 확인해 rebuild 되지 않은 Redis 에는
+        쓰지 않는다 (일부 태그만 든 색인이 완전한 것처럼 보이지 않도록). 그 사이
+        rebuild/flush 로 표시가 바뀌면 다시 시도한다.
+        """
+        redis = self.redis_client.redis
+        if redis is None:
+            return None
+        try:
+            for _ in range(self.WRITE_ATTEMPTS):
+                async with redis.pipeline(transaction=True) as pipe:
+                    if require_seeded:
+                        await pipe.watch(self.SEEDED_KEY)
+                        if not await pipe.exists(self.SEEDED_KEY):
+                            return None
+                        pipe.multi()
+                    write(pipe)
+                    pipe.incr(self.VERSION_KEY)
+                    try:
+                        results = await pipe.execute()
+                    except WatchError:
+                        continue
+                return int(results[-1])
+        except Exception as e:
+            logger.warning(f"Tag ranking write failed: {e}")
+            return None
+        logger.warning("Tag ranking write skipped: ranking was rebuilt concurrently")
+        return None
+
+    def _record_trending(self, pipe, tag_id: str, delta: int) -> None:
+        bucket_key = self._bucket_key(self._today())
+        pipe.zincrby(bucket_key, delta, tag_id)
+        pipe.expire(bucket_key, self._bucket_ttl())
+
+    async def _refresh_trending(self) -> None:
+        """일별 집계를 반감기 가중치로 합쳐 캐시 키에 저장"""
+        redis = self.redis_client.redis
+        today = self._today()
+        weights = {
+            self._bucket_key(today - timedelta(days=age)): 0.5
+            ** (age / self.trending_half_life_days)
+            for age in range(self.trending_days)
+        }
+        pipe = redis.pipeline(transaction=True)  # type: ignore
+        pipe.zunionstore(self.TRENDING_RECENT_KEY, weights, aggregate="SUM")
+        pipe.expire(self.TRENDING_RECENT_KEY, self.trending_cache_ttl)
+        await pipe.execute()
+
+    async def _hydrate(self, ranked: List[Tuple[str, float]]) -> List[TagSuggestion]:
+        if not ranked:
+            return []
+        tag_ids = [tag_id for tag_id, _ in ranked]
+        names = await self.redis_client.redis.hmget(self.NAMES_KEY, tag_ids)  # type: ignore
+        return [
+            TagSuggestion(id=tag_id, name=name, usage_count=max(int(score), 0))
+            for (tag_id, score), name in zip(ranked, names)
+            if name is not None
+        ]
+
+    def _bucket_key(self, day: date) -> str:
+        return f"{self.TRENDING_KEY_PREFIX}:{day.strftime('%Y%m%d')}"
+
+    def _bucket_ttl(self) -> int:
+        return (self.trending_days + 1) * 24 * 60 * 60
+
+    @staticmethod
+    def _today() -> date:
+        return datetime.now(timezone.utc).date()
@@ -1,29 +1,87 @@
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, func, select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ulid import ULID  # type: ignore
 
+from app.common.db.upsert import insert_ignore_duplicates
 from app.modules.taxonomy.domain.entity.tag import Tag
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
 from app.modules.taxonomy.domain.repository.tag_repo import ITagRepository
 from app.modules.taxonomy.domain.vo.tag_name import TagName
 from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
 
 
+def _tag_model_to_domain(tag_model: TagModel) -> Tag:
+    return Tag(
+        id=tag_model.id,
+        name=TagName(tag_model.name),
+        usage_count=tag_model.usage_count,
+        created_by=tag_model.created_by,
+        created_at=tag_model.created_at,
+        updated_at=tag_model.updated_at,
+    )
+
+
+async def find_or_insert_tags(
+    session: AsyncSession,
+    tag_names: List[TagName],
+    created_by: str,
+    now: datetime,
+) -> List[Tag]:
+    """
+    태그 이름들을 일괄로 찾거나 생성한다 (commit 하지 않음).
+
+    이름 수와 무관하게 최대 3개 문장:
+    1) SELECT ... WHERE name IN (...)
+    2) 없는 이름만 다중 행 INSERT (동시 생성 충돌은 무시)
+    3) 2)에서 넣으려던 이름 재조회 → 동시 요청이 먼저 만든 행의 id 도 반영
+    반환 순서는 입력 순서(중복 제거)를 따른다.
+    """
+    names: List[str] = list(dict.fromkeys(tag_name.value for tag_name in tag_names))
+    if not names:
+        return []
+
+    result = await session.execute(select(TagModel).where(TagModel.name.in_(names)))
+    found: Dict[str, Tag] = {
+        model.name: _tag_model_to_domain(model) for model in result.scalars().all()
+    }
+
+    missing: List[str] = [name for name in names if name not in found]
+    if missing:
+        await insert_ignore_duplicates(
+            session,
+            TagModel,
+            [
+                {
+                    "id": ULID().generate(),
+                    "name": name,
+                    "usage_count": 0,
+                    "created_by": created_by,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for name in missing
+            ],
+        )
+        result = await session.execute(
+            select(TagModel)
+            .where(TagModel.name.in_(missing))
+            .execution_options(populate_existing=True)
+        )
+        for model in result.scalars().all():
+            found[model.name] = _tag_model_to_domain(model)
+
+    return [found[name] for name in names if name in found]
+
+
 class TagRepository(ITagRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session: AsyncSession = session
 
     def _to_domain(self, tag_model: TagModel) -> Tag:
         """DB Model → Domain Entity 변환"""
-        return Tag(
-            id=tag_model.id,
-            name=TagName(tag_model.name),
-            usage_count=tag_model.usage_count,
-            created_by=tag_model.created_by,
-            created_at=tag_model.created_at,
-            updated_at=tag_model.updated_at,
-        )
+        return _tag_model_to_domain(tag_model)
 
     async def save(self, tag: Tag) -> None:
         """태그 저장"""
@@ -70,28 +128,14 @@ class TagRepository(ITagRepository):
         self, tag_names: List[TagName], created_by: str
     ) -> List[Tag]:
         """태그 이름 리스트로 태그들을 찾거나 생성"""
-        tags = []
-        now = datetime.now(timezone.utc)
-
-        for tag_name in tag_names:
-            # 기존 태그 찾기
-            existing_tag = await self.find_by_name(tag_name)
-
-            if existing_tag:
-                tags.append(existing_tag)
-            else:
-                # 새 태그 생성
-                new_tag = Tag(
-                    id=ULID().generate(),
-                    name=tag_name,
-                    usage_count=0,
-                    created_by=created_by,
-                    created_at=now,
-                    updated_at=now,
-                )
-                await self.save(new_tag)
-                tags.append(new_tag)
-
+        tags = await find_or_insert_tags(
+            self.session, tag_names, created_by, datetime.now(timezone.utc)
+        )
+        try:
+            await self.session.commit()
+        except:
+            await self.session.rollback()
+            raise
         return tags
 
     async def find_popular_tags(self, limit: int = 20, min_usage: int = 1) -> List[Tag]:
@@ -122,6 +166,16 @@ class TagRepository(ITagRepository):
 
         return [self._to_domain(model) for model in tag_models]
 
+    async def find_all_suggestions(self) -> List[TagSuggestion]:
+        """자동완성 인덱스 적재용 전체 태그 (ID, 이름, 사용횟수) 조회"""
+        result = await self.session.execute(
+            select(TagModel.id, TagModel.name, TagModel.usage_count)
+        )
+        return [
+            TagSuggestion(id=tag_id, name=name, usage_count=usage_count)
+            for tag_id, name, usage_count in result.all()
+        ]
+
     async def find_all(
         self, page: int = 1, items_per_page: int = 20
     ) -> Tuple[int, List[Tag]]:
@@ -0,0 +1,68 @@
+"""
+Redis 태그 랭킹 재구성 명령
+
+MySQL 의 tags.usage_count 로 인기 태그 랭킹을, 최근 curriculum_tags 추가 이력으로
+일별 트렌딩 집계를 다시 만든다. Redis 초기화/장애 복구 후 또는 카운트가 어긋났을 때 실행.
+
+사용법:
+    python -m app.modules.taxonomy.interface.cli.rebuild_tag_ranking
+"""
+
+import asyncio
+import sys
+from datetime import datetime, time, timedelta, timezone
+from typing import List, Optional
+
+from app.common.cache.redis_client import redis_client
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.common.db.database import AsyncSessionLocal
+from app.core.config import get_settings
+from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
+    CurriculumTagRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_ranking_repo import (
+    TagRankingRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_repo import TagRepository
+
+
+async def rebuild_tag_ranking() -> str:
+    settings = get_settings()
+    ranking = TagRankingRepository(
+        redis_client,
+        trending_days=settings.tag_trending_days,
+        trending_half_life_days=settings.tag_trending_half_life_days,
+    )
+    today = datetime.now(timezone.utc).date()
+    since = datetime.combine(
+        today - timedelta(days=settings.tag_trending_days - 1), time.min
+    )
+
+    await redis_client.connect()
+    try:
+        async with AsyncSessionLocal() as session:
+            suggestions = await TagRepository(session).find_all_suggestions()
+            daily_counts = await CurriculumTagRepository(
+                session
+            ).count_tag_additions_by_day(since)
+
+        version = await ranking.rebuild(suggestions)
+        if version is None:
+            raise RuntimeError("Redis 에 연결할 수 없습니다")
+        await ranking.rebuild_trending(daily_counts)
+    finally:
+        await redis_client.disconnect()
+
+    return (
+        f"tags={len(suggestions)} trending_rows={len(daily_counts)} "
+        f"version={version}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    print(asyncio.run(rebuild_tag_ranking()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,6 +50,18 @@ async def get_popular_tags(
     return [TagBriefResponse.from_dto(tag) for tag in tags]
 
 
+@tag_router.get("/trending", response_model=list[TagBriefResponse])
+@inject
+async def get_trending_tags(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    limit: int = Query(20, ge=1, le=50, description="조회할 태그 수"),
+    tag_service: TagService = Depends(Provide[Container.tag_service]),
+) -> list[TagBriefResponse]:
+    """최근 일주일 트렌딩 태그 목록 조회"""
+    tags = await tag_service.get_trending_tags(limit=limit)
+    return [TagBriefResponse.from_dto(tag) for tag in tags]
+
+
 @tag_router.get("/search", response_model=TagSearchResponse)
 @inject
 async def search_tags(
@@ -11,6 +11,7 @@ from app.modules.taxonomy.application.dto.tag_dto import (
     RemoveTagFromCurriculumCommand,
     AssignCategoryToCurriculumCommand,
     TagDTO,
+    TagSuggestionDTO,
     CategoryDTO,
     TagPageDTO,
     CategoryPageDTO,
@@ -80,7 +81,7 @@ class TagBriefResponse(BaseModel):
     is_popular: bool
 
     @classmethod
-    def from_dto(cls, dto: TagDTO) -> "TagBriefResponse":
+    def from_dto(cls, dto: TagDTO | TagSuggestionDTO) -> "TagBriefResponse":
         return cls(
             id=dto.id,
             name=dto.name,
@@ -113,7 +114,7 @@ class TagSearchResponse(BaseModel):
     suggestions: List[TagBriefResponse]
 
     @classmethod
-    def from_dto_list(cls, tags: List[TagDTO]) -> "TagSearchResponse":
+    def from_dto_list(cls, tags: List[TagSuggestionDTO]) -> "TagSearchResponse":
         return cls(suggestions=[TagBriefResponse.from_dto(tag) for tag in tags])
 
 
@@ -1,9 +1,9 @@
-import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 from ulid import ULID  # type: ignore
 from app.core.auth import Role, create_access_token
 from app.utils.crypto import Crypto
+from app.utils.password_hasher import PasswordHasher, password_hasher as default_hasher
 
 from app.common.monitoring.metrics import increment_user_registration
 from app.modules.user.application.exception import (
@@ -28,12 +28,14 @@ class AuthService:
         user_domain_service: UserDomainService,
         ulid: ULID = ULID(),
         crypto: Crypto = Crypto(),
+        password_hasher: PasswordHasher = default_hasher,
     ):
 
         self.user_repo: IUserRepository = user_repo
         self.user_domain_service: UserDomainService = user_domain_service
         self.ulid: ULID = ulid
         self.crypto: Crypto = crypto
+        self.password_hasher: PasswordHasher = password_hasher
 
     async def signup(
         self,
@@ -53,7 +55,8 @@ class AuthService:
             raise ExistNameError
 
         PasswordValidator.validate(command.password)
-        hashed: str = await asyncio.to_thread(
+        hashed: str = await self.password_hasher.run(
+            "hash",
             self.crypto.encrypt,
             command.password,
         )
@@ -79,9 +82,20 @@ class AuthService:
         if user is None:
             raise EmailNotFoundError("Email Not found")
 
-        if not self.crypto.verify(password, user.password.value):
+        verified, new_hashed = await self.password_hasher.run(
+            "verify",
+            self.crypto.verify_and_update,
+            password,
+            user.password.value,
+        )
+        if not verified:
             raise PasswordIncorrectError("Password incorrect")
 
+        # bcrypt cost 가 바뀐 경우 로그인 성공 시점에 새 해시로 교체
+        if new_hashed:
+            user.update_password(Password(new_hashed), datetime.now(timezone.utc))
+            await self.user_repo.update(user)
+
         access_token = create_access_token(subject=user.id, role=Role(user.role))
         # increment_user_login()
 
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
-import asyncio
+from typing import Optional
 from ulid import ULID  # type: ignore
+from app.modules.feed.application.service.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.user.application.dto.user_dto import (
     UpdateUserCommand,
     UserDTO,
@@ -14,6 +17,7 @@ from app.modules.user.domain.service.user_domain_service import UserDomainServic
 from app.modules.user.domain.vo import Name, Password
 from app.modules.user.domain.vo.password_validator import PasswordValidator
 from app.utils.crypto import Crypto
+from app.utils.password_hasher import PasswordHasher, password_hasher as default_hasher
 
 
 class UserService:
@@ -25,12 +29,16 @@ class UserService:
         user_domain_service: UserDomainService,
         ulid: ULID = ULID(),
         crypto: Crypto = Crypto(),
+        password_hasher: PasswordHasher = default_hasher,
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
     ) -> None:
 
         self.user_repo: IUserRepository = user_repo
         self.user_domain_service: UserDomainService = user_domain_service
         self.ulid: ULID = ulid
         self.crypto: Crypto = crypto
+        self.password_hasher: PasswordHasher = password_hasher
+        self.feed_event_handler = feed_event_handler
 
     async def get_user_by_id(self, user_id: str) -> UserDTO:
         """Get User by id"""
@@ -52,6 +60,7 @@ class UserService:
             raise UserNotFoundError(f"{command.user_id} user not found")
 
         updated_at = datetime.now(timezone.utc)
+        renamed = False
 
         if command.name:
             new_name = Name(command.name)
@@ -59,11 +68,13 @@ class UserService:
                 new_name, command.user_id
             ):
                 raise ExistNameError("Username already exist")
+            renamed = user.name != new_name
             user.update_name(new_name, updated_at)
 
         if command.password:
             PasswordValidator.validate(command.password)
-            new_hashed_password: str = await asyncio.to_thread(
+            new_hashed_password: str = await self.password_hasher.run(
+                "hash",
                 self.crypto.encrypt,
                 command.password,
             )
@@ -73,6 +84,9 @@ class UserService:
             user.update_role(command.role, updated_at)
 
         await self.user_repo.update(user)
+        if renamed and self.feed_event_handler:
+            # 작성자 이름도 피드 검색 대상
+            await self.feed_event_handler.on_owner_renamed(user.id)
         return UserDTO.from_domain(user)
 
     async def get_users(self, query: UserQuery) -> UsersPageDTO:
@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Optional, Tuple
 
 # bcrypt 핸들러 로깅을 WARNING 이상만 표시하도록
 
@@ -8,9 +9,19 @@ logging.getLogger("passlib.handlers.bcrypt").setLevel(logging.WARNING)
 
 
 class Crypto:
-    def __init__(self) -> None:
+    def __init__(self, rounds: Optional[int] = None) -> None:
+        # rounds 를 지정하면 다른 cost 로 만들어진 해시는 needs update 로 판정된다
+        options: dict[str, Any] = (
+            {
+                "bcrypt__default_rounds": rounds,
+                "bcrypt__min_rounds": rounds,
+                "bcrypt__max_rounds": rounds,
+            }
+            if rounds
+            else {}
+        )
         self.password_context: CryptContext = CryptContext(
-            schemes=["bcrypt"], deprecated="auto"
+            schemes=["bcrypt"], deprecated="auto", **options
         )
 
     def encrypt(self, secret: str) -> str:
@@ -18,3 +29,7 @@ class Crypto:
 
     def verify(self, secret: str, hash: str) -> bool:
         return self.password_context.verify(secret, hash)
+
+    def verify_and_update(self, secret: str, hash: str) -> Tuple[bool, Optional[str]]:
+        """검증 결과와, cost 가 바뀐 경우 새 해시를 함께 반환"""
+        return self.password_context.verify_and_update(secret, hash)
@@ -0,0 +1,78 @@
+"""
+한글 자모 분해 유틸리티 (자동완성용).
+
+IME 입력 중간 상태("한ㄱ", "값" → "갑시")도 접두사로 매칭되도록
+완성형 음절을 호환 자모 시퀀스로 풀고, 겹모음/겹받침도 낱자로 분리한다.
+"""
+
+from typing import Dict
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 겹모음/겹받침 → 입력 순서대로의 낱자
+_COMPOUND_JAMO: Dict[str, str] = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+
+def _is_syllable(char: str) -> bool:
+    return _SYLLABLE_BASE <= ord(char) <= _SYLLABLE_LAST
+
+
+def has_hangul_syllable(text: str) -> bool:
+    """완성형 한글 음절 포함 여부"""
+    return any(_is_syllable(char) for char in text)
+
+
+def decompose(text: str) -> str:
+    """음절을 낱자 자모 시퀀스로 분해 ("과자" → "ㄱㅗㅏㅈㅏ"), 그 외 문자는 그대로"""
+    result = []
+    for char in text:
+        if _is_syllable(char):
+            code = ord(char) - _SYLLABLE_BASE
+            jong = code % _JONG_COUNT
+            jung = (code // _JONG_COUNT) % _JUNG_COUNT
+            cho = code // (_JONG_COUNT * _JUNG_COUNT)
+            result.append(CHOSEONG[cho])
+            result.append(_COMPOUND_JAMO.get(JUNGSEONG[jung], JUNGSEONG[jung]))
+            if jong:
+                result.append(_COMPOUND_JAMO.get(JONGSEONG[jong], JONGSEONG[jong]))
+        else:
+            result.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(result)
+
+
+def extract_choseong(text: str) -> str:
+    """음절의 초성만 추출 ("파이썬3" → "ㅍㅇㅆ3"), 그 외 문자는 그대로"""
+    return "".join(
+        (
+            CHOSEONG[(ord(char) - _SYLLABLE_BASE) // (_JONG_COUNT * _JUNG_COUNT)]
+            if _is_syllable(char)
+            else char
+        )
+        for char in text
+    )
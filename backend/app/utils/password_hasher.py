@@ -0,0 +1,87 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.common.monitoring.metrics import (
+    record_password_hash,
+    set_password_hash_active,
+    set_password_hash_queue_depth,
+)
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """bcrypt 전용 스레드 풀
+
+    기본 executor(asyncio.to_thread)와 분리해 해시 폭주가 다른 to_thread 작업을
+    막지 않도록 하고, 동시 실행 수를 max_workers 로 제한한다.
+    대기 중인 요청 수는 password_hash_queue_depth 로 노출된다.
+    bcrypt 는 해시 계산 중 GIL 을 놓으므로 프로세스 풀 없이 스레드로 충분하다.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiting = 0
+        self._active = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프가 바뀌면(테스트, 워커 재시작) 새 세마포어 사용
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._semaphore
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """func(*args) 를 전용 풀에서 실행 (operation: 메트릭 라벨, hash | verify)"""
+        semaphore = self._get_semaphore()
+
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        set_password_hash_queue_depth(self._waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+            set_password_hash_queue_depth(self._waiting)
+
+        started_at = time.perf_counter()
+        self._active += 1
+        set_password_hash_active(self._active)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._active -= 1
+            set_password_hash_active(self._active)
+            semaphore.release()
+            record_password_hash(
+                operation,
+                wait=started_at - queued_at,
+                duration=time.perf_counter() - started_at,
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(max_workers=get_settings().password_hash_workers)
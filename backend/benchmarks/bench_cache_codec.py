@@ -0,0 +1,228 @@
+"""
+Redis 캐시 값 크기/디코드 CPU 벤치마크 (feed:item, curriculum:detail)
+
+    - legacy : 필드 이름이 들어간 JSON dict + ISO 시각 (datetime.fromisoformat 로 복원)
+    - codec  : CacheCodec (버전 헤더 + 고정 순서 배열 + epoch 정수, 기준 이상 zlib)
+
+값 크기는 항상 재고, --redis-url 을 주면 실제 키를 써서 MEMORY USAGE 평균도 잰다.
+
+사용법:
+    python -m benchmarks.bench_cache_codec --items 1000 --repeat 200
+    python -m benchmarks.bench_cache_codec --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.common.cache.codec import CacheCodec
+from app.modules.curriculum.infrastructure.repository.curriculum_cache_codec import (
+    CurriculumDetailCodec,
+)
+from app.modules.feed.domain.entity.feed_item import FeedItem
+from app.modules.feed.infrastructure.repository.feed_cache_codec import FeedItemCodec
+
+WORDS = ["변수", "함수", "클래스", "모듈", "예외 처리", "비동기", "테스트", "배포"]
+NOW = datetime(2025, 8, 4, 9, 30)
+
+
+def build_feed_items(rng: random.Random, count: int) -> List[FeedItem]:
+    return [
+        FeedItem(
+            curriculum_id=f"01HKQJQJQJQJQJQJQJQJQ{i:05d}",
+            title=f"Python 학습 과정 {i}",
+            owner_id=f"01HKQJQJQJQJQJQJQJQJU{i % 500:05d}",
+            owner_name=f"사용자{i % 500}",
+            total_weeks=rng.randint(4, 12),
+            total_lessons=rng.randint(10, 40),
+            created_at=NOW - timedelta(days=i, microseconds=rng.randint(0, 10**6)),
+            updated_at=NOW - timedelta(hours=i, microseconds=rng.randint(0, 10**6)),
+            score=0.0,
+            category_name="프로그래밍",
+            category_color="#3366FF",
+            tags=rng.sample(WORDS, 3),
+            category_id=f"01HKQJQJQJQJQJQJQJQJC{i % 20:05d}",
+        )
+        for i in range(count)
+    ]
+
+
+def build_details(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "etag": f'"{rng.getrandbits(128):032x}"',
+            "curriculum": {
+                "id": f"01HKQJQJQJQJQJQJQJQJQ{i:05d}",
+                "owner_id": "01HKQJQJQJQJQJQJQJQJUSER",
+                "title": f"{weeks}주 Python 과정",
+                "visibility": "PUBLIC",
+                "created_at": (NOW - timedelta(days=i)).isoformat(),
+                "updated_at": (NOW - timedelta(hours=i)).isoformat(),
+                "week_schedules": [
+                    {"week_number": w, "lessons": rng.sample(WORDS, 5)}
+                    for w in range(1, weeks + 1)
+                ],
+            },
+        }
+        for i, weeks in enumerate(rng.choice([4, 12, 24]) for _ in range(count))
+    ]
+
+
+# 변경 전 FeedItem.to_dict / from_dict
+def legacy_feed_encode(item: FeedItem) -> bytes:
+    data = {
+        "curriculum_id": item.curriculum_id,
+        "title": item.title,
+        "owner_id": item.owner_id,
+        "owner_name": item.owner_name,
+        "total_weeks": item.total_weeks,
+        "total_lessons": item.total_lessons,
+        "created_at": item.created_at.isoformat(),
+        "updated_at": item.updated_at.isoformat(),
+        "category_name": item.category_name,
+        "category_color": item.category_color,
+        "tags": item.tags,
+    }
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def legacy_feed_decode(raw: bytes) -> FeedItem:
+    data = json.loads(raw)
+    return FeedItem(
+        curriculum_id=data["curriculum_id"],
+        title=data["title"],
+        owner_id=data["owner_id"],
+        owner_name=data["owner_name"],
+        total_weeks=data["total_weeks"],
+        total_lessons=data["total_lessons"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        score=0.0,
+        category_name=data.get("category_name"),
+        category_color=data.get("category_color"),
+        tags=data.get("tags", []),
+    )
+
+
+def legacy_detail_encode(detail: Dict[str, Any]) -> bytes:
+    return json.dumps(detail, ensure_ascii=False).encode()
+
+
+def legacy_detail_decode(raw: bytes) -> Dict[str, Any]:
+    return json.loads(raw)
+
+
+def decode_cost(
+    decode: Callable[[bytes], Any], values: List[bytes], repeat: int
+) -> float:
+    """값 하나 디코드의 CPU 시간(µs) 중앙값 (측정 중 GC 는 끔)"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        start = time.process_time_ns()
+        for raw in values:
+            decode(raw)
+        elapsed = time.process_time_ns() - start
+        gc.enable()
+        samples.append(elapsed / 1000 / len(values))
+    return statistics.median(samples)
+
+
+def memory_usage(redis_url: str, prefix: str, values: List[bytes]) -> float:
+    """실제 Redis 에 써 보고 MEMORY USAGE 평균 (키 포함, 끝나면 삭제)"""
+    import redis
+
+    client = redis.Redis.from_url(redis_url)
+    keys = [f"bench:{prefix}:{i}" for i in range(len(values))]
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, raw in zip(keys, values):
+            pipe.set(key, raw)
+        pipe.execute()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.memory_usage(key, samples=0)
+        return statistics.mean(pipe.execute())
+    finally:
+        client.delete(*keys)
+        client.close()
+
+
+def run_case(
+    title: str,
+    values: List[Any],
+    legacy: tuple,
+    codec: CacheCodec,
+    repeat: int,
+    redis_url: Optional[str],
+) -> None:
+    legacy_encode, legacy_decode = legacy
+    encoded = {
+        "legacy": [legacy_encode(v) for v in values],
+        "codec": [codec.encode(v) for v in values],
+    }
+    decoders = {"legacy": legacy_decode, "codec": codec.decode}
+    compressed = sum(raw[0] & 0x80 != 0 for raw in encoded["codec"])
+
+    print(f"\n{title} x{len(values)} (codec compressed: {compressed})")
+    header = f"{'path':<8}{'bytes/item':>12}{'decode µs':>12}"
+    print(header + (f"{'MEMORY USAGE':>14}" if redis_url else ""))
+    results = {}
+    for name, raws in encoded.items():
+        size = statistics.mean(len(raw) for raw in raws)
+        cost = decode_cost(decoders[name], raws, repeat)
+        row = f"{name:<8}{size:>12.1f}{cost:>12.2f}"
+        if redis_url:
+            row += f"{memory_usage(redis_url, name, raws):>14.1f}"
+        results[name] = (size, cost)
+        print(row)
+    (legacy_size, legacy_cost), (codec_size, codec_cost) = results.values()
+    print(
+        f"size: {codec_size / legacy_size:.0%} of legacy, "
+        f"decode: {legacy_cost / codec_cost:.2f}x faster"
+    )
+
+
+def main(items: int, repeat: int, redis_url: Optional[str]) -> None:
+    rng = random.Random(7)
+    feed_items = build_feed_items(rng, items)
+    details = build_details(rng, max(items // 10, 1))
+    feed_codec, detail_codec = FeedItemCodec(), CurriculumDetailCodec()
+
+    for item in feed_items[:10]:
+        restored = feed_codec.decode(feed_codec.encode(item))
+        assert restored is not None and restored.updated_at == item.updated_at
+    for detail in details[:10]:
+        assert detail_codec.decode(detail_codec.encode(detail)) == detail
+
+    run_case(
+        "feed:item",
+        feed_items,
+        (legacy_feed_encode, legacy_feed_decode),
+        feed_codec,
+        repeat,
+        redis_url,
+    )
+    run_case(
+        "curriculum:detail",
+        details,
+        (legacy_detail_encode, legacy_detail_decode),
+        detail_codec,
+        repeat,
+        redis_url,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="캐시 값 크기/디코드 벤치마크")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    main(args.items, args.repeat, args.redis_url)
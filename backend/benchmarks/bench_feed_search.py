@@ -0,0 +1,272 @@
+"""
+피드 검색 관련도/지연 벤치마크
+
+주제 키워드가 제목/태그/레슨 중 한 곳에만 들어간 커리큘럼을 시드하고,
+변경 전 검색(제목/작성자 LIKE)과 검색 색인(curriculum_search_documents)을 비교한다.
+
+    - legacy : title LIKE '%q%' OR users.name LIKE '%q%' (EXISTS), 최신순
+    - index  : build_search_condition (MySQL FULLTEXT ngram / 그 외 LIKE), 관련도순
+
+관련도는 주제 키워드를 어느 필드에든 가진 공개 커리큘럼을 정답으로 보고
+recall(전체 매칭), P@10, 상위 10개 중 제목 매칭 비율을 잰다.
+지연은 페이지 1(20건) ID 조회 + COUNT 의 중앙값/p95.
+SQLite 에서는 색인 경로도 LIKE 이므로 지연 비교는 MySQL(빈 스크래치 DB)에서 의미가 있다.
+
+사용법:
+    python -m benchmarks.bench_feed_search --curricula 5000 --repeat 20
+    python -m benchmarks.bench_feed_search --url mysql+aiomysql://u:p@host/scratch
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.common.db.database import Base
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.feed.infrastructure.db_model.curriculum_search import (
+    CurriculumSearchDocumentModel,
+)
+from app.modules.feed.infrastructure.repository.curriculum_search_repo import (
+    CurriculumSearchRepository,
+    build_search_condition,
+    parse_search_terms,
+)
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+TOPICS = [
+    "파이썬",
+    "자바스크립트",
+    "머신러닝",
+    "알고리즘",
+    "데이터베이스",
+    "react",
+    "docker",
+]
+FILLER = ["입문", "기초", "실전", "완성", "프로젝트", "스터디", "로드맵", "핵심"]
+QUERIES = ["파이썬", "머신러닝", "react", "docker", "데이터베이스 실전"]
+PAGE_SIZE = 20
+
+SearchFn = Callable[[AsyncSession, str], Awaitable[Tuple[int, List[str]]]]
+
+
+async def seed(session: AsyncSession, curricula: int) -> Dict[str, str]:
+    """시드 삽입, 공개 커리큘럼 ID → 검색 대상 텍스트(제목/태그/레슨/작성자) 반환"""
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    users = [
+        UserModel(  # type: ignore
+            id=f"user{i:04d}",
+            email=f"bench{i}@example.com",
+            name=f"작성자{i}",
+            password="hashed_password",
+            role=RoleVO.USER,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(max(curricula // 50, 1))
+    ]
+    tags = [
+        TagModel(  # type: ignore
+            id=f"tag{i:04d}",
+            name=name,
+            usage_count=0,
+            created_by=users[0].id,
+            created_at=now,
+            updated_at=now,
+        )
+        for i, name in enumerate(TOPICS + FILLER)
+    ]
+    session.add_all(users + tags)
+    await session.flush()
+
+    public_texts: Dict[str, str] = {}
+    curriculum_rows, children = [], []
+    for i in range(curricula):
+        curriculum_id = f"cur{i:06d}"
+        topic = rng.choice(TOPICS)
+        filler = rng.sample(FILLER, 2)
+        placement = rng.choice(["title", "tag", "lesson"])
+        is_public = i % 4 != 0
+        title = f"{topic} {filler[0]}" if placement == "title" else " ".join(filler)
+        lessons = [
+            f"{filler[1]} 개요",
+            f"{topic} 실습" if placement == "lesson" else "복습",
+        ]
+        tag_name = topic if placement == "tag" else filler[1]
+        owner = users[i % len(users)]
+        if is_public:
+            public_texts[curriculum_id] = " ".join(
+                [title, tag_name, owner.name, *lessons]
+            ).lower()
+        curriculum_rows.append(
+            CurriculumModel(  # type: ignore
+                id=curriculum_id,
+                user_id=owner.id,
+                title=title,
+                visibility="PUBLIC" if is_public else "PRIVATE",
+                created_at=now,
+                updated_at=now - timedelta(seconds=i),
+            )
+        )
+        children.append(
+            WeekScheduleModel(  # type: ignore
+                curriculum_id=curriculum_id, week_number=1, lessons=lessons
+            )
+        )
+        tag = next(t for t in tags if t.name == tag_name)
+        children.append(
+            CurriculumTagModel(  # type: ignore
+                id=f"{curriculum_id}_{tag.id}",
+                curriculum_id=curriculum_id,
+                tag_id=tag.id,
+                added_by=users[0].id,
+                created_at=now,
+            )
+        )
+    session.add_all(curriculum_rows)
+    await session.flush()
+    session.add_all(children)
+    await session.commit()
+    return public_texts
+
+
+async def legacy_search(session: AsyncSession, query: str) -> Tuple[int, List[str]]:
+    """변경 전 FeedRepository 검색 조건 (제목/작성자 LIKE)"""
+    term = f"%{query}%"
+    base = select(CurriculumModel.id).where(
+        CurriculumModel.visibility == "PUBLIC",
+        or_(
+            CurriculumModel.title.like(term),
+            CurriculumModel.user.has(UserModel.name.like(term)),
+        ),
+    )
+    total = await session.scalar(select(func.count()).select_from(base.subquery()))
+    ids = await session.scalars(
+        base.order_by(CurriculumModel.updated_at.desc()).limit(PAGE_SIZE)
+    )
+    return total or 0, list(ids.all())
+
+
+async def index_search(session: AsyncSession, query: str) -> Tuple[int, List[str]]:
+    """검색 색인 경로 (FeedRepository 와 같은 조건/정렬)"""
+    condition = build_search_condition(session.get_bind().dialect.name, query)
+    assert condition is not None
+    base = (
+        select(CurriculumModel.id)
+        .join(
+            CurriculumSearchDocumentModel,
+            CurriculumSearchDocumentModel.curriculum_id == CurriculumModel.id,
+        )
+        .where(CurriculumModel.visibility == "PUBLIC", condition.where)
+    )
+    total = await session.scalar(select(func.count()).select_from(base.subquery()))
+    ids = await session.scalars(
+        base.order_by(condition.score.desc(), CurriculumModel.updated_at.desc()).limit(
+            PAGE_SIZE
+        )
+    )
+    return total or 0, list(ids.all())
+
+
+async def evaluate(
+    session: AsyncSession,
+    search: SearchFn,
+    public_texts: Dict[str, str],
+    titles: Dict[str, str],
+    repeat: int,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    recalls, precisions, title_first = [], [], []
+    for query in QUERIES:
+        terms = parse_search_terms(query)
+        expected = {
+            cid
+            for cid, text in public_texts.items()
+            if all(term in text for term in terms)
+        }
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            total, ids = await search(session, query)
+            latencies.append(time.perf_counter() - start)
+
+        top = ids[:10]
+        recalls.append(min(total, len(expected)) / len(expected) if expected else 1.0)
+        precisions.append(len(set(top) & expected) / len(top) if top else 0.0)
+        title_first.append(
+            sum(1 for cid in top if terms[0] in titles[cid]) / len(top) if top else 0.0
+        )
+
+    latencies.sort()
+    return {
+        "recall": statistics.mean(recalls),
+        "p_at_10": statistics.mean(precisions),
+        "title_top10": statistics.mean(title_first),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main(url: str, curricula: int, repeat: int) -> None:
+    is_sqlite = url.startswith("sqlite")
+    engine = create_async_engine(
+        url,
+        poolclass=StaticPool if is_sqlite else None,  # type: ignore[arg-type]
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    async with session_factory() as session:
+        public_texts = await seed(session, curricula)
+        start = time.perf_counter()
+        indexed = await CurriculumSearchRepository(session).rebuild()
+        print(
+            f"{engine.dialect.name}: {curricula} curricula, indexed {indexed} "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        titles = dict(
+            (await session.execute(select(CurriculumModel.id, CurriculumModel.title)))
+            .tuples()
+            .all()
+        )
+
+        print(
+            f"{'scenario':8} {'recall':>7} {'P@10':>6} {'title@10':>9} "
+            f"{'median':>9} {'p95':>9}"
+        )
+        for name, search in (("legacy", legacy_search), ("index", index_search)):
+            r = await evaluate(session, search, public_texts, titles, repeat)
+            print(
+                f"{name:8} {r['recall']:7.2f} {r['p_at_10']:6.2f} "
+                f"{r['title_top10']:9.2f} {r['median_ms']:7.2f}ms {r['p95_ms']:7.2f}ms"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="피드 검색 관련도/지연 벤치마크")
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--curricula", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.curricula, args.repeat))
@@ -0,0 +1,216 @@
+"""
+DB 행 → 목록 응답 변환 CPU 비용 마이크로 벤치마크
+
+커리큘럼 목록 한 페이지(기본 50건)의 ORM 객체를 메모리에 만들어 두고
+저장소 _to_domain → CurriculumBriefDTO → CurriculumsPageResponse 변환만 반복한다.
+DB I/O 는 빼고 변환 자체의 항목당 비용을 비교한다.
+
+    - legacy  : 변경 전 구조 (VO/엔티티 생성자 검증 + pydantic 검증 생성)
+    - trusted : from_trusted/hydrate + model_construct
+    - +output : FastAPI response_model 출력 검증(model_dump → 재검증)까지 포함
+
+사용법:
+    python -m benchmarks.bench_hydration --items 50 --repeat 2000
+"""
+
+import argparse
+import gc
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+from app.common.db import database_models  # type: ignore # noqa: F401
+from app.modules.curriculum.application.dto.curriculum_dto import (
+    CurriculumBriefDTO,
+    CurriculumPageDTO,
+)
+from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.vo import (
+    Lesson,
+    Lessons,
+    Title,
+    Visibility,
+    WeekNumber,
+)
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
+    CurriculumRepository,
+)
+from app.modules.curriculum.interface.schema.curriculum_schema import (
+    CurriculumBriefResponse,
+    CurriculumsPageResponse,
+)
+
+WORDS = ["변수", "함수", "클래스", "모듈", "예외 처리", "비동기", "테스트", "배포"]
+
+
+def build_rows(items: int, seed: int = 7) -> List[CurriculumModel]:
+    rng = random.Random(seed)
+    now = datetime(2025, 8, 4, tzinfo=timezone.utc)
+    rows = []
+    for i in range(items):
+        model = CurriculumModel(  # type: ignore
+            id=f"01HKQJQJQJQJQJQJQJQJQ{i:04d}",
+            user_id="01HKQJQJQJQJQJQJQJQJUSER",
+            title=f"Python 학습 과정 {i}",
+            visibility="PUBLIC",
+            created_at=now - timedelta(days=i),
+            updated_at=now - timedelta(hours=i),
+        )
+        for week in range(1, rng.randint(4, 12) + 1):
+            model.week_schedules.append(
+                WeekScheduleModel(  # type: ignore
+                    week_number=week,
+                    lessons=rng.sample(WORDS, rng.randint(2, 5)),
+                )
+            )
+        rows.append(model)
+    return rows
+
+
+class LegacyLessons(Lessons):
+    """변경 전 Lessons: 레슨마다 Lesson VO 를 만들어 보관"""
+
+    def __init__(self, raw: List[str]) -> None:
+        lessons = [Lesson(item.strip()) for item in raw if item.strip()]
+        if not (self.MIN_COUNT <= len(lessons) <= self.MAX_COUNT):
+            raise ValueError("invalid lesson count")
+        self._items = tuple(lessons)  # type: ignore
+
+
+def legacy_to_domain(model: CurriculumModel) -> Curriculum:
+    """변경 전 CurriculumRepository._to_domain"""
+    return Curriculum(
+        id=model.id,
+        owner_id=model.user_id,
+        title=Title(model.title),
+        week_schedules=[
+            WeekSchedule(
+                week_number=WeekNumber(ws.week_number),
+                lessons=LegacyLessons(ws.lessons),
+            )
+            for ws in model.week_schedules
+        ],
+        visibility=Visibility(model.visibility),
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def legacy_response(rows: List[CurriculumModel]) -> CurriculumsPageResponse:
+    dtos = [CurriculumBriefDTO.from_domain(legacy_to_domain(m)) for m in rows]
+    return CurriculumsPageResponse(
+        total_count=len(dtos),
+        page=1,
+        items_per_page=len(dtos),
+        curriculums=[
+            CurriculumBriefResponse(
+                id=d.id,
+                owner_id=d.owner_id,
+                title=d.title,
+                visibility=d.visibility,
+                total_weeks=d.total_weeks,
+                total_lessons=d.total_lessons,
+                created_at=d.created_at,
+                updated_at=d.updated_at,
+            )
+            for d in dtos
+        ],
+    )
+
+
+def trusted_response(rows: List[CurriculumModel]) -> CurriculumsPageResponse:
+    repo = CurriculumRepository(session=None)  # type: ignore
+    curriculums = [repo._to_domain(m) for m in rows]
+    return CurriculumsPageResponse.from_dto(
+        CurriculumPageDTO.from_domain(
+            total_count=len(curriculums),
+            page=1,
+            items_per_page=len(curriculums),
+            curriculums=curriculums,
+        )
+    )
+
+
+def with_output_validation(
+    build: Callable[[List[CurriculumModel]], CurriculumsPageResponse],
+) -> Callable[[List[CurriculumModel]], CurriculumsPageResponse]:
+    """FastAPI serialize_response 와 같이 dump 후 response_model 로 재검증"""
+
+    def run(rows: List[CurriculumModel]) -> CurriculumsPageResponse:
+        return CurriculumsPageResponse.model_validate(
+            build(rows).model_dump(by_alias=True)
+        )
+
+    return run
+
+
+def measure(
+    paths: Dict[str, Callable[[List[CurriculumModel]], CurriculumsPageResponse]],
+    rows: List[CurriculumModel],
+    repeat: int,
+    batch: int = 20,
+) -> Dict[str, List[float]]:
+    """
+    경로별 항목당 CPU 시간(µs) 표본. 표본 하나는 페이지 변환 batch 회의 평균이고,
+    경로를 번갈아 돌려 같은 시점의 잡음을 공유하게 하고, timeit 처럼 측정 중 GC 는 끈다.
+    """
+    for fn in paths.values():
+        for _ in range(batch):
+            fn(rows)
+    samples: Dict[str, List[float]] = {name: [] for name in paths}
+    for _ in range(max(repeat // batch, 1)):
+        for name, fn in paths.items():
+            gc.collect()
+            gc.disable()
+            start = time.process_time_ns()
+            for _ in range(batch):
+                fn(rows)
+            elapsed = time.process_time_ns() - start
+            gc.enable()
+            samples[name].append(elapsed / 1000 / batch / len(rows))
+    return samples
+
+
+def main(items: int, repeat: int) -> None:
+    rows = build_rows(items)
+    assert legacy_response(rows) == trusted_response(rows)
+
+    lessons = sum(len(ws.lessons) for m in rows for ws in m.week_schedules)
+    print(f"{items} curricula / {lessons} lessons, {repeat} runs (CPU µs per item)")
+    print(f"{'path':<18}{'median':>10}{'p95':>10}")
+    samples = measure(
+        {
+            "legacy": legacy_response,
+            "trusted": trusted_response,
+            "legacy+output": with_output_validation(legacy_response),
+            "trusted+output": with_output_validation(trusted_response),
+        },
+        rows,
+        repeat,
+    )
+    results = {}
+    for name, values in samples.items():
+        values.sort()
+        results[name] = statistics.median(values)
+        p95 = values[max(int(len(values) * 0.95) - 1, 0)]
+        print(f"{name:<18}{results[name]:>10.1f}{p95:>10.1f}")
+
+    for suffix in ("", "+output"):
+        before = results["legacy" + suffix]
+        after = results["trusted" + suffix]
+        print(f"speedup{suffix or ' (convert)'}: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 응답 변환 CPU 벤치마크")
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
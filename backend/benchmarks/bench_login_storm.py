@@ -0,0 +1,91 @@
+"""
+로그인 폭주 시 이벤트 루프 지연 측정
+
+동시에 N 건의 bcrypt verify 를 실행하면서, 10ms 간격으로 깨어나는 ticker 코루틴의
+지연(예정 시각 대비 실제 시각)을 수집한다. 루프가 막히면 지연이 커진다.
+
+    - inline      : 변경 전 AuthService.login (루프에서 직접 verify)
+    - to_thread   : 기본 executor (asyncio.to_thread)
+    - hasher      : 전용 bounded 풀 (PasswordHasher)
+
+사용법:
+    python -m benchmarks.bench_login_storm --logins 50 --rounds 12 --workers 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from app.utils.crypto import Crypto
+from app.utils.password_hasher import PasswordHasher
+
+TICK_INTERVAL = 0.01
+
+
+async def _ticker(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def storm(verify: Callable[[], Awaitable[bool]], logins: int) -> dict:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(TICK_INTERVAL * 2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    assert all(results)
+    lags.sort()
+    return {
+        "elapsed": elapsed,
+        "max_lag": lags[-1] if lags else 0.0,
+        "p99_lag": lags[int(len(lags) * 0.99) - 1] if lags else 0.0,
+        "median_lag": statistics.median(lags) if lags else 0.0,
+    }
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    crypto = Crypto(rounds=rounds)
+    hashed = crypto.encrypt("Password123!")
+    hasher = PasswordHasher(max_workers=workers)
+
+    async def inline() -> bool:
+        return crypto.verify("Password123!", hashed)
+
+    async def to_thread() -> bool:
+        return await asyncio.to_thread(crypto.verify, "Password123!", hashed)
+
+    async def bounded() -> bool:
+        return await hasher.run("verify", crypto.verify, "Password123!", hashed)
+
+    print(f"{logins} concurrent logins, bcrypt rounds={rounds}, workers={workers}")
+    print(f"{'scenario':12} {'elapsed':>9} {'max lag':>9} {'p99 lag':>9} {'median':>9}")
+    for name, verify in (
+        ("inline", inline),
+        ("to_thread", to_thread),
+        ("hasher", bounded),
+    ):
+        r = await storm(verify, logins)
+        print(
+            f"{name:12} {r['elapsed'] * 1000:7.0f}ms {r['max_lag'] * 1000:7.1f}ms "
+            f"{r['p99_lag'] * 1000:7.1f}ms {r['median_lag'] * 1000:7.1f}ms"
+        )
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 폭주 이벤트 루프 지연 측정")
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers))
@@ -0,0 +1,120 @@
+"""
+미들웨어 요청당 오버헤드 마이크로 벤치마크
+
+BaseHTTPMiddleware 방식(이전 ActivityTrackingMiddleware 와 동일한 구조)과
+pure ASGI 미들웨어를 같은 FastAPI 앱에 얹어 ASGI 호출을 직접 반복한다.
+네트워크/서버 비용을 빼고 미들웨어 자체 비용만 비교한다.
+
+사용법:
+    python -m benchmarks.bench_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, List, Tuple
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.common.middleware.activity_middleware import ActivityTrackingMiddleware
+from app.common.middleware.timing_middleware import RequestTimingMiddleware
+from app.core.auth import decode_access_token
+
+
+class LegacyActivityMiddleware(BaseHTTPMiddleware):
+    """변경 전 구조: call_next 이후 요청 안에서 활동 추적을 await"""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        auth_header = request.headers.get("authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            payload = decode_access_token(auth_header[7:])
+            tracker = ActivityTrackingMiddleware(self.app)
+            await tracker._track_user_activity(payload["sub"])
+        return response
+
+
+def build_app(configure: Callable[[FastAPI], None]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"item_id": item_id}
+
+    configure(app)
+    return app
+
+
+SCENARIOS: List[Tuple[str, Callable[[FastAPI], None]]] = [
+    ("no middleware", lambda app: None),
+    (
+        "BaseHTTPMiddleware (before)",
+        lambda app: app.add_middleware(LegacyActivityMiddleware),
+    ),
+    (
+        "pure ASGI activity (after)",
+        lambda app: app.add_middleware(ActivityTrackingMiddleware),
+    ),
+    (
+        "pure ASGI activity + timing (after)",
+        lambda app: (
+            app.add_middleware(ActivityTrackingMiddleware),
+            app.add_middleware(RequestTimingMiddleware),
+        ),
+    ),
+]
+
+
+async def _call(app: FastAPI) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        return None
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, requests: int, rounds: int = 3) -> float:
+    """요청당 평균 소요 시간 (µs, 여러 회차 중 최솟값)"""
+    for _ in range(1000):  # warm-up
+        await _call(app)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(requests):
+            await _call(app)
+        best = min(best, (time.perf_counter() - start) / requests * 1_000_000)
+    return best
+
+
+async def main(requests: int) -> None:
+    baseline = None
+    print(f"{'scenario':40} {'µs/req':>10} {'overhead':>10}")
+    for name, configure in SCENARIOS:
+        per_request = await measure(build_app(configure), requests)
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:40} {per_request:10.1f} {per_request - baseline:+10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미들웨어 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
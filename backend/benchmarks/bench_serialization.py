@@ -0,0 +1,251 @@
+"""
+응답/캐시 직렬화 CPU 마이크로 벤치마크
+
+가장 큰 응답 세 가지(피드 한 페이지, 커리큘럼 상세, 학습 통계)의 DTO 를 메모리에
+만들어 두고, DTO → HTTP 본문 bytes 변환만 반복한다. DB/네트워크는 제외한다.
+
+    - fastapi : 응답 모델 반환 → FastAPI serialize_response (dump → 재검증 →
+                JSON 모드 변환) → 표준 json 으로 JSONResponse 렌더
+    - direct  : FastJSONResponse 직접 반환 (pydantic-core 한 번, 상세는 DTO 를 코덱으로)
+
+Redis 캐시 값(피드 아이템 dict)의 표준 json 대비 코덱 인코드+디코드 비용도 함께 잰다.
+
+사용법:
+    python -m benchmarks.bench_serialization --repeat 2000
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.common.serialization.codec import json_codec
+from app.common.serialization.response import FastJSONResponse
+from app.modules.curriculum.application.dto.curriculum_dto import (
+    CurriculumDTO,
+    WeekScheduleDTO,
+)
+from app.modules.curriculum.interface.schema.curriculum_schema import (
+    CurriculumResponse,
+)
+from app.modules.feed.application.dto.feed_dto import FeedItemDTO, FeedPageDTO
+from app.modules.feed.interface.schema.feed_schema import FeedPageResponse
+from app.modules.learning.application.dto.learning_stats_dto import (
+    CurriculumProgressDTO,
+    LearningStreakDTO,
+    MonthlyProgressDTO,
+    RecentActivityDTO,
+    ScoreDistributionDTO,
+    UserLearningStatsDTO,
+)
+from app.modules.learning.interface.schema.learning_stats_schema import (
+    UserLearningStatsResponse,
+)
+
+WORDS = ["변수", "함수", "클래스", "모듈", "예외 처리", "비동기", "테스트", "배포"]
+NOW = datetime(2025, 8, 4, tzinfo=timezone.utc)
+
+
+def build_feed(rng: random.Random, items: int = 50) -> FeedPageDTO:
+    return FeedPageDTO(
+        total_count=1000,
+        page=1,
+        items_per_page=items,
+        has_next=True,
+        items=[
+            FeedItemDTO(
+                curriculum_id=f"01HKQJQJQJQJQJQJQJQJQ{i:04d}",
+                title=f"Python 학습 과정 {i}",
+                owner_id="01HKQJQJQJQJQJQJQJQJUSER",
+                owner_name=f"사용자{i}",
+                total_weeks=rng.randint(4, 12),
+                total_lessons=rng.randint(10, 40),
+                created_at=NOW - timedelta(days=i),
+                updated_at=NOW - timedelta(hours=i),
+                category_name="프로그래밍",
+                category_color="#3366FF",
+                tags=rng.sample(WORDS, 3),
+            )
+            for i in range(items)
+        ],
+    )
+
+
+def build_detail(rng: random.Random, weeks: int = 24) -> CurriculumDTO:
+    return CurriculumDTO(
+        id="01HKQJQJQJQJQJQJQJQJQJ",
+        owner_id="01HKQJQJQJQJQJQJQJQJUSER",
+        title="24주 Python 과정",
+        visibility="PUBLIC",
+        created_at=NOW,
+        updated_at=NOW,
+        week_schedules=[
+            WeekScheduleDTO(week_number=w, lessons=rng.sample(WORDS, 5))
+            for w in range(1, weeks + 1)
+        ],
+    )
+
+
+def build_stats(rng: random.Random) -> UserLearningStatsDTO:
+    return UserLearningStatsDTO(
+        user_id="01HKQJQJQJQJQJQJQJQJUSER",
+        stats_period_days=365,
+        total_summaries=240,
+        total_feedbacks=180,
+        active_curriculums=12,
+        completed_curriculums=4,
+        learning_streak=LearningStreakDTO(5, 21, 140),
+        score_distribution=ScoreDistributionDTO(
+            grade_counts={"A+": 20, "A": 40, "B": 60, "C": 40, "D": 20},
+            average_score=7.8,
+            highest_score=10.0,
+            lowest_score=3.5,
+            total_feedbacks=180,
+        ),
+        curriculum_progress=[
+            CurriculumProgressDTO(
+                curriculum_id=f"c{i}",
+                curriculum_title=f"커리큘럼 {i}",
+                total_weeks=12,
+                completed_summaries=rng.randint(0, 12),
+                received_feedbacks=rng.randint(0, 12),
+                completion_rate=rng.uniform(0, 100),
+                feedback_rate=rng.uniform(0, 100),
+                average_score=rng.uniform(0, 10),
+                latest_activity=NOW - timedelta(days=i),
+            )
+            for i in range(12)
+        ],
+        recent_activities=[
+            RecentActivityDTO(
+                type="summary" if i % 2 else "feedback",
+                curriculum_title=f"커리큘럼 {i % 12}",
+                week_number=i % 12 + 1,
+                content_snippet="오늘은 비동기 프로그래밍의 이벤트 루프를 공부했다" * 2,
+                score=rng.uniform(0, 10),
+                created_at=NOW - timedelta(hours=i),
+            )
+            for i in range(20)
+        ],
+        monthly_progress=[
+            MonthlyProgressDTO(f"2025-{m:02d}", 20, 15, 7.5) for m in range(1, 13)
+        ],
+        weekly_goal_achievement=66.7,
+        generated_at=NOW,
+    )
+
+
+def fastapi_path(response_model: type) -> Callable[[Any], bytes]:
+    """응답 모델을 반환했을 때 FastAPI 가 하는 일 (routing.serialize_response)"""
+    field = create_model_field(
+        name="Response", type_=response_model, mode="serialization"
+    )
+
+    def run(model: Any) -> bytes:
+        coro = serialize_response(field=field, response_content=model)
+        try:
+            coro.send(None)
+        except StopIteration as done:
+            return JSONResponse(done.value).body
+        raise RuntimeError("serialize_response awaited unexpectedly")
+
+    return run
+
+
+def measure(
+    paths: Dict[str, Callable[[], Any]], repeat: int, batch: int = 20
+) -> Dict[str, List[float]]:
+    """경로별 호출당 CPU 시간(µs) 표본 (경로를 번갈아 돌리고 측정 중 GC 는 끔)"""
+    for fn in paths.values():
+        for _ in range(batch):
+            fn()
+    samples: Dict[str, List[float]] = {name: [] for name in paths}
+    for _ in range(max(repeat // batch, 1)):
+        for name, fn in paths.items():
+            gc.collect()
+            gc.disable()
+            start = time.process_time_ns()
+            for _ in range(batch):
+                fn()
+            elapsed = time.process_time_ns() - start
+            gc.enable()
+            samples[name].append(elapsed / 1000 / batch)
+    return samples
+
+
+def report(title: str, samples: Dict[str, List[float]], size: int) -> None:
+    print(f"\n{title} ({size} bytes, CPU µs per call)")
+    print(f"{'path':<10}{'median':>10}{'p95':>10}")
+    medians = []
+    for name, values in samples.items():
+        values.sort()
+        medians.append(statistics.median(values))
+        p95 = values[max(int(len(values) * 0.95) - 1, 0)]
+        print(f"{name:<10}{medians[-1]:>10.1f}{p95:>10.1f}")
+    print(f"speedup: {medians[0] / medians[1]:.2f}x")
+
+
+def main(repeat: int) -> None:
+    rng = random.Random(7)
+    feed, detail, stats = build_feed(rng), build_detail(rng), build_stats(rng)
+    feed_fastapi = fastapi_path(FeedPageResponse)
+    detail_fastapi = fastapi_path(CurriculumResponse)
+    stats_fastapi = fastapi_path(UserLearningStatsResponse)
+    cases = {
+        "feed page": (
+            lambda: feed_fastapi(FeedPageResponse.from_dto(feed)),
+            lambda: FastJSONResponse(FeedPageResponse.from_dto(feed)).body,
+        ),
+        "curriculum detail": (
+            lambda: detail_fastapi(CurriculumResponse.from_dto(detail)),
+            lambda: FastJSONResponse(detail).body,
+        ),
+        "learning stats": (
+            lambda: stats_fastapi(UserLearningStatsResponse.from_dto(stats)),
+            lambda: FastJSONResponse(UserLearningStatsResponse.from_dto(stats)).body,
+        ),
+    }
+    print(f"codec: {json_codec.name}, {repeat} runs")
+    for title, (before, after) in cases.items():
+        assert json.loads(before()) == json.loads(after()), title
+        samples = measure({"fastapi": before, "direct": after}, repeat)
+        report(title, samples, len(after()))
+
+    # FeedRepository 가 Redis 에 저장하는 FeedItem.to_dict() 형태
+    cached = [
+        {
+            **vars(item),
+            "created_at": item.created_at.isoformat(),
+            "updated_at": item.updated_at.isoformat(),
+        }
+        for item in feed.items
+    ]
+
+    def stdlib_cache() -> None:
+        for value in cached:
+            json.loads(json.dumps(value, ensure_ascii=False))
+
+    def codec_cache() -> None:
+        for value in cached:
+            json_codec.loads(json_codec.dumps(value))
+
+    report(
+        f"redis feed items x{len(cached)} (encode+decode)",
+        measure({"json": stdlib_cache, "codec": codec_cache}, repeat),
+        sum(len(json_codec.dumps(v)) for v in cached),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답/캐시 직렬화 CPU 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.repeat)
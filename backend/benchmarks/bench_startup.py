@@ -0,0 +1,98 @@
+"""
+API 프로세스 시작 벤치마크 (time-to-first-request / 워커 기본 RSS)
+
+매 회 새 파이썬 프로세스를 띄워 app.main 을 import 하고, ASGI 로 GET /health 를
+한 번 보낸 시점까지의 시간(프로세스 생성부터)과 그때의 RSS 를 잰다.
+lifespan(DB/Redis 연결)은 실행하지 않으므로 외부 서비스 없이 재현된다.
+
+    - lazy  : 현재 구성 (LLM 클라이언트는 첫 생성 요청 때 import)
+    - eager : 시작 시 LLM 클라이언트까지 만든 경우 (지연 로딩 이전과 같은 비용)
+
+모듈별 내역은 python -m app.core.startup_profile 로 본다.
+
+사용법:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+CHILD = """
+import asyncio, json, os, sys, time
+
+import app.main
+from app.core.startup_profile import current_rss
+
+imported = time.time()
+if sys.argv[1] == "eager":
+    asyncio.run(app.main.app.container.llm_client().resolve())
+
+import httpx
+
+
+async def first_request() -> int:
+    transport = httpx.ASGITransport(app=app.main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+        return (await c.get("/health")).status_code
+
+
+status = asyncio.run(first_request())
+started = float(os.environ["BENCH_STARTED"])
+print(json.dumps({
+    "status": status,
+    "import_s": imported - started,
+    "first_request_s": time.time() - started,
+    "rss": current_rss(),
+}))
+"""
+
+
+def run_once(mode: str) -> Dict[str, float]:
+    env = dict(os.environ)
+    # eager 모드에서 ChatOpenAI 생성이 키 검증으로 실패하지 않도록
+    env.setdefault("LLM_API_KEY", "sk-bench")
+    env["BENCH_STARTED"] = repr(time.time())
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    assert result["status"] == 200, result
+    return result
+
+
+def report(mode: str, runs: List[Dict[str, float]]) -> None:
+    def median(key: str) -> float:
+        return statistics.median(run[key] for run in runs)
+
+    print(
+        f"{mode:6} import {median('import_s') * 1000:7.0f} ms  "
+        f"first request {median('first_request_s') * 1000:7.0f} ms  "
+        f"RSS {median('rss') / 1024 / 1024:6.1f} MB"
+    )
+
+
+def main(repeat: int, modes: List[str]) -> None:
+    print(f"{repeat} runs per mode (median)")
+    for mode in modes:
+        run_once(mode)  # .pyc 생성/파일 캐시 워밍업
+        report(mode, [run_once(mode) for _ in range(repeat)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API 프로세스 시작 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--mode", choices=["lazy", "eager"], action="append", dest="modes"
+    )
+    args = parser.parse_args()
+    main(args.repeat, args.modes or ["lazy", "eager"])
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from typing import Any, List
+
+import pytest
+
+from app.common.cache.codec import (
+    COMPRESSED,
+    CacheCodec,
+    from_epoch_us,
+    to_epoch_us,
+)
+
+
+class _PairCodec(CacheCodec[tuple]):
+    VERSION = 3
+
+    def to_fields(self, value: tuple) -> List[Any]:
+        return list(value)
+
+    def from_fields(self, fields: List[Any]) -> tuple:
+        return tuple(fields)
+
+
+class TestCacheCodec:
+    def test_header_byte_carries_version(self) -> None:
+        raw = _PairCodec().encode(("a", 1))
+
+        assert raw == b'\x03["a",1]'
+        assert _PairCodec().decode(raw) == ("a", 1)
+
+    def test_large_values_are_compressed(self) -> None:
+        codec = _PairCodec(compress_threshold=64)
+        value = ("레슨 " * 100, 1)
+
+        raw = codec.encode(value)
+
+        assert raw[0] == 3 | COMPRESSED
+        assert len(raw) < len(_PairCodec(compress_threshold=0).encode(value))
+        assert codec.decode(raw) == value
+
+    @pytest.mark.parametrize(
+        "raw",
+        [None, b"", b'{"title": "legacy json"}', b'\x02["a",1]', b"\x03[broken"],
+        ids=["missing", "empty", "legacy-json", "other-version", "corrupt"],
+    )
+    def test_unreadable_values_are_cache_misses(self, raw) -> None:
+        assert _PairCodec().decode(raw) is None
+
+
+class TestEpochTimestamps:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2025, 8, 4, 9, 30, 15, 123456),
+            datetime(2025, 8, 4, tzinfo=timezone.utc),
+            datetime(1969, 12, 31, 23, 59, 59, 999999),
+        ],
+    )
+    def test_round_trip_keeps_isoformat(self, value: datetime) -> None:
+        restored = from_epoch_us(to_epoch_us(value), value.tzinfo is not None)
+
+        assert restored.isoformat() == value.isoformat()
@@ -0,0 +1,23 @@
+import pytest
+
+from app.common.cache.namespaces import OTHER, namespace_of
+
+
+@pytest.mark.parametrize(
+    "key, namespace",
+    [
+        ("feed:item:01HKQJ", "feed:item"),
+        ("feed:public_curriculums", "feed"),
+        (b"curriculum:detail:01HKQJ", "curriculum:detail"),
+        ("timeline:user:u1:celebs", "timeline"),
+        ("refdata:categories:version", "refdata:categories"),
+        ("refdata:categories:3", "refdata:categories"),
+        ("refdata:invalidate", "refdata"),
+        ("active_user:u1", "active_user"),
+        ("unknown:key", OTHER),
+        ("plain", OTHER),
+        (123, OTHER),
+    ],
+)
+def test_namespace_of(key, namespace) -> None:
+    assert namespace_of(key) == namespace
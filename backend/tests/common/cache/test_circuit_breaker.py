@@ -0,0 +1,149 @@
+import asyncio
+from typing import List
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.common.cache import circuit_breaker as breaker_module
+from app.common.cache.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from app.common.cache.redis_client import RedisClient, _GuardedRedis
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(breaker_module.time, "monotonic", clock)
+    return clock
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock: _Clock) -> None:
+        transitions: List[str] = []
+        breaker = CircuitBreaker(
+            "test",
+            failure_threshold=3,
+            cooldown=10,
+            on_state_change=lambda name, state: transitions.append(state),
+        )
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert not breaker.allow()
+        assert transitions == [OPEN]
+
+    def test_half_open_after_cooldown(self, clock: _Clock) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+
+        clock.now += 9.9
+        assert breaker.state == OPEN
+        clock.now += 0.1
+        assert breaker.state == HALF_OPEN
+
+        # 반개방 상태의 실패는 바로 다시 연다
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        clock.now += 10
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_half_open_lets_one_probe_through(self, clock: _Clock) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+        clock.now += 10
+
+        assert breaker.allow()
+        # 탐색 결과가 나오기 전 다른 요청은 건너뜀
+        assert not breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        clock.now += 10
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.allow() and breaker.allow()
+
+    def test_unanswered_probe_is_handed_over_after_cooldown(
+        self, clock: _Clock
+    ) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow()
+
+        clock.now += 9
+        assert not breaker.allow()
+        clock.now += 1
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_probe_task_keeps_access(self, clock: _Clock) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+        clock.now += 10
+
+        assert breaker.allow()
+        assert breaker.allow()
+        assert not await asyncio.create_task(_allow(breaker))
+
+
+async def _allow(breaker: CircuitBreaker) -> bool:
+    return breaker.allow()
+
+
+class TestRedisClientBreaker:
+    def test_clients_are_hidden_while_open(self, clock: _Clock) -> None:
+        client = RedisClient(CircuitBreaker("test", failure_threshold=1, cooldown=5))
+        assert client.redis is None and not client.circuit_open
+
+        client._redis = client._binary = object()  # type: ignore[assignment]
+        assert client.redis is not None
+
+        client.breaker.record_failure()
+        assert client.redis is None and client.binary is None
+        assert client.circuit_open
+
+        clock.now += 5
+        assert client.redis is not None
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_recorded(self) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=2, cooldown=60)
+        redis = _GuardedRedis.from_url(
+            "redis://127.0.0.1:1/0", socket_connect_timeout=0.2
+        )
+        redis.breaker = breaker
+        try:
+            for _ in range(2):
+                with pytest.raises(RedisConnectionError):
+                    await redis.get("key")
+            with pytest.raises(RedisConnectionError):
+                await redis.pipeline().set("key", "1").execute()
+        finally:
+            await redis.aclose()
+
+        assert breaker.state == OPEN
@@ -0,0 +1,36 @@
+from typing import Any
+
+from prometheus_client import REGISTRY
+
+from app.common.cache.redis_client import _record_lookup
+
+
+def _count(namespace: str, result: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "cache_requests_total",
+        {"namespace": namespace, "tier": "redis", "result": result},
+    )
+    return value or 0.0
+
+
+def _lookup(command: str, result: Any) -> tuple:
+    before = (_count("feed:item", "hit"), _count("feed:item", "miss"))
+    _record_lookup("feed:item", command, result)
+    after = (_count("feed:item", "hit"), _count("feed:item", "miss"))
+    return after[0] - before[0], after[1] - before[1]
+
+
+class TestRecordLookup:
+    def test_single_key_reads(self) -> None:
+        assert _lookup("GET", b"value") == (1, 0)
+        assert _lookup("GET", None) == (0, 1)
+
+    def test_multi_key_reads_count_each_key(self) -> None:
+        assert _lookup("MGET", [b"a", None, b"c"]) == (2, 1)
+
+    def test_collection_reads(self) -> None:
+        assert _lookup("ZREVRANGE", []) == (0, 1)
+        assert _lookup("EXISTS", 1) == (1, 0)
+
+    def test_writes_are_not_lookups(self) -> None:
+        assert _lookup("SET", True) == (0, 0)
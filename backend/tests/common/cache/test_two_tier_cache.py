@@ -0,0 +1,224 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.common.cache.codec import CacheCodec
+from app.common.cache.reference_data import ReferenceDataCache
+from app.common.cache.two_tier import (
+    INVALIDATION_CHANNEL,
+    TOMBSTONE,
+    LocalCache,
+    TwoTierCacheRegistry,
+)
+from app.common.serialization.codec import json_codec
+
+
+class _TextCodec(CacheCodec[str]):
+    def to_fields(self, value: str) -> List[Any]:
+        return [value]
+
+    def from_fields(self, fields: List[Any]) -> str:
+        return fields[0]
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self.redis = redis
+        self.ops: List[tuple] = []
+
+    def set(
+        self, key: str, value: bytes, ex: Optional[int] = None, nx: bool = False
+    ) -> None:
+        self.ops.append((key, value, nx))
+
+    async def execute(self) -> List[Optional[bool]]:
+        results: List[Optional[bool]] = []
+        for key, value, nx in self.ops:
+            if nx and key in self.redis.data:
+                results.append(None)
+                continue
+            self.redis.data[key] = value
+            results.append(True)
+        return results
+
+
+class _FakeRedis:
+    """여러 워커가 공유하는 Redis (mget/pipeline/delete/publish/get 만)"""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.published: List[tuple] = []
+        self.mget_calls = 0
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Any]:
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        self.published.append((channel, message))
+        return 1
+
+
+class _FakeClient:
+    def __init__(self, redis: Optional[_FakeRedis]) -> None:
+        self.redis = redis
+        self.binary = redis
+        self.circuit_open = False
+
+
+def _worker(redis: Optional[_FakeRedis], **kwargs: Any) -> TwoTierCacheRegistry:
+    return TwoTierCacheRegistry(_FakeClient(redis), **kwargs)  # type: ignore
+
+
+class TestLocalCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LocalCache[str] = LocalCache(max_size=2, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+
+        assert cache.set("c", "3") == 1
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+    def test_stale_entries_only_for_allow_stale(self) -> None:
+        cache: LocalCache[str] = LocalCache(max_size=10, ttl=0, stale_ttl=60)
+        cache.set("a", "1")
+
+        assert cache.get("a") is None
+        assert cache.get("a", allow_stale=True) == "1"
+
+    def test_expired_entries_are_misses(self) -> None:
+        cache: LocalCache[str] = LocalCache(max_size=10, ttl=0)
+        cache.set("a", "1")
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestTwoTierCache:
+    @pytest.mark.asyncio
+    async def test_l1_miss_reads_l2_once_and_fills_l1(self) -> None:
+        redis = _FakeRedis()
+        writer = _worker(redis).register("ns", _TextCodec())
+        reader = _worker(redis).register("ns", _TextCodec())
+        await writer.set_many({"a": "A", "b": "B"})
+
+        assert await reader.get_many(["a", "b", "c"]) == {"a": "A", "b": "B"}
+        assert redis.mget_calls == 1
+
+        assert await reader.get_many(["a", "b"]) == {"a": "A", "b": "B"}
+        assert redis.mget_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_l1_on_other_workers(self) -> None:
+        redis = _FakeRedis()
+        first, second = _worker(redis), _worker(redis)
+        cache_1 = first.register("ns", _TextCodec())
+        cache_2 = second.register("ns", _TextCodec())
+        await cache_1.set("a", "old")
+        assert await cache_2.get("a") == "old"
+
+        await cache_1.invalidate(["a"])
+        redis.data.pop("ns:a")  # 툼스톤 만료
+        await cache_1.set("a", "new")
+        # 아직 메시지를 받지 못한 워커는 L1 값을 그대로 사용
+        assert await cache_2.get("a") == "old"
+
+        channel, message = redis.published[0]
+        assert channel == INVALIDATION_CHANNEL
+        first.handle_message(message)  # 자기 메시지는 무시
+        second.handle_message(message)
+        assert await cache_1.get("a") == "new"
+        assert await cache_2.get("a") == "new"
+
+    @pytest.mark.asyncio
+    async def test_fill_read_before_invalidate_is_not_stored(self) -> None:
+        redis = _FakeRedis()
+        reader, writer = _worker(redis), _worker(redis)
+        reader_cache = reader.register("ns", _TextCodec())
+        writer_cache = writer.register("ns", _TextCodec())
+        await writer_cache.set("a", "old")
+
+        # reader 가 원본에서 old 를 읽은 뒤 writer 의 수정/무효화가 먼저 끝남
+        await writer_cache.invalidate(["a"])
+        await reader_cache.set("a", "old")
+
+        assert redis.data["ns:a"] == TOMBSTONE
+        assert await reader_cache.get("a") is None
+        assert await writer_cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_namespace_size_limit_from_settings(self) -> None:
+        registry = _worker(_FakeRedis(), l1_sizes={"small": 1})
+        small = registry.register("small", _TextCodec(), l1_size=100)
+        default = registry.register("other", _TextCodec())
+
+        await small.set_many({"a": "A", "b": "B"})
+        await default.set_many({"a": "A", "b": "B"})
+
+        assert (len(small.local), len(default.local)) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_l1_while_circuit_is_open(self) -> None:
+        redis = _FakeRedis()
+        registry = _worker(redis, default_l1_ttl=0, l1_stale_ttl=60)
+        cache = registry.register("ns", _TextCodec())
+        await cache.set("a", "A")
+        assert await cache.get("a") == "A"  # L1 만료 → L2
+        assert redis.mget_calls == 1
+
+        registry.client.circuit_open = True  # type: ignore[attr-defined]
+        assert await cache.get_many(["a", "b"]) == {"a": "A"}
+        assert redis.mget_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_works_without_redis(self) -> None:
+        cache = _worker(None).register("ns", _TextCodec())
+
+        assert await cache.get("a") is None
+        await cache.set("a", "A")
+        assert await cache.get("a") == "A"
+        await cache.invalidate(["a"])
+        assert await cache.get("a") is None
+
+    def test_ignores_malformed_messages(self) -> None:
+        registry = _worker(_FakeRedis())
+        registry.register("ns", _TextCodec())
+
+        registry.handle_message("not json")
+        registry.handle_message(json_codec.dumps({"s": "x", "n": "unknown", "k": []}))
+
+
+class TestReferenceDataSharedSnapshot:
+    @pytest.mark.asyncio
+    async def test_only_first_worker_runs_loader_per_version(self) -> None:
+        redis = _FakeRedis()
+        redis.data["refdata:items:version"] = "3"
+        loads: List[str] = []
+
+        async def loader() -> str:
+            loads.append("load")
+            return "snapshot-v3"
+
+        for _ in range(2):
+            client = _FakeClient(redis)
+            shared = _worker(redis).register("refdata:items", _TextCodec())
+            cache: ReferenceDataCache[str] = ReferenceDataCache(
+                "items",
+                client,  # type: ignore
+                shared=shared,
+            )
+            assert await cache.get(loader) == "snapshot-v3"
+
+        assert loads == ["load"]
+        assert redis.data["refdata:items:3"] == _TextCodec().encode("snapshot-v3")
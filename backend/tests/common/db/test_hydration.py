@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+
+from app.common.db.hydration import hydrate
+from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.vo import Lessons, Title, Visibility, WeekNumber
+
+NOW = datetime(2025, 8, 4, tzinfo=timezone.utc)
+
+
+def _trusted_curriculum() -> Curriculum:
+    return hydrate(
+        Curriculum,
+        id="c1",
+        owner_id="u1",
+        title=Title.from_trusted("Python 기초"),
+        visibility=Visibility.PUBLIC,
+        created_at=NOW,
+        updated_at=NOW,
+        week_schedules=[
+            hydrate(
+                WeekSchedule,
+                week_number=WeekNumber.from_trusted(1),
+                lessons=Lessons.from_trusted(["변수", "함수"]),
+            )
+        ],
+    )
+
+
+class TestHydrate:
+    def test_equals_validated_construction(self) -> None:
+        validated = Curriculum(
+            id="c1",
+            owner_id="u1",
+            title=Title("Python 기초"),
+            visibility=Visibility.PUBLIC,
+            created_at=NOW,
+            updated_at=NOW,
+            week_schedules=[
+                WeekSchedule(
+                    week_number=WeekNumber(1), lessons=Lessons(["변수", "함수"])
+                )
+            ],
+        )
+
+        assert _trusted_curriculum() == validated
+
+    def test_fills_defaults_with_fresh_factories(self) -> None:
+        first = _trusted_curriculum()
+        second = _trusted_curriculum()
+
+        first.record_week_shift(1, 1)
+
+        assert first.week_shifts == [(1, 1)]
+        assert second.week_shifts == []
+
+    def test_entity_methods_still_validate(self) -> None:
+        curriculum = _trusted_curriculum()
+
+        curriculum.change_title(Title("Python 심화"))
+        week = curriculum.week_schedules[0].add_lesson("클래스")
+
+        assert curriculum.title.value == "Python 심화"
+        assert week.lessons.items == ["변수", "함수", "클래스"]
@@ -0,0 +1,91 @@
+import pytest
+
+from app.common.db.query_audit import (
+    FILESORT,
+    FULL_SCAN,
+    TEMPORARY,
+    analyze_mysql_plan,
+    analyze_sqlite_plan,
+    run_audit,
+)
+
+
+class TestAnalyzePlan:
+    """실행계획 분석 테스트"""
+
+    def test_sqlite_full_scan_and_filesort(self):
+        """SQLite 풀스캔/정렬 임시 B-TREE 감지"""
+        issues = analyze_sqlite_plan(
+            ["SCAN curriculums", "USE TEMP B-TREE FOR ORDER BY"], ["curriculums"]
+        )
+        assert [issue.kind for issue in issues] == [FULL_SCAN, FILESORT]
+        assert issues[0].table == "curriculums"
+
+    def test_sqlite_index_usage_is_not_flagged(self):
+        """인덱스 탐색/커버링 스캔, 서브쿼리 스캔은 경고하지 않음"""
+        issues = analyze_sqlite_plan(
+            [
+                "SEARCH curriculums USING INDEX idx_curriculum_user_created (user_id=?)",
+                "SCAN tags USING COVERING INDEX idx_tag_usage_count",
+                "SCAN anon_1",
+            ],
+            ["curriculums", "tags"],
+        )
+        assert issues == []
+
+    def test_sqlite_alias_is_resolved(self):
+        """joinedload 별칭 테이블도 원래 테이블로 인식"""
+        issues = analyze_sqlite_plan(["SCAN users_1"], ["users"])
+        assert issues[0].table == "users"
+
+    def test_mysql_plan(self):
+        """MySQL type=ALL, filesort, temporary 감지"""
+        issues = analyze_mysql_plan(
+            [
+                {
+                    "table": "summaries",
+                    "type": "ALL",
+                    "rows": 1000,
+                    "Extra": "Using where; Using filesort",
+                },
+                {"table": "<derived2>", "type": "ALL", "rows": 10, "Extra": None},
+                {
+                    "table": "curriculum_tags",
+                    "type": "ref",
+                    "rows": 3,
+                    "Extra": "Using temporary",
+                },
+            ]
+        )
+        assert [(issue.kind, issue.table) for issue in issues] == [
+            (FULL_SCAN, "summaries"),
+            (FILESORT, "summaries"),
+            (TEMPORARY, "curriculum_tags"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_composite_indexes():
+    """시드 DB에서 주요 목록/카운트 쿼리가 풀스캔하지 않는지 확인"""
+    results = await run_audit(rows=50)
+
+    hot_labels = {
+        "curriculum.find_by_owner_id",
+        "curriculum.find_public_curriculums",
+        "feed.get_public_feed",
+        "summary.find_by_curriculum_and_week",
+        "summary.find_by_curriculum",
+        "feedback.find_by_summary_id",
+        "curriculum_tag.find_curriculums_by_tag",
+        "follow.find_followers",
+    }
+    assert hot_labels <= {result.label for result in results}
+
+    full_scans = [
+        (result.label, issue.table)
+        for result in results
+        if result.label in hot_labels
+        for issue in result.issues
+        if issue.kind == FULL_SCAN
+    ]
+    assert full_scans == []
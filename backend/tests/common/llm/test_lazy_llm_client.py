@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from app.common.llm.lazy_client import LazyLLMClient
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.core.di_container import Container
+
+created: List[Dict[str, Any]] = []
+# 클라이언트를 만든 스레드
+creator_threads: List[int] = []
+
+
+class _FakeClient(ILLMClientRepository):
+    def __init__(self, **kwargs: Any) -> None:
+        created.append(kwargs)
+        creator_threads.append(threading.get_ident())
+
+    async def generate_curriculum(
+        self, goal: str, period: int, difficulty: str, details: str
+    ) -> Dict[str, Any]:
+        return {"goal": goal, "period": period}
+
+    async def generate_feedback(
+        self, lessons: List[str], summary_content: str
+    ) -> Dict[str, Any]:
+        return {"comment": summary_content, "score": float(len(lessons))}
+
+
+@pytest.fixture(autouse=True)
+def _reset_created() -> None:
+    created.clear()
+    creator_threads.clear()
+
+
+class TestLazyLLMClient:
+    @pytest.mark.asyncio
+    async def test_creates_client_once_on_first_call(self) -> None:
+        client = LazyLLMClient(f"{__name__}:_FakeClient", api_key="k", model="m")
+        assert not client.is_loaded
+        assert created == []
+
+        result = await client.generate_curriculum("goal", 4, "easy", "")
+        feedback = await client.generate_feedback(["a", "b"], "summary")
+
+        assert result == {"goal": "goal", "period": 4}
+        assert feedback == {"comment": "summary", "score": 2.0}
+        assert created == [{"api_key": "k", "model": "m"}]
+        assert client.is_loaded
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_load_once_off_the_event_loop(
+        self,
+    ) -> None:
+        client = LazyLLMClient(f"{__name__}:_FakeClient")
+
+        await asyncio.gather(
+            *(client.generate_feedback(["a"], str(i)) for i in range(5))
+        )
+
+        assert len(created) == 1
+        assert creator_threads != [threading.get_ident()]
+
+    def test_container_registers_lazy_llm_client(self) -> None:
+        provider = Container.llm_client
+
+        assert provider.provides is LazyLLMClient
+        assert provider.args == ("app.common.llm.langchain_client:LangChainLLMClient",)
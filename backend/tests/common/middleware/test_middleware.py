@@ -0,0 +1,101 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.common.cache.redis_client import redis_client
+from app.common.middleware.activity_middleware import (
+    ActivityTrackingMiddleware,
+    get_bearer_token,
+)
+from app.common.middleware.background import drain_background_tasks
+from app.common.middleware.timing_middleware import (
+    UNMATCHED_ROUTE,
+    RequestTimingMiddleware,
+)
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """미들웨어가 적용된 테스트 앱"""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"item_id": item_id}
+
+    app.add_middleware(ActivityTrackingMiddleware)
+    app.add_middleware(RequestTimingMiddleware)
+    return app
+
+
+@pytest.fixture
+async def client(app: FastAPI):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+class TestRequestTimingMiddleware:
+    """RequestTimingMiddleware 테스트"""
+
+    async def test_records_route_template(self, client: AsyncClient, mocker):
+        """원본 경로 대신 라우트 템플릿으로 기록"""
+        record = mocker.patch(
+            "app.common.middleware.timing_middleware.record_api_request"
+        )
+
+        response = await client.get("/items/42")
+
+        assert response.status_code == 200
+        method, endpoint, status_code, duration = record.call_args.args
+        assert (method, endpoint, status_code) == ("GET", "/items/{item_id}", 200)
+        assert duration >= 0
+
+    async def test_unmatched_route(self, client: AsyncClient, mocker):
+        """매칭되지 않는 경로는 하나의 라벨로 묶음"""
+        record = mocker.patch(
+            "app.common.middleware.timing_middleware.record_api_request"
+        )
+
+        response = await client.get("/unknown/path")
+
+        assert response.status_code == 404
+        assert record.call_args.args[1:3] == (UNMATCHED_ROUTE, 404)
+
+
+class TestActivityTrackingMiddleware:
+    """ActivityTrackingMiddleware 테스트"""
+
+    def test_get_bearer_token(self):
+        """Authorization 헤더에서 Bearer 토큰 추출"""
+        assert (
+            get_bearer_token({"headers": [(b"authorization", b"Bearer abc")]}) == "abc"
+        )
+        assert get_bearer_token({"headers": [(b"authorization", b"Basic abc")]}) is None
+        assert get_bearer_token({"headers": []}) is None
+
+    async def test_tracks_after_response(self, client: AsyncClient, mocker):
+        """응답 이후 백그라운드로 활성 사용자 기록"""
+        mocker.patch(
+            "app.common.middleware.activity_middleware.decode_access_token",
+            return_value={"sub": "user-1"},
+        )
+        redis_set = mocker.patch.object(redis_client, "set", mocker.AsyncMock())
+
+        response = await client.get(
+            "/items/1", headers={"Authorization": "Bearer token"}
+        )
+        await drain_background_tasks()
+
+        assert response.status_code == 200
+        redis_set.assert_awaited_once_with("active_user:user-1", "1", ex=300)
+
+    async def test_skips_anonymous_request(self, client: AsyncClient, mocker):
+        """토큰 없는 요청은 추적하지 않음"""
+        redis_set = mocker.patch.object(redis_client, "set", mocker.AsyncMock())
+
+        await client.get("/items/1")
+        await drain_background_tasks()
+
+        redis_set.assert_not_awaited()
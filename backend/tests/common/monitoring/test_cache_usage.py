@@ -0,0 +1,97 @@
+import random
+from typing import Any, Dict, List, Optional
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.common.monitoring.cache_usage import CacheUsageSampler
+
+
+class _FakePipeline:
+    def __init__(self, sizes: Dict[str, Optional[int]]) -> None:
+        self.sizes = sizes
+        self.keys: List[str] = []
+
+    def memory_usage(self, key: str) -> None:
+        self.keys.append(key)
+
+    async def execute(self) -> List[Optional[int]]:
+        return [self.sizes.get(key) for key in self.keys]
+
+
+class _FakeRedis:
+    """SCAN 을 page 개씩 돌려주는 Redis"""
+
+    def __init__(self, sizes: Dict[str, Optional[int]], page: int = 3) -> None:
+        self.sizes = sizes
+        self.keys = list(sizes)
+        self.page = page
+
+    async def scan(self, cursor: int, count: int = 10) -> tuple:
+        end = cursor + self.page
+        return (end if end < len(self.keys) else 0), self.keys[cursor:end]
+
+    async def dbsize(self) -> int:
+        return len(self.keys)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.sizes)
+
+
+class _FakeClient:
+    def __init__(self, redis: Any) -> None:
+        self.redis = redis
+
+
+def _sampler(redis: _FakeRedis, **kwargs: Any) -> CacheUsageSampler:
+    return CacheUsageSampler(
+        _FakeClient(redis),  # type: ignore[arg-type]
+        rng=random.Random(7),
+        **kwargs,
+    )
+
+
+class TestCacheUsageSampler:
+    @pytest.mark.asyncio
+    async def test_counts_keys_and_estimates_memory_per_namespace(self) -> None:
+        sizes: Dict[str, Optional[int]] = {
+            f"feed:item:{i}": 100 + i % 2 * 100 for i in range(10)
+        }
+        sizes.update({"timeline:user:1": 500, "timeline:user:2": None})
+        sizes["random"] = 50
+
+        usage = await _sampler(_FakeRedis(sizes), memory_samples=4).sample()
+
+        assert {ns: u.keys for ns, u in usage.items()} == {
+            "feed:item": 10,
+            "timeline": 2,
+            "other": 1,
+        }
+        assert len(usage["feed:item"].samples) == 4
+        assert 1000 <= usage["feed:item"].estimated_bytes <= 2000
+        # 만료된 키(None) 는 평균에서 빠짐
+        assert usage["timeline"].estimated_bytes == 1000
+
+    @pytest.mark.asyncio
+    async def test_scales_counts_when_scan_is_capped(self) -> None:
+        sizes: Dict[str, Optional[int]] = {f"feed:item:{i}": 10 for i in range(12)}
+
+        usage = await _sampler(_FakeRedis(sizes), max_keys=6).sample()
+
+        assert usage["feed:item"].keys == 12
+
+    @pytest.mark.asyncio
+    async def test_run_if_due_sets_gauges_once_per_interval(self) -> None:
+        redis = _FakeRedis({"graph:following:u1": 300})
+        sampler = _sampler(redis, interval=3600)
+
+        await sampler.run_if_due()
+        assert REGISTRY.get_sample_value("cache_keys", {"namespace": "graph"}) == 1
+        assert (
+            REGISTRY.get_sample_value("cache_memory_bytes", {"namespace": "graph"})
+            == 300
+        )
+
+        redis.keys.append("graph:followers:u1")
+        await sampler.run_if_due()
+        assert REGISTRY.get_sample_value("cache_keys", {"namespace": "graph"}) == 1
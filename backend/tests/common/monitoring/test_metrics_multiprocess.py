@@ -0,0 +1,108 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import Gauge
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from app.common.monitoring import metrics
+from app.common.monitoring.metrics_collector import MetricsService
+
+
+def _write(path: Path, name: str, value: float) -> None:
+    """워커 하나가 남긴 멀티프로세스 메트릭 파일"""
+    values = MmapedDict(str(path))
+    values.write_value(mmap_key(name, name, [], [], "help"), value, 1.0)
+    values.close()
+
+
+@pytest.fixture
+def multiproc_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(metrics.MULTIPROC_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+class TestMultiprocessMetrics:
+    def test_single_process_uses_default_registry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(metrics.MULTIPROC_DIR_ENV, raising=False)
+
+        assert not metrics.is_multiprocess()
+        assert b"api_request_total" in metrics.generate_metrics()
+
+    def test_aggregates_counters_and_live_gauges(self, multiproc_dir: Path) -> None:
+        _write(multiproc_dir / "counter_101.db", "jobs_total", 3)
+        _write(multiproc_dir / "counter_102.db", "jobs_total", 4)
+        _write(multiproc_dir / "gauge_livesum_101.db", "queue_depth", 2)
+        _write(multiproc_dir / "gauge_livesum_102.db", "queue_depth", 5)
+
+        output = metrics.generate_metrics().decode()
+
+        assert "jobs_total 7.0" in output
+        assert "queue_depth 7.0" in output
+
+    def test_dead_worker_keeps_counters_but_drops_live_gauges(
+        self, multiproc_dir: Path
+    ) -> None:
+        _write(multiproc_dir / "counter_101.db", "jobs_total", 3)
+        _write(multiproc_dir / "counter_102.db", "jobs_total", 4)
+        _write(multiproc_dir / "gauge_livesum_101.db", "queue_depth", 2)
+        _write(multiproc_dir / "gauge_livesum_102.db", "queue_depth", 5)
+
+        metrics.mark_worker_dead(102)
+        output = metrics.generate_metrics().decode()
+
+        assert not (multiproc_dir / "gauge_livesum_102.db").exists()
+        assert "jobs_total 7.0" in output
+        assert "queue_depth 2.0" in output
+
+    def test_all_gauges_use_live_modes(self) -> None:
+        gauges = [value for value in vars(metrics).values() if isinstance(value, Gauge)]
+
+        assert gauges
+        for gauge in gauges:
+            assert gauge._multiprocess_mode.startswith("live"), gauge._name
+
+
+class TestGlobalMetricsCollection:
+    @pytest.fixture
+    def service(self, monkeypatch: pytest.MonkeyPatch) -> MetricsService:
+        service = MetricsService(MagicMock(), MagicMock())
+        monkeypatch.setattr(service, "_update_db_connection_metrics", AsyncMock())
+        monkeypatch.setattr(service, "_update_global_metrics", AsyncMock())
+        return service
+
+    def test_single_process_always_collects(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(metrics.MULTIPROC_DIR_ENV, raising=False)
+        monkeypatch.setattr(metrics, "_metrics_server_port", None)
+
+        assert metrics.collects_global_metrics()
+
+    async def test_worker_without_exporter_port_updates_pool_only(
+        self,
+        multiproc_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        service: MetricsService,
+    ) -> None:
+        monkeypatch.setattr(metrics, "_metrics_server_port", None)
+
+        await service.update_all_metrics()
+
+        service._update_db_connection_metrics.assert_awaited_once()
+        service._update_global_metrics.assert_not_awaited()
+
+    async def test_exporter_worker_collects_global_metrics(
+        self,
+        multiproc_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        service: MetricsService,
+    ) -> None:
+        monkeypatch.setattr(metrics, "_metrics_server_port", 8001)
+
+        await service.update_all_metrics()
+
+        service._update_db_connection_metrics.assert_awaited_once()
+        service._update_global_metrics.assert_awaited_once()
@@ -0,0 +1,98 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from app.common.serialization.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    load_json_codec,
+)
+from app.common.serialization.response import FastJSONResponse
+from app.modules.curriculum.application.dto.curriculum_dto import (
+    CurriculumDTO,
+    WeekScheduleDTO,
+)
+from app.modules.curriculum.domain.vo import Visibility
+from app.modules.curriculum.interface.schema.curriculum_schema import (
+    CurriculumResponse,
+)
+
+CODECS = [OrjsonCodec(), StdlibJSONCodec()]
+
+
+def _detail() -> CurriculumDTO:
+    return CurriculumDTO(
+        id="c1",
+        owner_id="u1",
+        title="Python 기초",
+        visibility="PUBLIC",
+        created_at=datetime(2025, 8, 4, 9, 30, 0, 123, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 8, 5, 12, 0),
+        week_schedules=[WeekScheduleDTO(week_number=1, lessons=["변수", "함수"])],
+    )
+
+
+@dataclass
+class _Row:
+    visibility: Visibility
+    at: datetime
+    counts: dict
+
+
+class _Page(BaseModel):
+    items: List[int]
+    at: datetime
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+    def test_dataclass_dto_matches_response_model(self, codec) -> None:
+        dto = _detail()
+        expected = CurriculumResponse.from_dto(dto).model_dump(mode="json")
+
+        assert codec.loads(codec.dumps(dto)) == expected
+
+    def test_codecs_produce_identical_bytes(self) -> None:
+        value = [
+            _Row(Visibility.PUBLIC, datetime(2025, 1, 1, tzinfo=timezone.utc), {1: 2}),
+            _Page(items=[1, 2], at=datetime(2025, 1, 1, 9)),
+            datetime(2025, 1, 1, tzinfo=timezone(timedelta(hours=9))),
+            {"b": 1, "a": None},
+        ]
+        orjson_codec, stdlib_codec = CODECS
+
+        assert orjson_codec.dumps(value) == stdlib_codec.dumps(value)
+        # sort_keys 는 dict 에만 적용 (ETag 계산용 to_dict 결과)
+        payload = {"b": [1, {"d": 1, "c": 2}], "a": "x"}
+        assert orjson_codec.dumps(payload, sort_keys=True) == stdlib_codec.dumps(
+            payload, sort_keys=True
+        )
+        assert orjson_codec.dumps({"title": "한글"}) == '{"title":"한글"}'.encode()
+
+    def test_unknown_codec_falls_back_to_orjson(self) -> None:
+        assert load_json_codec("json").name == "json"
+        assert load_json_codec("unknown").name == "orjson"
+
+    def test_base_codec_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            JSONCodec()  # type: ignore[abstract]
+
+
+class TestFastJSONResponse:
+    def test_pydantic_model_is_rendered_like_model_dump_json(self) -> None:
+        model = CurriculumResponse.from_dto(_detail())
+
+        body = FastJSONResponse(model).body
+
+        assert body == model.model_dump_json().encode()
+
+    def test_dataclass_dto_is_rendered_directly(self) -> None:
+        body = FastJSONResponse(_detail(), headers={"ETag": '"x"'})
+
+        assert json.loads(body.body)["week_schedules"][0]["lessons"] == ["변수", "함수"]
+        assert body.headers["etag"] == '"x"'
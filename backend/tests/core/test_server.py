@@ -0,0 +1,119 @@
+import argparse
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from app.common.cache.redis_client import redis_client
+from app.common.cache.two_tier import two_tier_caches
+from app.common.db.database import engine
+from app.core import server
+
+
+def _cgroup(monkeypatch: pytest.MonkeyPatch, root: Path, files: Dict[str, str]) -> None:
+    for name, text in files.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(text)
+    monkeypatch.setattr(server, "CGROUP_ROOT", str(root))
+
+
+class TestAvailableCpus:
+    def test_uses_cgroup_v2_quota(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        _cgroup(monkeypatch, tmp_path, {"cpu.max": "150000 100000\n"})
+
+        assert server.available_cpus() == 2
+
+    def test_uses_cgroup_v1_quota(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        _cgroup(
+            monkeypatch,
+            tmp_path,
+            {"cpu/cpu.cfs_quota_us": "50000", "cpu/cpu.cfs_period_us": "100000"},
+        )
+
+        assert server.available_cpus() == 1
+
+    def test_unlimited_quota_falls_back_to_affinity(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        _cgroup(monkeypatch, tmp_path, {"cpu.max": "max 100000\n"})
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2})
+
+        assert server.available_cpus() == 3
+
+
+class TestBuildOptions:
+    def _args(self, workers: Optional[int] = None) -> argparse.Namespace:
+        return argparse.Namespace(bind=None, workers=workers, app=server.APP)
+
+    def test_preloads_and_recycles_workers(self) -> None:
+        options = server.build_options(self._args(workers=3))
+
+        assert options["workers"] == 3
+        assert options["preload_app"] is True
+        assert options["worker_class"] == server.WORKER_CLASS
+        assert options["max_requests"] > 0
+        assert options["max_requests_jitter"] > 0
+
+    def test_defaults_workers_to_cpu_count(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(server, "available_cpus", lambda: 6)
+
+        assert server.build_options(self._args())["workers"] == 6
+
+
+class TestPrepareMetricsDir:
+    def test_wipes_previous_run_and_sets_env(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv(server.MULTIPROC_DIR_ENV, "unused")
+        path = tmp_path / "metrics"
+        path.mkdir()
+        (path / "counter_123.db").write_bytes(b"stale")
+
+        server.prepare_metrics_dir(str(path))
+
+        assert list(path.iterdir()) == []
+        assert os.environ[server.MULTIPROC_DIR_ENV] == str(path)
+
+
+class TestResetAfterFork:
+    def test_forked_worker_gets_new_sender_and_drops_clients(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # 부모가 연결을 맺은 상태를 흉내 낸다 (fork 후 자식에서 비워져야 함)
+        for attr in ("_redis", "_binary", "_pubsub"):
+            monkeypatch.setattr(redis_client, attr, object())
+        parent_sender = two_tier_caches.sender
+        parent_pool = engine.sync_engine.pool
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # 자식: fork 훅 결과를 부모에게 전달
+            try:
+                os.close(read_fd)
+                ok = (
+                    two_tier_caches.sender != parent_sender
+                    and redis_client._redis is None
+                    and redis_client._binary is None
+                    and redis_client._pubsub is None
+                    and engine.sync_engine.pool is not parent_pool
+                )
+                os.write(write_fd, b"1" if ok else b"0")
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert result == b"1"
+        # 부모 상태는 그대로
+        assert two_tier_caches.sender == parent_sender
+        assert redis_client._redis is not None
+        assert engine.sync_engine.pool is parent_pool
@@ -0,0 +1,130 @@
+import sys
+import time
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.common.middleware.activity_middleware import ActivityTrackingMiddleware
+from app.core import auth
+from app.core.auth import CurrentUser, Role, create_access_token, get_current_user
+from app.core.jwt_backend import JOSE, PYJWT, InvalidTokenError, load_jwt_backend
+from app.core.token_cache import VerifiedTokenCache
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth.token_cache.clear()
+    yield
+    auth.token_cache.clear()
+
+
+class TestVerifiedTokenCache:
+    """VerifiedTokenCache 테스트"""
+
+    def test_get_and_set(self):
+        cache = VerifiedTokenCache(maxsize=10, ttl=60)
+        cache.set("token", {"sub": "user-1"})
+
+        assert cache.get("token") == {"sub": "user-1"}
+        assert cache.get("other") is None
+
+    def test_lru_eviction(self):
+        """가장 오래 사용되지 않은 항목부터 제거"""
+        cache = VerifiedTokenCache(maxsize=2, ttl=60)
+        cache.set("a", {"sub": "a"})
+        cache.set("b", {"sub": "b"})
+        cache.get("a")
+        cache.set("c", {"sub": "c"})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_honors_exp(self):
+        """exp 가 지난 claims 는 반환하지 않음"""
+        cache = VerifiedTokenCache(maxsize=10, ttl=60)
+        cache.set("expired", {"sub": "a", "exp": int(time.time()) - 1})
+
+        assert cache.get("expired") is None
+        assert len(cache) == 0
+
+    def test_ttl(self, mocker):
+        """exp 보다 ttl 이 먼저 끝나면 ttl 기준으로 만료"""
+        cache = VerifiedTokenCache(maxsize=10, ttl=5)
+        now = time.time()
+        cache.set("token", {"sub": "a", "exp": int(now) + 3600})
+
+        mocker.patch("app.core.token_cache.time.time", return_value=now + 6)
+        assert cache.get("token") is None
+
+
+class TestDecodeAccessToken:
+    """decode_access_token 캐시 연동 테스트"""
+
+    def test_verifies_once(self, mocker):
+        token = create_access_token(subject="user-1", role=Role.USER)
+        decode = mocker.spy(auth.jwt_backend, "decode")
+
+        first = auth.decode_access_token(token)
+        second = auth.decode_access_token(token)
+
+        assert first == second
+        assert first["sub"] == "user-1"
+        assert decode.call_count == 1
+
+    def test_invalid_token_is_not_cached(self):
+        with pytest.raises(HTTPException) as exc_info:
+            auth.decode_access_token("invalid.token.value")
+
+        assert exc_info.value.status_code == 401
+        assert len(auth.token_cache) == 0
+
+    async def test_middleware_and_dependency_share_decode(self, mocker):
+        """미들웨어가 디코딩한 claims 를 get_current_user 가 재사용"""
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(user: CurrentUser = Depends(get_current_user)) -> dict:
+            return {"id": user.id}
+
+        app.add_middleware(ActivityTrackingMiddleware)
+        mocker.patch(
+            "app.common.middleware.activity_middleware.schedule_after_response",
+            side_effect=lambda coro: coro.close(),
+        )
+        decode = mocker.spy(auth, "decode_access_token")
+        token = create_access_token(subject="user-1", role=Role.USER)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/me", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.json() == {"id": "user-1"}
+        # get_current_user 는 state 의 claims 를 사용 (미들웨어는 import 시점의 함수 참조)
+        assert decode.call_count == 0
+        assert len(auth.token_cache) == 1
+
+
+class TestJWTBackend:
+    """JWT 백엔드 선택 테스트"""
+
+    def test_default_is_jose(self):
+        assert load_jwt_backend(JOSE).name == JOSE
+        assert load_jwt_backend("unknown").name == JOSE
+
+    def test_pyjwt_fallback_when_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "jwt", None)
+        assert load_jwt_backend(PYJWT).name == JOSE
+
+    def test_pyjwt_roundtrip(self):
+        pytest.importorskip("jwt")
+        backend = load_jwt_backend(PYJWT)
+        token = backend.encode({"sub": "user-1"}, "secret", "HS256")
+
+        assert backend.decode(token, "secret", "HS256") == {"sub": "user-1"}
+        with pytest.raises(InvalidTokenError):
+            backend.decode(token, "wrong", "HS256")
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from ulid import ULID  # type: ignore
@@ -7,7 +7,10 @@ from pytest_mock import MockerFixture
 
 from app.common.llm.llm_client_repo import ILLMClientRepository
 from app.modules.curriculum.application.dto.curriculum_dto import (
+    BatchEditCurriculumCommand,
     CreateCurriculumCommand,
+    CurriculumEditOp,
+    CurriculumEditOperation,
     GenerateCurriculumCommand,
     UpdateCurriculumCommand,
     CurriculumQuery,
@@ -17,13 +20,21 @@ from app.modules.curriculum.application.dto.curriculum_dto import (
 from app.modules.curriculum.application.exception import (
     CurriculumCountOverError,
     CurriculumNotFoundError,
+    CurriculumVersionConflictError,
     LLMGenerationError,
+    WeekScheduleNotFoundError,
 )
 from app.modules.curriculum.application.service.curriculum_service import (
     CurriculumService,
 )
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.repository.curriculum_cache_repo import (
+    ICurriculumCacheRepository,
+)
+from app.modules.curriculum.infrastructure.repository.curriculum_cache_codec import (
+    curriculum_detail_codec,
+)
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
 )
@@ -1314,6 +1325,290 @@ class TestLLMResponseParsing:
 
 
 # 통합 테스트용 픽스처
+class TestBatchEditCurriculum:
+    """주차/레슨 일괄 수정 테스트"""
+
+    @pytest.fixture
+    def batch_service(
+        self,
+        mock_curriculum_repo: AsyncMock,
+        mock_llm_client: AsyncMock,
+        mock_follow_repo: AsyncMock,
+    ) -> CurriculumService:
+        return CurriculumService(
+            curriculum_repo=mock_curriculum_repo,
+            curriculum_domain_service=CurriculumDomainService(mock_curriculum_repo),
+            llm_client=mock_llm_client,
+            follow_repo=mock_follow_repo,
+        )
+
+    def _command(
+        self, sample_curriculum: Curriculum, operations  # type: ignore
+    ) -> BatchEditCurriculumCommand:
+        return BatchEditCurriculumCommand(
+            curriculum_id=sample_curriculum.id,
+            owner_id="user_123",
+            expected_updated_at=sample_curriculum.updated_at,
+            operations=operations,
+        )
+
+    @pytest.mark.asyncio
+    async def test_applies_operations_in_order_and_saves_once(
+        self,
+        batch_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        mock_curriculum_repo.update_if_unchanged.return_value = True
+        command = self._command(
+            sample_curriculum,
+            [
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.INSERT_WEEK, week_number=1, lessons=["소개"]
+                ),
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.UPDATE_LESSON,
+                    week_number=2,
+                    lesson_index=0,
+                    lesson="기초 개념 정리",
+                ),
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.INSERT_LESSON, week_number=3, lesson="과제"
+                ),
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.REMOVE_LESSON, week_number=3, lesson_index=0
+                ),
+            ],
+        )
+
+        result = await batch_service.batch_edit_curriculum(command, RoleVO.USER)
+
+        assert [(w.week_number, w.lessons) for w in result.week_schedules] == [
+            (1, ["소개"]),
+            (2, ["기초 개념 정리", "환경 설정"]),
+            (3, ["실습", "과제"]),
+        ]
+        mock_curriculum_repo.find_by_id.assert_called_once()
+        mock_curriculum_repo.update.assert_not_called()
+        saved, expected = mock_curriculum_repo.update_if_unchanged.call_args.args
+        assert saved.week_shifts == [(1, 1)]
+        assert expected == sample_curriculum.updated_at
+
+    @pytest.mark.asyncio
+    async def test_stale_version_is_rejected_before_applying(
+        self,
+        batch_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        command = self._command(
+            sample_curriculum,
+            [CurriculumEditOperation(op=CurriculumEditOp.REMOVE_WEEK, week_number=1)],
+        )
+        command.expected_updated_at = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+        with pytest.raises(CurriculumVersionConflictError):
+            await batch_service.batch_edit_curriculum(command, RoleVO.USER)
+
+        mock_curriculum_repo.update_if_unchanged.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_write_is_reported_as_conflict(
+        self,
+        batch_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        mock_curriculum_repo.update_if_unchanged.return_value = False
+        command = self._command(
+            sample_curriculum,
+            [CurriculumEditOperation(op=CurriculumEditOp.REMOVE_WEEK, week_number=2)],
+        )
+
+        with pytest.raises(CurriculumVersionConflictError):
+            await batch_service.batch_edit_curriculum(command, RoleVO.USER)
+
+    @pytest.mark.asyncio
+    async def test_failing_operation_saves_nothing(
+        self,
+        batch_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        command = self._command(
+            sample_curriculum,
+            [
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.INSERT_LESSON, week_number=1, lesson="추가"
+                ),
+                CurriculumEditOperation(
+                    op=CurriculumEditOp.REMOVE_LESSON, week_number=9, lesson_index=0
+                ),
+            ],
+        )
+
+        with pytest.raises(WeekScheduleNotFoundError):
+            await batch_service.batch_edit_curriculum(command, RoleVO.USER)
+
+        mock_curriculum_repo.update_if_unchanged.assert_not_called()
+
+    def test_operation_requires_fields_for_its_type(self) -> None:
+        with pytest.raises(ValueError):
+            CurriculumEditOperation(op=CurriculumEditOp.UPDATE_LESSON, week_number=1)
+
+
+class InMemoryCurriculumCache(ICurriculumCacheRepository):
+    """무효화 후에는 다시 저장되지 않는 동작까지 흉내 내는 상세 캐시 (코덱 값 저장)"""
+
+    def __init__(self) -> None:
+        self.details: Dict[str, bytes] = {}
+        self.invalidated: List[str] = []
+
+    async def get(self, curriculum_id: str) -> Optional[Dict[str, Any]]:
+        return curriculum_detail_codec.decode(self.details.get(curriculum_id))
+
+    async def set(self, curriculum_id: str, detail: Dict[str, Any]) -> None:
+        if curriculum_id not in self.invalidated:
+            self.details.setdefault(
+                curriculum_id, curriculum_detail_codec.encode(detail)
+            )
+
+    async def invalidate(self, curriculum_id: str) -> None:
+        self.details.pop(curriculum_id, None)
+        self.invalidated.append(curriculum_id)
+
+
+class TestCurriculumDetailCache:
+    """커리큘럼 상세 read-through 캐시 테스트"""
+
+    @pytest.fixture
+    def cache(self) -> InMemoryCurriculumCache:
+        return InMemoryCurriculumCache()
+
+    @pytest.fixture
+    def cached_service(
+        self,
+        mock_curriculum_repo: AsyncMock,
+        mock_llm_client: AsyncMock,
+        mock_follow_repo: AsyncMock,
+        cache: InMemoryCurriculumCache,
+    ) -> CurriculumService:
+        return CurriculumService(
+            curriculum_repo=mock_curriculum_repo,
+            curriculum_domain_service=CurriculumDomainService(mock_curriculum_repo),
+            llm_client=mock_llm_client,
+            follow_repo=mock_follow_repo,
+            curriculum_cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache_with_same_etag(
+        self,
+        cached_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+
+        first, etag = await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+        second, cached_etag = await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+
+        assert second == first
+        assert cached_etag == etag
+        assert etag.startswith('"') and etag.endswith('"')
+        mock_curriculum_repo.find_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_private_curriculum_is_hidden_from_other_users(
+        self,
+        cached_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+
+        with pytest.raises(CurriculumNotFoundError):
+            await cached_service.get_curriculum_detail(
+                sample_curriculum.id, RoleVO.USER, "someone_else"
+            )
+        dto, _ = await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.ADMIN, None
+        )
+        assert dto.id == sample_curriculum.id
+        mock_curriculum_repo.find_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_and_change_etag(
+        self,
+        cached_service: CurriculumService,
+        mock_curriculum_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+        cache: InMemoryCurriculumCache,
+    ) -> None:
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+        _, etag = await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+
+        await cached_service.update_curriculum(
+            UpdateCurriculumCommand(
+                curriculum_id=sample_curriculum.id,
+                owner_id="user_123",
+                title="수정된 제목",
+            ),
+            RoleVO.USER,
+        )
+        assert cache.invalidated == [sample_curriculum.id]
+
+        dto, new_etag = await cached_service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+        assert dto.title == "수정된 제목"
+        assert new_etag != etag
+
+        await cached_service.delete_curriculum(
+            sample_curriculum.id, "user_123", RoleVO.USER
+        )
+        assert cache.invalidated == [sample_curriculum.id] * 2
+
+    @pytest.mark.asyncio
+    async def test_works_without_cache(
+        self,
+        mock_curriculum_repo: AsyncMock,
+        mock_llm_client: AsyncMock,
+        mock_follow_repo: AsyncMock,
+        sample_curriculum: Curriculum,
+    ) -> None:
+        service = CurriculumService(
+            curriculum_repo=mock_curriculum_repo,
+            curriculum_domain_service=CurriculumDomainService(mock_curriculum_repo),
+            llm_client=mock_llm_client,
+            follow_repo=mock_follow_repo,
+        )
+        mock_curriculum_repo.find_by_id.return_value = sample_curriculum
+
+        _, etag = await service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+        _, again = await service.get_curriculum_detail(
+            sample_curriculum.id, RoleVO.USER, "user_123"
+        )
+
+        assert again == etag
+        assert mock_curriculum_repo.find_by_id.call_count == 2
+
+
 @pytest.fixture
 def integration_test_setup():  # type: ignore
     """통합 테스트 설정"""
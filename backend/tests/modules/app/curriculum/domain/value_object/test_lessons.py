@@ -167,3 +167,11 @@ class TestLessons:
         """문자열 표현 테스트"""
         lessons = Lessons(["Python 기초", "변수"])
         assert repr(lessons) == "<Lessons ['Python 기초', '변수']>"
+
+    def test_from_trusted_matches_validated(self):
+        """저장소 전용 생성은 검증 생성과 같은 값"""
+        trusted = Lessons.from_trusted(["Python 기초", "변수"])
+
+        assert trusted == Lessons(["Python 기초", "변수"])
+        assert trusted.items == ["Python 기초", "변수"]
+        assert all(isinstance(lesson, Lesson) for lesson in trusted)
@@ -1,5 +1,6 @@
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import StaticPool
 
@@ -8,6 +9,10 @@ from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
     CurriculumRepository,
 )
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.entity.curriculum_brief import CurriculumBrief
+from app.modules.curriculum.domain.service.curriculum_domain_service import (
+    CurriculumDomainService,
+)
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
 from app.modules.curriculum.domain.vo import Title, Visibility, WeekNumber, Lessons
 from app.modules.user.domain.vo.role import RoleVO
@@ -623,3 +628,236 @@ class TestCurriculumRepositoryErrorHandling:
         # When & Then - 예외가 발생하지 않아야 함 (update 메서드는 None 반환)
         result = await curriculum_repository.update(non_existing_curriculum)  # type: ignore
         assert result is None
+
+
+class TestCurriculumRepositoryWeekDiff:
+    """주차 변경분만 저장하는지 (행 단위 SQL 기록) 테스트"""
+
+    @pytest.fixture
+    async def long_curriculum(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_user: UserModel,
+    ) -> Curriculum:
+        now = datetime.now(timezone.utc)
+        curriculum = Curriculum(
+            id="long_curriculum",
+            owner_id="test_user_id",
+            title=Title("24주 과정"),
+            visibility=Visibility.PRIVATE,
+            created_at=now,
+            updated_at=now,
+            week_schedules=[
+                WeekSchedule(
+                    week_number=WeekNumber(week),
+                    lessons=Lessons([f"{week}주차 레슨"]),
+                )
+                for week in range(1, 25)
+            ],
+        )
+        await curriculum_repository.save(curriculum)
+        return curriculum
+
+    @pytest.fixture
+    def week_writes(self, async_session: AsyncSession):
+        """week_schedules 에 대한 INSERT/UPDATE/DELETE 행 수"""
+        writes = {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            verb = statement.split()[0].upper()
+            if verb in writes and "week_schedules" in statement.split("SET")[0]:
+                writes[verb] += len(parameters) if executemany else 1
+
+        engine = async_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        yield writes
+        event.remove(engine, "before_cursor_execute", _record)
+
+    async def _weeks(
+        self, curriculum_repository: CurriculumRepository
+    ) -> list[tuple[int, list[str]]]:
+        found = await curriculum_repository.find_by_id(
+            curriculum_id="long_curriculum",
+            role=RoleVO.USER,
+            owner_id="test_user_id",
+        )
+        assert found is not None
+        return [(ws.week_number.value, ws.lessons.items) for ws in found.week_schedules]
+
+    @pytest.mark.asyncio
+    async def test_single_lesson_edit_updates_one_row(
+        self,
+        curriculum_repository: CurriculumRepository,
+        long_curriculum: Curriculum,
+        week_writes: dict,
+    ) -> None:
+        week = long_curriculum.get_week_schedule(WeekNumber(5))
+        assert week is not None
+        long_curriculum.update_week_schedule(
+            WeekNumber(5), week.update_lesson_at(0, "수정된 레슨")
+        )
+
+        await curriculum_repository.update(long_curriculum)
+
+        assert week_writes == {"INSERT": 0, "UPDATE": 1, "DELETE": 0}
+        weeks = await self._weeks(curriculum_repository)
+        assert len(weeks) == 24
+        assert weeks[4] == (5, ["수정된 레슨"])
+
+    @pytest.mark.asyncio
+    async def test_insert_week_shifts_numbers_in_one_statement(
+        self,
+        curriculum_repository: CurriculumRepository,
+        long_curriculum: Curriculum,
+        week_writes: dict,
+    ) -> None:
+        removed = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 24)
+        await curriculum_repository.update(removed)
+        week_writes.update({"INSERT": 0, "UPDATE": 0, "DELETE": 0})
+
+        inserted = await CurriculumDomainService(
+            curriculum_repository
+        ).insert_week_and_shift(removed, 3, ["새 주차"])
+        await curriculum_repository.update(inserted)
+
+        # 번호 이동 1 + 새 주차 1
+        assert week_writes == {"INSERT": 1, "UPDATE": 1, "DELETE": 0}
+        assert inserted.week_shifts == []
+        weeks = await self._weeks(curriculum_repository)
+        assert [week for week, _ in weeks] == list(range(1, 25))
+        assert weeks[2] == (3, ["새 주차"])
+        assert weeks[3] == (4, ["3주차 레슨"])
+        assert weeks[23] == (24, ["23주차 레슨"])
+
+    @pytest.mark.asyncio
+    async def test_remove_week_shifts_numbers_in_one_statement(
+        self,
+        curriculum_repository: CurriculumRepository,
+        long_curriculum: Curriculum,
+        week_writes: dict,
+    ) -> None:
+        removed = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 10)
+
+        await curriculum_repository.update(removed)
+
+        assert week_writes == {"INSERT": 0, "UPDATE": 1, "DELETE": 1}
+        weeks = await self._weeks(curriculum_repository)
+        assert [week for week, _ in weeks] == list(range(1, 24))
+        assert weeks[8] == (9, ["9주차 레슨"])
+        assert weeks[9] == (10, ["11주차 레슨"])
+
+    @pytest.mark.asyncio
+    async def test_update_if_unchanged_rejects_stale_version(
+        self,
+        curriculum_repository: CurriculumRepository,
+        long_curriculum: Curriculum,
+        week_writes: dict,
+    ) -> None:
+        version = long_curriculum.updated_at
+        first = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 1)
+        first.updated_at = version + timedelta(minutes=1)
+
+        assert await curriculum_repository.update_if_unchanged(first, version)
+        assert first.week_shifts == []
+
+        # 같은 버전을 읽었던 두 번째 요청은 아무것도 쓰지 않음
+        week_writes.update({"INSERT": 0, "UPDATE": 0, "DELETE": 0})
+        second = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 24)
+        assert not await curriculum_repository.update_if_unchanged(second, version)
+        assert week_writes == {"INSERT": 0, "UPDATE": 0, "DELETE": 0}
+
+        weeks = await self._weeks(curriculum_repository)
+        assert len(weeks) == 23
+        assert weeks[0] == (1, ["2주차 레슨"])
+
+    @pytest.mark.asyncio
+    async def test_update_if_unchanged_detects_write_in_same_second(
+        self,
+        curriculum_repository: CurriculumRepository,
+        long_curriculum: Curriculum,
+    ) -> None:
+        version = long_curriculum.updated_at
+        first = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 1)
+        # 시계가 같은 값을 주더라도 저장되는 버전은 읽은 버전과 달라야 함
+        first.updated_at = version
+
+        assert await curriculum_repository.update_if_unchanged(first, version)
+        assert first.updated_at == version + timedelta(microseconds=1)
+
+        second = await CurriculumDomainService(
+            curriculum_repository
+        ).remove_week_and_shift(long_curriculum, 24)
+        assert not await curriculum_repository.update_if_unchanged(second, version)
+        assert await curriculum_repository.update_if_unchanged(second, first.updated_at)
+
+
+class TestCurriculumRepositoryBrief:
+    """목록 조회 읽기 모델과 비정규화 개수 테스트"""
+
+    @pytest.fixture
+    def statements(self, async_session: AsyncSession):
+        """실행된 SQL 문"""
+        executed: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        engine = async_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", _record)
+
+    @pytest.mark.asyncio
+    async def test_list_reads_counts_without_week_schedules(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_curriculum: Curriculum,
+        sample_user: UserModel,
+        statements: list,
+    ) -> None:
+        await curriculum_repository.save(sample_curriculum)
+        statements.clear()
+
+        _, curriculums = await curriculum_repository.find_by_owner_id(
+            owner_id="test_user_id"
+        )
+
+        brief = curriculums[0]
+        assert isinstance(brief, CurriculumBrief)
+        assert brief.title == Title("Python 기초 과정")
+        assert brief.visibility == Visibility.PRIVATE
+        assert brief.get_total_weeks() == 2
+        assert brief.get_total_lessons() == 5
+        assert not any("week_schedules" in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_week_changes(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_curriculum: Curriculum,
+        sample_user: UserModel,
+    ) -> None:
+        await curriculum_repository.save(sample_curriculum)
+        domain_service = CurriculumDomainService(curriculum_repository)
+
+        inserted = await domain_service.insert_week_and_shift(
+            sample_curriculum, 1, ["오리엔테이션"]
+        )
+        await curriculum_repository.update(inserted)
+        _, (brief,) = await curriculum_repository.find_by_owner_id("test_user_id")
+        assert (brief.total_weeks, brief.total_lessons) == (3, 6)
+
+        removed = await domain_service.remove_week_and_shift(inserted, 3)
+        await curriculum_repository.update(removed)
+        _, (brief,) = await curriculum_repository.find_by_owner_id("test_user_id")
+        assert (brief.total_weeks, brief.total_lessons) == (2, 3)
@@ -256,8 +256,9 @@ class TestCurriculumController:
     ):
         """커리큘럼 상세 조회 성공 테스트"""
         # Given
-        mock_curriculum_service.get_curriculum_by_id.return_value = (
-            sample_curriculum_dto
+        mock_curriculum_service.get_curriculum_detail.return_value = (
+            sample_curriculum_dto,
+            '"abc"',
         )
 
         # When
@@ -265,16 +266,41 @@ class TestCurriculumController:
 
         # Then
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"abc"'
         data = response.json()
         assert data["id"] == "01HKQJQJQJQJQJQJQJQJQJ"
         assert data["title"] == "Python 기초 과정"
 
+    def test_get_curriculum_not_modified(
+        self,
+        client: TestClient,
+        mock_curriculum_service: AsyncMock,
+        sample_curriculum_dto: CurriculumDTO,
+    ):
+        """If-None-Match 일치 시 304 테스트"""
+        # Given
+        mock_curriculum_service.get_curriculum_detail.return_value = (
+            sample_curriculum_dto,
+            '"abc"',
+        )
+
+        # When
+        response = client.get(
+            "/api/v1/curriculums/01HKQJQJQJQJQJQJQJQJQJ",
+            headers={"If-None-Match": '"old", "abc"'},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == '"abc"'
+
     def test_get_curriculum_by_id_not_found(
         self, client: TestClient, mock_curriculum_service: AsyncMock
     ):
         """존재하지 않는 커리큘럼 조회 테스트"""
         # Given
-        mock_curriculum_service.get_curriculum_by_id.side_effect = (
+        mock_curriculum_service.get_curriculum_detail.side_effect = (
             CurriculumNotFoundError("Curriculum not found")
         )
 
@@ -0,0 +1,210 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import List
+from sqlalchemy import select, update
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from app.common.db.database import Base
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.feed.application.service.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.infrastructure.db_model.curriculum_search import (
+    CurriculumSearchDocumentModel,
+)
+from app.modules.feed.infrastructure.repository.curriculum_search_repo import (
+    CurriculumSearchRepository,
+    build_search_condition,
+    parse_search_terms,
+)
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+
+@pytest.fixture
+async def async_session() -> AsyncSession:
+    """커리큘럼 4개(공개 3, 비공개 1)가 준비된 세션"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    now = datetime.now(timezone.utc)
+
+    async with async_session_local() as session:
+        session.add(
+            UserModel(  # type: ignore
+                id="user_a",
+                email="a@example.com",
+                name="김개발",
+                password="hashed_password",
+                role=RoleVO.USER,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.add(
+            TagModel(  # type: ignore
+                id="tag_python",
+                name="파이썬",
+                usage_count=1,
+                created_by="user_a",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        seeds = [
+            # (id, 제목, 공개 여부, 레슨)
+            ("cur_title", "파이썬 기초 완성", "PUBLIC", ["변수와 자료형"]),
+            ("cur_lesson", "데이터 분석 입문", "PUBLIC", ["파이썬 판다스 실습"]),
+            ("cur_other", "자바스크립트 입문", "PUBLIC", ["DOM 조작"]),
+            ("cur_private", "파이썬 심화", "PRIVATE", ["비동기"]),
+        ]
+        for i, (curriculum_id, title, visibility, lessons) in enumerate(seeds):
+            session.add(
+                CurriculumModel(  # type: ignore
+                    id=curriculum_id,
+                    user_id="user_a",
+                    title=title,
+                    visibility=visibility,
+                    created_at=now,
+                    updated_at=now - timedelta(minutes=i),
+                )
+            )
+        await session.flush()
+        for curriculum_id, _, _, lessons in seeds:
+            session.add(
+                WeekScheduleModel(  # type: ignore
+                    curriculum_id=curriculum_id, week_number=1, lessons=lessons
+                )
+            )
+        session.add(
+            CurriculumTagModel(  # type: ignore
+                id="cur_other_tag_python",
+                curriculum_id="cur_other",
+                tag_id="tag_python",
+                added_by="user_a",
+                created_at=now,
+            )
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def _search(session: AsyncSession, query: str) -> List[str]:
+    _, items = await FeedRepository(session).get_public_feed(
+        FeedFilter(search_query=query)
+    )
+    return [item.curriculum_id for item in items]
+
+
+class TestSearchCondition:
+    """검색어 파싱/조건 생성 테스트"""
+
+    def test_parse_strips_boolean_operators(self) -> None:
+        assert parse_search_terms('+파이썬 -"기초" 파이썬 (C++)') == [
+            "파이썬",
+            "기초",
+            "c",
+        ]
+        assert parse_search_terms("  +-*  ") == []
+
+    def test_mysql_uses_fulltext_boolean_mode(self) -> None:
+        condition = build_search_condition("mysql", "파이썬 기초")
+        sql = str(
+            select(CurriculumSearchDocumentModel.curriculum_id)
+            .where(condition.where)  # type: ignore
+            .compile(dialect=mysql.dialect())
+        )
+        assert "MATCH (curriculum_search_documents.title, " in sql
+        assert "IN BOOLEAN MODE" in sql
+        assert "LIKE" not in sql
+
+    def test_mysql_short_terms_fall_back_to_like(self) -> None:
+        condition = build_search_condition("mysql", "c")
+        sql = str(
+            select(CurriculumSearchDocumentModel.curriculum_id)
+            .where(condition.where)  # type: ignore
+            .compile(dialect=mysql.dialect())
+        )
+        assert "MATCH" not in sql
+        assert "LIKE" in sql
+
+
+class TestCurriculumSearch:
+    """검색 색인 + 피드 검색 테스트 (sqlite 에서는 LIKE 기반)"""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_all_fields(
+        self, async_session: AsyncSession
+    ) -> None:
+        indexed = await CurriculumSearchRepository(async_session).rebuild(batch_size=3)
+
+        assert indexed == 4
+        doc = await async_session.get(CurriculumSearchDocumentModel, "cur_other")
+        assert doc is not None
+        assert doc.owner_name == "김개발"
+        assert (doc.tags, doc.lessons) == ("파이썬", "DOM 조작")
+
+    @pytest.mark.asyncio
+    async def test_search_matches_tags_and_lessons_ranked_by_field(
+        self, async_session: AsyncSession
+    ) -> None:
+        """제목 > 태그 > 레슨 순으로 정렬, 비공개 커리큘럼 제외"""
+        await CurriculumSearchRepository(async_session).rebuild()
+
+        assert await _search(async_session, "파이썬") == [
+            "cur_title",
+            "cur_other",
+            "cur_lesson",
+        ]
+        assert await _search(async_session, "파이썬 판다스") == ["cur_lesson"]
+        assert await _search(async_session, "김개발") == [
+            "cur_title",
+            "cur_lesson",
+            "cur_other",
+        ]
+        assert await _search(async_session, "러스트") == []
+
+    @pytest.mark.asyncio
+    async def test_event_handler_keeps_index_in_sync(
+        self, async_session: AsyncSession
+    ) -> None:
+        search_repo = CurriculumSearchRepository(async_session)
+        handler = CurriculumEventHandler(search_repo, FeedRepository(async_session))
+        await search_repo.rebuild()
+
+        # 제목 변경 → 재색인
+        await async_session.execute(
+            update(CurriculumModel)
+            .where(CurriculumModel.id == "cur_other")
+            .values(title="러스트 입문")
+        )
+        await async_session.commit()
+        await handler.on_curriculum_updated("cur_other")
+        assert await _search(async_session, "러스트") == ["cur_other"]
+
+        # 삭제 → 문서 제거
+        await handler.on_curriculum_deleted("cur_other")
+        removed = await async_session.get(CurriculumSearchDocumentModel, "cur_other")
+        assert removed is None
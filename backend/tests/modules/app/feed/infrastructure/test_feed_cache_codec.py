@@ -0,0 +1,43 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.feed.domain.entity.feed_item import FeedItem
+from app.modules.feed.infrastructure.repository.feed_cache_codec import FeedItemCodec
+
+
+def _item(updated_at: datetime) -> FeedItem:
+    return FeedItem(
+        curriculum_id="01HKQJQJQJQJQJQJQJQJQJ",
+        title="Python 기초 과정",
+        owner_id="user_1",
+        owner_name="홍길동",
+        total_weeks=4,
+        total_lessons=12,
+        created_at=updated_at.replace(day=1),
+        updated_at=updated_at,
+        score=updated_at.timestamp(),
+        category_name="프로그래밍",
+        category_color="#3366FF",
+        tags=["python", "기초"],
+        category_id="cat_1",
+    )
+
+
+class TestFeedItemCodec:
+    @pytest.mark.parametrize(
+        "updated_at",
+        [datetime(2025, 8, 4, 9, 30, 0, 5), datetime(2025, 8, 4, tzinfo=timezone.utc)],
+    )
+    def test_round_trip_stores_category_id_only(self, updated_at: datetime) -> None:
+        item = _item(updated_at)
+        codec = FeedItemCodec()
+
+        raw = codec.encode(item)
+        restored = codec.decode(raw)
+
+        assert b"#3366FF" not in raw
+        assert restored == replace(
+            item, score=0.0, category_name=None, category_color=None
+        )
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from app.common.cache.two_tier import LocalCache
+from app.modules.feed.domain.entity.feed_item import FeedItem
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.infrastructure.repository import feed_repo as feed_repo_module
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+
+
+class _OpenCircuitRedis:
+    circuit_open = True
+
+
+class _FakeItemCache:
+    """서킷이 열린 동안의 L1 (stale 포함) 조회만 흉내"""
+
+    def __init__(self, items: Dict[str, FeedItem]) -> None:
+        self.items = items
+
+    async def get_many(self, keys: List[str]) -> Dict[str, FeedItem]:
+        return {key: self.items[key] for key in keys if key in self.items}
+
+
+def _item(curriculum_id: str) -> FeedItem:
+    now = datetime(2025, 8, 4, 9, 30)
+    return FeedItem(
+        curriculum_id=curriculum_id,
+        title=f"과정 {curriculum_id}",
+        owner_id="user_1",
+        owner_name="홍길동",
+        total_weeks=4,
+        total_lessons=12,
+        created_at=now,
+        updated_at=now,
+        score=0.0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def open_circuit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(feed_repo_module, "redis_client", _OpenCircuitRedis())
+
+
+def _repo(items: Dict[str, FeedItem], pages: LocalCache) -> FeedRepository:
+    return FeedRepository(
+        session=None,  # type: ignore[arg-type]
+        item_cache=_FakeItemCache(items),  # type: ignore[arg-type]
+        recent_pages=pages,
+    )
+
+
+class TestFeedRepositoryOpenCircuit:
+    @pytest.mark.asyncio
+    async def test_serves_recent_page_from_l1(self) -> None:
+        pages: LocalCache[Any] = LocalCache(max_size=10, ttl=60)
+        feed_filter = FeedFilter(page=1, items_per_page=2)
+        pages.set(FeedRepository._page_key(feed_filter), (5, ["c1", "c2"]))
+        items = {"c1": _item("c1"), "c2": _item("c2")}
+
+        result = await _repo(items, pages)._get_from_cache(feed_filter)
+
+        assert result is not None
+        total_count, feed_items = result
+        assert total_count == 5
+        assert [item.curriculum_id for item in feed_items] == ["c1", "c2"]
+        assert feed_items[0] is not items["c1"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_page_is_incomplete(self) -> None:
+        pages: LocalCache[Any] = LocalCache(max_size=10, ttl=60)
+        feed_filter = FeedFilter(page=1, items_per_page=2)
+        pages.set(FeedRepository._page_key(feed_filter), (5, ["c1", "c2"]))
+
+        repo = _repo({"c1": _item("c1")}, pages)
+
+        assert await repo._get_from_cache(feed_filter) is None
+        assert await repo._get_from_cache(FeedFilter(page=2)) is None
@@ -0,0 +1,364 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from app.common.cache.redis_client import RedisClient
+from app.common.db.database import Base
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
+    CurriculumRepository,
+)
+from app.modules.feed.application.service.timeline_service import TimelineService
+from app.modules.feed.domain.repository.timeline_repo import ITimelineRepository
+from app.modules.feed.domain.vo.timeline import TimelineEntry, TimelinePage
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.modules.feed.infrastructure.repository.timeline_repo import (
+    TimelineRepository,
+)
+from app.modules.social.infrastructure.db_model.follow import FollowModel
+from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+NOW = datetime(2025, 8, 4, 12, 0, 0)
+
+
+class InMemoryTimelineRepository(ITimelineRepository):
+    """Redis 타임라인 동작(만들어진 키에만 쓰기, 세대가 바뀌면 교체 안 함)을 흉내 내는 저장소"""
+
+    def __init__(self) -> None:
+        self.timelines: Dict[str, Dict[str, float]] = {}
+        self.followed_celebs: Dict[str, Set[str]] = {}
+        self.authors: Dict[str, Dict[str, float]] = {}
+        self.celebrities: Set[str] = set()
+        self.generations: Dict[str, int] = {}
+
+    def _bump(self, key: str) -> int:
+        self.generations[key] = self.generations.get(key, 0) + 1
+        return self.generations[key]
+
+    def _touch(self, key: str, built: bool) -> bool:
+        """만들어졌거나 만드는 중이면 세대를 올리고, 만들어진 경우만 True"""
+        if built or key in self.generations:
+            self._bump(key)
+        return built
+
+    @staticmethod
+    def _page(scores: Dict[str, float], window: int) -> TimelinePage:
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        return TimelinePage(entries=ranked[:window], total=len(scores))
+
+    async def read(self, user_id: str, window: int) -> Optional[TimelinePage]:
+        if user_id not in self.timelines:
+            return None
+        page = self._page(self.timelines[user_id], window)
+        page.celebrity_ids = sorted(self.followed_celebs[user_id])
+        return page
+
+    async def generation(self, user_id: str) -> Optional[int]:
+        return self._bump(f"user:{user_id}")
+
+    async def replace(
+        self,
+        user_id: str,
+        entries: List[TimelineEntry],
+        celebrity_ids: Set[str],
+        generation: Optional[int],
+    ) -> bool:
+        if self.generations.get(f"user:{user_id}") != generation:
+            return False
+        self.timelines[user_id] = {e.curriculum_id: e.score for e in entries}
+        self.followed_celebs[user_id] = set(celebrity_ids)
+        return True
+
+    async def add_entries(
+        self, user_ids: List[str], entries: List[TimelineEntry]
+    ) -> None:
+        for user_id in user_ids:
+            if self._touch(f"user:{user_id}", user_id in self.timelines):
+                self.timelines[user_id].update(
+                    {e.curriculum_id: e.score for e in entries}
+                )
+
+    async def remove_entries(
+        self, user_ids: List[str], curriculum_ids: List[str]
+    ) -> None:
+        for user_id in user_ids:
+            if self._touch(f"user:{user_id}", user_id in self.timelines):
+                for curriculum_id in curriculum_ids:
+                    self.timelines[user_id].pop(curriculum_id, None)
+
+    async def read_authors(
+        self, author_ids: List[str], window: int
+    ) -> Dict[str, Optional[TimelinePage]]:
+        return {
+            a: self._page(self.authors[a], window) if a in self.authors else None
+            for a in author_ids
+        }
+
+    async def author_generation(self, author_id: str) -> Optional[int]:
+        return self._bump(f"author:{author_id}")
+
+    async def replace_author(
+        self, author_id: str, entries: List[TimelineEntry], generation: Optional[int]
+    ) -> bool:
+        if self.generations.get(f"author:{author_id}") != generation:
+            return False
+        self.authors[author_id] = {e.curriculum_id: e.score for e in entries}
+        return True
+
+    async def add_author_entry(self, author_id: str, entry: TimelineEntry) -> None:
+        if self._touch(f"author:{author_id}", author_id in self.authors):
+            self.authors[author_id][entry.curriculum_id] = entry.score
+
+    async def remove_author_entries(
+        self, author_id: str, curriculum_ids: List[str]
+    ) -> None:
+        if self._touch(f"author:{author_id}", author_id in self.authors):
+            for curriculum_id in curriculum_ids:
+                self.authors[author_id].pop(curriculum_id, None)
+
+    async def find_celebrity_ids(self) -> Optional[Set[str]]:
+        return set(self.celebrities)
+
+    async def promote_celebrity(self, author_id: str, follower_ids: List[str]) -> None:
+        self.celebrities.add(author_id)
+        for user_id in follower_ids:
+            if self._touch(f"user:{user_id}", user_id in self.timelines):
+                self.followed_celebs[user_id].add(author_id)
+
+    async def set_followed_celebrity(
+        self, user_id: str, author_id: str, following: bool
+    ) -> None:
+        if not self._touch(f"user:{user_id}", user_id in self.timelines):
+            return
+        if following:
+            self.followed_celebs[user_id].add(author_id)
+        else:
+            self.followed_celebs[user_id].discard(author_id)
+
+
+@pytest.fixture
+async def async_session() -> AsyncSession:
+    """
+    reader → writer, reader → star, fan → star
+    writer: w_old(공개), w_private(비공개) / star: s_old(공개)
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with async_session_local() as session:
+        for user_id in ("reader", "writer", "star", "fan"):
+            session.add(
+                UserModel(  # type: ignore
+                    id=user_id,
+                    email=f"{user_id}@example.com",
+                    name=user_id,
+                    password="hashed_password",
+                    role=RoleVO.USER,
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+            )
+        await session.flush()
+        for follower_id, followee_id in (
+            ("reader", "writer"),
+            ("reader", "star"),
+            ("fan", "star"),
+        ):
+            session.add(
+                FollowModel(  # type: ignore
+                    id=f"{follower_id}_{followee_id}",
+                    follower_id=follower_id,
+                    followee_id=followee_id,
+                    created_at=NOW,
+                )
+            )
+        for curriculum_id, owner_id, visibility, minutes_ago in (
+            ("w_old", "writer", "PUBLIC", 30),
+            ("w_private", "writer", "PRIVATE", 5),
+            ("s_old", "star", "PUBLIC", 20),
+        ):
+            session.add(
+                CurriculumModel(  # type: ignore
+                    id=curriculum_id,
+                    user_id=owner_id,
+                    title=curriculum_id,
+                    visibility=visibility,
+                    created_at=NOW,
+                    updated_at=NOW - timedelta(minutes=minutes_ago),
+                )
+            )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def _publish(
+    session: AsyncSession, service: TimelineService, curriculum_id: str, owner_id: str
+) -> None:
+    session.add(
+        CurriculumModel(  # type: ignore
+            id=curriculum_id,
+            user_id=owner_id,
+            title=curriculum_id,
+            visibility="PUBLIC",
+            created_at=NOW,
+            updated_at=NOW,
+        )
+    )
+    await session.commit()
+    await service.on_curriculum_changed(curriculum_id)
+
+
+class TestTimelineService:
+    def _service(self, session: AsyncSession) -> TimelineService:
+        return TimelineService(
+            timeline_repo=InMemoryTimelineRepository(),
+            feed_repo=FeedRepository(session),
+            follow_repo=FollowRepository(session),
+            fanout_threshold=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_builds_from_database_then_fans_out_on_write(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+
+        assert await service.get_page("reader", 1, 10) == (2, ["s_old", "w_old"])
+
+        # 팔로워 1명 → 팔로워 타임라인에 push
+        await _publish(async_session, service, "w_new", "writer")
+        assert service.timeline_repo.timelines["reader"]["w_new"]
+        assert await service.get_page("reader", 1, 2) == (3, ["w_new", "s_old"])
+        assert await service.get_page("reader", 2, 2) == (3, ["w_old"])
+
+    @pytest.mark.asyncio
+    async def test_publish_during_build_is_not_overwritten(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        store = service.timeline_repo
+        replace = store.replace
+
+        async def publish_then_replace(*args) -> bool:
+            store.replace = replace  # type: ignore[method-assign]
+            await _publish(async_session, service, "w_new", "writer")
+            return await replace(*args)
+
+        store.replace = publish_then_replace  # type: ignore[method-assign]
+        assert await service.get_page("reader", 1, 10) == (2, ["s_old", "w_old"])
+        assert "reader" not in store.timelines
+
+        assert await service.get_page("reader", 1, 10) == (
+            3,
+            ["w_new", "s_old", "w_old"],
+        )
+        assert "w_new" in store.timelines["reader"]
+
+    @pytest.mark.asyncio
+    async def test_high_follower_account_switches_to_fan_out_on_read(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        store = service.timeline_repo
+        await service.get_page("reader", 1, 10)
+
+        # 팔로워 2명(threshold) → 대형 계정 전환, 팔로워 타임라인의 기존 항목 제거
+        await _publish(async_session, service, "s_new", "star")
+        assert store.celebrities == {"star"}
+        assert set(store.timelines["reader"]) == {"w_old"}
+        assert await service.get_page("reader", 1, 10) == (
+            3,
+            ["s_new", "s_old", "w_old"],
+        )
+
+        # 새로 만들어지는 타임라인은 대형 계정 항목을 저장하지 않는다
+        del store.timelines["reader"]
+        assert await service.get_page("reader", 1, 10) == (
+            3,
+            ["s_new", "s_old", "w_old"],
+        )
+        assert store.followed_celebs["reader"] == {"star"}
+
+    @pytest.mark.asyncio
+    async def test_unfollow_trims_and_follow_backfills(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        await service.get_page("reader", 1, 10)
+
+        await async_session.execute(
+            delete(FollowModel).where(FollowModel.id == "reader_writer")
+        )
+        await async_session.commit()
+        await service.on_unfollow("reader", "writer")
+        assert await service.get_page("reader", 1, 10) == (1, ["s_old"])
+
+        await service.on_follow("reader", "writer")
+        assert await service.get_page("reader", 1, 10) == (2, ["s_old", "w_old"])
+
+    @pytest.mark.asyncio
+    async def test_private_curriculum_is_retracted(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        await service.get_page("reader", 1, 10)
+
+        await async_session.execute(
+            update(CurriculumModel)
+            .where(CurriculumModel.id == "w_old")
+            .values(visibility="PRIVATE")
+        )
+        await async_session.commit()
+        await service.on_curriculum_changed("w_old")
+
+        assert await service.get_page("reader", 1, 10) == (1, ["s_old"])
+
+
+class TestFollowingCurriculums:
+    @pytest.mark.asyncio
+    async def test_followed_by_uses_subquery_without_followee_limit(
+        self, async_session: AsyncSession
+    ) -> None:
+        repo = CurriculumRepository(async_session)
+
+        total, curriculums = await repo.find_public_curriculums_followed_by("reader")
+
+        assert total == 2
+        assert [c.id for c in curriculums] == ["s_old", "w_old"]
+
+    @pytest.mark.asyncio
+    async def test_find_public_by_ids_keeps_order_and_drops_private(
+        self, async_session: AsyncSession
+    ) -> None:
+        repo = CurriculumRepository(async_session)
+
+        curriculums = await repo.find_public_by_ids(
+            ["w_old", "missing", "w_private", "s_old"]
+        )
+
+        assert [c.id for c in curriculums] == ["w_old", "s_old"]
+
+    @pytest.mark.asyncio
+    async def test_redis_repository_without_connection(self) -> None:
+        repo = TimelineRepository(RedisClient())
+
+        assert await repo.read("reader", 10) is None
+        assert await repo.find_celebrity_ids() is None
+        assert await repo.read_authors(["star"], 10) == {"star": None}
@@ -0,0 +1,260 @@
+import pytest
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from app.common.cache.redis_client import RedisClient
+from app.common.db.database import Base
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.social.application.service.follow_suggestion_service import (
+    FollowSuggestionService,
+)
+from app.modules.social.domain.repository.follow_suggestion_repo import (
+    IFollowSuggestionRepository,
+)
+from app.modules.social.infrastructure.db_model.follow import FollowModel
+from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.social.infrastructure.repository.follow_suggestion_repo import (
+    FollowSuggestionRepository,
+)
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
+    CurriculumTagRepository,
+)
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+USERS = ["a", "b", "c", "d", "e", "f"]
+FOLLOWS = [("a", "b"), ("a", "c"), ("b", "a"), ("b", "d"), ("c", "b"), ("c", "d")]
+FOLLOWS += [("c", "e"), ("e", "f"), ("f", "a")]
+
+
+class InMemoryFollowSuggestionRepository(IFollowSuggestionRepository):
+    """Redis zset 동작(계산된 사용자만 증감, 1 미만 제거)을 흉내 내는 저장소"""
+
+    def __init__(self) -> None:
+        self.scores: Dict[str, Dict[str, float]] = {}
+
+    async def get_suggestions(self, user_id: str, limit: int) -> Optional[List[str]]:
+        if user_id not in self.scores:
+            return None
+        ranked = sorted(self.scores[user_id].items(), key=lambda x: (-x[1], x[0]))
+        return [candidate_id for candidate_id, _ in ranked[:limit]]
+
+    async def replace(self, scores_by_user: Dict[str, Dict[str, float]]) -> bool:
+        self.scores.update({u: dict(s) for u, s in scores_by_user.items()})
+        return True
+
+    async def apply_deltas(self, deltas_by_user: Dict[str, Dict[str, float]]) -> None:
+        for user_id, deltas in deltas_by_user.items():
+            if user_id not in self.scores:
+                continue
+            scores = self.scores[user_id]
+            for candidate_id, delta in deltas.items():
+                scores[candidate_id] = scores.get(candidate_id, 0.0) + delta
+            self.scores[user_id] = {c: s for c, s in scores.items() if s >= 1}
+
+    async def remove_candidate(self, user_id: str, candidate_id: str) -> None:
+        self.scores.get(user_id, {}).pop(candidate_id, None)
+
+    async def find_computed_user_ids(self) -> List[str]:
+        return list(self.scores)
+
+
+@pytest.fixture
+async def async_session() -> AsyncSession:
+    """a~f 사용자 팔로우 그래프, a/e 커리큘럼에 같은 태그"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    now = datetime.now(timezone.utc)
+
+    async with async_session_local() as session:
+        for user_id in USERS:
+            session.add(
+                UserModel(  # type: ignore
+                    id=user_id,
+                    email=f"{user_id}@example.com",
+                    name=f"user_{user_id}",
+                    password="hashed_password",
+                    role=RoleVO.USER,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        session.add(
+            TagModel(  # type: ignore
+                id="tag_python",
+                name="python",
+                usage_count=2,
+                created_by="a",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        await session.flush()
+        for follower_id, followee_id in FOLLOWS:
+            session.add(
+                FollowModel(  # type: ignore
+                    id=f"{follower_id}_{followee_id}",
+                    follower_id=follower_id,
+                    followee_id=followee_id,
+                    created_at=now,
+                )
+            )
+        for owner_id in ("a", "e"):
+            session.add(
+                CurriculumModel(  # type: ignore
+                    id=f"cur_{owner_id}",
+                    user_id=owner_id,
+                    title="python",
+                    visibility="PUBLIC",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        await session.flush()
+        for owner_id in ("a", "e"):
+            session.add(
+                CurriculumTagModel(  # type: ignore
+                    id=f"cur_{owner_id}_tag_python",
+                    curriculum_id=f"cur_{owner_id}",
+                    tag_id="tag_python",
+                    added_by=owner_id,
+                    created_at=now,
+                )
+            )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+class TestFollowRepositorySecondDegree:
+    @pytest.mark.asyncio
+    async def test_count_second_degree_excludes_self_and_followees(
+        self, async_session: AsyncSession
+    ) -> None:
+        counts = await FollowRepository(async_session).count_second_degree(["a", "e"])
+
+        # a → b → (a 제외, d), a → c → (b 는 이미 팔로우, d, e)
+        assert counts["a"] == {"d": 2, "e": 1}
+        assert counts["e"] == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_find_user_ids_with_followees_pages_by_id(
+        self, async_session: AsyncSession
+    ) -> None:
+        repo = FollowRepository(async_session)
+
+        assert await repo.find_user_ids_with_followees("", 2) == ["a", "b"]
+        assert await repo.find_user_ids_with_followees("b", 10) == ["c", "e", "f"]
+
+
+class TestFollowSuggestionService:
+    def _service(
+        self, session: AsyncSession, tag_affinity_weight: float = 0.0
+    ) -> FollowSuggestionService:
+        return FollowSuggestionService(
+            follow_repo=FollowRepository(session),
+            follow_suggestion_repo=InMemoryFollowSuggestionRepository(),
+            curriculum_tag_repo=CurriculumTagRepository(session),
+            tag_affinity_weight=tag_affinity_weight,
+        )
+
+    @pytest.mark.asyncio
+    async def test_tag_affinity_boost_below_one_mutual(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session, tag_affinity_weight=0.5)
+
+        scores = await service.compute_scores(["a"])
+
+        assert scores["a"] == {"d": 2.0, "e": 1.5}
+
+    @pytest.mark.asyncio
+    async def test_miss_computes_and_stores_then_serves_from_store(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        store = service.follow_suggestion_repo
+
+        assert await service.get_suggested_user_ids("a", 10) == ["d", "e"]
+        assert await store.get_suggestions("a", 1) == ["d"]
+        assert await service.get_suggested_user_ids("d", 10) == []
+        assert await store.get_suggestions("d", 10) == []
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_database_when_store_unavailable(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = FollowSuggestionService(
+            follow_repo=FollowRepository(async_session),
+            follow_suggestion_repo=FollowSuggestionRepository(RedisClient()),
+        )
+
+        assert await service.get_suggested_user_ids("a", 1) == ["d"]
+        assert await service.get_suggested_user_ids("a", 10) == ["d", "e"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates_match_full_recompute(
+        self, async_session: AsyncSession
+    ) -> None:
+        service = self._service(async_session)
+        store = service.follow_suggestion_repo
+        await service.refresh(USERS)
+
+        async def assert_matches_recompute() -> None:
+            assert store.scores == await service.compute_scores(USERS)
+
+        # a → d 팔로우
+        async_session.add(
+            FollowModel(  # type: ignore
+                id="a_d",
+                follower_id="a",
+                followee_id="d",
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        await async_session.commit()
+        await service.on_follow("a", "d")
+        await assert_matches_recompute()
+
+        # c → e 언팔로우 (c 의 추천에 e 가 되돌아오지 않고, b/f 경로 갱신)
+        await async_session.execute(delete(FollowModel).where(FollowModel.id == "c_e"))
+        await async_session.commit()
+        await service.on_unfollow("c", "e")
+        await assert_matches_recompute()
+
+        # a → b 언팔로우 (c 를 통해 b 가 다시 후보)
+        await async_session.execute(delete(FollowModel).where(FollowModel.id == "a_b"))
+        await async_session.commit()
+        await service.on_unfollow("a", "b")
+        await assert_matches_recompute()
+        assert "b" in (await store.get_suggestions("a", 10) or [])
+
+
+class TestFollowSuggestionRepository:
+    """Redis 미연결 시 조회는 None (호출 측 DB 계산), 변경은 무시"""
+
+    @pytest.mark.asyncio
+    async def test_reads_return_none_without_redis(self) -> None:
+        repo = FollowSuggestionRepository(RedisClient())
+
+        assert await repo.get_suggestions("a", 10) is None
+        assert await repo.replace({"a": {"b": 1.0}}) is False
+        assert await repo.find_computed_user_ids() == []
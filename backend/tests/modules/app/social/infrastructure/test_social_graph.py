@@ -0,0 +1,365 @@
+import pytest
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from redis.exceptions import WatchError
+
+from app.common.cache.redis_client import RedisClient
+from app.common.db.database import Base
+from app.modules.social.domain.entity.follow import Follow
+from app.modules.social.infrastructure.db_model.follow import FollowModel
+from app.modules.social.infrastructure.repository.follow_repo import FollowRepository
+from app.modules.social.infrastructure.repository.social_graph_cache import (
+    FOLLOWERS,
+    SocialGraphCache,
+)
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+USERS = ["a", "b", "c", "d"]
+FOLLOWS = [("a", "b"), ("b", "a"), ("c", "a"), ("c", "b"), ("d", "b")]
+
+
+class InMemorySocialGraphCache(SocialGraphCache):
+    """Redis set 동작(센티널 있는 set 만 warm)을 흉내 내는 캐시"""
+
+    def __init__(self, max_set_size: int = 10000) -> None:
+        super().__init__(RedisClient(), max_set_size=max_set_size)
+        self.sets: Dict[str, Set[str]] = {}
+        self.generations: Dict[str, int] = {}
+        self.round_trips = 0
+
+    async def contains(
+        self, checks: Sequence[Tuple[str, str, List[str]]]
+    ) -> Optional[List[Optional[List[bool]]]]:
+        self.round_trips += 1
+        flags: List[Optional[List[bool]]] = []
+        for direction, user_id, member_ids in checks:
+            members = self.sets.get(self._key(direction, user_id), set())
+            warm = self.WARM in members
+            flags.append([m in members for m in member_ids] if warm else None)
+        return flags
+
+    async def intersect(
+        self, direction: str, user_ids: List[str]
+    ) -> Optional[Set[str]]:
+        self.round_trips += 1
+        sets = [self.sets.get(self._key(direction, u), set()) for u in user_ids]
+        if not all(self.WARM in members for members in sets):
+            return None
+        return set.intersection(*sets) - {self.WARM}
+
+    async def generation(self, user_id: str) -> Optional[str]:
+        generation = self.generations.get(user_id)
+        return None if generation is None else str(generation)
+
+    async def warm(
+        self,
+        direction: str,
+        user_id: str,
+        member_ids: List[str],
+        generation: Optional[str],
+    ) -> None:
+        if await self.generation(user_id) != generation:
+            return
+        if len(member_ids) <= self.max_set_size:
+            self.sets[self._key(direction, user_id)] = {self.WARM, *member_ids}
+
+    def _bump(self, *user_ids: str) -> None:
+        for user_id in user_ids:
+            self.generations[user_id] = self.generations.get(user_id, 0) + 1
+
+    async def _write_edge(self, follower_id: str, followee_id: str, add: bool) -> None:
+        self._bump(follower_id, followee_id)
+        for key, member in (
+            (self._key("followees", follower_id), followee_id),
+            (self._key("followers", followee_id), follower_id),
+        ):
+            members = self.sets.setdefault(key, set())
+            if add:
+                members.add(member)
+            else:
+                members.discard(member)
+
+    async def remove_user(
+        self, user_id: str, follower_ids: List[str], followee_ids: List[str]
+    ) -> None:
+        self._bump(user_id, *follower_ids, *followee_ids)
+        self.sets.pop(self._key("followers", user_id), None)
+        self.sets.pop(self._key("followees", user_id), None)
+        for follower_id in follower_ids:
+            self.sets.get(self._key("followees", follower_id), set()).discard(user_id)
+        for followee_id in followee_ids:
+            self.sets.get(self._key("followers", followee_id), set()).discard(user_id)
+
+
+class _FakePipeline:
+    """watch 한 키가 execute 전에 바뀌면 WatchError (redis-py 와 같은 동작)"""
+
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list = []
+        self._watched: Dict[str, Optional[str]] = {}
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._watched = {}
+
+    async def watch(self, key: str) -> None:
+        self._watched[key] = self._redis.strings.get(key)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._redis.strings.get(key)
+
+    def multi(self) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return lambda *args: self._ops.append((name, args))
+
+    async def execute(self) -> list:
+        for key, value in self._watched.items():
+            if self._redis.strings.get(key) != value:
+                raise WatchError()
+        for name, args in self._ops:
+            getattr(self._redis, name)(*args)
+        return []
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: Dict[str, str] = {}
+        self.sets: Dict[str, Set[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.strings.get(key)
+
+    def incr(self, key: str) -> None:
+        self.strings[key] = str(int(self.strings.get(key, 0)) + 1)
+
+    def expire(self, key: str, ttl: int) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.sets.pop(key, None)
+
+    def sadd(self, key: str, *members: str) -> None:
+        self.sets.setdefault(key, set()).update(members)
+
+    def srem(self, key: str, member: str) -> None:
+        self.sets.get(key, set()).discard(member)
+
+
+@pytest.fixture
+async def async_session() -> AsyncSession:
+    """a ↔ b 맞팔로우, c → a/b, d → b"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    now = datetime.now(timezone.utc)
+
+    async with async_session_local() as session:
+        for user_id in USERS:
+            session.add(
+                UserModel(  # type: ignore
+                    id=user_id,
+                    email=f"{user_id}@example.com",
+                    name=f"user_{user_id}",
+                    password="hashed_password",
+                    role=RoleVO.USER,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        await session.flush()
+        for follower_id, followee_id in FOLLOWS:
+            session.add(
+                FollowModel(  # type: ignore
+                    id=f"{follower_id}_{followee_id}",
+                    follower_id=follower_id,
+                    followee_id=followee_id,
+                    created_at=now,
+                )
+            )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+EXPECTED_FOR_A = {
+    "b": (True, True),
+    "c": (False, True),
+    "d": (False, False),
+}
+
+
+class TestSocialGraph:
+    @pytest.mark.asyncio
+    async def test_relationships_from_database(
+        self, async_session: AsyncSession
+    ) -> None:
+        repo = FollowRepository(async_session)
+
+        assert await repo.get_relationships("a", ["b", "c", "d"]) == EXPECTED_FOR_A
+        assert await repo.get_relationships("a", []) == {}
+
+    @pytest.mark.asyncio
+    async def test_cold_sets_are_warmed_then_served_in_one_round_trip(
+        self, async_session: AsyncSession
+    ) -> None:
+        graph = InMemorySocialGraphCache()
+        repo = FollowRepository(async_session, social_graph=graph)
+
+        assert await repo.get_relationships("a", ["b", "c", "d"]) == EXPECTED_FOR_A
+        assert graph.sets["graph:followers:a"] == {"", "b", "c"}
+
+        graph.round_trips = 0
+        assert await repo.get_relationships("a", ["b", "c", "d"]) == EXPECTED_FOR_A
+        assert graph.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_sets_in_sync_with_database(
+        self, async_session: AsyncSession
+    ) -> None:
+        graph = InMemorySocialGraphCache()
+        repo = FollowRepository(async_session, social_graph=graph)
+        await repo.get_relationships("a", ["d"])
+        await repo.get_relationships("d", ["a"])
+
+        await repo.save(
+            Follow(
+                id="a_d",
+                follower_id="a",
+                followee_id="d",
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        assert await repo.exists_follow("a", "d") is True
+        assert (await repo.get_relationships("d", ["a"]))["a"] == (False, True)
+
+        await repo.delete("b_a")
+        assert (await repo.get_relationships("a", ["b"]))["b"] == (True, False)
+
+        await repo.delete_all_by_user("d")
+        assert await repo.exists_follow("a", "d") is False
+        assert "graph:followers:d" not in graph.sets
+        assert await FollowRepository(async_session).exists_follow("a", "d") is False
+
+    @pytest.mark.asyncio
+    async def test_mutual_followers_use_set_intersection(
+        self, async_session: AsyncSession
+    ) -> None:
+        graph = InMemorySocialGraphCache()
+        repo = FollowRepository(async_session, social_graph=graph)
+
+        assert await repo.get_mutual_followers("a", "b") == (1, ["c"])
+        assert graph.sets["graph:followers:b"] == {"", "a", "c", "d"}
+        assert await repo.get_mutual_followers("a", "b", page=2, items_per_page=1) == (
+            1,
+            [],
+        )
+
+    @pytest.mark.asyncio
+    async def test_oversized_sets_are_not_cached(
+        self, async_session: AsyncSession
+    ) -> None:
+        graph = InMemorySocialGraphCache(max_set_size=2)
+        repo = FollowRepository(async_session, social_graph=graph)
+
+        assert await repo.get_relationships("b", ["a", "c"]) == {
+            "a": (True, True),
+            "c": (False, True),
+        }
+        assert "graph:followers:b" not in graph.sets
+        assert await repo.get_mutual_followers("a", "b") == (1, ["c"])
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_database_without_redis(
+        self, async_session: AsyncSession
+    ) -> None:
+        repo = FollowRepository(
+            async_session, social_graph=SocialGraphCache(RedisClient())
+        )
+
+        assert await repo.get_relationships("a", ["b", "c", "d"]) == EXPECTED_FOR_A
+        assert await repo.exists_follow("c", "a") is True
+        assert await repo.get_mutual_followers("a", "b") == (1, ["c"])
+
+    @pytest.mark.asyncio
+    async def test_follow_between_read_and_warm_is_not_cached(
+        self, async_session: AsyncSession
+    ) -> None:
+        graph = InMemorySocialGraphCache()
+        repo = FollowRepository(async_session, social_graph=graph)
+        warm = graph.warm
+
+        async def follow_then_warm(*args) -> None:
+            graph.warm = warm  # type: ignore[method-assign]
+            await repo.save(
+                Follow(
+                    id="a_d",
+                    follower_id="a",
+                    followee_id="d",
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            await warm(*args)
+
+        graph.warm = follow_then_warm  # type: ignore[method-assign]
+        await repo.get_relationships("a", ["d"])
+
+        assert "" not in graph.sets.get("graph:followees:a", set())
+        assert (await repo.get_relationships("a", ["d"]))["d"] == (True, False)
+        assert graph.sets["graph:followees:a"] == {"", "b", "d"}
+
+
+class TestSocialGraphCacheWarm:
+    @pytest.mark.asyncio
+    async def test_warm_skips_when_generation_changed(self) -> None:
+        redis = _FakeRedis()
+        graph = SocialGraphCache(SimpleNamespace(redis=redis))  # type: ignore[arg-type]
+
+        generation = await graph.generation("a")
+        await graph.add_edge("d", "a")
+        await graph.warm(FOLLOWERS, "a", ["b", "c"], generation)
+        assert redis.sets["graph:followers:a"] == {"d"}
+
+        await graph.warm(FOLLOWERS, "a", ["b", "c", "d"], await graph.generation("a"))
+        assert redis.sets["graph:followers:a"] == {"", "b", "c", "d"}
+
+    @pytest.mark.asyncio
+    async def test_warm_aborts_when_edge_written_during_transaction(self) -> None:
+        redis = _FakeRedis()
+        graph = SocialGraphCache(SimpleNamespace(redis=redis))  # type: ignore[arg-type]
+        get = _FakePipeline.get
+
+        async def get_then_follow(pipe: _FakePipeline, key: str) -> Optional[str]:
+            value = await get(pipe, key)
+            redis.incr(key)
+            return value
+
+        _FakePipeline.get = get_then_follow  # type: ignore[method-assign]
+        try:
+            await graph.warm(FOLLOWERS, "a", ["b"], None)
+        finally:
+            _FakePipeline.get = get  # type: ignore[method-assign]
+        assert "graph:followers:a" not in redis.sets
@@ -0,0 +1,176 @@
+import pytest
+from datetime import datetime, timezone
+from typing import List
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from app.common.cache.namespaces import CACHE_NAMESPACES, namespace_of
+from app.common.cache.redis_client import RedisClient
+from app.common.cache.reference_data import ReferenceDataCache
+from app.common.db.database import Base
+from app.modules.taxonomy.domain.entity.category import Category
+from app.modules.taxonomy.domain.vo.category_name import CategoryName
+from app.modules.taxonomy.domain.vo.tag_color import TagColor
+from app.modules.taxonomy.infrastructure.repository.cached_category_repo import (
+    CachedCategoryRepository,
+    CategorySnapshotCodec,
+    category_reference_data,
+    category_snapshot_cache,
+)
+from app.modules.taxonomy.infrastructure.repository.category_repo import (
+    CategoryRepository,
+)
+
+
+@pytest.fixture
+async def engine():
+    """테스트용 비동기 엔진"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session(engine) -> AsyncSession:
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session_local() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine) -> List[str]:
+    """실행된 SQL 문 기록"""
+    recorded: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+async def repo(async_session: AsyncSession) -> CachedCategoryRepository:
+    """Redis 미연결 상태의 캐시 저장소 (카테고리 3개 준비)"""
+    inner = CategoryRepository(async_session)
+    now = datetime.now(timezone.utc)
+    seeds = [
+        ("cat_a", "Backend", True),
+        ("cat_b", "Frontend", True),
+        ("cat_c", "Data", False),
+    ]
+    for sort_order, (category_id, name, is_active) in enumerate(seeds, start=1):
+        await inner.save(
+            Category(
+                id=category_id,
+                name=CategoryName(name),
+                description=None,
+                color=TagColor("#3B82F6"),
+                icon=None,
+                sort_order=sort_order,
+                is_active=is_active,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    cache: ReferenceDataCache = ReferenceDataCache(
+        "categories_test", RedisClient(), check_interval=60.0
+    )
+    return CachedCategoryRepository(inner, cache)
+
+
+class TestCachedCategoryRepository:
+    """CachedCategoryRepository 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_snapshot(
+        self, repo: CachedCategoryRepository, statements: List[str]
+    ) -> None:
+        """첫 조회만 DB 를 읽고 이후 조회는 스냅샷에서 처리"""
+        active = await repo.find_all_active()
+        assert [c.id for c in active] == ["cat_a", "cat_b"]
+        assert statements == ["SELECT"]
+
+        assert (await repo.find_by_id("cat_c")).is_active is False  # type: ignore
+        frontend = await repo.find_by_name(CategoryName("Frontend"))
+        assert frontend.id == "cat_b"  # type: ignore
+        assert await repo.count_all(include_inactive=True) == 3
+        assert await repo.count_active() == 2
+        total, page = await repo.find_all(page=2, items_per_page=1)
+        assert (total, [c.id for c in page]) == (2, ["cat_b"])
+        assert statements == ["SELECT"]
+
+    @pytest.mark.asyncio
+    async def test_returned_entities_do_not_mutate_snapshot(
+        self, repo: CachedCategoryRepository
+    ) -> None:
+        """반환된 엔티티를 변경해도 스냅샷은 그대로"""
+        category = await repo.find_by_id("cat_a")
+        category.deactivate()  # type: ignore
+
+        assert (await repo.find_by_id("cat_a")).is_active is True  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_write_reloads_snapshot(self, repo: CachedCategoryRepository) -> None:
+        """변경 후 다음 조회는 새 스냅샷을 읽음"""
+        category = await repo.find_by_id("cat_a")
+        category.change_color(TagColor("#10B981"))  # type: ignore
+        await repo.update(category)  # type: ignore
+
+        updated = await repo.find_by_id("cat_a")
+        assert updated.color.value == "#10B981"  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_reorder_is_single_update(
+        self, repo: CachedCategoryRepository, statements: List[str]
+    ) -> None:
+        """정렬 순서 일괄 변경은 UPDATE 한 번"""
+        await repo.find_all_active()
+        statements.clear()
+
+        await repo.reorder_categories([("cat_a", 3), ("cat_b", 1), ("cat_c", 2)])
+        assert statements.count("UPDATE") == 1
+
+        total, categories = await repo.find_all(include_inactive=True)
+        assert [(c.id, c.sort_order) for c in categories] == [
+            ("cat_b", 1),
+            ("cat_c", 2),
+            ("cat_a", 3),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_codec_round_trip(
+        self, repo: CachedCategoryRepository
+    ) -> None:
+        """Redis 공유용 스냅샷 코덱은 정렬 순서와 시각을 보존"""
+        snapshot = await repo._snapshot()
+        codec = CategorySnapshotCodec()
+
+        restored = codec.decode(codec.encode(snapshot))
+
+        assert restored is not None
+        assert restored.categories == snapshot.categories
+        assert restored.name_and_color("cat_b") == ("Frontend", "#3B82F6")
+
+    def test_all_tiers_share_one_metric_namespace(self) -> None:
+        """로컬 스냅샷, L1, Redis 키가 같은 캐시 라벨로 집계됨"""
+        namespace = category_reference_data.metric_namespace
+
+        assert namespace in CACHE_NAMESPACES
+        assert category_snapshot_cache.namespace == namespace
+        assert namespace_of(category_reference_data.version_key) == namespace
+        assert namespace_of(category_snapshot_cache.redis_key("7")) == namespace
@@ -0,0 +1,243 @@
+import pytest
+from datetime import datetime, timezone
+from typing import List
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+import app.common.db.database_models  # noqa: F401
+from app.common.db.database import Base
+from app.common.db.upsert import (
+    build_insert_ignore_duplicates,
+    insert_ignore_duplicates,
+)
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.taxonomy.domain.vo.tag_name import TagName
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.taxonomy.infrastructure.repository.curriculum_tag import (
+    CurriculumTagRepository,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_repo import TagRepository
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+
+@pytest.fixture
+async def engine():
+    """테스트용 비동기 엔진"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session(engine) -> AsyncSession:
+    """사용자/커리큘럼이 준비된 세션"""
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    now = datetime.now(timezone.utc)
+
+    async with async_session_local() as session:
+        session.add(
+            UserModel(  # type: ignore
+                id="test_user_id",
+                email="test@example.com",
+                name="Test User",
+                password="hashed_password",
+                role=RoleVO.USER,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for curriculum_id in ("curriculum_a", "curriculum_b"):
+            session.add(
+                CurriculumModel(  # type: ignore
+                    id=curriculum_id,
+                    user_id="test_user_id",
+                    title="Python 기초",
+                    visibility="PUBLIC",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        await session.commit()
+        yield session
+
+
+@pytest.fixture
+def statements(engine) -> List[str]:
+    """실행된 SQL 문 기록"""
+    recorded: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+class TestAddTagsByNames:
+    """CurriculumTagRepository.add_tags_by_names 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_constant_statement_count(
+        self, async_session: AsyncSession, statements: List[str]
+    ) -> None:
+        """태그 10개 추가도 고정된 문장 수로 처리"""
+        repo = CurriculumTagRepository(async_session)
+        names = [TagName(f"tag{i}") for i in range(10)]
+
+        added = await repo.add_tags_by_names("curriculum_a", names, "test_user_id")
+
+        assert [tag.name.value for tag in added] == [f"tag{i}" for i in range(10)]
+        assert all(tag.usage_count == 1 for tag in added)
+        # SELECT tags, INSERT tags, SELECT tags, SELECT links, INSERT links, UPDATE
+        assert statements == [
+            "SELECT",
+            "INSERT",
+            "SELECT",
+            "SELECT",
+            "INSERT",
+            "UPDATE",
+        ]
+
+        link_count = await async_session.scalar(
+            select(func.count()).select_from(CurriculumTagModel)
+        )
+        assert link_count == 10
+
+    @pytest.mark.asyncio
+    async def test_reuses_existing_tags_and_skips_linked(
+        self, async_session: AsyncSession
+    ) -> None:
+        """기존 태그 재사용, 이미 연결된 태그는 건너뛰고 usage_count 는 연결 수와 일치"""
+        repo = CurriculumTagRepository(async_session)
+        await repo.add_tags_by_names(
+            "curriculum_a", [TagName("python"), TagName("fastapi")], "test_user_id"
+        )
+
+        added_again = await repo.add_tags_by_names(
+            "curriculum_a", [TagName("Python"), TagName("sql")], "test_user_id"
+        )
+        added_other = await repo.add_tags_by_names(
+            "curriculum_b", [TagName("python")], "test_user_id"
+        )
+
+        assert [tag.name.value for tag in added_again] == ["sql"]
+        assert [tag.name.value for tag in added_other] == ["python"]
+
+        rows = (
+            await async_session.execute(
+                select(TagModel.name, TagModel.usage_count).order_by(TagModel.name)
+            )
+        ).all()
+        assert [tuple(row) for row in rows] == [
+            ("fastapi", 1),
+            ("python", 2),
+            ("sql", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_find_or_create_dedupes_names(
+        self, async_session: AsyncSession
+    ) -> None:
+        """중복 이름은 한 번만 생성하고 기존 태그는 그대로 재사용"""
+        tag_repo = TagRepository(async_session)
+        [existing] = await tag_repo.find_or_create_by_names(
+            [TagName("python")], "test_user_id"
+        )
+
+        tags = await tag_repo.find_or_create_by_names(
+            [TagName("python"), TagName("django"), TagName("Django")],
+            "test_user_id",
+        )
+
+        assert [tag.name.value for tag in tags] == ["python", "django"]
+        assert tags[0].id == existing.id
+        assert (
+            await async_session.scalar(select(func.count()).select_from(TagModel)) == 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_insert_ignore_duplicates_skips_conflicting_name(
+        self, async_session: AsyncSession
+    ) -> None:
+        """동시 요청이 같은 이름을 먼저 넣은 경우: 오류 없이 기존 행 유지"""
+        now = datetime.now(timezone.utc)
+        row = {
+            "usage_count": 0,
+            "created_by": "test_user_id",
+            "created_at": now,
+            "updated_at": now,
+        }
+        await insert_ignore_duplicates(
+            async_session, TagModel, [{"id": "first", "name": "python", **row}]
+        )
+        await insert_ignore_duplicates(
+            async_session,
+            TagModel,
+            [
+                {"id": "second", "name": "python", **row},
+                {"id": "third", "name": "django", **row},
+            ],
+        )
+        await async_session.commit()
+
+        rows = (
+            await async_session.execute(
+                select(TagModel.id, TagModel.name).order_by(TagModel.name)
+            )
+        ).all()
+        assert [tuple(r) for r in rows] == [("third", "django"), ("first", "python")]
+
+
+class TestCountTagAdditionsByDay:
+    """트렌딩 재구성용 일별 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_groups_by_tag_and_day(self, async_session: AsyncSession) -> None:
+        repo = CurriculumTagRepository(async_session)
+        await repo.add_tags_by_names(
+            "curriculum_a", [TagName("python"), TagName("sql")], "test_user_id"
+        )
+        await repo.add_tags_by_names(
+            "curriculum_b", [TagName("python")], "test_user_id"
+        )
+        python_id = (
+            await async_session.execute(
+                select(TagModel.id).where(TagModel.name == "python")
+            )
+        ).scalar_one()
+
+        rows = await repo.count_tag_additions_by_day(datetime(2025, 8, 1))
+        future = await repo.count_tag_additions_by_day(datetime(2025, 8, 5))
+
+        today = datetime.now(timezone.utc).date()
+        assert (python_id, today, 2) in rows
+        assert len(rows) == 2
+        assert future == []
+
+
+def test_mysql_insert_ignore_duplicates_keeps_existing_row() -> None:
+    """MySQL 에서는 PK 자기 갱신(no-op) ON DUPLICATE KEY UPDATE 로 컴파일"""
+    stmt = build_insert_ignore_duplicates(
+        "mysql", TagModel, [{"id": "a", "name": "python"}]
+    )
+    sql = str(stmt.compile(dialect=mysql.dialect()))
+
+    assert "ON DUPLICATE KEY UPDATE id = tags.id" in sql
@@ -0,0 +1,202 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.cache.redis_client import RedisClient
+from app.modules.taxonomy.domain.entity.tag_suggestion import TagSuggestion
+from app.modules.taxonomy.infrastructure.repository.tag_autocomplete_repo import (
+    TagAutocompleteRepository,
+    TagPrefixIndex,
+)
+from app.modules.taxonomy.infrastructure.repository.tag_ranking_repo import (
+    TagRankingRepository,
+)
+
+
+@pytest.fixture
+def index() -> TagPrefixIndex:
+    index = TagPrefixIndex()
+    index.load(
+        [
+            TagSuggestion(id="1", name="python", usage_count=30),
+            TagSuggestion(id="2", name="pytorch", usage_count=50),
+            TagSuggestion(id="3", name="파이썬", usage_count=10),
+            TagSuggestion(id="4", name="파이프라인", usage_count=20),
+            TagSuggestion(id="5", name="자바", usage_count=5),
+        ]
+    )
+    return index
+
+
+def _names(suggestions) -> list[str]:
+    return [s.name for s in suggestions]
+
+
+class _FakePipeline:
+    """WATCH 중에는 즉시 실행, multi() 이후에는 모았다가 execute 에서 실행"""
+
+    def __init__(self, redis: "_FakeRedis"):
+        self._redis = redis
+        self._ops: list = []
+        self._immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._immediate = False
+
+    async def watch(self, *keys):
+        self._immediate = True
+
+    def multi(self):
+        self._immediate = False
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def _call(*args, **kwargs):
+            if self._immediate:
+                return method(*args, **kwargs)
+            self._ops.append((method, args, kwargs))
+
+        return _call
+
+    async def execute(self):
+        ops, self._ops = self._ops, []
+        return [await method(*args, **kwargs) for method, args, kwargs in ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.strings: dict = {}
+        self.hashes: dict = {}
+        self.zsets: dict = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def exists(self, key):
+        return int(key in self.strings or key in self.hashes or key in self.zsets)
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value):
+        self.strings[key] = str(value)
+
+    async def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key, 0)) + 1)
+        return int(self.strings[key])
+
+    async def delete(self, *keys):
+        for key in keys:
+            for store in (self.strings, self.hashes, self.zsets):
+                store.pop(key, None)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(f) for f in fields]
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrevrangebyscore(self, key, max, min, start, num, withscores):
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda kv: -kv[1])
+        return [(m, s) for m, s in ranked if s >= min][start : start + num]
+
+
+class TestTagPrefixIndex:
+    """TagPrefixIndex 테스트"""
+
+    def test_prefix_search_ranks_by_usage(self, index: TagPrefixIndex):
+        assert _names(index.search("py")) == ["pytorch", "python"]
+        assert _names(index.search("PYTH")) == ["python"]
+        assert _names(index.search("py", limit=1)) == ["pytorch"]
+
+    def test_choseong_and_partial_syllable_search(self, index: TagPrefixIndex):
+        """초성 검색과 입력 중간 상태(자모 단위 접두사) 검색"""
+        assert _names(index.search("ㅍㅇ")) == ["파이프라인", "파이썬"]
+        assert _names(index.search("ㅍㅇㅆ")) == ["파이썬"]
+        assert _names(index.search("파있")) == ["파이썬"]
+        assert _names(index.search("ㅈ")) == ["자바"]
+
+    def test_incremental_updates(self, index: TagPrefixIndex):
+        """생성/이름 변경/사용횟수 변경/삭제 반영"""
+        assert _names(index.search("py")) == ["pytorch", "python"]  # 캐시 적재
+
+        index.upsert(TagSuggestion(id="6", name="pydantic", usage_count=40))
+        index.adjust_usage("1", 25)
+        index.upsert(TagSuggestion(id="2", name="torch", usage_count=50))
+        index.remove("3")
+
+        assert _names(index.search("py")) == ["python", "pydantic"]
+        assert _names(index.search("to")) == ["torch"]
+        assert _names(index.search("ㅍㅇ")) == ["파이프라인"]
+        assert len(index) == 5
+
+    def test_empty_query(self, index: TagPrefixIndex):
+        assert index.search("  ") == []
+
+
+class TestTagAutocompleteRepository:
+    """Redis 미연결 시 로컬 인덱스만으로 동작"""
+
+    async def test_warm_from_loader_and_apply_events(self):
+        repo = TagAutocompleteRepository(TagRankingRepository(RedisClient()))
+        loads = 0
+
+        async def loader():
+            nonlocal loads
+            loads += 1
+            return [TagSuggestion(id="1", name="fastapi", usage_count=3)]
+
+        await repo.upsert([TagSuggestion(id="0", name="flask", usage_count=1)])
+        assert not repo.is_ready
+
+        await repo.warm(loader)
+        await repo.warm(loader)
+        await repo.upsert([TagSuggestion(id="2", name="fastapi2", usage_count=9)])
+        await repo.adjust_usage("1", 10)
+
+        assert loads == 1
+        assert _names(repo.search("fa")) == ["fastapi", "fastapi2"]
+        assert repo.search("fl") == []
+
+
+class TestTagRankingRepository:
+    """Redis 미연결 시 조회는 None (호출 측 DB 대체), 변경은 무시"""
+
+    async def test_reads_return_none_without_redis(self):
+        ranking = TagRankingRepository(RedisClient())
+
+        assert await ranking.find_popular(limit=10) is None
+        assert await ranking.find_trending(limit=10) is None
+        assert await ranking.count_by_min_usage(10) is None
+        assert await ranking.snapshot() is None
+        assert await ranking.adjust_usage("1", 1) is None
+
+    async def test_upsert_before_rebuild_is_not_seeded(self):
+        redis = _FakeRedis()
+        ranking = TagRankingRepository(SimpleNamespace(redis=redis))  # type: ignore[arg-type]
+
+        assert (
+            await ranking.upsert([TagSuggestion(id="1", name="a", usage_count=5)])
+            is None
+        )
+        assert await ranking.find_popular(limit=10) is None
+        assert redis.hashes == {} and redis.zsets == {}
+
+        await ranking.rebuild([TagSuggestion(id="1", name="a", usage_count=5)])
+        assert (
+            await ranking.upsert([TagSuggestion(id="2", name="b", usage_count=9)]) == 2
+        )
+        assert _names(await ranking.find_popular(limit=10)) == ["b", "a"]
+
+    def test_trending_bucket_keys(self):
+        ranking = TagRankingRepository(RedisClient(), trending_days=7)
+
+        assert ranking._bucket_key(ranking._today()) == "tag:trending:20250804"
+        assert ranking._bucket_ttl() == 8 * 24 * 60 * 60
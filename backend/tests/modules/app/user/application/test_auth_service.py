@@ -1,13 +1,20 @@
+from typing import Tuple
+from unittest.mock import AsyncMock
 import pytest
 from datetime import datetime, timezone
+from pytest_mock import MockerFixture
 from app.modules.user.application.dto.user_dto import (
     CreateUserCommand,
     UpdateUserCommand,
     UserDTO,
     UsersPageDTO,
 )
+from app.modules.user.application.exception import PasswordIncorrectError
+from app.modules.user.application.service.auth_service import AuthService
 from app.modules.user.domain.entity.user import User
 from app.modules.user.domain.vo import Email, Name, Password, RoleVO
+from app.utils.crypto import Crypto
+from app.utils.password_hasher import PasswordHasher
 
 
 class TestUserDTO:
@@ -78,3 +85,79 @@ class TestUserDTO:
         assert command.name == "newname"
         assert command.password == "NewPassword123!"
         assert command.role is None
+
+
+class TestAuthServiceLogin:
+
+    @pytest.fixture  # type: ignore
+    def auth_service(self, mocker: MockerFixture) -> Tuple[AuthService, AsyncMock]:
+        mock_user_repo: AsyncMock = mocker.AsyncMock()
+        return (
+            AuthService(
+                user_repo=mock_user_repo,
+                user_domain_service=mocker.AsyncMock(),
+                crypto=Crypto(rounds=4),
+                password_hasher=PasswordHasher(max_workers=1),
+            ),
+            mock_user_repo,
+        )
+
+    def _user(self, hashed: str) -> User:
+        return User(
+            id="test_id",
+            email=Email("test@example.com"),
+            name=Name("testuser"),
+            password=Password(hashed),
+            role=RoleVO.USER,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    async def test_login_success(
+        self, auth_service: Tuple[AuthService, AsyncMock]
+    ) -> None:
+        """login with current cost factor does not rehash"""
+        # Given
+        service, mock_user_repo = auth_service
+        hashed = Crypto(rounds=4).encrypt("Password123!")
+        mock_user_repo.find_by_email.return_value = self._user(hashed)
+
+        # When
+        token, role = await service.login("test@example.com", "Password123!")
+
+        # Then
+        assert token
+        assert role == "USER"
+        mock_user_repo.update.assert_not_called()
+
+    async def test_login_rehash_on_cost_change(
+        self, auth_service: Tuple[AuthService, AsyncMock]
+    ) -> None:
+        """login with outdated cost factor stores a new hash"""
+        # Given
+        service, mock_user_repo = auth_service
+        old_hashed = Crypto(rounds=5).encrypt("Password123!")
+        mock_user_repo.find_by_email.return_value = self._user(old_hashed)
+
+        # When
+        await service.login("test@example.com", "Password123!")
+
+        # Then
+        mock_user_repo.update.assert_called_once()
+        updated_user: User = mock_user_repo.update.call_args.args[0]
+        assert updated_user.password.value != old_hashed
+        assert updated_user.password.value.startswith("$2b$04$")
+
+    async def test_login_password_incorrect(
+        self, auth_service: Tuple[AuthService, AsyncMock]
+    ) -> None:
+        """login with wrong password"""
+        # Given
+        service, mock_user_repo = auth_service
+        hashed = Crypto(rounds=4).encrypt("Password123!")
+        mock_user_repo.find_by_email.return_value = self._user(hashed)
+
+        # When & Then
+        with pytest.raises(PasswordIncorrectError):
+            await service.login("test@example.com", "Wrong123!")
+        mock_user_repo.update.assert_not_called()
@@ -0,0 +1,22 @@
+from app.utils.hangul import decompose, extract_choseong, has_hangul_syllable
+
+
+class TestHangul:
+    """한글 자모 분해 테스트"""
+
+    def test_decompose_splits_compound_jamo(self):
+        """겹모음/겹받침은 입력 순서대로 낱자로 분리"""
+        assert decompose("과자") == "ㄱㅗㅏㅈㅏ"
+        assert decompose("값") == "ㄱㅏㅂㅅ"
+        assert decompose("python3") == "python3"
+
+    def test_partial_input_is_prefix(self):
+        """IME 입력 중간 상태가 완성된 단어 분해의 접두사"""
+        assert decompose("파이썬").startswith(decompose("파있"))
+        assert decompose("한국어").startswith(decompose("한ㄱ"))
+        assert decompose("갑시다").startswith(decompose("값"))
+
+    def test_extract_choseong(self):
+        assert extract_choseong("파이썬3") == "ㅍㅇㅆ3"
+        assert has_hangul_syllable("파이썬")
+        assert not has_hangul_syllable("ㅍㅇ")
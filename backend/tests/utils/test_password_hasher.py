@@ -0,0 +1,43 @@
+import asyncio
+import threading
+import time
+
+from app.utils.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher:
+    """PasswordHasher 테스트"""
+
+    async def test_runs_in_dedicated_pool(self):
+        """기본 executor 가 아닌 전용 스레드에서 실행"""
+        hasher = PasswordHasher(max_workers=1)
+
+        thread_name = await hasher.run("hash", lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hasher")
+        hasher.shutdown()
+
+    async def test_concurrency_is_bounded(self):
+        """동시 실행 수는 max_workers 이하, 초과분은 큐에서 대기"""
+        hasher = PasswordHasher(max_workers=2)
+        running = 0
+        max_running = 0
+        lock = threading.Lock()
+
+        def slow_hash() -> None:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        tasks = [asyncio.create_task(hasher.run("hash", slow_hash)) for _ in range(6)]
+        await asyncio.sleep(0)
+
+        assert hasher.queue_depth == 4
+        await asyncio.gather(*tasks)
+        assert max_running == 2
+        assert hasher.queue_depth == 0
+        hasher.shutdown()
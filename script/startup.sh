@@ -83,4 +83,9 @@ else
 fi
 
 echo "🌟 Starting application..."
+if [ "${ENVIRONMENT:-development}" = "production" ]; then
+    # preload + CPU 수만큼 워커 (WEB_WORKERS, WEB_MAX_REQUESTS 등으로 조정)
+    echo "🚀 Production server (multi-worker)"
+    exec python -m app.core.server
+fi
 exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload